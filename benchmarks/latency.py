@@ -0,0 +1,97 @@
+"""
+Mesure le temps d'aller-retour d'un tour sur la boucle locale.
+
+Un serveur et deux clients GameClient sont lancés sur 127.0.0.1. Les deux
+clients jouent à tour de rôle : chaque tour, le joueur envoie une action
+("action" avec un compteur de tours) et on mesure le temps jusqu'à ce qu'il
+reçoive l'état du serveur qui contient cette action. On affiche les
+percentiles p50 et p99 et le maximum, en millisecondes.
+
+Usage : python -m benchmarks.latency [--turns 500] [--async] [--port 5599]
+"""
+import argparse
+import contextlib
+import os
+import threading
+import time
+
+from network.async_server import AsyncGameServer
+from network.client import GameClient
+from network.server import GameServer
+
+# Délai maximal d'attente de l'état d'un tour (secondes)
+TURN_TIMEOUT = 5
+
+
+def percentile(values, fraction):
+    """Retourne le percentile `fraction` (entre 0 et 1) d'une liste de valeurs triées"""
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def measure_turns(port, turns, warmup, use_async=False):
+    """Lance un serveur et deux clients, et mesure le temps d'aller-retour de chaque tour
+
+    Returns:
+        list: Durées des tours mesurés (hors échauffement), en millisecondes, triées
+    """
+    server_class = AsyncGameServer if use_async else GameServer
+    server = server_class("127.0.0.1", port)
+    if not server.start():
+        raise RuntimeError(f"Impossible de démarrer le serveur sur le port {port}")
+
+    clients = [GameClient("127.0.0.1", port) for _ in range(2)]
+    received = [threading.Event() for _ in clients]
+    expected = {"turn": None}
+
+    def on_game_update(state, player):
+        if state.get("turn") == expected["turn"]:
+            received[player].set()
+
+    try:
+        for player, client in enumerate(clients):
+            client.register_callback("game_update", lambda state, player=player: on_game_update(state, player))
+            if not client.connect():
+                raise RuntimeError("Connexion au serveur impossible")
+        # Laisser la négociation du codec et les premiers états se terminer
+        time.sleep(0.5)
+
+        durations = []
+        for turn in range(warmup + turns):
+            player = turn % 2
+            received[player].clear()
+            expected["turn"] = turn
+            start_time = time.perf_counter()
+            clients[player].send_action({"turn": turn})
+            if not received[player].wait(TURN_TIMEOUT):
+                raise RuntimeError(f"État du tour {turn} non reçu")
+            if turn >= warmup:
+                durations.append((time.perf_counter() - start_time) * 1000)
+        return sorted(durations)
+    finally:
+        for client in clients:
+            client.disconnect()
+        server.stop()
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Temps d'aller-retour d'un tour sur la boucle locale")
+    parser.add_argument("--turns", type=int, default=500, help="Nombre de tours mesurés (par défaut: 500)")
+    parser.add_argument("--warmup", type=int, default=20, help="Tours d'échauffement non mesurés (par défaut: 20)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Utiliser le serveur asyncio")
+    parser.add_argument("--port", type=int, default=5599, help="Port du serveur (par défaut: 5599)")
+    args = parser.parse_args()
+
+    # Les journaux du serveur et des clients faussent la mesure à l'écran : les masquer
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        durations = measure_turns(args.port, args.turns, args.warmup, args.use_async)
+
+    server_name = "asyncio" if args.use_async else "threads"
+    print(f"{len(durations)} tours, serveur {server_name}")
+    print(f"p50 {percentile(durations, 0.50):.3f} ms  p99 {percentile(durations, 0.99):.3f} ms  "
+          f"max {durations[-1]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Test de charge du serveur avec des clients synthétiques.
+
+Le serveur (python server.py) est lancé dans un processus séparé, puis
+--matches parties de deux robots GameClient sont jouées sur la boucle locale :
+chaque paire de robots crée sa salle, se déclare prête, puis joue une vraie
+partie sans affichage (game.sim) à --rate tours par seconde. Après chaque
+tour, le robot qui a joué envoie le nouvel état (send_state) et on mesure le
+temps jusqu'à sa réception par l'adversaire.
+
+Résultats (JSON, sur la sortie standard ou dans --output) :
+- connect_ms : durée de connexion d'un robot (jusqu'au message "connection")
+- fanout_ms : délai entre l'envoi d'un tour et sa réception par l'adversaire
+- actions_per_s, updates_per_s : débit des tours envoyés et des états reçus
+- lost_turns : tours jamais reçus par l'adversaire (par exemple un delta
+  refusé par le serveur parce que le robot n'avait pas encore reçu le tour
+  précédent)
+- server : CPU (en % d'un cœur) et mémoire résidente du processus serveur,
+  lus dans /proc (None sur les systèmes qui n'en ont pas)
+- generator_cpu_percent : CPU des robots ; proche de 100, c'est le
+  générateur et non le serveur qui limite les mesures
+
+Usage : python -m benchmarks.load [--matches 20] [--duration 10] [--rate 5] [--async] [--output load.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.latency import percentile
+from game.sim import create_match, aggressive_policy, LION_BUILD, TIGER_BUILD
+from network.client import GameClient
+from network.game_state import GameStateEncoder
+
+# Délai maximal pour le démarrage du serveur, la connexion et l'entrée en salle (secondes)
+SETUP_TIMEOUT = 10
+
+# Intervalle entre deux relevés CPU/mémoire du serveur (secondes)
+SAMPLE_INTERVAL = 0.5
+
+
+class Bot:
+    """Client synthétique : un GameClient et ses mesures"""
+
+    def __init__(self, port):
+        """Initialise un robot (non connecté)
+
+        Args:
+            port: Port du serveur sur 127.0.0.1
+        """
+        self.client = GameClient("127.0.0.1", port)
+        self.connected = threading.Event()
+        self.joined = threading.Event()
+        self.room_id = None
+        self.connect_ms = None
+        self.opponent = None  # Robot adverse, qui enregistre les délais de nos états
+        self.pending = {}  # {turn_id: instant d'envoi} des tours envoyés à l'adversaire
+        self.fanout_ms = []
+        self.coalesced = 0  # Tours remplacés par un état plus récent avant d'être reçus
+        self.updates = 0
+        self.lock = threading.Lock()
+        self.client.register_callback("connection", lambda client_id: self.connected.set())
+        self.client.register_callback("room_joined", self.on_room_joined)
+        self.client.register_callback("game_update", self.on_game_update)
+
+    def connect(self):
+        """Se connecte au serveur et mesure la durée de connexion
+
+        Returns:
+            bool: True si le message "connection" a été reçu à temps
+        """
+        start_time = time.perf_counter()
+        if not self.client.connect() or not self.connected.wait(SETUP_TIMEOUT):
+            return False
+        self.connect_ms = (time.perf_counter() - start_time) * 1000
+        return True
+
+    def on_room_joined(self, room_id, player_id):
+        self.room_id = room_id
+        self.joined.set()
+
+    def on_game_update(self, state):
+        """Enregistre le délai du tour de l'adversaire contenu dans l'état reçu"""
+        received_time = time.perf_counter()
+        self.updates += 1
+        turn_id = state.get("turn_id")
+        if turn_id is None or self.opponent is None:
+            return
+        sent = self.opponent.pending
+        with self.opponent.lock:
+            sent_time = sent.pop(turn_id, None)
+            older = [pending_id for pending_id in sent if pending_id < turn_id]
+            for pending_id in older:
+                del sent[pending_id]
+            self.coalesced += len(older)
+        if sent_time is not None:
+            self.fanout_ms.append((received_time - sent_time) * 1000)
+
+    def send_turn(self, turn_id, state):
+        """Envoie l'état d'un tour joué par ce robot"""
+        state["turn_id"] = turn_id
+        with self.lock:
+            self.pending[turn_id] = time.perf_counter()
+        self.client.send_state(state)
+
+
+def play_match(bots, seed, rate, size, stop_time, counters):
+    """Joue des parties entre deux robots jusqu'à stop_time (thread par paire)
+
+    Args:
+        bots: Les deux robots de la salle
+        seed: Graine des parties
+        rate: Tours par seconde
+        size: Côté de la carte
+        stop_time: Instant (time.perf_counter) de fin du test
+        counters: Dictionnaire partagé {"actions": ...}, mis à jour sous counters["lock"]
+    """
+    rng = random.Random(seed)
+    game, animal_a, animal_b = create_match(LION_BUILD, TIGER_BUILD, seed=seed, width=size, height=size)
+    turn_id = 0
+    next_time = time.perf_counter()
+    while time.perf_counter() < stop_time:
+        if game.game_over:
+            seed += 1
+            game, animal_a, animal_b = create_match(LION_BUILD, TIGER_BUILD, seed=seed, width=size, height=size)
+        animal = game.get_next_animal_to_play()
+        while animal is None and not game.game_over:
+            animal = game.get_next_animal_to_play()
+        if animal is None:
+            continue
+        action, target = aggressive_policy(game, animal, rng)
+        if target is None:
+            game.play_turn(animal, action)
+        else:
+            game.play_turn(animal, action, target)
+
+        state = GameStateEncoder.encode_game_state(game)
+        # La liste des joueurs appartient à la salle d'attente du serveur
+        state.pop("players", None)
+        turn_id += 1
+        bots[0 if animal is animal_a else 1].send_turn(turn_id, state)
+        with counters["lock"]:
+            counters["actions"] += 1
+
+        next_time += 1 / rate
+        time.sleep(max(0, next_time - time.perf_counter()))
+
+
+def start_server(port, use_async):
+    """Lance python server.py dans un processus séparé et attend qu'il écoute
+
+    Returns:
+        subprocess.Popen: Processus du serveur
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, os.path.join(root, "server.py"), "--host", "127.0.0.1", "--port", str(port)]
+    if use_async:
+        command.append("--async")
+    process = subprocess.Popen(command, cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.perf_counter() + SETUP_TIMEOUT
+    while time.perf_counter() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"Le serveur n'a pas démarré sur le port {port}")
+
+
+def read_process_stats(pid):
+    """Lit le temps CPU cumulé et la mémoire résidente d'un processus dans /proc
+
+    Returns:
+        tuple: (secondes CPU utilisateur + système, mémoire résidente en Mo), ou (None, None)
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            # Les champs suivent le nom du programme entre parenthèses
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return cpu_seconds, int(line.split()[1]) / 1024
+        return cpu_seconds, None
+    except (OSError, ValueError, IndexError):
+        return None, None
+
+
+def summarize(values):
+    """Résume une liste de durées en millisecondes (p50, p99, max)"""
+    if not values:
+        return {"count": 0, "p50": None, "p99": None, "max": None}
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 0.50), 3),
+        "p99": round(percentile(values, 0.99), 3),
+        "max": round(values[-1], 3)
+    }
+
+
+def run_load(matches, duration, rate, size, port, use_async):
+    """Lance le serveur et les robots, joue pendant `duration` secondes et retourne les résultats
+
+    Returns:
+        dict: Résultats du test (voir la documentation du module)
+    """
+    server = start_server(port, use_async)
+    bots = []
+    samples = []
+    try:
+        _, rss_start = read_process_stats(server.pid)
+
+        # Connexion des robots, puis une salle par paire
+        for _ in range(2 * matches):
+            bot = Bot(port)
+            if not bot.connect():
+                raise RuntimeError("Connexion d'un robot impossible")
+            bots.append(bot)
+        pairs = [bots[index:index + 2] for index in range(0, len(bots), 2)]
+        for index, (host, guest) in enumerate(pairs):
+            host.opponent, guest.opponent = guest, host
+            host.client.create_room(f"charge {index + 1}")
+            if not host.joined.wait(SETUP_TIMEOUT):
+                raise RuntimeError("Création de salle sans réponse")
+            guest.client.join_room(host.room_id)
+            if not guest.joined.wait(SETUP_TIMEOUT):
+                raise RuntimeError("Entrée en salle sans réponse")
+            for bot in (host, guest):
+                bot.client.send_action({"ready": True})
+        time.sleep(0.5)
+
+        counters = {"actions": 0, "lock": threading.Lock()}
+        for bot in bots:
+            bot.updates = 0
+        cpu_start, _ = read_process_stats(server.pid)
+        generator_cpu_start = time.process_time()
+        start_time = time.perf_counter()
+        stop_time = start_time + duration
+        threads = [
+            threading.Thread(target=play_match, args=(pair, index, rate, size, stop_time, counters), daemon=True)
+            for index, pair in enumerate(pairs)
+        ]
+        for thread in threads:
+            thread.start()
+        while time.perf_counter() < stop_time:
+            time.sleep(SAMPLE_INTERVAL)
+            samples.append(read_process_stats(server.pid)[1])
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+        cpu_end, _ = read_process_stats(server.pid)
+        generator_cpu = time.process_time() - generator_cpu_start
+        # Laisser arriver les derniers états
+        time.sleep(0.5)
+    finally:
+        for bot in bots:
+            with contextlib.suppress(Exception):
+                bot.client.client_socket.shutdown(socket.SHUT_RDWR)
+            bot.client.disconnect()
+        for bot in bots:
+            if bot.client.receive_thread is not None:
+                bot.client.receive_thread.join(1)
+        server.terminate()
+        server.wait()
+
+    rss_values = [rss for rss in samples if rss is not None]
+    return {
+        "params": {
+            "matches": matches, "bots": 2 * matches, "duration": duration, "rate": rate,
+            "size": size, "server": "asyncio" if use_async else "threads",
+            "python": platform.python_version()
+        },
+        "connect_ms": summarize([bot.connect_ms for bot in bots]),
+        "fanout_ms": summarize([value for bot in bots for value in bot.fanout_ms]),
+        "actions_per_s": round(counters["actions"] / elapsed, 2),
+        "updates_per_s": round(sum(bot.updates for bot in bots) / elapsed, 2),
+        "coalesced_turns": sum(bot.coalesced for bot in bots),
+        "lost_turns": sum(len(bot.pending) for bot in bots),
+        "server": {
+            "cpu_percent": None if cpu_start is None or cpu_end is None
+            else round(100 * (cpu_end - cpu_start) / elapsed, 1),
+            "rss_mb_start": None if rss_start is None else round(rss_start, 1),
+            "rss_mb_max": round(max(rss_values), 1) if rss_values else None
+        },
+        "generator_cpu_percent": round(100 * generator_cpu / elapsed, 1)
+    }
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Test de charge du serveur avec des robots GameClient")
+    parser.add_argument("--matches", type=int, default=20, help="Nombre de parties simultanées (par défaut: 20)")
+    parser.add_argument("--duration", type=float, default=10, help="Durée du test en secondes (par défaut: 10)")
+    parser.add_argument("--rate", type=float, default=5, help="Tours par seconde et par partie (par défaut: 5)")
+    parser.add_argument("--size", type=int, default=10, help="Côté de la carte (par défaut: 10)")
+    parser.add_argument("--port", type=int, default=5600, help="Port du serveur (par défaut: 5600)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Utiliser le serveur asyncio")
+    parser.add_argument("--output", help="Fichier JSON des résultats (par défaut: sortie standard)")
+    args = parser.parse_args()
+
+    # Les journaux des robots masqueraient les résultats
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = run_load(args.matches, args.duration, args.rate, args.size, args.port, args.use_async)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f"Résultats écrits dans {args.output}")
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Mesure l'évolution des coûts du jeu avec la taille de la carte.
+
+Pour chaque taille, on mesure :
+- tick : une mise à jour du terrain (points de vitesse des cases + fruits)
+- coups : le calcul des actions possibles d'un animal (sans cache)
+- sérialisation : encodage de l'état complet + pickle, comme envoyé par le serveur
+
+Usage : python -m benchmarks.map_sizes [--sizes 10 32 64 128 256] [--backend array]
+"""
+import argparse
+import pickle
+import time
+
+from game.game import Game
+from game.sim import create_match, LION_BUILD, TIGER_BUILD
+from network.game_state import GameStateEncoder
+
+
+def measure(function, repeat):
+    """Retourne la durée moyenne d'un appel à `function`, en microsecondes"""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start_time) / repeat * 1e6
+
+
+def benchmark_size(size, repeat, backend=Game.TERRAIN_OBJECTS):
+    """Mesure les coûts d'une partie sur une carte size x size
+
+    Returns:
+        dict: Durées en microsecondes et taille de l'état sérialisé
+    """
+    start_time = time.perf_counter()
+    game, animal, _ = create_match(LION_BUILD, TIGER_BUILD, seed=0, width=size, height=size,
+                                   terrain_backend=backend)
+    setup = (time.perf_counter() - start_time) * 1e6
+
+    # Construire les tables paresseuses (voisins franchissables) avant de mesurer
+    game.compute_animal_possible_actions(animal)
+
+    tick = measure(lambda: game.update_terrain(add_speed=True), repeat)
+    moves = measure(lambda: game.compute_animal_possible_actions(animal), repeat)
+
+    serialization_repeat = max(1, repeat // 100)
+    payload = pickle.dumps(GameStateEncoder.encode_game_state(game))
+    serialization = measure(lambda: pickle.dumps(GameStateEncoder.encode_game_state(game)), serialization_repeat)
+
+    return {
+        "size": size,
+        "area": size * size,
+        "setup_us": setup,
+        "tick_us": tick,
+        "moves_us": moves,
+        "serialization_us": serialization,
+        "payload_bytes": len(payload)
+    }
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Coûts du jeu en fonction de la taille de la carte")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 32, 64, 128, 256],
+                        help="Côtés des cartes à mesurer (par défaut: 10 32 64 128 256)")
+    parser.add_argument("--repeat", type=int, default=1000, help="Nombre de répétitions par mesure (par défaut: 1000)")
+    parser.add_argument("--backend", choices=[Game.TERRAIN_OBJECTS, Game.TERRAIN_ARRAY], default=Game.TERRAIN_OBJECTS,
+                        help="Représentation du terrain (par défaut: objects)")
+    args = parser.parse_args()
+
+    print(f"{'carte':>9} {'cases':>7} {'création':>11} {'tick':>10} {'coups':>9} {'sérial.':>11} {'octets':>10} {'sérial./case':>13}")
+    for size in args.sizes:
+        result = benchmark_size(size, args.repeat, args.backend)
+        print(f"{size:>4}x{size:<4} {result['area']:>7} "
+              f"{result['setup_us'] / 1000:>8.1f} ms "
+              f"{result['tick_us']:>7.1f} us "
+              f"{result['moves_us']:>6.1f} us "
+              f"{result['serialization_us'] / 1000:>8.2f} ms "
+              f"{result['payload_bytes']:>10} "
+              f"{result['serialization_us'] * 1000 / result['area']:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compare les codecs réseau sur les messages d'une vraie partie.
+
+Une partie Lion contre Tigre est jouée sans affichage ; après chaque tour on
+construit les deux messages que le serveur peut envoyer : l'état complet
+("game_update") et le delta depuis le tour précédent ("game_delta"). Pour
+chaque codec on mesure les octets par tour et les durées d'encodage et de
+décodage.
+
+Usage : python -m benchmarks.serialization [--turns 200] [--size 10] [--repeat 20]
+"""
+import argparse
+import random
+import time
+
+from game.sim import create_match, aggressive_policy, LION_BUILD, TIGER_BUILD
+from network import delta
+from network.codec import CODECS
+from network.game_state import GameStateEncoder
+
+
+def record_messages(turns, size, seed=0):
+    """Joue une partie et retourne les messages envoyés après chaque tour
+
+    Returns:
+        dict: {"full": [messages game_update], "delta": [messages game_delta]}
+    """
+    game, _, _ = create_match(LION_BUILD, TIGER_BUILD, seed=seed, width=size, height=size)
+    rng = random.Random(seed)
+    messages = {"full": [], "delta": []}
+    previous = GameStateEncoder.encode_game_state(game)
+
+    for version in range(1, turns + 1):
+        if game.game_over:
+            break
+        animal = game.get_next_animal_to_play()
+        while animal is None:
+            animal = game.get_next_animal_to_play()
+        action, target = aggressive_policy(game, animal, rng)
+        if target is None:
+            game.play_turn(animal, action)
+        else:
+            game.play_turn(animal, action, target)
+
+        state = GameStateEncoder.encode_game_state(game)
+        messages["full"].append({"type": "game_update", "state": state, "version": version})
+        messages["delta"].append({"type": "game_delta", "base": version - 1, "version": version,
+                                  "delta": delta.diff(previous, state)})
+        previous = state
+
+    return messages
+
+
+def benchmark_codec(codec, messages, repeat):
+    """Mesure un codec sur une liste de messages
+
+    Returns:
+        dict: Octets moyens par message, durées moyennes d'encodage et de décodage en microsecondes
+    """
+    encoded = [codec.encode(message) for message in messages]
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for message in messages:
+            codec.encode(message)
+    encode_us = (time.perf_counter() - start_time) / (repeat * len(messages)) * 1e6
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for data in encoded:
+            codec.decode(data)
+    decode_us = (time.perf_counter() - start_time) / (repeat * len(messages)) * 1e6
+
+    return {
+        "bytes": sum(len(data) for data in encoded) / len(encoded),
+        "encode_us": encode_us,
+        "decode_us": decode_us
+    }
+
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Comparaison des codecs réseau (octets par tour, durées)")
+    parser.add_argument("--turns", type=int, default=200, help="Nombre de tours joués (par défaut: 200)")
+    parser.add_argument("--size", type=int, default=10, help="Côté de la carte (par défaut: 10)")
+    parser.add_argument("--repeat", type=int, default=20, help="Nombre de passes de mesure (par défaut: 20)")
+    args = parser.parse_args()
+
+    messages = record_messages(args.turns, args.size)
+    print(f"{len(messages['full'])} tours sur une carte {args.size}x{args.size}")
+    print(f"{'message':>8} {'codec':>7} {'octets/tour':>12} {'encodage':>11} {'décodage':>11}")
+    for kind in ("full", "delta"):
+        for name, codec in CODECS.items():
+            result = benchmark_codec(codec, messages[kind], args.repeat)
+            print(f"{kind:>8} {name:>7} {result['bytes']:>12.0f} "
+                  f"{result['encode_us']:>8.1f} us {result['decode_us']:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
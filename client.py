@@ -9,7 +9,9 @@ import time
 import traceback
 from network.client import GameClient
 from game.game import Game
-from ui.gui import GUI
+from game.square import Square
+from ui.events import post_network_event
+from ui.gui import GUI, CELL_SIZE
 from network.game_state import GameStateEncoder
 
 class NetworkedGUI(GUI):
@@ -40,6 +42,10 @@ class NetworkedGUI(GUI):
         self.client.register_callback("game_update", self.on_game_update)
         self.client.register_callback("disconnect", self.on_disconnect)
         self.client.register_callback("both_ready", self.on_both_ready)
+        self.client.register_callback("intent_rejected", self.on_intent_rejected)
+        # Réveiller la boucle d'affichage, bloquée quand rien ne change, à chaque message
+        self.client.register_callback("message", post_network_event)
+        self.client.register_callback("disconnect", post_network_event)
         
         # Ajouter un message d'attente
         self.waiting_message = "En attente d'un autre joueur..."
@@ -148,8 +154,15 @@ class NetworkedGUI(GUI):
                 if not our_animal_found:
                     self.game.add_animal(our_animal, our_animal.position)
             
-            # Mettre à jour l'animal actuel
-            self.current_animal = self.game.get_next_animal_to_play()
+            # Mettre à jour l'animal actuel (désigné par le serveur en mode autoritaire)
+            if self.client.authoritative and "current_player" in game_state:
+                current_player = game_state["current_player"]
+                if current_player is not None and 0 < current_player <= len(self.game.animals):
+                    self.current_animal = self.game.animals[current_player - 1]
+                else:
+                    self.current_animal = None
+            else:
+                self.current_animal = self.game.get_next_animal_to_play()
             
             # Déterminer si c'est notre tour
             animal_index = self.game.animals.index(self.current_animal) if self.current_animal in self.game.animals else -1
@@ -193,10 +206,26 @@ class NetworkedGUI(GUI):
                 screen.blit(text, text_rect)
                 pygame.display.flip()
                 pygame.time.delay(100)
+            
+            # Le message a recouvert toute la fenêtre : la redessiner entièrement
+            self.invalidate()
         except Exception as e:
             print(f"Erreur lors de l'affichage du message de déconnexion: {e}")
             traceback.print_exc()
     
+    def on_intent_rejected(self, action, reason):
+        """Callback appelé lorsque le serveur autoritaire refuse une intention
+        
+        Args:
+            action: Action refusée
+            reason: Raison du refus
+        """
+        print(f"Callback on_intent_rejected appelé: {action} ({reason})")
+        # Le tour n'a pas été joué : le joueur peut réessayer
+        if self.current_animal in self.game.animals:
+            self.is_my_turn = self.game.animals.index(self.current_animal) + 1 == self.player_id
+        self.show_info_message(f"Action refusée: {reason}", duration=120)
+    
     def on_both_ready(self):
         """Callback appelé lorsque les deux joueurs ont terminé leur configuration"""
         print("Callback on_both_ready appelé")
@@ -238,15 +267,26 @@ class NetworkedGUI(GUI):
             return
         
         try:
+            if self.client.authoritative:
+                # Le serveur joue le tour : n'envoyer que l'intention
+                intent = self.click_to_intent(pos, shift_pressed)
+                if intent is None:
+                    return
+                self.last_action_time = current_time
+                self.client.send_intent(*intent)
+                self.is_my_turn = False
+                self.show_info_message("Action envoyée au serveur", duration=120)
+                return
+            
             # Appeler la méthode de la classe parente
             super().handle_click(pos, shift_pressed)
             
             # Mettre à jour le temps de la dernière action
             self.last_action_time = current_time
             
-            # Envoyer l'état du jeu au serveur
+            # Envoyer au serveur ce qui a changé dans l'état du jeu
             game_state = GameStateEncoder.encode_game_state(self.game)
-            self.client.send_action(game_state)
+            self.client.send_state(game_state)
             
             # Mettre à jour le statut du tour
             self.is_my_turn = False
@@ -256,6 +296,45 @@ class NetworkedGUI(GUI):
             traceback.print_exc()
             self.show_info_message(f"Erreur: {str(e)}", duration=120)
     
+    def click_to_intent(self, pos, shift_pressed=False):
+        """Traduit un clic sur le terrain en intention, avec les mêmes règles que GUI.handle_click
+        
+        Args:
+            pos: Position du clic (x, y)
+            shift_pressed: True si la touche Shift est enfoncée (morsure, course)
+            
+        Returns:
+            tuple: (action, cible) à envoyer au serveur, ou None si le clic ne correspond à aucune action
+        """
+        x, y = pos
+        if x >= self.game.terrain.width * CELL_SIZE or y >= self.game.terrain.height * CELL_SIZE:
+            return None
+        animal = self.current_animal
+        if animal is None:
+            return None
+        
+        position = self.game.terrain.coordinates_to_position(x // CELL_SIZE, y // CELL_SIZE)
+        actions = self.game.get_animal_possible_actions(animal)
+        
+        target_animal = self.game.terrain.get_animal_at(position)
+        if target_animal and target_animal is not animal:
+            # Attaque : la cible est désignée par l'ID de son joueur
+            action = "bite" if shift_pressed else "slap"
+            if action in actions and target_animal in actions[action]:
+                return action, self.game.animals.index(target_animal) + 1
+        elif not target_animal:
+            square = self.game.terrain.get_square(position)
+            if square and square.terrain_type == Square.TYPE_WATER and position in actions.get("drink", []):
+                return "drink", position
+            action = "run" if shift_pressed else "walk"
+            if position in actions.get(action, []):
+                return action, position
+        else:
+            return None
+        
+        self.show_info_message(f"Action {action} impossible")
+        return None
+    
     def run(self):
         """Exécute la boucle principale du jeu"""
         try:
@@ -322,6 +401,10 @@ class NetworkedGUI(GUI):
             # Marquer la configuration comme terminée
             self.setup_complete = True
             
+            # En mode autoritaire, le serveur crée la partie à partir des animaux configurés
+            if self.client.authoritative and game.animals:
+                self.client.send_setup(game.animals[0])
+            
             # Informer le serveur que nous avons terminé la configuration
             # Envoyer un message différent selon que nous sommes l'hôte ou le client
             if self.player_id == 1:  # L'hôte a l'ID 1
@@ -7,9 +7,15 @@ from game.config import (
     HUNGER_DAMAGE, THIRST_DAMAGE
 )
 from game.square import Square
-import random
 
 class Animal:
+    # Attributs fixes : pas de __dict__ par instance (nombreuses parties en mémoire)
+    __slots__ = (
+        "name", "max_hp", "hp", "max_stamina", "stamina", "speed", "speed_points",
+        "position", "is_alive", "teeth", "claws", "skin", "height",
+        "max_hunger", "hunger", "max_thirst", "thirst"
+    )
+    
     def __init__(self, name, hp, stamina, speed, position, teeth=1, claws=1, skin=1, height=1):
         self.name = name
         self.max_hp = hp
@@ -121,7 +127,7 @@ class Animal:
             dodge_chance = height_diff * HEIGHT_DODGE_FACTOR
             
             # Vérifier si la cible esquive l'attaque
-            if random.random() < dodge_chance:
+            if terrain.rng.random() < dodge_chance:
                 return 0  # L'attaque a manqué
             
             # Calculer les dégâts en tenant compte des dents
@@ -0,0 +1,313 @@
+"""
+Terrain stocké sous forme de tableaux NumPy (structure de tableaux).
+
+Au lieu d'un objet Square par case, ArrayTerrain conserve l'état de toutes les
+cases dans quelques plans NumPy : type de terrain (uint8), points de vitesse
+(int16), masque des vergers et index des occupants (animal, ressource). Les
+cases restent accessibles via terrain.grid[y][x] ou get_square() sous forme de
+vues légères (SquareView) qui lisent et écrivent directement dans ces plans :
+le reste du jeu utilise donc la même API qu'avec Terrain.
+
+NumPy est une dépendance optionnelle : elle n'est requise que pour utiliser
+ce module.
+"""
+from game.config import SQUARE_SPEED, SQUARE_INITIAL_SPEED_POINTS
+from game.terrain import Terrain
+from game.square import Square
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+# Codes des types de terrain stockés dans le plan uint8
+TERRAIN_TYPE_CODES = {
+    Square.TYPE_NORMAL: 0,
+    Square.TYPE_WATER: 1,
+    Square.TYPE_FOREST: 2,
+    Square.TYPE_MOUNTAIN: 3
+}
+TERRAIN_TYPE_NAMES = {code: name for name, code in TERRAIN_TYPE_CODES.items()}
+
+# Valeur des plans d'occupants pour une case vide
+NO_OCCUPANT = -1
+
+
+class SquareView(Square):
+    """Vue d'une case d'ArrayTerrain, sans état propre
+
+    Hérite de toutes les règles de Square (on_enter, can_move_to,
+    try_generate_fruit...) ; seuls les attributs d'état sont redirigés vers
+    les plans du terrain.
+    """
+    __slots__ = ("terrain",)
+
+    def __init__(self, terrain, x, y):
+        """Initialise une vue sur la case (x, y) d'un ArrayTerrain
+
+        Args:
+            terrain: ArrayTerrain propriétaire des plans
+            x: Coordonnée x de la case
+            y: Coordonnée y de la case
+        """
+        # Ne pas appeler Square.__init__ : l'état vit dans les plans du terrain
+        self.terrain = terrain
+        self.x = x
+        self.y = y
+
+    @property
+    def position(self):
+        """Retourne la position de la case sur son terrain"""
+        return self.terrain.coordinates_to_position(self.x, self.y)
+
+    @property
+    def speed(self):
+        """Vitesse de base de la case (identique pour toutes les cases)"""
+        return self.terrain.square_speed
+
+    @property
+    def terrain_type(self):
+        return TERRAIN_TYPE_NAMES[int(self.terrain.type_plane[self.y, self.x])]
+
+    @terrain_type.setter
+    def terrain_type(self, terrain_type):
+        self.terrain.type_plane[self.y, self.x] = TERRAIN_TYPE_CODES[terrain_type]
+
+    @property
+    def speed_points(self):
+        return int(self.terrain.speed_plane[self.y, self.x])
+
+    @speed_points.setter
+    def speed_points(self, speed_points):
+        self.terrain.speed_plane[self.y, self.x] = speed_points
+
+    @property
+    def is_orchard(self):
+        return bool(self.terrain.orchard_mask[self.y, self.x])
+
+    @is_orchard.setter
+    def is_orchard(self, is_orchard):
+        self.terrain.orchard_mask[self.y, self.x] = is_orchard
+
+    @property
+    def animal(self):
+        return self.terrain.get_occupant(self.terrain.animal_plane, self.terrain.animal_slots, self.x, self.y)
+
+    @animal.setter
+    def animal(self, animal):
+        self.terrain.set_occupant(self.terrain.animal_plane, self.terrain.animal_slots,
+                                  self.terrain.animal_free_slots, self.x, self.y, animal)
+
+    @property
+    def resource(self):
+        return self.terrain.get_occupant(self.terrain.resource_plane, self.terrain.resource_slots, self.x, self.y)
+
+    @resource.setter
+    def resource(self, resource):
+        self.terrain.set_occupant(self.terrain.resource_plane, self.terrain.resource_slots,
+                                  self.terrain.resource_free_slots, self.x, self.y, resource)
+
+    @property
+    def is_occupied(self):
+        return self.terrain.animal_plane[self.y, self.x] != NO_OCCUPANT
+
+    @property
+    def has_resource(self):
+        return self.terrain.resource_plane[self.y, self.x] != NO_OCCUPANT
+
+    def __eq__(self, other):
+        return (isinstance(other, SquareView) and other.terrain is self.terrain
+                and other.x == self.x and other.y == self.y)
+
+    def __hash__(self):
+        return hash((id(self.terrain), self.x, self.y))
+
+
+class _GridRow:
+    """Ligne de la grille d'un ArrayTerrain (crée les vues à la demande)"""
+
+    def __init__(self, terrain, y):
+        self.terrain = terrain
+        self.y = y
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.terrain.width
+        if not 0 <= x < self.terrain.width:
+            raise IndexError("Coordonnée x hors du terrain")
+        return SquareView(self.terrain, x, self.y)
+
+    def __len__(self):
+        return self.terrain.width
+
+    def __iter__(self):
+        for x in range(self.terrain.width):
+            yield SquareView(self.terrain, x, self.y)
+
+
+class _Grid:
+    """Grille d'un ArrayTerrain, indexable comme la liste de listes de Terrain"""
+
+    def __init__(self, terrain):
+        self.terrain = terrain
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.terrain.height
+        if not 0 <= y < self.terrain.height:
+            raise IndexError("Coordonnée y hors du terrain")
+        return _GridRow(self.terrain, y)
+
+    def __len__(self):
+        return self.terrain.height
+
+    def __iter__(self):
+        for y in range(self.terrain.height):
+            yield _GridRow(self.terrain, y)
+
+
+class ArrayTerrain(Terrain):
+    """Terrain dont l'état des cases est stocké dans des plans NumPy"""
+
+    def create_grid(self):
+        """Crée les plans NumPy et la grille de vues
+
+        Returns:
+            _Grid: Grille de vues indexée par [y][x]
+        """
+        if np is None:
+            raise ImportError("ArrayTerrain nécessite NumPy (pip install numpy)")
+
+        shape = (self.height, self.width)
+        self.square_speed = SQUARE_SPEED
+        self.type_plane = np.full(shape, TERRAIN_TYPE_CODES[Square.TYPE_NORMAL], dtype=np.uint8)
+        self.speed_plane = np.full(shape, SQUARE_INITIAL_SPEED_POINTS, dtype=np.int16)
+        self.orchard_mask = np.zeros(shape, dtype=np.bool_)
+        # Index des occupants dans animal_slots / resource_slots (NO_OCCUPANT si vide)
+        self.animal_plane = np.full(shape, NO_OCCUPANT, dtype=np.int16)
+        self.resource_plane = np.full(shape, NO_OCCUPANT, dtype=np.int16)
+        self.animal_slots = []
+        self.resource_slots = []
+        # Index libérés de animal_slots / resource_slots, réutilisés avant d'agrandir la liste
+        self.animal_free_slots = []
+        self.resource_free_slots = []
+        return _Grid(self)
+
+    def get_square(self, position):
+        """Récupère une vue de la case à une position donnée"""
+        if not self.is_valid_position(position):
+            return None
+        x, y = self.position_to_coordinates(position)
+        return SquareView(self, x, y)
+
+    def get_occupant(self, plane, slots, x, y):
+        """Récupère l'objet référencé par un plan d'occupants
+
+        Args:
+            plane: Plan d'index (animal_plane ou resource_plane)
+            slots: Liste des objets correspondants
+            x: Coordonnée x de la case
+            y: Coordonnée y de la case
+
+        Returns:
+            object: L'occupant de la case, ou None
+        """
+        index = plane[y, x]
+        if index == NO_OCCUPANT:
+            return None
+        return slots[index]
+
+    def set_occupant(self, plane, slots, free_slots, x, y, occupant):
+        """Place ou retire un objet dans un plan d'occupants
+
+        Les emplacements libérés sont réutilisés pour que la liste reste
+        de la taille du nombre d'occupants simultanés. Ils sont gardés dans
+        free_slots : placer ou retirer un objet se fait en temps constant.
+
+        Args:
+            plane: Plan d'index (animal_plane ou resource_plane)
+            slots: Liste des objets correspondants
+            free_slots: Index libres de slots (animal_free_slots ou resource_free_slots)
+            x: Coordonnée x de la case
+            y: Coordonnée y de la case
+            occupant: Objet à placer, ou None pour vider la case
+        """
+        index = int(plane[y, x])
+        if index != NO_OCCUPANT:
+            if occupant is not None:
+                # Remplacement : l'emplacement de l'ancien occupant est réutilisé
+                slots[index] = occupant
+                return
+            slots[index] = None
+            free_slots.append(index)
+            plane[y, x] = NO_OCCUPANT
+            return
+        if occupant is None:
+            return
+        if free_slots:
+            index = free_slots.pop()
+            slots[index] = occupant
+        else:
+            index = len(slots)
+            slots.append(occupant)
+        plane[y, x] = index
+
+    # L'index des cases actives est inutile : update_squares traite tout le plan d'un coup
+    def mark_square_dirty(self, square):
+        pass
+
+    def refresh_active_squares(self):
+        pass
+
+    def update_squares(self, fruit_class, add_speed=True, ticks=1):
+        """Met à jour toutes les cases en une passe vectorisée
+
+        Mêmes règles que Terrain.update_squares : les tirages aléatoires des
+        vergers candidats se font dans l'ordre des positions, si bien que les
+        deux représentations donnent les mêmes parties pour une même graine.
+
+        Args:
+            fruit_class: Classe de fruit à générer
+            add_speed: Si True, ajoute des points de vitesse aux cases
+            ticks: Nombre de ticks de vitesse à appliquer en une seule passe
+
+        Returns:
+            list: Liste des positions où des fruits ont été générés
+        """
+        speed_plane = self.speed_plane
+        ready = speed_plane >= 100
+        ready_ticks = np.where(ready, ticks, 0)
+
+        if add_speed and self.square_speed > 0:
+            charging = ~ready
+            if charging.any():
+                # Ticks nécessaires pour atteindre 100 points (cf. Square.advance_speed_points)
+                missing = 100 - speed_plane[charging].astype(np.int32)
+                ticks_to_ready = (missing + self.square_speed - 1) // self.square_speed
+                reached = ticks_to_ready <= ticks
+                gained = np.where(reached, ticks_to_ready, ticks) * self.square_speed
+                speed_plane[charging] += gained.astype(np.int16)
+                ready_ticks[charging] = np.where(reached, ticks - ticks_to_ready + 1, 0)
+
+        # Vergers prêts et libres : seules ces cases tirent au sort un fruit
+        candidates = (ready_ticks > 0) & self.orchard_mask
+        candidates &= (self.animal_plane == NO_OCCUPANT) & (self.resource_plane == NO_OCCUPANT)
+
+        new_fruit_positions = []
+        for index in np.flatnonzero(candidates):
+            y, x = divmod(int(index), self.width)
+            square = SquareView(self, x, y)
+            if square.try_generate_fruit(fruit_class, self.verbose, int(ready_ticks[y, x]), self.rng):
+                position = square.position
+                self.resources[position] = square.resource
+                new_fruit_positions.append(position)
+
+        if new_fruit_positions:
+            self.version += 1
+        return new_fruit_positions
+
+    def memory_footprint(self):
+        """Retourne la mémoire occupée par les plans de cases, en octets"""
+        return sum(plane.nbytes for plane in (
+            self.type_plane, self.speed_plane, self.orchard_mask, self.animal_plane, self.resource_plane
+        ))
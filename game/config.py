@@ -56,6 +56,7 @@ HEIGHT_MAX = 100
 # Paramètres du terrain
 TERRAIN_WIDTH = 10  # Largeur du terrain
 TERRAIN_HEIGHT = 10  # Hauteur du terrain
+LAYOUT_BLOCK_SIZE = 10  # Côté du motif (vergers + eau) répété en mosaïque sur les grandes cartes
 
 # Positions initiales des animaux
 LION_START_POSITION = 1  # Position de départ du lion
@@ -68,7 +69,7 @@ RED_FRUIT_POSITIONS = [37, 67]  # Positions des fruits rouges sur le terrain
 
 # Paramètres des cases (Square)
 SQUARE_SPEED = 1  # Vitesse de base des cases
-SQUARE_FRUIT_PROBABILITY = 0.01  # Probabilité qu'une case génère un fruit quand elle atteint 100 points de vitesse
+SQUARE_FRUIT_PROBABILITY = 0.05  # Probabilité qu'un verger prêt (100 points de vitesse) génère un fruit à chaque tick
 SQUARE_INITIAL_SPEED_POINTS = 100  # Points de vitesse initiaux des cases
 
 # Ressources
@@ -6,20 +6,53 @@ from game.config import (
     BITE_COST, SLAP_COST,
     RUN_COST
 )
+import math
 import random
 
 class Game:
-    def __init__(self, terrain_width=TERRAIN_WIDTH, terrain_height=TERRAIN_HEIGHT):
-        self.terrain = Terrain(terrain_width, terrain_height)
+    # Modes de planification des tours
+    SCHEDULER_TICK = "tick"    # Un tick de vitesse par appel (rythme de l'interface graphique)
+    SCHEDULER_EVENT = "event"  # Saute directement au prochain animal prêt (simulations)
+    
+    # Représentations possibles du terrain
+    TERRAIN_OBJECTS = "objects"  # Un objet Square par case (par défaut)
+    TERRAIN_ARRAY = "array"      # Plans NumPy (grandes cartes, nombreuses parties simultanées)
+    
+    def __init__(self, terrain_width=TERRAIN_WIDTH, terrain_height=TERRAIN_HEIGHT, verbose=True,
+                 scheduler=SCHEDULER_TICK, terrain_backend=TERRAIN_OBJECTS, seed=None):
+        # Générateur aléatoire propre à la partie : une même graine rejoue la même partie
+        self.seed = seed
+        self.rng = random.Random(seed)
+        if terrain_backend == self.TERRAIN_ARRAY:
+            # Import local : NumPy n'est requis que pour cette représentation
+            from game.array_terrain import ArrayTerrain
+            self.terrain = ArrayTerrain(terrain_width, terrain_height, verbose=verbose, rng=self.rng)
+        else:
+            self.terrain = Terrain(terrain_width, terrain_height, verbose=verbose, rng=self.rng)
+        self.scheduler = scheduler
         self.animals = []
         self.current_turn = 0
         self.game_over = False
         self.winner = None
+        
+        # Version de l'état du jeu : incrémentée à chaque changement qui peut
+        # modifier les actions possibles (tour joué, dégâts, animal ajouté...)
+        self.version = 0
+        self._actions_cache = {}  # {animal: (version, terrain, version du terrain, actions)}
+
+    def invalidate_actions(self):
+        """Invalide les actions possibles mémorisées pour tous les animaux
+        
+        À appeler après une modification directe des animaux (ex: décodage d'un état réseau).
+        """
+        self.version += 1
+        self._actions_cache.clear()
 
     def add_animal(self, animal, position):
         """Ajoute un animal au jeu"""
         if self.terrain.place_animal(animal, position):
             self.animals.append(animal)
+            self.invalidate_actions()
             return True
         return False
 
@@ -52,13 +85,20 @@ class Game:
             # Ne pas déduire les points de vitesse ici, cela sera fait dans play_turn
             return next_animal
             
+        # En mode événementiel, avancer directement jusqu'au prochain animal prêt
+        ticks = 1
+        if self.scheduler == self.SCHEDULER_EVENT:
+            ticks = self.ticks_until_next_turn(animals_alive)
+            if ticks is None:
+                return None
+            
         # Sinon, ajouter des points de vitesse à tous les animaux
         for animal in animals_alive:
-            animal.add_speed_points(animal.speed)
+            animal.add_speed_points(animal.speed * ticks)
             
         # Mettre à jour les points de vitesse des cases en même temps
         # Passer True pour indiquer que les cases doivent gagner des points de vitesse
-        new_fruit_positions = self.update_terrain(add_speed=True)
+        new_fruit_positions = self.update_terrain(add_speed=True, ticks=ticks)
         
         # Vérifier à nouveau si un animal peut jouer
         next_animal = max(animals_alive, key=lambda a: a.speed_points)
@@ -69,6 +109,30 @@ class Game:
         # Aucun animal ne peut jouer pour l'instant
         return None
 
+    def ticks_until_next_turn(self, animals_alive):
+        """Calcule le nombre de ticks avant qu'un animal atteigne 100 points de vitesse
+        
+        Simple minimum sur les animaux vivants, en O(n) par tour et sans file de
+        priorité : le tour coûte de toute façon O(n), puisque get_next_animal_to_play
+        ajoute ensuite les points de vitesse de ces ticks à chaque animal. Le gain du
+        mode événementiel vient du nombre de tours, pas du choix de l'animal : un seul
+        pas, quelles que soient les vitesses, au lieu d'un pas par tick.
+        
+        Args:
+            animals_alive: Liste des animaux vivants
+            
+        Returns:
+            int: Nombre de ticks (au moins 1), ou None si aucun animal ne peut progresser
+        """
+        ticks = None
+        for animal in animals_alive:
+            if animal.speed <= 0:
+                continue
+            animal_ticks = max(1, math.ceil((100 - animal.speed_points) / animal.speed))
+            if ticks is None or animal_ticks < ticks:
+                ticks = animal_ticks
+        return ticks
+
     def play_turn(self, animal, action, *args):
         """Joue un tour pour un animal"""
         if animal not in self.animals or not animal.is_alive:
@@ -132,6 +196,9 @@ class Game:
         # Vérifier si le jeu est terminé
         self.check_game_over()
         
+        # L'action a pu modifier la stamina, les points de vie ou les positions
+        self.invalidate_actions()
+        
         # Vérifier si des fruits peuvent être générés (sans ajouter de points de vitesse aux cases)
         if result:
             self.update_terrain(add_speed=False)
@@ -152,10 +219,31 @@ class Game:
         return False
 
     def get_animal_possible_actions(self, animal):
-        """Retourne les actions possibles pour un animal"""
+        """Retourne les actions possibles pour un animal
+        
+        Le résultat est mémorisé jusqu'au prochain changement d'état du jeu ou
+        du terrain : le dictionnaire retourné est partagé et ne doit pas être modifié.
+        """
         if not animal.is_alive or animal.speed_points < 100:
             return {}
             
+        cached = self._actions_cache.get(animal)
+        if cached and cached[0] == self.version and cached[1] is self.terrain and cached[2] == self.terrain.version:
+            return cached[3]
+            
+        actions = self.compute_animal_possible_actions(animal)
+        self._actions_cache[animal] = (self.version, self.terrain, self.terrain.version, actions)
+        return actions
+
+    def compute_animal_possible_actions(self, animal):
+        """Calcule les actions possibles pour un animal, sans passer par le cache
+        
+        Args:
+            animal: Animal qui doit jouer
+            
+        Returns:
+            dict: {action: liste de cibles}
+        """
         actions = {}
         
         # Déplacements
@@ -165,24 +253,18 @@ class Game:
         if animal.stamina >= RUN_COST:
             actions["run"] = animal.get_possible_run_positions(self.terrain)
             
-        # Attaques
-        if animal.stamina >= BITE_COST:
-            # Trouver les animaux adjacents
-            bite_targets = []
-            for other_animal in self.animals:
-                if other_animal != animal and other_animal.is_alive and self.terrain.is_adjacent(animal.position, other_animal.position):
-                    bite_targets.append(other_animal)
-            if bite_targets:
-                actions["bite"] = bite_targets
-                
-        if animal.stamina >= SLAP_COST:
-            # Même logique que pour bite
-            slap_targets = []
-            for other_animal in self.animals:
-                if other_animal != animal and other_animal.is_alive and self.terrain.is_adjacent(animal.position, other_animal.position):
-                    slap_targets.append(other_animal)
-            if slap_targets:
-                actions["slap"] = slap_targets
+        # Attaques : morsure et gifle visent les mêmes animaux adjacents
+        if animal.stamina >= BITE_COST or animal.stamina >= SLAP_COST:
+            targets = [
+                other_animal for other_animal in self.animals
+                if other_animal != animal and other_animal.is_alive
+                and self.terrain.is_adjacent(animal.position, other_animal.position)
+            ]
+            if targets:
+                if animal.stamina >= BITE_COST:
+                    actions["bite"] = targets
+                if animal.stamina >= SLAP_COST:
+                    actions["slap"] = list(targets)
                 
         # Action de boire
         # Trouver les cases d'eau adjacentes
@@ -196,16 +278,17 @@ class Game:
                 
         return actions
         
-    def update_terrain(self, add_speed=True):
+    def update_terrain(self, add_speed=True, ticks=1):
         """Met à jour le terrain (points de vitesse des cases, génération de fruits)
         
         Args:
             add_speed: Si True, ajoute des points de vitesse aux cases
+            ticks: Nombre de ticks de vitesse regroupés en une seule mise à jour
             
         Returns:
             list: Liste des positions où des fruits ont été générés
         """
         # Choisir aléatoirement entre les deux types de fruits
-        fruit_class = random.choice([GreenFruit, RedFruit])
+        fruit_class = self.rng.choice([GreenFruit, RedFruit])
         
-        return self.terrain.update_squares(fruit_class, add_speed) 
\ No newline at end of file
+        return self.terrain.update_squares(fruit_class, add_speed, ticks) 
\ No newline at end of file
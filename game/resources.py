@@ -5,43 +5,98 @@ from game.config import (
 )
 
 class Resource:
+    __slots__ = ("name", "value", "position")
+
     def __init__(self, name, value, position=None):
         self.name = name
         self.value = value
         self.position = position
 
-class Fruit(Resource):
-    def __init__(self, name="Fruit", value=FRUIT_VALUE, heal_amount=FRUIT_HEAL_AMOUNT, stamina_recovery=FRUIT_STAMINA_RECOVERY, hunger_recovery=FRUIT_HUNGER_RECOVERY, position=None):
-        super().__init__(name, value, position)
+class FruitKind:
+    """Caractéristiques partagées par tous les fruits d'un même type (poids-mouche)
+
+    Les instances sont immuables et uniques pour un jeu de caractéristiques
+    donné : chaque fruit ne stocke qu'une référence vers son type et sa position.
+    """
+    __slots__ = ("name", "value", "heal_amount", "stamina_recovery", "hunger_recovery")
+
+    _registry = {}  # {(name, value, heal, stamina, hunger): FruitKind}
+
+    def __init__(self, name, value, heal_amount, stamina_recovery, hunger_recovery):
+        self.name = name
+        self.value = value
         self.heal_amount = heal_amount
         self.stamina_recovery = stamina_recovery
         self.hunger_recovery = hunger_recovery
 
+    @classmethod
+    def get(cls, name, value, heal_amount, stamina_recovery, hunger_recovery):
+        """Retourne le type de fruit partagé correspondant à ces caractéristiques"""
+        key = (name, value, heal_amount, stamina_recovery, hunger_recovery)
+        kind = cls._registry.get(key)
+        if kind is None:
+            kind = cls._registry[key] = cls(*key)
+        return kind
+
+    def __reduce__(self):
+        # Désérialiser vers le type partagé existant plutôt qu'une copie
+        return FruitKind.get, (self.name, self.value, self.heal_amount, self.stamina_recovery, self.hunger_recovery)
+
+class Fruit(Resource):
+    __slots__ = ("kind",)
+
+    KIND = FruitKind.get("Fruit", FRUIT_VALUE, FRUIT_HEAL_AMOUNT, FRUIT_STAMINA_RECOVERY, FRUIT_HUNGER_RECOVERY)
+
+    def __init__(self, name="Fruit", value=FRUIT_VALUE, heal_amount=FRUIT_HEAL_AMOUNT, stamina_recovery=FRUIT_STAMINA_RECOVERY, hunger_recovery=FRUIT_HUNGER_RECOVERY, position=None):
+        # Les caractéristiques sont partagées via FruitKind au lieu d'être copiées sur chaque fruit
+        self.kind = FruitKind.get(name, value, heal_amount, stamina_recovery, hunger_recovery)
+        self.position = position
+
+    # Accès en lecture aux caractéristiques du type de fruit
+    name = property(lambda self: self.kind.name)
+    value = property(lambda self: self.kind.value)
+    heal_amount = property(lambda self: self.kind.heal_amount)
+    stamina_recovery = property(lambda self: self.kind.stamina_recovery)
+    hunger_recovery = property(lambda self: self.kind.hunger_recovery)
+
+    def __getstate__(self):
+        # name et value sont lus depuis le type de fruit : seuls kind et position sont sérialisés
+        return None, {"kind": self.kind, "position": self.position}
+
     def consume(self, animal):
         """L'animal consomme le fruit et récupère des points de vie, de stamina et de faim"""
-        hp_recovered = animal.heal(self.heal_amount)
-        stamina_recovered = animal.recover_stamina(self.stamina_recovery)
-        hunger_recovered = animal.recover_hunger(self.hunger_recovery)
+        kind = self.kind
+        hp_recovered = animal.heal(kind.heal_amount)
+        stamina_recovered = animal.recover_stamina(kind.stamina_recovery)
+        hunger_recovered = animal.recover_hunger(kind.hunger_recovery)
         return hp_recovered, stamina_recovered, hunger_recovered
 
 class GreenFruit(Fruit):
+    __slots__ = ()
+
+    KIND = FruitKind.get(
+        name="GreenFruit",
+        value=FRUIT_VALUE,
+        heal_amount=GREEN_FRUIT_HEAL_AMOUNT,
+        stamina_recovery=GREEN_FRUIT_STAMINA_RECOVERY,
+        hunger_recovery=GREEN_FRUIT_HUNGER_RECOVERY
+    )
+
     def __init__(self, position=None):
-        super().__init__(
-            name="GreenFruit", 
-            value=FRUIT_VALUE, 
-            heal_amount=GREEN_FRUIT_HEAL_AMOUNT,
-            stamina_recovery=GREEN_FRUIT_STAMINA_RECOVERY,
-            hunger_recovery=GREEN_FRUIT_HUNGER_RECOVERY,
-            position=position
-        )
+        self.kind = self.KIND
+        self.position = position
 
 class RedFruit(Fruit):
+    __slots__ = ()
+
+    KIND = FruitKind.get(
+        name="RedFruit",
+        value=FRUIT_VALUE,
+        heal_amount=RED_FRUIT_HEAL_AMOUNT,
+        stamina_recovery=RED_FRUIT_STAMINA_RECOVERY,
+        hunger_recovery=RED_FRUIT_HUNGER_RECOVERY
+    )
+
     def __init__(self, position=None):
-        super().__init__(
-            name="RedFruit", 
-            value=FRUIT_VALUE, 
-            heal_amount=RED_FRUIT_HEAL_AMOUNT,
-            stamina_recovery=RED_FRUIT_STAMINA_RECOVERY,
-            hunger_recovery=RED_FRUIT_HUNGER_RECOVERY,
-            position=position
-        ) 
\ No newline at end of file
+        self.kind = self.KIND
+        self.position = position
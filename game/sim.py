@@ -0,0 +1,332 @@
+"""
+Simulation de parties sans interface graphique.
+
+Ce module permet de jouer un grand nombre de parties complètes entre deux
+configurations d'animaux (builds) afin d'équilibrer les statistiques. Les
+règles utilisées sont exactement celles de Game.play_turn : seules les
+décisions des animaux sont confiées à des politiques interchangeables.
+"""
+import random
+
+from game.game import Game
+from game.animal import Animal
+from game.resources import GreenFruit, RedFruit
+from game.config import (
+    HP_CONVERSION, STAMINA_CONVERSION, SPEED_CONVERSION,
+    TEETH_CONVERSION, CLAWS_CONVERSION, SKIN_CONVERSION, HEIGHT_CONVERSION,
+    HP_MIN, STAMINA_MIN, SPEED_MIN, TEETH_MIN, CLAWS_MIN, SKIN_MIN, HEIGHT_MIN,
+    BITE_DAMAGE, TEETH_DAMAGE_BONUS, SLAP_DAMAGE, CLAWS_DAMAGE_BONUS,
+    TERRAIN_WIDTH, TERRAIN_HEIGHT
+)
+
+# Nombre maximal de tours joués avant de déclarer un match nul
+MAX_TURNS = 500
+
+# Seuil de soif en dessous duquel un animal cherche à boire
+THIRST_THRESHOLD = 40
+
+# Builds des animaux pré-configurés (points bruts, comme dans l'écran de configuration)
+LION_BUILD = {
+    "hp": HP_MIN * HP_CONVERSION + 6,
+    "stamina": STAMINA_MIN * STAMINA_CONVERSION + 5,
+    "speed": SPEED_MIN * SPEED_CONVERSION + 5,
+    "teeth": TEETH_MIN * TEETH_CONVERSION + 12,
+    "claws": CLAWS_MIN * CLAWS_CONVERSION + 3,
+    "skin": SKIN_MIN * SKIN_CONVERSION + 3,
+    "height": HEIGHT_MIN * HEIGHT_CONVERSION + 10
+}
+
+TIGER_BUILD = {
+    "hp": HP_MIN * HP_CONVERSION + 4,
+    "stamina": STAMINA_MIN * STAMINA_CONVERSION + 10,
+    "speed": SPEED_MIN * SPEED_CONVERSION + 10,
+    "teeth": TEETH_MIN * TEETH_CONVERSION + 3,
+    "claws": CLAWS_MIN * CLAWS_CONVERSION + 12,
+    "skin": SKIN_MIN * SKIN_CONVERSION + 9,
+    "height": HEIGHT_MIN * HEIGHT_CONVERSION + 6
+}
+
+
+def create_animal(name, build, position):
+    """Crée un animal à partir d'un build en points bruts
+
+    Args:
+        name: Nom de l'animal
+        build: Dictionnaire des points bruts (hp, stamina, speed, teeth, claws, skin, height)
+        position: Position de départ de l'animal
+
+    Returns:
+        Animal: L'animal créé
+    """
+    return Animal(
+        name,
+        hp=build["hp"] // HP_CONVERSION,
+        stamina=build["stamina"] // STAMINA_CONVERSION,
+        speed=build["speed"] // SPEED_CONVERSION,
+        position=position,
+        teeth=build["teeth"] // TEETH_CONVERSION,
+        claws=build["claws"] // CLAWS_CONVERSION,
+        skin=build["skin"] // SKIN_CONVERSION,
+        height=build["height"] // HEIGHT_CONVERSION
+    )
+
+
+def create_match(build_a, build_b, seed=None, width=TERRAIN_WIDTH, height=TERRAIN_HEIGHT,
+                 terrain_backend=Game.TERRAIN_OBJECTS, names=("A", "B")):
+    """Prépare une partie entre deux builds, sans affichage
+
+    Args:
+        build_a: Build du premier animal
+        build_b: Build du second animal
+        seed: Graine de la partie (terrain, fruits, esquives)
+        width: Largeur de la carte
+        height: Hauteur de la carte
+        terrain_backend: Représentation du terrain (Game.TERRAIN_OBJECTS ou Game.TERRAIN_ARRAY)
+        names: Noms des deux animaux
+
+    Returns:
+        tuple: (game, animal_a, animal_b)
+    """
+    game = Game(width, height, verbose=False, scheduler=Game.SCHEDULER_EVENT,
+                terrain_backend=terrain_backend, seed=seed)
+    terrain = game.terrain
+
+    # Coins opposés de la carte (cases 1 et 100 sur la carte 10x10, comme le Lion et le Tigre)
+    start_a, start_b = terrain.start_positions
+    animal_a = create_animal(names[0], build_a, start_a)
+    animal_b = create_animal(names[1], build_b, start_b)
+    game.add_animal(animal_a, start_a)
+    game.add_animal(animal_b, start_b)
+
+    # Un fruit sur chaque verger au départ, comme dans GUI.setup_game
+    for pos in terrain.green_fruit_positions:
+        game.add_resource(GreenFruit(position=pos), pos)
+    for pos in terrain.red_fruit_positions:
+        game.add_resource(RedFruit(position=pos), pos)
+
+    return game, animal_a, animal_b
+
+
+def random_policy(game, animal, rng):
+    """Politique aléatoire : choisit uniformément parmi toutes les actions possibles
+
+    Args:
+        game: Instance de Game
+        animal: Animal qui doit jouer
+        rng: Générateur aléatoire (random.Random)
+
+    Returns:
+        tuple: (action, cible) à passer à Game.play_turn, ou ("wait", None)
+    """
+    choices = []
+    for action, targets in game.get_animal_possible_actions(animal).items():
+        for target in targets:
+            choices.append((action, target))
+    if not choices:
+        return "wait", None
+    return rng.choice(choices)
+
+
+def aggressive_policy(game, animal, rng):
+    """Politique agressive : attaque dès que possible, boit si nécessaire, sinon se rapproche
+
+    Args:
+        game: Instance de Game
+        animal: Animal qui doit jouer
+        rng: Générateur aléatoire (random.Random)
+
+    Returns:
+        tuple: (action, cible) à passer à Game.play_turn, ou ("wait", None)
+    """
+    actions = game.get_animal_possible_actions(animal)
+
+    # Attaquer avec l'action qui fait le plus de dégâts
+    bite_damage = BITE_DAMAGE + animal.teeth * TEETH_DAMAGE_BONUS
+    slap_damage = SLAP_DAMAGE + animal.claws * CLAWS_DAMAGE_BONUS
+    if "bite" in actions or "slap" in actions:
+        target = (actions.get("bite") or actions["slap"])[0]
+        if "bite" in actions and ("slap" not in actions or bite_damage >= slap_damage - target.skin):
+            return "bite", target
+        return "slap", target
+
+    # Boire si l'animal a soif
+    if "drink" in actions and animal.thirst < THIRST_THRESHOLD:
+        return "drink", actions["drink"][0]
+
+    # Se rapprocher de l'ennemi le plus proche
+    moves = actions.get("walk", [])
+    if not moves:
+        return "wait", None
+    enemies = [a for a in game.animals if a is not animal and a.is_alive]
+    if not enemies:
+        return "walk", rng.choice(moves)
+
+    terrain = game.terrain
+
+    def distance_to_enemy(position):
+        x, y = terrain.position_to_coordinates(position)
+        best = None
+        for enemy in enemies:
+            ex, ey = terrain.position_to_coordinates(enemy.position)
+            distance = abs(ex - x) + abs(ey - y)
+            if best is None or distance < best:
+                best = distance
+        return best
+
+    best_distance = min(distance_to_enemy(position) for position in moves)
+    best_moves = [position for position in moves if distance_to_enemy(position) == best_distance]
+    return "walk", rng.choice(best_moves)
+
+
+def play_match(build_a, build_b, policy_a=aggressive_policy, policy_b=aggressive_policy,
+               seed=None, max_turns=MAX_TURNS):
+    """Joue une partie complète entre deux builds
+
+    Une même graine rejoue exactement la même partie, quel que soit le
+    processus ou le thread qui l'exécute.
+
+    Args:
+        build_a: Build du premier animal
+        build_b: Build du second animal
+        policy_a: Politique du premier animal
+        policy_b: Politique du second animal
+        seed: Graine de la partie (None pour une partie aléatoire)
+        max_turns: Nombre maximal de tours avant un match nul
+
+    Returns:
+        tuple: (vainqueur, nombre de tours) où vainqueur vaut "a", "b" ou None (match nul)
+    """
+    # Les politiques ont leur propre flux, distinct de celui des règles du jeu
+    rng = random.Random() if seed is None else random.Random(f"{seed}:policy")
+
+    game, animal_a, animal_b = create_match(build_a, build_b, seed)
+    policies = {id(animal_a): policy_a, id(animal_b): policy_b}
+
+    turns = 0
+    while not game.game_over and turns < max_turns:
+        animal = game.get_next_animal_to_play()
+        if animal is None:
+            continue
+
+        action, target = policies[id(animal)](game, animal, rng)
+        if target is None:
+            game.play_turn(animal, action)
+        else:
+            game.play_turn(animal, action, target)
+        turns += 1
+
+    if game.winner is animal_a:
+        return "a", turns
+    if game.winner is animal_b:
+        return "b", turns
+    return None, turns
+
+
+def watch_match(build_a, build_b, policy_a=aggressive_policy, policy_b=aggressive_policy,
+                seed=None, speed=1):
+    """Affiche une partie entre deux politiques dans l'interface graphique
+
+    La partie avance au rythme de l'horloge de simulation de l'interface
+    (vitesse x1, x10 ou illimitée, modifiable avec les touches 1, 2 et 3).
+
+    Args:
+        build_a: Build du Lion
+        build_b: Build du Tigre
+        policy_a: Politique du Lion
+        policy_b: Politique du Tigre
+        seed: Graine de la partie (None pour une partie aléatoire)
+        speed: Vitesse initiale de la simulation (1, 10 ou None pour illimitée)
+    """
+    # Import local : les simulations sans affichage n'ont pas besoin de pygame
+    from ui.gui import GUI
+
+    game, animal_a, animal_b = create_match(build_a, build_b, seed, names=("Lion", "Tiger"))
+    # Un tick de vitesse par tick de simulation, pour que la partie se déroule à l'écran
+    game.scheduler = Game.SCHEDULER_TICK
+    gui = GUI(game, policies={animal_a: policy_a, animal_b: policy_b}, speed=speed)
+    if seed is not None:
+        gui.policy_rng = random.Random(f"{seed}:policy")
+    gui.run()
+
+
+def run_matches(n, build_a, build_b, seed=None, policy_a=aggressive_policy, policy_b=aggressive_policy,
+                max_turns=MAX_TURNS):
+    """Joue n parties entre deux builds et agrège les résultats
+
+    Args:
+        n: Nombre de parties à jouer
+        build_a: Build du premier animal
+        build_b: Build du second animal
+        seed: Graine pour rendre la série de parties reproductible
+        policy_a: Politique du premier animal
+        policy_b: Politique du second animal
+        max_turns: Nombre maximal de tours par partie
+
+    Returns:
+        dict: Résultats agrégés (victoires, matchs nuls, taux de victoire, tours moyens)
+    """
+    # Chaque partie reçoit sa propre graine, tirée d'un flux dérivé de `seed`
+    rng = random.Random(seed)
+
+    wins_a = 0
+    wins_b = 0
+    draws = 0
+    total_turns = 0
+
+    for _ in range(n):
+        winner, turns = play_match(build_a, build_b, policy_a, policy_b, rng.getrandbits(64), max_turns)
+        if winner == "a":
+            wins_a += 1
+        elif winner == "b":
+            wins_b += 1
+        else:
+            draws += 1
+        total_turns += turns
+
+    return {
+        "matches": n,
+        "wins_a": wins_a,
+        "wins_b": wins_b,
+        "draws": draws,
+        "win_rate_a": wins_a / n if n else 0.0,
+        "win_rate_b": wins_b / n if n else 0.0,
+        "avg_turns": total_turns / n if n else 0.0
+    }
+
+
+def main():
+    """Point d'entrée en ligne de commande : python -m game.sim"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Simulation de parties sans interface graphique")
+    parser.add_argument("--matches", type=int, default=1000, help="Nombre de parties à jouer (par défaut: 1000)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine aléatoire pour des résultats reproductibles")
+    parser.add_argument("--policy", choices=["aggressive", "random"], default="aggressive",
+                        help="Politique utilisée par les deux animaux (par défaut: aggressive)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Afficher une seule partie dans l'interface graphique au lieu de simuler")
+    parser.add_argument("--speed", choices=["1", "10", "max"], default="1",
+                        help="Vitesse de simulation de --watch (par défaut: 1)")
+    args = parser.parse_args()
+
+    policy = aggressive_policy if args.policy == "aggressive" else random_policy
+    if args.watch:
+        watch_match(LION_BUILD, TIGER_BUILD, policy, policy, args.seed,
+                    None if args.speed == "max" else int(args.speed))
+        return
+
+    start_time = time.perf_counter()
+    results = run_matches(args.matches, LION_BUILD, TIGER_BUILD, args.seed, policy, policy)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Lion contre Tigre sur {results['matches']} parties:")
+    print(f"- Victoires du Lion: {results['wins_a']} ({results['win_rate_a']:.1%})")
+    print(f"- Victoires du Tigre: {results['wins_b']} ({results['win_rate_b']:.1%})")
+    print(f"- Matchs nuls: {results['draws']}")
+    print(f"- Tours moyens: {results['avg_turns']:.1f}")
+    print(f"Durée: {elapsed:.2f} s ({results['matches'] / elapsed * 60:.0f} parties/minute)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,33 @@
 Module définissant la classe Square (case du terrain)
 """
 from game.config import (
-    TERRAIN_WIDTH, TERRAIN_HEIGHT,
+    TERRAIN_WIDTH,
     SQUARE_SPEED, SQUARE_FRUIT_PROBABILITY, SQUARE_INITIAL_SPEED_POINTS,
     WATER_THIRST_RECOVERY
 )
+from game.resources import GreenFruit, RedFruit
+import math
 import random
 
 class Square:
     """Représente une case du terrain de jeu"""
     
+    # Attributs fixes : pas de __dict__ par case (grandes cartes, nombreuses parties)
+    __slots__ = ("x", "y", "position", "terrain_type", "animal", "resource", "speed", "speed_points", "is_orchard")
+    
     # Types de terrain possibles
     TYPE_NORMAL = "normal"  # Terrain normal
     TYPE_WATER = "water"    # Eau (pourrait ralentir les animaux)
     TYPE_FOREST = "forest"  # Forêt (pourrait cacher les animaux)
     TYPE_MOUNTAIN = "mountain"  # Montagne (pourrait être infranchissable)
     
-    def __init__(self, x, y, terrain_type=TYPE_NORMAL, is_orchard=False):
+    # Types de terrain infranchissables
+    IMPASSABLE_TYPES = (TYPE_WATER, TYPE_MOUNTAIN)
+    
+    # Probabilité qu'un verger prêt génère un fruit à chaque tick
+    FRUIT_PROBABILITY = SQUARE_FRUIT_PROBABILITY
+    
+    def __init__(self, x, y, terrain_type=TYPE_NORMAL, is_orchard=False, width=TERRAIN_WIDTH):
         """Initialise une case du terrain
         
         Args:
@@ -25,9 +36,11 @@ class Square:
             y: Coordonnée y de la case
             terrain_type: Type de terrain (normal, eau, forêt, montagne)
             is_orchard: Si True, la case peut produire des fruits
+            width: Largeur du terrain auquel appartient la case
         """
         self.x = x
         self.y = y
+        self.position = y * width + x + 1  # Position de la case (1 à width*height)
         self.terrain_type = terrain_type
         self.animal = None  # Animal présent sur la case
         self.resource = None  # Ressource présente sur la case
@@ -36,9 +49,9 @@ class Square:
         self.is_orchard = is_orchard  # Si True, la case peut produire des fruits
         
     @property
-    def position(self):
-        """Retourne la position de la case (1-100)"""
-        return self.y * TERRAIN_WIDTH + self.x + 1
+    def is_passable(self):
+        """Vérifie si le type de terrain permet d'entrer sur la case"""
+        return self.terrain_type not in self.IMPASSABLE_TYPES
         
     @property
     def is_occupied(self):
@@ -179,18 +192,42 @@ class Square:
         # Vérifier si la case a atteint 100 points
         return self.speed_points >= 100
     
-    def try_generate_fruit(self, fruit_class):
+    def advance_speed_points(self, ticks):
+        """Ajoute en une fois les points de vitesse de plusieurs ticks
+        
+        Équivaut à appeler add_speed_points `ticks` fois de suite.
+        
+        Args:
+            ticks: Nombre de ticks écoulés
+            
+        Returns:
+            int: Nombre de ticks pendant lesquels la case était prête (100 points ou plus)
+        """
+        if self.speed_points >= 100:
+            return ticks
+        if self.speed <= 0:
+            return 0
+            
+        # Nombre de ticks nécessaires pour atteindre 100 points
+        ticks_to_ready = math.ceil((100 - self.speed_points) / self.speed)
+        if ticks_to_ready > ticks:
+            self.speed_points += self.speed * ticks
+            return 0
+            
+        self.speed_points += self.speed * ticks_to_ready
+        return ticks - ticks_to_ready + 1
+    
+    def try_generate_fruit(self, fruit_class, verbose=True, trials=1, rng=random):
         """Essaie de générer un fruit sur la case
         
         Args:
             fruit_class: Classe de fruit à générer
-            
+            verbose: Si False, n'affiche pas de message lors de la génération
+            trials: Nombre de ticks d'essai regroupés en un seul tirage
+            rng: Générateur aléatoire à utiliser (celui du terrain en jeu)
         Returns:
             bool: True si un fruit a été généré, False sinon
         """
-        import random
-        from game.resources import GreenFruit, RedFruit
-        
         # Vérifier si la case est un verger
         if not self.is_orchard:
             return False
@@ -199,17 +236,23 @@ class Square:
         if self.is_occupied or self.has_resource:
             return False
             
-        # Générer un fruit avec une certaine probabilité
-        if random.random() < 0.05:  # 5% de chance
+        # Générer un fruit avec une certaine probabilité (5% de chance par tick)
+        if trials == 1:
+            probability = self.FRUIT_PROBABILITY
+        else:
+            # Probabilité qu'au moins un des essais réussisse
+            probability = 1 - (1 - self.FRUIT_PROBABILITY) ** trials
+        if rng.random() < probability:
             # Choisir aléatoirement entre un fruit vert et un fruit rouge
-            if random.choice([True, False]):
+            if rng.choice([True, False]):
                 fruit = GreenFruit(position=self.position)
             else:
                 fruit = RedFruit(position=self.position)
                 
             # Placer le fruit sur la case
             if self.place_resource(fruit):
-                print(f"Fruit généré à la position {self.position}!")
+                if verbose:
+                    print(f"Fruit généré à la position {self.position}!")
                 return True
             
         return False
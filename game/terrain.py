@@ -1,80 +1,272 @@
-from game.config import TERRAIN_WIDTH, TERRAIN_HEIGHT, GREEN_FRUIT_POSITIONS, RED_FRUIT_POSITIONS, LION_START_POSITION, TIGER_START_POSITION
+from game.config import TERRAIN_WIDTH, TERRAIN_HEIGHT, GREEN_FRUIT_POSITIONS, RED_FRUIT_POSITIONS, LAYOUT_BLOCK_SIZE
 from game.square import Square
+import random
+
+# Position des vergers dans un bloc du motif, déduite de la carte d'origine
+GREEN_ORCHARD_OFFSETS = [((p - 1) % LAYOUT_BLOCK_SIZE, (p - 1) // LAYOUT_BLOCK_SIZE) for p in GREEN_FRUIT_POSITIONS]
+RED_ORCHARD_OFFSETS = [((p - 1) % LAYOUT_BLOCK_SIZE, (p - 1) // LAYOUT_BLOCK_SIZE) for p in RED_FRUIT_POSITIONS]
+
+# Tables de voisinage partagées entre les terrains de mêmes dimensions
+# {(width, height): (adjacent_table, move_table, ring_tables)}
+_NEIGHBOUR_TABLES = {}
 
 class Terrain:
-    def __init__(self, width=TERRAIN_WIDTH, height=TERRAIN_HEIGHT):
+    def __init__(self, width=TERRAIN_WIDTH, height=TERRAIN_HEIGHT, verbose=True, rng=None):
         self.width = width
         self.height = height
+        self.verbose = verbose  # Si False, aucun message n'est affiché (simulations)
+        # Générateur aléatoire propre à la partie (eau, fruits, esquives)
+        self.rng = rng if rng is not None else random.Random()
         # Initialiser la grille avec des objets Square
-        self.grid = [[Square(x, y) for x in range(width)] for y in range(height)]
+        self.grid = self.create_grid()
         # Garder ces dictionnaires pour un accès rapide
         self.resources = {}  # {position: Resource}
         self.animals = {}  # {position: Animal}
+        # Version du terrain : incrémentée à chaque déplacement, ressource ou changement de case
+        self.version = 0
+        # Index des cases actives (vergers et cases sous 100 points de vitesse) :
+        # seules ces cases sont parcourues par update_squares
+        self.active_squares = {}  # {position: Square}
+        self._active_order = None  # Cache des cases actives triées par position
+        
+        # Tables de voisinage précalculées, indexées par position (l'index 0 est inutilisé)
+        self.build_neighbour_tables()
+        
+        # Disposer les vergers et l'eau selon le motif de la carte
+        self.initialize_layout()
+        
+        # Construire l'index des cases actives
+        self.refresh_active_squares()
+
+    def layout_blocks(self):
+        """Retourne l'origine (x, y) de chaque bloc du motif qui tient entièrement dans la carte
+        
+        La carte d'origine (10x10) est un seul bloc ; les cartes plus grandes
+        répètent le motif en mosaïque, les bandes restantes restant en terrain normal.
+        """
+        return [
+            (block_x, block_y)
+            for block_y in range(0, self.height - LAYOUT_BLOCK_SIZE + 1, LAYOUT_BLOCK_SIZE)
+            for block_x in range(0, self.width - LAYOUT_BLOCK_SIZE + 1, LAYOUT_BLOCK_SIZE)
+        ]
+
+    def initialize_layout(self):
+        """Place les vergers et les tuiles d'eau de chaque bloc du motif
+        
+        Les positions de départ (première et dernière case) et des vergers sont
+        exposées via start_positions, green_fruit_positions et red_fruit_positions.
+        """
+        self.start_positions = [1, self.width * self.height]
+        self.green_fruit_positions = []
+        self.red_fruit_positions = []
+        for block_x, block_y in self.layout_blocks():
+            for dx, dy in GREEN_ORCHARD_OFFSETS:
+                self.green_fruit_positions.append(self.coordinates_to_position(block_x + dx, block_y + dy))
+            for dx, dy in RED_ORCHARD_OFFSETS:
+                self.red_fruit_positions.append(self.coordinates_to_position(block_x + dx, block_y + dy))
         
         # Marquer les cases qui peuvent produire des fruits (vergers)
-        for position in GREEN_FRUIT_POSITIONS:
-            square = self.get_square(position)
-            if square:
-                square.is_orchard = True
-        for position in RED_FRUIT_POSITIONS:
+        for position in self.green_fruit_positions + self.red_fruit_positions:
             square = self.get_square(position)
             if square:
                 square.is_orchard = True
         
-        # Initialiser les tuiles d'eau dans le carré central
+        # Initialiser les tuiles d'eau dans le carré central de chaque bloc
         self.initialize_water_tiles()
 
     def initialize_water_tiles(self):
-        """Initialise les tuiles d'eau uniquement sur les bords du carré central de 6x6, des cases 23 à 78"""
-        import random
-        
-        # Définir les limites du carré central (6x6)
-        start_row = 2  # Ligne 2 (position 21-30)
-        end_row = 7    # Ligne 7 (position 71-80)
-        start_col = 2  # Colonne 2 (positions 3, 13, 23, etc.)
-        end_col = 7    # Colonne 7 (positions 8, 18, 28, etc.)
+        """Initialise les tuiles d'eau sur les bords du carré central de 6x6 de chaque bloc
         
-        # Nombre de tuiles d'eau à créer (environ 20% du carré central)
-        num_water_tiles = 10  # Augmenté pour avoir plus de tuiles d'eau sur les bords
+        Sur la carte 10x10, il s'agit du carré des cases 23 à 78.
+        """
+        rng = self.rng
         
         # Positions à éviter (positions de départ des animaux et positions des fruits)
-        avoid_positions = [LION_START_POSITION, TIGER_START_POSITION] + GREEN_FRUIT_POSITIONS + RED_FRUIT_POSITIONS
-        
-        # Créer les tuiles d'eau uniquement sur les bords du carré central
-        water_tiles_created = 0
-        while water_tiles_created < num_water_tiles:
-            # Choisir une position aléatoire sur les bords du carré central
-            # Pour cela, on choisit d'abord si on veut une position sur un bord horizontal ou vertical
-            if random.choice([True, False]):
-                # Bord horizontal (haut ou bas)
-                row = random.choice([start_row, end_row])
-                col = random.randint(start_col, end_col)
-            else:
-                # Bord vertical (gauche ou droite)
-                row = random.randint(start_row, end_row)
-                col = random.choice([start_col, end_col])
+        avoid_positions = set(self.start_positions + self.green_fruit_positions + self.red_fruit_positions)
+        
+        for block_x, block_y in self.layout_blocks():
+            # Définir les limites du carré central (6x6) du bloc
+            start_row = block_y + 2  # Ligne 2 (position 21-30 sur la carte 10x10)
+            end_row = block_y + 7    # Ligne 7 (position 71-80)
+            start_col = block_x + 2  # Colonne 2 (positions 3, 13, 23, etc.)
+            end_col = block_x + 7    # Colonne 7 (positions 8, 18, 28, etc.)
             
-            position = self.coordinates_to_position(col, row)
+            # Nombre de tuiles d'eau à créer (environ 20% du carré central)
+            num_water_tiles = 10  # Augmenté pour avoir plus de tuiles d'eau sur les bords
             
-            # Vérifier que la position n'est pas à éviter
-            if position not in avoid_positions:
-                square = self.get_square(position)
-                if square and square.terrain_type == Square.TYPE_NORMAL:
-                    # Définir la case comme une tuile d'eau
-                    square.terrain_type = Square.TYPE_WATER
-                    water_tiles_created += 1
-                    # Ajouter la position à la liste des positions à éviter pour éviter les doublons
-                    avoid_positions.append(position)
+            # Créer les tuiles d'eau uniquement sur les bords du carré central
+            water_tiles_created = 0
+            while water_tiles_created < num_water_tiles:
+                # Choisir une position aléatoire sur les bords du carré central
+                # Pour cela, on choisit d'abord si on veut une position sur un bord horizontal ou vertical
+                if rng.choice([True, False]):
+                    # Bord horizontal (haut ou bas)
+                    row = rng.choice([start_row, end_row])
+                    col = rng.randint(start_col, end_col)
+                else:
+                    # Bord vertical (gauche ou droite)
+                    row = rng.randint(start_row, end_row)
+                    col = rng.choice([start_col, end_col])
+                
+                position = self.coordinates_to_position(col, row)
+                
+                # Vérifier que la position n'est pas à éviter
+                if position not in avoid_positions:
+                    square = self.get_square(position)
+                    if square and square.terrain_type == Square.TYPE_NORMAL:
+                        # Définir la case comme une tuile d'eau
+                        self.set_terrain_type(position, Square.TYPE_WATER)
+                        water_tiles_created += 1
+                        # Ajouter la position à l'ensemble des positions à éviter pour éviter les doublons
+                        avoid_positions.add(position)
+
+    def create_grid(self):
+        """Crée la grille de cases du terrain
+        
+        Les sous-classes peuvent la remplacer par une autre représentation
+        (voir game.array_terrain.ArrayTerrain).
+        
+        Returns:
+            list: Grille de cases indexée par [y][x]
+        """
+        return [[Square(x, y, width=self.width) for x in range(self.width)] for y in range(self.height)]
+
+    def build_neighbour_tables(self):
+        """Précalcule les voisins de chaque position
+        
+        - adjacent_table: voisins dans l'ordre haut, bas, gauche, droite (get_adjacent_positions)
+        - move_table: voisins dans l'ordre haut, droite, bas, gauche (get_valid_moves)
+        Les anneaux de distance > 1 sont calculés à la demande par get_ring_positions.
+        Les tables ne dépendent que des dimensions : elles sont partagées entre terrains.
+        """
+        self._passable_move_table = None  # Voisins franchissables, reconstruit à la demande
+        
+        tables = _NEIGHBOUR_TABLES.get((self.width, self.height))
+        if tables is not None:
+            self.adjacent_table, self.move_table, self.ring_tables = tables
+            return
+        
+        size = self.width * self.height
+        self.adjacent_table = [()] * (size + 1)
+        self.move_table = [()] * (size + 1)
+        for position in range(1, size + 1):
+            x, y = self.position_to_coordinates(position)
+            for table, directions in (
+                (self.adjacent_table, [(0, -1), (0, 1), (-1, 0), (1, 0)]),  # Haut, Bas, Gauche, Droite
+                (self.move_table, [(0, -1), (1, 0), (0, 1), (-1, 0)])       # Haut, Droite, Bas, Gauche
+            ):
+                neighbours = []
+                for dx, dy in directions:
+                    new_x, new_y = x + dx, y + dy
+                    if 0 <= new_x < self.width and 0 <= new_y < self.height:
+                        neighbours.append(self.coordinates_to_position(new_x, new_y))
+                table[position] = tuple(neighbours)
+        self.ring_tables = {1: self.move_table}  # {distance: table des positions à cette distance}
+        _NEIGHBOUR_TABLES[(self.width, self.height)] = (self.adjacent_table, self.move_table, self.ring_tables)
+
+    def get_ring_positions(self, position, distance):
+        """Retourne les positions en ligne droite à exactement `distance` cases
+        
+        Args:
+            position: Position de départ (valide)
+            distance: Distance de Manhattan (1 ou plus)
+            
+        Returns:
+            tuple: Positions dans l'ordre historique de get_valid_moves
+        """
+        table = self.ring_tables.get(distance)
+        if table is None:
+            size = self.width * self.height
+            table = [()] * (size + 1)
+            # Même ordre que l'ancien parcours dx puis dy : gauche, haut, bas, droite
+            offsets = [(-distance, 0), (0, -distance), (0, distance), (distance, 0)]
+            for pos in range(1, size + 1):
+                x, y = self.position_to_coordinates(pos)
+                ring = []
+                for dx, dy in offsets:
+                    new_x, new_y = x + dx, y + dy
+                    if 0 <= new_x < self.width and 0 <= new_y < self.height:
+                        ring.append(self.coordinates_to_position(new_x, new_y))
+                table[pos] = tuple(ring)
+            self.ring_tables[distance] = table
+        return table[position]
+
+    def get_passable_moves(self, position):
+        """Retourne les voisins franchissables (ni eau ni montagne), sans tenir compte des animaux
+        
+        Args:
+            position: Position de départ (valide)
+            
+        Returns:
+            tuple: Voisins dans l'ordre haut, droite, bas, gauche
+        """
+        if self._passable_move_table is None:
+            passable = [False] * len(self.move_table)
+            for row in self.grid:
+                for square in row:
+                    passable[self.coordinates_to_position(square.x, square.y)] = square.is_passable
+            self._passable_move_table = [
+                tuple(neighbour for neighbour in neighbours if passable[neighbour])
+                for neighbours in self.move_table
+            ]
+        return self._passable_move_table[position]
+
+    def invalidate_passable_moves(self):
+        """Invalide la table des voisins franchissables
+        
+        À appeler après une modification directe du type de terrain des cases
+        (set_terrain_type s'en charge automatiquement).
+        """
+        self._passable_move_table = None
+
+    def is_square_active(self, square):
+        """Indique si une case doit être mise à jour à chaque tick
+        
+        Args:
+            square: Case à tester
+            
+        Returns:
+            bool: True si la case est un verger ou n'a pas encore 100 points de vitesse
+        """
+        return square.is_orchard or square.speed_points < 100
+
+    def mark_square_dirty(self, square):
+        """Réévalue l'appartenance d'une case à l'index des cases actives
+        
+        À appeler après toute modification des points de vitesse ou du statut
+        de verger d'une case.
+        
+        Args:
+            square: Case modifiée
+        """
+        position = self.coordinates_to_position(square.x, square.y)
+        if self.is_square_active(square):
+            if position not in self.active_squares:
+                self.active_squares[position] = square
+                self._active_order = None
+        elif position in self.active_squares:
+            del self.active_squares[position]
+            self._active_order = None
+
+    def refresh_active_squares(self):
+        """Reconstruit l'index des cases actives à partir de la grille complète
+        
+        À appeler après une modification directe des cases (ex: décodage d'un état réseau).
+        """
+        self.active_squares = {}
+        for row in self.grid:
+            for square in row:
+                if self.is_square_active(square):
+                    self.active_squares[self.coordinates_to_position(square.x, square.y)] = square
+        self._active_order = None
 
     def position_to_coordinates(self, position):
-        """Convertit une position (1-100) en coordonnées (x, y)"""
-        position -= 1  # Ajustement car les positions commencent à 1
-        x = position % self.width
-        y = position // self.width
+        """Convertit une position (1 à width*height) en coordonnées (x, y)"""
+        y, x = divmod(position - 1, self.width)  # Ajustement car les positions commencent à 1
         return x, y
 
     def coordinates_to_position(self, x, y):
-        """Convertit des coordonnées (x, y) en position (1-100)"""
+        """Convertit des coordonnées (x, y) en position (1 à width*height)"""
         return y * self.width + x + 1
     
     def get_square(self, position):
@@ -102,85 +294,50 @@ class Terrain:
         to_square = self.get_square(to_pos)
         if not to_square or not to_square.can_move_to(None):  # None sera remplacé par l'animal plus tard
             return False
-
-        from_x, from_y = self.position_to_coordinates(from_pos)
-        to_x, to_y = self.position_to_coordinates(to_pos)
-
-        # Calculer la distance de Manhattan
-        manhattan_distance = abs(to_x - from_x) + abs(to_y - from_y)
         
-        # Vérifier si le déplacement est horizontal ou vertical (pas de diagonale)
-        is_horizontal_or_vertical = (from_x == to_x) or (from_y == to_y)
-        
-        return manhattan_distance <= distance and is_horizontal_or_vertical
+        if not self.is_valid_position(from_pos):
+            return False
+        if to_pos == from_pos:
+            return True
+            
+        # Déplacement horizontal ou vertical d'au plus `distance` cases
+        for step in range(1, distance + 1):
+            if to_pos in self.get_ring_positions(from_pos, step):
+                return True
+        return False
 
     def is_adjacent(self, pos1, pos2):
         """Vérifie si deux positions sont adjacentes (sans diagonales)"""
         if not self.is_valid_position(pos1) or not self.is_valid_position(pos2):
             return False
             
-        pos1_x, pos1_y = self.position_to_coordinates(pos1)
-        pos2_x, pos2_y = self.position_to_coordinates(pos2)
-        
-        # Calculer la distance de Manhattan
-        manhattan_distance = abs(pos2_x - pos1_x) + abs(pos2_y - pos1_y)
-        
-        # Vérifier si les positions sont adjacentes horizontalement ou verticalement
-        return manhattan_distance == 1
+        return pos2 in self.adjacent_table[pos1]
 
     def get_adjacent_positions(self, position):
         """Retourne toutes les positions adjacentes à une position donnée"""
         if not self.is_valid_position(position):
             return []
             
-        x, y = self.position_to_coordinates(position)
-        adjacent_positions = []
-        
-        # Vérifier les quatre directions (haut, bas, gauche, droite)
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < self.width and 0 <= new_y < self.height:
-                new_position = self.coordinates_to_position(new_x, new_y)
-                adjacent_positions.append(new_position)
-                
-        return adjacent_positions
+        # Quatre directions (haut, bas, gauche, droite), précalculées
+        return list(self.adjacent_table[position])
 
     def get_valid_moves(self, position, distance=1):
         """Retourne toutes les positions valides où un animal peut se déplacer"""
         if not self.is_valid_position(position):
             return []
         
-        valid_moves = []
-        x, y = self.position_to_coordinates(position)
-        animal = self.get_animal_at(position)
-        
-        # Si distance = 1, on cherche les cases adjacentes (sans diagonales)
+        # Si distance = 1, seules les cases franchissables et libres sont retenues
         if distance == 1:
-            # Vérifier les 4 directions (horizontales et verticales uniquement)
-            for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:  # Haut, Droite, Bas, Gauche
-                new_x, new_y = x + dx, y + dy
-                if 0 <= new_x < self.width and 0 <= new_y < self.height:
-                    new_position = self.coordinates_to_position(new_x, new_y)
-                    square = self.get_square(new_position)
-                    if square and square.can_move_to(animal):
-                        valid_moves.append(new_position)
-        # Si distance > 1, on cherche les cases à exactement cette distance (sans diagonales)
-        else:
-            # Parcourir toutes les cases dans un carré de côté 2*distance+1
-            for dx in range(-distance, distance + 1):
-                for dy in range(-distance, distance + 1):
-                    # Calculer la distance de Manhattan
-                    manhattan_distance = abs(dx) + abs(dy)
-                    # Vérifier si la case est exactement à la distance spécifiée et n'est pas en diagonale
-                    if manhattan_distance == distance and (dx == 0 or dy == 0):
-                        new_x, new_y = x + dx, y + dy
-                        if 0 <= new_x < self.width and 0 <= new_y < self.height:
-                            new_position = self.coordinates_to_position(new_x, new_y)
-                            square = self.get_square(new_position)
-                            if square and square.can_move_to(animal):
-                                valid_moves.append(new_position)
+            return [new_position for new_position in self.get_passable_moves(position)
+                    if new_position not in self.animals]
         
+        # Si distance > 1, on cherche les cases à exactement cette distance (sans diagonales)
+        animal = self.get_animal_at(position)
+        valid_moves = []
+        for new_position in self.get_ring_positions(position, distance):
+            square = self.get_square(new_position)
+            if square and square.can_move_to(animal):
+                valid_moves.append(new_position)
         return valid_moves
 
     def place_animal(self, animal, position):
@@ -188,6 +345,7 @@ class Terrain:
         square = self.get_square(position)
         if square and square.place_animal(animal):
             self.animals[position] = animal
+            self.version += 1
             return True
         return False
 
@@ -195,6 +353,7 @@ class Terrain:
         """Déplace un animal sur le terrain"""
         # Vérifier si l'animal est bien à sa position actuelle
         if animal.position in self.animals and self.animals[animal.position] == animal:
+            self.version += 1
             old_position = animal.position
             old_square = self.get_square(old_position)
             new_square = self.get_square(new_position)
@@ -210,6 +369,8 @@ class Terrain:
                 
                 # Appliquer les effets de la nouvelle case
                 effects = new_square.on_enter(animal)
+                # Un fruit mangé remet les points de vitesse de la case à zéro
+                self.mark_square_dirty(new_square)
                 
                 return True, effects
             
@@ -225,6 +386,7 @@ class Terrain:
         square = self.get_square(position)
         if square and square.place_resource(resource):
             self.resources[position] = resource
+            self.version += 1
             return True
         return False
 
@@ -235,6 +397,8 @@ class Terrain:
             resource = square.remove_resource()
             if position in self.resources:
                 del self.resources[position]
+            self.mark_square_dirty(square)
+            self.version += 1
             return resource
         return None
 
@@ -255,6 +419,7 @@ class Terrain:
             if square:
                 square.remove_animal()
             del self.animals[animal.position]
+            self.version += 1
             return True
         return False
         
@@ -268,8 +433,6 @@ class Terrain:
         Returns:
             list: Liste des positions où des fruits ont été générés
         """
-        import random
-        
         new_fruit_positions = []
         
         for y in range(self.height):
@@ -280,7 +443,7 @@ class Terrain:
                 # Vérifier si la case est vide (pas d'animal ni de ressource)
                 if not square.is_occupied and not square.has_resource:
                     # Générer un fruit avec la probabilité donnée
-                    if random.random() < probability:
+                    if self.rng.random() < probability:
                         # Créer un nouveau fruit
                         fruit = fruit_class(position=position)
                         
@@ -289,6 +452,9 @@ class Terrain:
                             self.resources[position] = fruit
                             new_fruit_positions.append(position)
         
+        if new_fruit_positions:
+            self.version += 1
+        
         return new_fruit_positions
         
     def get_terrain_type_at(self, position):
@@ -300,16 +466,22 @@ class Terrain:
         """Définit le type de terrain à une position donnée"""
         square = self.get_square(position)
         if square:
+            was_passable = square.is_passable
             square.terrain_type = terrain_type
+            self.version += 1
+            # Les voisins franchissables ne changent que si la franchissabilité change
+            if square.is_passable != was_passable:
+                self.invalidate_passable_moves()
             return True
         return False
         
-    def update_squares(self, fruit_class, add_speed=True):
+    def update_squares(self, fruit_class, add_speed=True, ticks=1):
         """Met à jour les cases du terrain (points de vitesse, génération de fruits)
         
         Args:
             fruit_class: Classe de fruit à générer
             add_speed: Si True, ajoute des points de vitesse aux cases
+            ticks: Nombre de ticks de vitesse à appliquer en une seule passe
             
         Returns:
             list: Liste des positions où des fruits ont été générés
@@ -319,26 +491,40 @@ class Terrain:
         # Compter les cases qui ont atteint 100 points de vitesse
         ready_squares = 0
         
-        for y in range(self.height):
-            for x in range(self.width):
-                square = self.grid[y][x]
-                position = square.position
-                
-                # Ajouter des points de vitesse si demandé
-                if add_speed:
-                    square_ready = square.add_speed_points()
-                else:
-                    square_ready = square.speed_points >= 100
+        # Ne parcourir que les cases actives, dans l'ordre des positions pour
+        # que les tirages aléatoires restent reproductibles
+        if self._active_order is None:
+            self._active_order = [self.active_squares[position] for position in sorted(self.active_squares)]
+        
+        settled_squares = []
+        for square in self._active_order:
+            # Ajouter des points de vitesse si demandé (inutile si la case est déjà prête)
+            # ready_ticks compte les ticks pendant lesquels la case est prête
+            if add_speed and square.speed_points < 100:
+                ready_ticks = square.advance_speed_points(ticks)
+            else:
+                ready_ticks = ticks if square.speed_points >= 100 else 0
+            
+            # Si la case a atteint 100 points de vitesse
+            if ready_ticks:
+                ready_squares += 1
                 
-                # Si la case a atteint 100 points de vitesse
-                if square_ready:
-                    ready_squares += 1
-                    
-                    # Essayer de générer un fruit
-                    if square.try_generate_fruit(fruit_class):
+                # Essayer de générer un fruit (seuls les vergers peuvent en produire)
+                if square.is_orchard:
+                    if square.try_generate_fruit(fruit_class, self.verbose, ready_ticks, self.rng):
                         # Mettre à jour le dictionnaire des ressources
+                        position = square.position
                         self.resources[position] = square.resource
                         new_fruit_positions.append(position)
+                else:
+                    # Une case ordinaire prête n'a plus rien à faire jusqu'à sa prochaine remise à zéro
+                    settled_squares.append(square)
+        
+        for square in settled_squares:
+            self.mark_square_dirty(square)
+        
+        if new_fruit_positions:
+            self.version += 1
         
         # Afficher le nombre de cases prêtes à générer des fruits
         # if ready_squares > 0:
@@ -0,0 +1,202 @@
+"""
+Tournois multiprocessus entre builds d'animaux.
+
+Les builds couvrent l'espace des répartitions de MAX_POINTS entre les
+statistiques (hp, stamina, speed, teeth, claws, skin, height). Chaque paire de
+builds joue une série de parties headless (voir game.sim) ; les paires sont
+réparties en lots (shards) exécutés en parallèle sur tous les cœurs, et les
+résultats sont renvoyés au fur et à mesure que les lots se terminent.
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game.sim import run_matches, aggressive_policy, MAX_TURNS
+from game.config import (
+    MAX_POINTS,
+    HP_CONVERSION, STAMINA_CONVERSION, SPEED_CONVERSION,
+    TEETH_CONVERSION, CLAWS_CONVERSION, SKIN_CONVERSION, HEIGHT_CONVERSION,
+    HP_MIN, HP_MAX, STAMINA_MIN, STAMINA_MAX, SPEED_MIN, SPEED_MAX,
+    TEETH_MIN, TEETH_MAX, CLAWS_MIN, CLAWS_MAX, SKIN_MIN, SKIN_MAX,
+    HEIGHT_MIN, HEIGHT_MAX
+)
+
+# Ordre des statistiques et (conversion, min, max) pour chacune
+STATS = ["hp", "stamina", "speed", "teeth", "claws", "skin", "height"]
+STAT_LIMITS = {
+    "hp": (HP_CONVERSION, HP_MIN, HP_MAX),
+    "stamina": (STAMINA_CONVERSION, STAMINA_MIN, STAMINA_MAX),
+    "speed": (SPEED_CONVERSION, SPEED_MIN, SPEED_MAX),
+    "teeth": (TEETH_CONVERSION, TEETH_MIN, TEETH_MAX),
+    "claws": (CLAWS_CONVERSION, CLAWS_MIN, CLAWS_MAX),
+    "skin": (SKIN_CONVERSION, SKIN_MIN, SKIN_MAX),
+    "height": (HEIGHT_CONVERSION, HEIGHT_MIN, HEIGHT_MAX)
+}
+
+# Nombre de paires de builds par lot envoyé à un processus
+SHARD_SIZE = 16
+
+
+def generate_builds(step=15):
+    """Génère les builds qui dépensent exactement MAX_POINTS
+
+    Chaque statistique part de son minimum ; les points libres sont ensuite
+    répartis par paquets de `step` points bruts, le reste éventuel allant à la
+    taille (height) dont la conversion vaut 1.
+
+    Args:
+        step: Taille des paquets de points répartis (plus petit = plus de builds)
+
+    Returns:
+        list: Liste de builds (dictionnaires de points bruts)
+    """
+    base = {stat: STAT_LIMITS[stat][1] * STAT_LIMITS[stat][0] for stat in STATS}
+    free_points = MAX_POINTS - sum(base.values())
+    chunks = free_points // step
+    remainder = free_points - chunks * step
+
+    builds = []
+
+    def distribute(index, remaining, current):
+        # Dernière statistique : elle reçoit tous les paquets restants
+        if index == len(STATS) - 1:
+            current[STATS[index]] = remaining
+            build = {}
+            for stat in STATS:
+                build[stat] = base[stat] + current[stat] * step
+            build["height"] += remainder
+            if all(build[stat] // STAT_LIMITS[stat][0] <= STAT_LIMITS[stat][2] for stat in STATS):
+                builds.append(build)
+            return
+        for count in range(remaining + 1):
+            current[STATS[index]] = count
+            distribute(index + 1, remaining - count, current)
+
+    distribute(0, chunks, {})
+    return builds
+
+
+def round_robin_pairs(builds):
+    """Retourne toutes les paires (i, j) avec i < j pour un tournoi toutes rondes"""
+    return [(i, j) for i in range(len(builds)) for j in range(i + 1, len(builds))]
+
+
+def _play_shard(shard_index, pairs, builds, matches_per_pair, seed, policy, max_turns):
+    """Joue toutes les paires d'un lot (exécuté dans un processus du pool)
+
+    Chaque lot dispose de son propre flux aléatoire dérivé de (seed, shard_index),
+    ce qui rend les résultats indépendants du nombre de processus.
+
+    Returns:
+        dict: Index du lot et résultats de chaque paire
+    """
+    rng = random.Random(f"{seed}:{shard_index}")
+    results = []
+    for i, j in pairs:
+        # Jouer la moitié des parties dans chaque sens pour annuler l'avantage de position
+        first_half = matches_per_pair // 2
+        second_half = matches_per_pair - first_half
+        direct = run_matches(first_half, builds[i], builds[j], rng.getrandbits(64), policy, policy, max_turns)
+        swapped = run_matches(second_half, builds[j], builds[i], rng.getrandbits(64), policy, policy, max_turns)
+        results.append({
+            "pair": (i, j),
+            "matches": matches_per_pair,
+            "wins_i": direct["wins_a"] + swapped["wins_b"],
+            "wins_j": direct["wins_b"] + swapped["wins_a"],
+            "draws": direct["draws"] + swapped["draws"]
+        })
+    return {"shard": shard_index, "results": results}
+
+
+def iter_tournament(builds, matches_per_pair=10, seed=0, workers=None, shard_size=SHARD_SIZE,
+                    policy=aggressive_policy, max_turns=MAX_TURNS):
+    """Lance un tournoi toutes rondes et renvoie les résultats au fur et à mesure
+
+    Args:
+        builds: Liste des builds en compétition
+        matches_per_pair: Nombre de parties jouées par paire de builds
+        seed: Graine du tournoi
+        workers: Nombre de processus (par défaut: nombre de cœurs)
+        shard_size: Nombre de paires par lot
+        policy: Politique utilisée par tous les animaux (fonction de module, picklable)
+        max_turns: Nombre maximal de tours par partie
+
+    Yields:
+        dict: Résultat d'un lot terminé ({"shard": index, "results": [...]})
+    """
+    pairs = round_robin_pairs(builds)
+    shards = [pairs[start:start + shard_size] for start in range(0, len(pairs), shard_size)]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_play_shard, index, shard, builds, matches_per_pair, seed, policy, max_turns)
+            for index, shard in enumerate(shards)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_tournament(builds, matches_per_pair=10, seed=0, workers=None, shard_size=SHARD_SIZE,
+                   policy=aggressive_policy, max_turns=MAX_TURNS, progress_callback=None):
+    """Lance un tournoi toutes rondes et agrège les taux de victoire par build
+
+    Args:
+        progress_callback: Fonction appelée après chaque lot avec (standings, paires terminées, paires totales)
+
+    Returns:
+        list: Classement des builds trié par taux de victoire décroissant
+    """
+    standings = [{"build": build, "matches": 0, "wins": 0, "draws": 0, "win_rate": 0.0} for build in builds]
+    total_pairs = len(builds) * (len(builds) - 1) // 2
+    done_pairs = 0
+
+    for shard in iter_tournament(builds, matches_per_pair, seed, workers, shard_size, policy, max_turns):
+        for result in shard["results"]:
+            i, j = result["pair"]
+            for index, wins in ((i, result["wins_i"]), (j, result["wins_j"])):
+                entry = standings[index]
+                entry["matches"] += result["matches"]
+                entry["wins"] += wins
+                entry["draws"] += result["draws"]
+                entry["win_rate"] = entry["wins"] / entry["matches"]
+        done_pairs += len(shard["results"])
+        if progress_callback:
+            progress_callback(standings, done_pairs, total_pairs)
+
+    return sorted(standings, key=lambda entry: entry["win_rate"], reverse=True)
+
+
+def main():
+    """Point d'entrée en ligne de commande : python -m game.tournament"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Tournoi multiprocessus entre builds d'animaux")
+    parser.add_argument("--step", type=int, default=15, help="Taille des paquets de points répartis (par défaut: 15)")
+    parser.add_argument("--matches", type=int, default=10, help="Parties par paire de builds (par défaut: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du tournoi (par défaut: 0)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (par défaut: nombre de cœurs)")
+    parser.add_argument("--top", type=int, default=10, help="Nombre de builds affichés (par défaut: 10)")
+    args = parser.parse_args()
+
+    builds = generate_builds(args.step)
+    total_matches = len(builds) * (len(builds) - 1) // 2 * args.matches
+    print(f"{len(builds)} builds, {total_matches} parties à jouer")
+
+    start_time = time.perf_counter()
+
+    def show_progress(standings, done_pairs, total_pairs):
+        elapsed = time.perf_counter() - start_time
+        played = done_pairs * args.matches
+        print(f"{done_pairs}/{total_pairs} paires terminées ({played / max(elapsed, 1e-9):.0f} parties/s)")
+
+    standings = run_tournament(builds, args.matches, args.seed, args.workers, progress_callback=show_progress)
+
+    print(f"Meilleurs builds après {time.perf_counter() - start_time:.1f} s:")
+    for rank, entry in enumerate(standings[:args.top], start=1):
+        stats = ", ".join(f"{stat}={entry['build'][stat]}" for stat in STATS)
+        print(f"{rank}. {entry['win_rate']:.1%} de victoires ({stats})")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from game.resources import Fruit
 from ui.gui import GUI
 from ui.menu import MainMenu
 from ui.lobby import Lobby  # Importer la classe Lobby
+from ui.events import wait_for_events
 from game.config import (
     LION_START_POSITION, TIGER_START_POSITION,
     GREEN_FRUIT_POSITIONS, RED_FRUIT_POSITIONS, 
@@ -472,7 +473,7 @@ def handle_join_game(host):
             # Attendre que l'utilisateur appuie sur une touche
             waiting = True
             while waiting:
-                for event in pygame.event.get():
+                for event in wait_for_events(idle=True):
                     if event.type == pygame.QUIT:
                         return {"action": "quit"}
                     elif event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
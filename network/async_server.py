@@ -0,0 +1,276 @@
+"""
+Serveur asyncio pour le jeu des animaux.
+
+Même protocole que GameServer (taille sur 4 octets big-endian suivie du
+message encodé par le codec du client) et même traitement des messages, mais toutes les connexions
+sont gérées par une seule boucle asyncio tournant dans un thread dédié :
+un processus peut garder des milliers de connexions inactives ouvertes sans
+créer un thread par client, et l'arrêt est immédiat. La file d'envoi de
+chaque client (voir network.outbound) est vidée par une tâche asyncio.
+"""
+import asyncio
+import threading
+import traceback
+
+from network.codec import decode_message
+from network.framing import MAX_FRAME_SIZE
+from network.outbound import OutboundQueue, OUTBOUND_HIGH_WATER, OUTBOUND_STALL_TIMEOUT, OUTBOUND_MAX_BYTES
+from network.server import GameServer, NO_ACK_MESSAGES
+
+# Taille maximale de la file des connexions en attente d'acceptation
+ASYNC_BACKLOG = 1024
+
+
+class AsyncGameServer(GameServer):
+    """Serveur de jeu basé sur asyncio.start_server
+
+    Réutilise register_client, process_message, les salles et les files d'envoi
+    de GameServer : seules la boucle réseau et l'écriture des trames changent.
+    """
+
+    def __init__(self, host='0.0.0.0', port=5555, authoritative=False, high_water=OUTBOUND_HIGH_WATER,
+                 stall_timeout=OUTBOUND_STALL_TIMEOUT, max_queued_bytes=OUTBOUND_MAX_BYTES, allow_pickle=False):
+        """Initialise le serveur
+
+        Args:
+            host: Adresse IP du serveur (0.0.0.0 pour écouter sur toutes les interfaces)
+            port: Port d'écoute du serveur
+            authoritative: Si True, le serveur exécute les règles du jeu (voir GameServer)
+            high_water: Octets en attente d'envoi au-delà desquels un client est en retard
+            stall_timeout: Durée (secondes) au-delà de high_water avant de déconnecter le client
+            max_queued_bytes: Octets en attente d'envoi au-delà desquels le client est déconnecté
+            allow_pickle: Si True, annonce et accepte aussi pickle (voir GameServer)
+        """
+        super().__init__(host, port, authoritative, high_water, stall_timeout, max_queued_bytes, allow_pickle)
+        self.loop = None
+        self.loop_thread = None
+        self.server = None
+        self.stop_event = None  # asyncio.Event, créé dans la boucle
+        self.handler_tasks = set()
+        self.start_error = None
+
+    def start(self):
+        """Démarre la boucle asyncio dans un thread et attend que le serveur écoute
+
+        Returns:
+            bool: True si le serveur a démarré, False sinon
+        """
+        print("Démarrage de la boucle asyncio...")
+        started = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.run_loop, args=(started,))
+        self.loop_thread.daemon = True
+        self.loop_thread.start()
+        started.wait()
+
+        if self.start_error is not None:
+            print(f"Erreur lors du démarrage du serveur: {self.start_error}")
+            return False
+
+        # Vérifier si le serveur est accessible depuis l'extérieur
+        self.check_server_accessibility()
+
+        print(f"Serveur asyncio démarré sur {self.host}:{self.port}")
+        return True
+
+    def run_loop(self, started):
+        """Exécute la boucle asyncio du serveur (thread dédié)
+
+        Args:
+            started: threading.Event signalé dès que le serveur écoute (ou a échoué)
+        """
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.serve(started))
+        except Exception as e:
+            self.start_error = e
+            traceback.print_exc()
+        finally:
+            started.set()
+            self.loop.close()
+
+    async def serve(self, started):
+        """Écoute les connexions jusqu'à l'arrêt du serveur
+
+        Args:
+            started: threading.Event signalé dès que le serveur écoute
+        """
+        self.stop_event = asyncio.Event()
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port,
+            reuse_address=True, backlog=ASYNC_BACKLOG
+        )
+        self.running = True
+        started.set()
+
+        await self.stop_event.wait()
+
+        # Arrêt immédiat : plus de nouvelles connexions, fermeture des clients
+        self.running = False
+        self.server.close()
+        with self.lock:
+            clients_copy = self.clients.copy()
+        print(f"Fermeture de {len(clients_copy)} connexions clients...")
+        for client_info in clients_copy:
+            client_info["socket"].close()
+        for task in list(self.handler_tasks):
+            task.cancel()
+        if self.handler_tasks:
+            await asyncio.gather(*self.handler_tasks, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def stop(self):
+        """Arrête le serveur sans attendre de timeout de réception"""
+        print("Arrêt du serveur...")
+        if self.loop is not None and self.loop_thread is not None and self.loop_thread.is_alive():
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+            self.loop_thread.join()
+        self.running = False
+        print("Serveur arrêté")
+
+    async def handle_connection(self, reader, writer):
+        """Gère un client connecté (une coroutine par client, pas de thread)
+
+        Args:
+            reader: asyncio.StreamReader de la connexion
+            writer: asyncio.StreamWriter de la connexion
+        """
+        task = asyncio.current_task()
+        self.handler_tasks.add(task)
+        address = writer.get_extra_info("peername")
+        print(f"Nouvelle connexion de {address}")
+
+        client_info = None
+        try:
+            if not self.running:
+                return
+            client_info = self.register_client(writer, address)
+            self.send_initial_state(client_info)
+            self.start_game_if_ready()
+
+            # Boucle de réception des messages
+            while self.running:
+                try:
+                    size_bytes = await reader.readexactly(4)
+                    size = int.from_bytes(size_bytes, byteorder='big')
+                    if size > MAX_FRAME_SIZE:
+                        # Comme FrameReader : la connexion est fermée plutôt que de réserver la mémoire
+                        print(f"Trame trop grande du client {address}: {size} octets (maximum {MAX_FRAME_SIZE})")
+                        break
+                    data = await reader.readexactly(size)
+                except asyncio.IncompleteReadError:
+                    print(f"Client {address} déconnecté")
+                    break
+                except ConnectionError as e:
+                    print(f"Connexion perdue avec le client {address}: {e}")
+                    break
+
+                # Désérialiser le message (seuls les codecs acceptés pour ce client sont décodés)
+                try:
+                    message = decode_message(data, self.accepted_codecs(writer))
+                except Exception as e:
+                    print(f"Message refusé du client {address}: {e}")
+                    continue
+
+                # Traiter le message
+                try:
+                    self.process_message(client_info, message)
+
+                    # Envoyer une confirmation de réception au client
+                    if message.get("type") not in NO_ACK_MESSAGES:
+                        self.send_to_client(writer, {
+                            "type": "ack",
+                            "message_type": message.get("type", "unknown")
+                        })
+                except Exception as e:
+                    print(f"Erreur lors du traitement du message du client {address}: {e}")
+                    traceback.print_exc()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Erreur générale lors de la gestion du client {address}: {e}")
+            traceback.print_exc()
+        finally:
+            # Supprimer le client de la liste et de sa salle
+            if client_info is not None:
+                self.suspend_session(client_info)
+                self.leave_room(client_info)
+            with self.lock:
+                if client_info in self.clients:
+                    self.clients.remove(client_info)
+                    print(f"Client {address} supprimé de la liste")
+                self.client_codecs.pop(writer, None)
+            self.close_outbound(writer)
+            writer.close()
+            self.handler_tasks.discard(task)
+
+    def open_outbound(self, writer, address):
+        """Crée la file d'envoi d'une connexion et sa tâche d'écriture (exécuté dans la boucle)
+
+        Args:
+            writer: StreamWriter du client
+            address: Adresse du client
+        """
+        ready = asyncio.Event()
+        queue = OutboundQueue(self.high_water, self.stall_timeout, self.max_queued_bytes,
+                              wakeup=lambda: self.call_in_loop(ready.set))
+        with self.lock:
+            self.outbound[writer] = queue
+        task = self.loop.create_task(self.write_outbound(writer, queue, ready, address))
+        self.handler_tasks.add(task)
+        task.add_done_callback(self.handler_tasks.discard)
+
+    async def write_outbound(self, writer, queue, ready, address):
+        """Écrit les trames de la file d'une connexion jusqu'à sa fermeture
+
+        drain() attend que le client lise : pendant ce temps les trames
+        s'accumulent dans la file, où les états périmés sont remplacés. Un
+        client qui ne lit plus pendant stall_timeout est déconnecté.
+
+        Args:
+            writer: StreamWriter du client
+            queue: File d'envoi de la connexion
+            ready: asyncio.Event signalé à chaque ajout dans la file
+            address: Adresse du client
+        """
+        try:
+            while not queue.closed:
+                await ready.wait()
+                ready.clear()
+                frames = queue.pop_all()
+                if frames and not writer.is_closing():
+                    # Toutes les trames en attente en une écriture (TCP_NODELAY est
+                    # activé par asyncio sur les transports TCP)
+                    writer.writelines(frames)
+                    await asyncio.wait_for(writer.drain(), queue.stall_timeout)
+                queue.sent()
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            if not queue.closed:
+                self.drop_connection(writer, f"envoi vers {address} bloqué depuis plus de {queue.stall_timeout} s")
+        except ConnectionError as e:
+            if not queue.closed:
+                self.drop_connection(writer, f"erreur d'envoi vers {address}: {e}")
+
+    def drop_connection(self, writer, reason):
+        """Coupe la connexion d'un client (la coroutine du client termine le nettoyage)
+
+        Args:
+            writer: StreamWriter du client
+            reason: Raison de la déconnexion
+        """
+        print(f"Déconnexion d'un client: {reason}")
+        self.close_outbound(writer)
+        self.call_in_loop(writer.transport.abort)
+
+    def call_in_loop(self, callback):
+        """Exécute une fonction dans la boucle asyncio, depuis la boucle ou depuis un autre thread
+
+        Args:
+            callback: Fonction sans argument
+        """
+        if self.loop_thread is not None and threading.current_thread() is self.loop_thread:
+            callback()
+        else:
+            self.loop.call_soon_threadsafe(callback)
@@ -0,0 +1,250 @@
+"""
+Mode autoritaire du serveur.
+
+En mode autoritaire, le serveur exécute lui-même les règles du jeu
+(game.game.Game) pour chaque salle. Les clients n'envoient plus leur état
+complet mais de simples intentions, par exemple :
+
+    {"type": "intent", "action": "setup", "animal": {"name": ..., "hp": ..., ...}}
+    {"type": "intent", "action": "bite", "target": 2}      # ID du joueur visé
+    {"type": "intent", "action": "walk", "target": 45}     # position visée
+
+Le serveur valide chaque intention avec get_animal_possible_actions, l'applique
+avec Game.play_turn, puis diffuse le nouvel état (sous forme de delta).
+"""
+from game.config import (
+    MAX_POINTS,
+    HP_CONVERSION, STAMINA_CONVERSION, SPEED_CONVERSION,
+    TEETH_CONVERSION, CLAWS_CONVERSION, SKIN_CONVERSION, HEIGHT_CONVERSION,
+    HP_MIN, HP_MAX, STAMINA_MIN, STAMINA_MAX, SPEED_MIN, SPEED_MAX, TEETH_MIN, TEETH_MAX,
+    CLAWS_MIN, CLAWS_MAX, SKIN_MIN, SKIN_MAX, HEIGHT_MIN, HEIGHT_MAX
+)
+from game.sim import create_match
+from network.game_state import GameStateEncoder
+
+# Caractéristiques d'un animal : (points bruts par point de caractéristique, minimum, maximum)
+ANIMAL_STATS = {
+    "hp": (HP_CONVERSION, HP_MIN, HP_MAX),
+    "stamina": (STAMINA_CONVERSION, STAMINA_MIN, STAMINA_MAX),
+    "speed": (SPEED_CONVERSION, SPEED_MIN, SPEED_MAX),
+    "teeth": (TEETH_CONVERSION, TEETH_MIN, TEETH_MAX),
+    "claws": (CLAWS_CONVERSION, CLAWS_MIN, CLAWS_MAX),
+    "skin": (SKIN_CONVERSION, SKIN_MIN, SKIN_MAX),
+    "height": (HEIGHT_CONVERSION, HEIGHT_MIN, HEIGHT_MAX)
+}
+
+# Actions dont la cible est un animal (désigné par l'ID de son joueur)
+ANIMAL_TARGET_ACTIONS = ("bite", "slap")
+
+# Actions dont la cible est une position du terrain
+POSITION_TARGET_ACTIONS = ("walk", "run", "drink")
+
+# Passer son tour (toujours autorisé)
+WAIT_ACTION = "wait"
+
+# Longueur maximale du nom d'un animal
+MAX_NAME_LENGTH = 32
+
+
+class IntentError(Exception):
+    """Intention refusée par le serveur"""
+    pass
+
+
+class AuthoritativeGame:
+    """Partie d'une salle exécutée par le serveur"""
+
+    def __init__(self, seed=None, players=2):
+        """Initialise une partie en attente des animaux des joueurs
+
+        Args:
+            seed: Graine de la partie (None pour une partie aléatoire)
+            players: Nombre de joueurs (un animal chacun)
+        """
+        self.seed = seed
+        self.players = players
+        self.builds = {}  # {player_id: (nom, build en points bruts)}
+        self.game = None
+        self.animals = {}  # {player_id: Animal}
+        self.current_animal = None
+        # Dernier état encodé, pour ne réencoder que ce qui a changé (voir encode)
+        self.encoded = None
+        self.encoded_terrain_version = None
+        self.watched_positions = set()  # Cases qui pouvaient changer lors du dernier encodage
+
+    @property
+    def started(self):
+        """Vérifie si tous les animaux ont été configurés et la partie créée"""
+        return self.game is not None
+
+    def add_player(self, player_id, animal_data):
+        """Enregistre l'animal d'un joueur et démarre la partie quand tous sont prêts
+
+        Args:
+            player_id: ID du joueur dans la salle
+            animal_data: Caractéristiques de l'animal (hp, stamina, speed, teeth, claws, skin, height
+                et, facultatif, name : "Joueur N" par défaut)
+
+        Raises:
+            IntentError: Si la partie a déjà commencé ou si l'animal (nom compris) n'est pas valide
+        """
+        if self.started:
+            raise IntentError("La partie a déjà commencé")
+        if not isinstance(player_id, int) or not 1 <= player_id <= self.players:
+            raise IntentError(f"Joueur {player_id} inconnu")
+        if not isinstance(animal_data, dict):
+            raise IntentError("Caractéristiques de l'animal manquantes")
+
+        name = animal_data.get("name", f"Joueur {player_id}")
+        if not isinstance(name, str) or not 0 < len(name) <= MAX_NAME_LENGTH:
+            raise IntentError(f"Nom d'animal invalide (1 à {MAX_NAME_LENGTH} caractères)")
+
+        # Reconvertir en points bruts, comme sur l'écran de configuration
+        build = {}
+        for stat, (conversion, minimum, maximum) in ANIMAL_STATS.items():
+            value = animal_data.get(stat)
+            if type(value) is not int or not minimum <= value <= maximum:
+                raise IntentError(f"Valeur invalide pour {stat}: {value}")
+            build[stat] = value * conversion
+        if sum(build.values()) > MAX_POINTS:
+            raise IntentError(f"L'animal dépasse {MAX_POINTS} points")
+
+        self.builds[player_id] = (name, build)
+        if len(self.builds) == self.players:
+            self.start()
+
+    def start(self):
+        """Crée la partie avec les animaux des joueurs, dans l'ordre de leurs IDs"""
+        (name_a, build_a), (name_b, build_b) = (self.builds[player_id] for player_id in sorted(self.builds))
+        self.game, animal_a, animal_b = create_match(build_a, build_b, self.seed)
+        animal_a.name = name_a
+        animal_b.name = name_b
+        self.animals = dict(zip(sorted(self.builds), (animal_a, animal_b)))
+        self.advance()
+
+    def advance(self):
+        """Fait avancer le temps jusqu'au prochain animal qui doit jouer"""
+        self.current_animal = None
+        while not self.game.game_over and self.current_animal is None:
+            self.current_animal = self.game.get_next_animal_to_play()
+
+    def player_of(self, animal):
+        """Retourne l'ID du joueur d'un animal (None si aucun)"""
+        for player_id, player_animal in self.animals.items():
+            if player_animal is animal:
+                return player_id
+        return None
+
+    def apply_intent(self, player_id, action, target=None):
+        """Valide et applique l'intention d'un joueur
+
+        Args:
+            player_id: ID du joueur qui envoie l'intention
+            action: Nom de l'action (bite, slap, walk, run, drink ou wait)
+            target: ID du joueur visé (bite, slap) ou position visée (walk, run, drink)
+
+        Returns:
+            bool: Résultat de Game.play_turn
+
+        Raises:
+            IntentError: Si l'intention n'est pas valide
+        """
+        if not self.started:
+            raise IntentError("La partie n'a pas commencé")
+        if self.game.game_over:
+            raise IntentError("La partie est terminée")
+        animal = self.animals.get(player_id)
+        if animal is None or animal is not self.current_animal:
+            raise IntentError("Ce n'est pas votre tour")
+
+        if action == WAIT_ACTION:
+            result = self.game.play_turn(animal, WAIT_ACTION)
+        else:
+            if action in ANIMAL_TARGET_ACTIONS:
+                target = self.animals.get(target) if isinstance(target, int) else None
+            elif action not in POSITION_TARGET_ACTIONS:
+                raise IntentError(f"Action inconnue: {action}")
+
+            actions = self.game.get_animal_possible_actions(animal)
+            if target is None or target not in actions.get(action, []):
+                raise IntentError(f"Action {action} impossible")
+            result = self.game.play_turn(animal, action, target)
+
+        self.advance()
+        return result
+
+    def encode(self):
+        """Encode l'état de la partie pour les clients
+
+        Seul le premier appel encode toute la partie. Les suivants repartent de
+        l'état précédent et ne réencodent que ce qui a pu changer : les animaux,
+        les ressources si le terrain a changé (Terrain.version) et les cases
+        actives ou occupées (voir changing_positions). Les listes et
+        dictionnaires déjà renvoyés ne sont jamais modifiés : le serveur peut
+        comparer deux états successifs.
+
+        Returns:
+            dict: État encodé par GameStateEncoder (sans la liste des joueurs, gérée par
+            le serveur) et ID du joueur qui doit jouer ("current_player")
+        """
+        game = self.game
+        terrain = game.terrain
+        previous = self.encoded
+        if previous is None:
+            state = GameStateEncoder.encode_game_state(game)
+            state.pop("players", None)
+        else:
+            state = dict(previous)
+            state["current_turn"] = game.current_turn
+            state["game_over"] = game.game_over
+            state["winner"] = game.winner.name if game.winner else None
+            state["animals"] = [GameStateEncoder.encode_animal(animal) for animal in game.animals]
+            if terrain.version != self.encoded_terrain_version:
+                state["resources"] = GameStateEncoder.encode_resources(terrain)
+            squares = self.refresh_squares(previous["terrain"]["squares"])
+            if squares is not None:
+                state["terrain"] = dict(previous["terrain"], squares=squares)
+        state["current_player"] = self.player_of(self.current_animal)
+
+        self.encoded = state
+        self.encoded_terrain_version = terrain.version
+        self.watched_positions = self.changing_positions()
+        return state
+
+    def changing_positions(self):
+        """Retourne les positions des cases dont les points de vitesse peuvent changer
+
+        Ce sont les cases actives (en recharge ou vergers, voir Terrain.active_squares)
+        et les cases occupées par un animal ou une ressource, remises à zéro quand un
+        animal y entre ou mange le fruit.
+
+        Returns:
+            set: Positions des cases
+        """
+        terrain = self.game.terrain
+        positions = set(terrain.active_squares)
+        positions.update(terrain.resources)
+        positions.update(animal.position for animal in self.game.animals
+                         if animal.position is not None and terrain.is_valid_position(animal.position))
+        return positions
+
+    def refresh_squares(self, squares):
+        """Réencode les cases qui ont pu changer depuis l'encodage précédent
+
+        Args:
+            squares: Cases de l'état précédent (non modifiées)
+
+        Returns:
+            list: Nouvelle liste des cases, ou None si aucune case n'a changé
+        """
+        terrain = self.game.terrain
+        updated = None
+        for position in self.watched_positions | self.changing_positions():
+            x, y = terrain.position_to_coordinates(position)
+            index = y * terrain.width + x
+            square = GameStateEncoder.encode_square(terrain.grid[y][x])
+            if square != squares[index]:
+                if updated is None:
+                    updated = list(squares)
+                updated[index] = square
+        return updated
@@ -4,10 +4,21 @@ Gère la connexion au serveur et la synchronisation du jeu.
 """
 import socket
 import threading
-import pickle
 import time
 import traceback
 
+from network import delta
+from network.codec import DEFAULT_CODEC, SAFE_CODEC, negotiate_codec, decode_message
+from network.framing import FrameReader, send_buffers, set_nodelay
+from network.room import DEFAULT_ROOM_ID
+
+# Délai (secondes) après lequel la réception vérifie que le client est toujours connecté
+RECEIVE_TIMEOUT = 10
+
+# Messages de la salle d'accueil ignorés pendant une reprise de session : le serveur
+# place d'abord toute nouvelle connexion dans la salle par défaut
+RESUME_IGNORED_MESSAGES = ("game_update", "game_delta", "game_start")
+
 class GameClient:
     """Client de jeu pour le jeu des animaux"""
     
@@ -24,15 +35,30 @@ class GameClient:
         self.client_socket = None
         self.connected = False
         self.client_id = None
+        self.room_id = None  # Salle actuelle (None = salle par défaut, "lobby" = hall)
         self.game_state = {}
+        self.codec = DEFAULT_CODEC  # Codec des messages envoyés, négocié à la connexion
+        self.authoritative = False  # True si le serveur exécute les règles du jeu (intentions)
+        self.state_version = None  # Version de game_state reçue du serveur (None si inconnue)
+        self.session = None  # Jeton de session, pour reprendre sa place après une reconnexion
+        self.resuming = False  # True entre l'envoi de "resume" et la réponse du serveur
+        self.pending_connection = None  # Message "connection" reçu pendant la reprise
         self.callbacks = {
             "connection": [],
             "game_start": [],
             "game_update": [],
             "chat": [],
-            "disconnect": []
+            "disconnect": [],
+            "room_list": [],
+            "room_joined": [],
+            "room_error": [],
+            "intent_rejected": [],
+            "message": []  # Appelés après chaque message traité, quel que soit son type
         }
         self.receive_thread = None
+        # Le thread de réception (accusés "state_ack") et le jeu envoient en même temps :
+        # une trame doit partir en entier avant la suivante
+        self.send_lock = threading.Lock()
     
     def connect(self):
         """Se connecte au serveur
@@ -64,7 +90,11 @@ class GameClient:
             self.client_socket.connect((self.host, self.port))
             # Remettre le socket en mode bloquant après la connexion
             self.client_socket.settimeout(None)
+            # Envoyer chaque action immédiatement (pas d'algorithme de Nagle)
+            set_nodelay(self.client_socket)
             self.connected = True
+            # Une nouvelle connexion repart du codec par défaut
+            self.codec = DEFAULT_CODEC
             
             # Démarrer le thread de réception
             print("Démarrage du thread de réception...")
@@ -121,8 +151,8 @@ class GameClient:
                 print("Vérification de la connexion existante...")
                 self.client_socket.settimeout(2)
                 # Envoyer un message vide pour tester la connexion
-                self.client_socket.sendall(len(b'ping').to_bytes(4, byteorder='big'))
-                self.client_socket.sendall(b'ping')
+                with self.send_lock:
+                    send_buffers(self.client_socket, (len(b'ping').to_bytes(4, byteorder='big'), b'ping'))
                 self.client_socket.settimeout(None)
                 print("Connexion existante fonctionnelle")
                 return True
@@ -148,11 +178,20 @@ class GameClient:
         self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.client_socket.settimeout(5)
         
+        # Dès la connexion, ignorer l'état de la salle d'accueil si la session peut être reprise
+        self.resuming = self.session is not None
+        
         try:
             print(f"Connexion à {self.host}:{self.port}...")
             self.client_socket.connect((self.host, self.port))
             self.client_socket.settimeout(None)
+            set_nodelay(self.client_socket)
             self.connected = True
+            self.codec = DEFAULT_CODEC
+            
+            # Reprendre sa place et recevoir seulement les versions manquées
+            if self.session is not None:
+                self.resume_session()
             
             # Démarrer un nouveau thread de réception si nécessaire
             if not self.receive_thread or not self.receive_thread.is_alive():
@@ -165,6 +204,7 @@ class GameClient:
             return True
         except Exception as e:
             print(f"Échec de la reconnexion: {e}")
+            self.resuming = False
             return False
     
     def receive_messages(self):
@@ -173,17 +213,27 @@ class GameClient:
         consecutive_errors = 0
         max_consecutive_errors = 3
         
+        reader = None
+        
         while self.connected:
             try:
-                # Recevoir la taille des données
+                # (Re)créer le lecteur de trames pour le socket courant (après une reconnexion)
+                if reader is None or reader.sock is not self.client_socket:
+                    # Timeout pour ne pas bloquer indéfiniment : le lecteur reprend
+                    # ensuite la trame là où il s'était arrêté
+                    self.client_socket.settimeout(RECEIVE_TIMEOUT)
+                    reader = FrameReader(self.client_socket)
+                
                 print("En attente de données du serveur...")
-                # Définir un timeout pour éviter de bloquer indéfiniment
-                self.client_socket.settimeout(10)  # 10 secondes de timeout
-                size_bytes = self.client_socket.recv(4)
-                # Remettre en mode bloquant
-                self.client_socket.settimeout(None)
+                try:
+                    data = reader.read_frame()
+                except socket.timeout:
+                    continue
+                except ConnectionError as e:
+                    print(f"Réception de données interrompue: {e}")
+                    data = None
                 
-                if not size_bytes:
+                if data is None:
                     print("Aucune donnée reçue du serveur, tentative de reconnexion...")
                     consecutive_errors += 1
                     if consecutive_errors >= max_consecutive_errors:
@@ -202,51 +252,25 @@ class GameClient:
                         time.sleep(2)
                         continue
                 
-                # Réinitialiser le compteur d'erreurs si on reçoit des données
-                consecutive_errors = 0
-                
-                size = int.from_bytes(size_bytes, byteorder='big')
-                print(f"Taille des données à recevoir: {size} octets")
-                
-                # Recevoir les données
-                data = b""
-                self.client_socket.settimeout(5)  # 5 secondes de timeout pour chaque morceau
-                while len(data) < size:
-                    chunk = self.client_socket.recv(min(size - len(data), 4096))
-                    if not chunk:
-                        print("Réception de données interrompue, tentative de reconnexion...")
-                        consecutive_errors += 1
-                        if consecutive_errors >= max_consecutive_errors:
-                            print(f"Trop d'erreurs consécutives ({consecutive_errors}), déconnexion")
-                            self.connected = False
-                            break
-                        # Tenter de se reconnecter
-                        if self.reconnect():
-                            print("Reconnexion réussie, mais données perdues. Attente de nouvelles données...")
-                            break
-                        # Attendre un peu avant de réessayer
-                        time.sleep(2)
-                        break
-                    data += chunk
-                
-                # Remettre en mode bloquant
-                self.client_socket.settimeout(None)
-                
-                # Si on a quitté la boucle de réception à cause d'une erreur, continuer la boucle principale
-                if len(data) < size:
-                    continue
-                
                 # Réinitialiser le compteur d'erreurs si on reçoit des données complètes
                 consecutive_errors = 0
+                print(f"{len(data)} octets reçus du serveur")
                 
                 # Désérialiser les données
                 print("Désérialisation des données reçues...")
-                message = pickle.loads(data)
+                message = decode_message(data)
                 print(f"Message reçu du serveur: {message.get('type', 'inconnu')}")
                 
                 # Traiter le message
                 self.process_message(message)
                 
+                # Prévenir les abonnés (par exemple pour réveiller la boucle d'affichage)
+                for callback in self.callbacks["message"]:
+                    try:
+                        callback(message)
+                    except Exception as e:
+                        print(f"Erreur lors de l'appel du callback de message: {e}")
+                
             except Exception as e:
                 print(f"Erreur lors de la réception d'un message: {e}")
                 traceback.print_exc()
@@ -268,10 +292,32 @@ class GameClient:
         
         print(f"Traitement du message de type '{message_type}'")
         
+        if self.resuming and message_type in RESUME_IGNORED_MESSAGES:
+            print(f"Message '{message_type}' de la salle d'accueil ignoré pendant la reprise de session")
+            return
+        
         if message_type == "connection":
             # Message de connexion, contient l'ID du client
             client_id = message.get("id")
             print(f"ID client: {client_id}")
+            self.authoritative = message.get("authoritative", False)
+            
+            # Choisir un codec parmi ceux proposés par le serveur (une fois par connexion)
+            if "codecs" in message and self.codec is DEFAULT_CODEC:
+                codec = negotiate_codec(message["codecs"])
+                if codec is not self.codec:
+                    print(f"Passage au codec '{codec.name}'")
+                    self.send_message({"type": "set_codec", "codec": codec.name}, SAFE_CODEC)
+                    self.codec = codec
+            
+            if self.resuming:
+                # Place provisoire dans la salle d'accueil : utile seulement si la reprise échoue
+                self.pending_connection = message
+                return
+            self.session = message.get("session", self.session)
+            # Salle par défaut, ou hall si elle était complète
+            room_id = message.get("room_id")
+            self.room_id = None if room_id in (None, DEFAULT_ROOM_ID) else room_id
             
             # Appeler les callbacks de connexion
             print("Appel des callbacks de connexion...")
@@ -298,13 +344,34 @@ class GameClient:
             
             # Stocker l'état du jeu
             self.game_state = game_state
+            self.state_version = message.get("version")
             
-            # Appeler les callbacks de mise à jour de l'état du jeu
-            for callback in self.callbacks["game_update"]:
-                try:
-                    callback(game_state)
-                except Exception as e:
-                    print(f"Erreur lors de l'appel du callback de mise à jour de l'état du jeu: {e}")
+            self.notify_game_update()
+        
+        elif message_type == "game_delta":
+            # Mise à jour partielle : seulement ce qui a changé depuis la version `base`
+            base = message.get("base")
+            version = message.get("version")
+            if self.state_version is not None and version <= self.state_version:
+                # Version déjà reçue
+                return
+            if self.state_version is None or self.state_version < base:
+                print(f"Delta depuis la version {base} inapplicable (version locale {self.state_version}), resynchronisation...")
+                self.send_message({"type": "resync"})
+                return
+            
+            # Les patches ne contiennent que des valeurs finales : un état déjà plus
+            # récent que `base` peut recevoir le même delta
+            try:
+                self.game_state = delta.apply(self.game_state, message.get("delta"))
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                print(f"Erreur lors de l'application du delta: {e}, resynchronisation...")
+                self.state_version = None
+                self.send_message({"type": "resync"})
+                return
+            self.state_version = version
+            
+            self.notify_game_update()
         
         elif message_type == "chat":
             # Message de chat
@@ -318,6 +385,69 @@ class GameClient:
                 except Exception as e:
                     print(f"Erreur lors de l'appel du callback de chat: {e}")
                     
+        elif message_type == "room_list":
+            # Liste des salles du serveur
+            rooms = message.get("rooms", [])
+            for callback in self.callbacks["room_list"]:
+                try:
+                    callback(rooms)
+                except Exception as e:
+                    print(f"Erreur lors de l'appel du callback de liste des salles: {e}")
+        
+        elif message_type == "room_joined":
+            # Entrée dans une salle : nouvel ID de joueur et état de la salle
+            self.room_id = message.get("room_id")
+            self.client_id = message.get("id")
+            self.game_state = message.get("state", {})
+            self.state_version = message.get("version")
+            print(f"Salle {self.room_id} rejointe avec l'ID {self.client_id}")
+            for callback in self.callbacks["room_joined"]:
+                try:
+                    callback(self.room_id, self.client_id)
+                except Exception as e:
+                    print(f"Erreur lors de l'appel du callback d'entrée dans une salle: {e}")
+        
+        elif message_type == "resumed":
+            # Place de la session précédente retrouvée : les versions manquées suivent
+            self.resuming = False
+            self.pending_connection = None
+            room_id = message.get("room_id")
+            self.room_id = None if room_id == DEFAULT_ROOM_ID else room_id
+            self.client_id = message.get("id")
+            print(f"Session reprise: salle {room_id}, ID {self.client_id}")
+        
+        elif message_type == "resume_failed":
+            # Session expirée : garder la place attribuée à la connexion et recharger l'état
+            print(f"Reprise de session impossible: {message.get('reason', '')}")
+            self.resuming = False
+            self.session = None
+            self.room_id = None
+            self.state_version = None
+            if self.pending_connection is not None:
+                pending, self.pending_connection = self.pending_connection, None
+                self.process_message(pending)
+            self.send_message({"type": "resync"})
+        
+        elif message_type == "room_error":
+            # Création ou entrée dans une salle refusée
+            error_message = message.get("message", "")
+            print(f"Erreur de salle: {error_message}")
+            for callback in self.callbacks["room_error"]:
+                try:
+                    callback(error_message)
+                except Exception as e:
+                    print(f"Erreur lors de l'appel du callback d'erreur de salle: {e}")
+        
+        elif message_type == "intent_rejected":
+            # Intention refusée par le serveur (mode autoritaire)
+            reason = message.get("reason", "")
+            print(f"Intention '{message.get('action')}' refusée: {reason}")
+            for callback in self.callbacks["intent_rejected"]:
+                try:
+                    callback(message.get("action"), reason)
+                except Exception as e:
+                    print(f"Erreur lors de l'appel du callback d'intention refusée: {e}")
+        
         elif message_type == "ack":
             # Accusé de réception du serveur
             ack_message_type = message.get("message_type", "unknown")
@@ -328,6 +458,40 @@ class GameClient:
             # Type de message inconnu
             print(f"Type de message inconnu: {message_type}")
     
+    def notify_game_update(self):
+        """Acquitte la version reçue et appelle les callbacks de mise à jour avec l'état complet"""
+        if self.state_version is not None:
+            self.send_message({"type": "state_ack", "version": self.state_version})
+        
+        # Appeler les callbacks de mise à jour de l'état du jeu
+        for callback in self.callbacks["game_update"]:
+            try:
+                callback(self.game_state)
+            except Exception as e:
+                print(f"Erreur lors de l'appel du callback de mise à jour de l'état du jeu: {e}")
+    
+    def send_state(self, state):
+        """Envoie au serveur un nouvel état du jeu, réduit à ce qui a changé si possible
+        
+        Le delta est calculé par rapport au dernier état reçu du serveur ; sans
+        version connue, l'état est envoyé en entier comme avec send_action.
+        
+        Args:
+            state: État du jeu (voir GameStateEncoder.encode_game_state)
+            
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        if self.state_version is None:
+            return self.send_action(state)
+        
+        print("Envoi des changements de l'état du jeu au serveur...")
+        return self.send_message({
+            "type": "action",
+            "base": self.state_version,
+            "delta": delta.diff_update(self.game_state, state)
+        })
+    
     def send_action(self, action_data):
         """Envoie une action au serveur
         
@@ -349,6 +513,44 @@ class GameClient:
             print("Échec de l'envoi de l'action")
         return success
     
+    def send_intent(self, action, target=None):
+        """Envoie une intention au serveur autoritaire
+        
+        Args:
+            action: Nom de l'action (bite, slap, walk, run, drink ou wait)
+            target: ID du joueur visé (bite, slap) ou position visée (walk, run, drink)
+            
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        print(f"Envoi de l'intention '{action}' (cible: {target}) au serveur...")
+        return self.send_message({"type": "intent", "action": action, "target": target})
+    
+    def send_setup(self, animal):
+        """Envoie au serveur autoritaire les caractéristiques de l'animal du joueur
+        
+        Args:
+            animal: Animal configuré sur l'écran de configuration
+            
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        print(f"Envoi de la configuration de {animal.name} au serveur...")
+        return self.send_message({
+            "type": "intent",
+            "action": "setup",
+            "animal": {
+                "name": animal.name,
+                "hp": animal.max_hp,
+                "stamina": animal.max_stamina,
+                "speed": animal.speed,
+                "teeth": animal.teeth,
+                "claws": animal.claws,
+                "skin": animal.skin,
+                "height": animal.height
+            }
+        })
+    
     def send_chat(self, message_text):
         """Envoie un message de chat au serveur
         
@@ -370,11 +572,57 @@ class GameClient:
             print("Échec de l'envoi du message de chat")
         return success
     
-    def send_message(self, message):
+    def list_rooms(self):
+        """Demande la liste des salles (réponse via le callback "room_list")
+        
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        return self.send_message({"type": "list_rooms"})
+    
+    def create_room(self, name=None):
+        """Crée une salle et y entre comme hôte (réponse via le callback "room_joined")
+        
+        Args:
+            name: Nom de la salle
+            
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        return self.send_message({"type": "create_room", "name": name})
+    
+    def join_room(self, room_id):
+        """Rejoint une salle existante (réponse via "room_joined" ou "room_error")
+        
+        Args:
+            room_id: Identifiant de la salle
+            
+        Returns:
+            bool: True si l'envoi a réussi, False sinon
+        """
+        return self.send_message({"type": "join_room", "room_id": room_id})
+    
+    def resume_session(self):
+        """Demande au serveur de reprendre la place de la session précédente
+        
+        Le serveur répond "resumed" suivi des versions manquées depuis
+        state_version, ou "resume_failed" si la place a expiré.
+        
+        Returns:
+            bool: True si la demande a été envoyée, False sinon
+        """
+        print("Demande de reprise de session...")
+        self.resuming = True
+        # Envoyé avant le message "connection" : codec sûr, accepté même par un serveur sans pickle
+        return self.send_message({"type": "resume", "session": self.session, "version": self.state_version},
+                                 SAFE_CODEC)
+    
+    def send_message(self, message, codec=None):
         """Envoie un message au serveur
         
         Args:
             message: Message à envoyer
+            codec: Codec à utiliser (par défaut: celui négocié avec le serveur)
             
         Returns:
             bool: True si le message a été envoyé avec succès, False sinon
@@ -388,15 +636,16 @@ class GameClient:
         try:
             # Sérialiser le message
             print(f"Sérialisation du message de type '{message.get('type')}'...")
-            data = pickle.dumps(message)
+            data = (codec or self.codec).encode(message)
             
-            # Envoyer la taille des données
+            # Envoyer la taille des données suivie des données, en un seul appel système
             size = len(data)
+            buffers = (size.to_bytes(4, byteorder='big'), data)
             print(f"Envoi de {size} octets au serveur...")
             
             try:
-                self.client_socket.sendall(size.to_bytes(4, byteorder='big'))
-                self.client_socket.sendall(data)
+                with self.send_lock:
+                    send_buffers(self.client_socket, buffers)
                 print("Message envoyé avec succès")
                 return True
             except (ConnectionResetError, BrokenPipeError) as e:
@@ -408,8 +657,8 @@ class GameClient:
                     print("Reconnexion réussie, nouvelle tentative d'envoi...")
                     # Réessayer d'envoyer le message
                     try:
-                        self.client_socket.sendall(size.to_bytes(4, byteorder='big'))
-                        self.client_socket.sendall(data)
+                        with self.send_lock:
+                            send_buffers(self.client_socket, buffers)
                         print("Message envoyé avec succès après reconnexion")
                         return True
                     except Exception as e2:
@@ -0,0 +1,971 @@
+"""
+Codecs des messages échangés entre le client et le serveur.
+
+Chaque trame (taille sur 4 octets big-endian suivie des données) contient un
+message encodé par un codec. Le premier octet des données identifie le codec,
+ce qui permet de changer de codec en cours de connexion :
+
+- BinaryCodec : encodage binaire compact et sûr, avec des enregistrements de
+  taille fixe pour les animaux, les cases et les ressources (codec par défaut)
+- PickleCodec : pickle, le format historique (à n'utiliser qu'entre pairs de confiance)
+
+Les deux côtés commencent en binaire. Le serveur annonce ses codecs dans le
+message "connection" ; le client choisit le premier codec de PREFERRED_CODECS
+qu'ils ont en commun et l'annonce par un message "set_codec", encodé avec
+SAFE_CODEC. Un serveur n'annonce et n'accepte pickle que s'il l'autorise
+explicitement (allow_pickle=True).
+
+BinaryCodec, écrit en Python, reste plus lent que l'encodeur en C de pickle
+(environ 3x sur un état complet, 4x sur un delta, voir python -m benchmarks.serialization)
+mais produit des messages trois fois plus petits et ne peut pas exécuter de code
+à la lecture.
+"""
+import functools
+import operator
+import pickle
+import struct
+
+from network import delta
+
+
+class PickleCodec:
+    """Codec pickle (format historique)"""
+    name = "pickle"
+    MAGIC = 0x80  # Premier octet d'un pickle de protocole 2 ou plus
+
+    def encode(self, message):
+        """Encode un message
+
+        Args:
+            message: Message à encoder
+
+        Returns:
+            bytes: Message encodé
+        """
+        return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data):
+        """Décode un message
+
+        Args:
+            data: Message encodé (bytes ou memoryview)
+
+        Returns:
+            Le message décodé
+        """
+        return pickle.loads(data)
+
+
+# Étiquettes des valeurs de l'encodage binaire
+TAG_NONE = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT8 = 0x03
+TAG_INT16 = 0x04
+TAG_INT32 = 0x05
+TAG_INT64 = 0x06
+TAG_BIGINT = 0x07
+TAG_FLOAT = 0x08
+TAG_SHORT_STR = 0x09
+TAG_STR = 0x0A
+TAG_BYTES = 0x0B
+TAG_LIST = 0x0C
+TAG_TUPLE = 0x0D
+TAG_DICT = 0x0E
+TAG_STR_REF = 0x0F  # Chaîne déjà écrite dans le message (index sur 2 octets)
+# Enregistrements de taille fixe (voir GameStateEncoder)
+TAG_ANIMAL = 0x10
+TAG_SQUARE = 0x11
+TAG_RESOURCE = 0x12
+TAG_FRUIT = 0x13
+TAG_SQUARE_LIST = 0x14  # Liste de cases, écrite en colonnes en un seul bloc
+# Chaînes et dictionnaires dont les clés sont dans KNOWN_STRINGS
+TAG_KNOWN_STR = 0x15  # Index de la chaîne sur 1 octet
+TAG_KNOWN_DICT = 0x16  # Nombre de clés, index des clés, puis les valeurs
+TAG_INT_FIELDS = 0x17  # Nombre de clés, index des clés, puis les valeurs en entiers 32 bits d'un bloc
+# Patches de network.delta
+TAG_PATCH_REPLACE = 0x18  # ("r", valeur)
+TAG_PATCH_DICT = 0x19  # ("d", {clé: valeur}, {clé: patch}, [clés supprimées]), parties vides omises
+TAG_PATCH_LIST = 0x1A  # ("l", {index: patch}), index sur 2 octets
+
+# Champs numériques d'un animal, dans l'ordre de l'enregistrement (le nom est encodé à part)
+ANIMAL_NUMBER_FIELDS = (
+    "max_hp", "hp", "max_stamina", "stamina", "speed", "speed_points", "position",
+    "teeth", "claws", "skin", "height", "max_hunger", "hunger", "max_thirst", "thirst"
+)
+ANIMAL_KEYS = frozenset(ANIMAL_NUMBER_FIELDS + ("name", "is_alive"))
+get_animal_numbers = operator.itemgetter(*ANIMAL_NUMBER_FIELDS)
+
+SQUARE_FIELDS = ("x", "y", "terrain_type", "is_orchard", "speed_points")
+SQUARE_KEYS = frozenset(SQUARE_FIELDS)
+SQUARE_STRUCT = struct.Struct("<HHB?h")
+get_square_fields = operator.itemgetter(*SQUARE_FIELDS)
+
+RESOURCE_KEYS = frozenset(("position", "type"))
+RESOURCE_STRUCT = struct.Struct("<iB")
+FRUIT_FIELDS = ("heal_amount", "stamina_recovery", "hunger_recovery")
+FRUIT_KEYS = RESOURCE_KEYS | frozenset(FRUIT_FIELDS)
+FRUIT_STRUCT = struct.Struct("<iBiii")
+
+# Étiquette d'enregistrement de chaque jeu de clés
+RECORD_TAGS = {ANIMAL_KEYS: TAG_ANIMAL, SQUARE_KEYS: TAG_SQUARE, RESOURCE_KEYS: TAG_RESOURCE, FRUIT_KEYS: TAG_FRUIT}
+
+# Codes des types de terrain (propres au format, indépendants des plans d'ArrayTerrain)
+TERRAIN_TYPE_CODES = {"normal": 0, "water": 1, "forest": 2, "mountain": 3}
+TERRAIN_TYPE_NAMES = {code: name for name, code in TERRAIN_TYPE_CODES.items()}
+
+# Codes des types de ressources
+RESOURCE_TYPE_CODES = {"Resource": 0, "Fruit": 1, "GreenFruit": 2, "RedFruit": 3}
+RESOURCE_TYPE_NAMES = {code: name for name, code in RESOURCE_TYPE_CODES.items()}
+
+# Chaînes fréquentes des messages, écrites sur 2 octets. Fait partie du format :
+# n'ajouter des chaînes qu'à la fin (au plus 256) et changer VERSION sinon.
+KNOWN_STRINGS = tuple(dict.fromkeys((
+    # Types de patches (network.delta)
+    delta.REPLACE, delta.DICT, delta.LIST,
+    # Clés et types des messages
+    "type", "id", "version", "base", "delta", "state", "session", "codecs", "codec", "authoritative",
+    "message", "message_type", "sender_id", "action", "target", "data", "animal", "name", "room_id",
+    "rooms", "reason",
+    "game_update", "game_delta", "state_ack", "ack", "connection", "game_start", "chat", "intent",
+    "intent_rejected", "set_codec", "resync", "resume", "resumed", "resume_failed", "list_rooms",
+    "room_list", "create_room", "join_room", "room_joined", "room_error",
+    # Clés de l'état du jeu
+    "current_turn", "game_over", "winner", "animals", "resources", "players", "terrain", "width",
+    "height", "squares", "ready", "game_started", "setup_complete", "host_ready", "client_ready",
+    "is_alive", *ANIMAL_NUMBER_FIELDS, *SQUARE_FIELDS, *FRUIT_FIELDS,
+    *TERRAIN_TYPE_CODES, *RESOURCE_TYPE_CODES
+)))
+KNOWN_STRING_CODES = {string: code for code, string in enumerate(KNOWN_STRINGS)}
+KNOWN_STRING_BYTES = {string: bytes((TAG_KNOWN_STR, code)) for code, string in enumerate(KNOWN_STRINGS)}
+
+# Encodage des entiers de -128 à 127 (indexé par valeur + 128)
+SMALL_INT_BYTES = tuple(bytes((TAG_INT8, value & 0xFF)) for value in range(-128, 128))
+
+INT8 = struct.Struct("<b")
+INT16 = struct.Struct("<h")
+INT32 = struct.Struct("<i")
+INT64 = struct.Struct("<q")
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<I")
+FLOAT = struct.Struct("<d")
+
+# Structure de chaque étiquette de valeur numérique (None pour les autres étiquettes)
+SCALAR_STRUCTS = [None] * 256
+for _tag, _struct in ((TAG_INT16, INT16), (TAG_INT32, INT32), (TAG_INT64, INT64), (TAG_FLOAT, FLOAT)):
+    SCALAR_STRUCTS[_tag] = _struct
+del _tag, _struct
+
+# Parties présentes d'un patch de dictionnaire (octet qui suit TAG_PATCH_DICT)
+PATCH_HAS_VALUES = 0x01
+PATCH_HAS_PATCHES = 0x02
+PATCH_HAS_REMOVED = 0x04
+
+# Dictionnaire et liste vides (étiquette et nombre d'éléments)
+EMPTY_DICT_BYTES = bytes((TAG_DICT, 0, 0, 0, 0))
+EMPTY_LIST_BYTES = bytes((TAG_LIST, 0, 0, 0, 0))
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+INT_TYPES = {int}
+BOOL_TYPES = {bool}
+DICT_TYPES = {dict}
+
+
+@functools.lru_cache(maxsize=1024)
+def dict_shape(keys):
+    """Retourne la forme d'un dictionnaire d'après ses clés (calculée une fois par suite de clés)
+
+    Args:
+        keys: Clés du dictionnaire, dans l'ordre
+
+    Returns:
+        tuple: (étiquette d'enregistrement ou None, en-tête TAG_KNOWN_DICT, en-tête
+            TAG_INT_FIELDS, structure des valeurs entières) ; les trois derniers sont
+            None si une clé n'est pas dans KNOWN_STRINGS
+    """
+    record_tag = RECORD_TAGS.get(frozenset(keys))
+    codes = [KNOWN_STRING_CODES.get(key) if type(key) is str else None for key in keys]
+    if len(codes) > 255 or None in codes:
+        return record_tag, None, None, None
+    return (record_tag, bytes((TAG_KNOWN_DICT, len(codes), *codes)),
+            bytes((TAG_INT_FIELDS, len(codes), *codes)), int_fields_struct(len(codes)))
+
+
+@functools.lru_cache(maxsize=1024)
+def known_keys(codes):
+    """Retourne les clés désignées par des index de KNOWN_STRINGS
+
+    Args:
+        codes: Index des clés (bytes)
+
+    Returns:
+        tuple: Clés
+
+    Raises:
+        IndexError: Si un index est hors de KNOWN_STRINGS
+    """
+    return tuple(KNOWN_STRINGS[code] for code in codes)
+
+
+@functools.lru_cache(maxsize=64)
+def square_list_struct(count):
+    """Retourne la structure d'un bloc de `count` cases
+
+    Les champs sont rangés par colonnes (tous les x, puis tous les y...) pour
+    être packés en un seul appel, sans boucle Python par case.
+
+    Args:
+        count: Nombre de cases du bloc
+
+    Returns:
+        struct.Struct: Colonnes des champs de SQUARE_STRUCT mises bout à bout
+    """
+    return struct.Struct(f"<{count}H{count}H{count}B{count}?{count}h")
+
+
+@functools.lru_cache(maxsize=None)
+def int_fields_struct(count):
+    """Retourne la structure de `count` entiers sur 32 bits (count <= 255)"""
+    return struct.Struct(f"<{count}i")
+
+
+@functools.lru_cache(maxsize=None)
+def animal_struct(float_mask):
+    """Retourne la structure des champs numériques d'un animal
+
+    Args:
+        float_mask: Masque des champs flottants (bit i pour ANIMAL_NUMBER_FIELDS[i])
+
+    Returns:
+        struct.Struct: Entiers sur 32 bits, flottants sur 64 bits
+    """
+    formats = ["d" if float_mask >> index & 1 else "i" for index in range(len(ANIMAL_NUMBER_FIELDS))]
+    return struct.Struct("<" + "".join(formats))
+
+
+def is_int32(value):
+    """Vérifie qu'une valeur est un entier (hors booléen) codable sur 32 bits"""
+    return type(value) is int and INT32_MIN <= value <= INT32_MAX
+
+
+class BinaryCodec:
+    """Codec binaire compact
+
+    Les valeurs sont précédées d'une étiquette d'un octet. Les dictionnaires
+    qui ont exactement les clés d'un animal, d'une case ou d'une ressource
+    sont écrits comme un enregistrement de taille fixe (types de terrain et de
+    fruit codés sur un octet), les patches de network.delta ont leurs propres
+    étiquettes et les chaînes de KNOWN_STRINGS tiennent sur deux octets ; tous
+    les autres passent par l'encodage générique.
+
+    L'encodeur évite le travail par valeur : la forme d'un dictionnaire
+    (enregistrement, en-tête des clés connues, structure de ses entiers) est
+    calculée une fois par suite de clés, les valeurs entières d'un même
+    dictionnaire ou d'une liste de cases sont packées en un seul appel à
+    struct, et les petits entiers et les clés connues sont écrits sans appel
+    récursif.
+
+    Le décodage ne crée que des types simples : contrairement à pickle, un
+    message malveillant ne peut pas exécuter de code.
+    """
+    name = "binary"
+    MAGIC = 0xB1
+    VERSION = 2
+
+    def __init__(self):
+        """Initialise le codec"""
+        self.readers = self.build_readers()
+
+    def encode(self, message):
+        """Encode un message
+
+        Args:
+            message: Message à encoder (dictionnaires, listes, tuples, chaînes, nombres, booléens, None)
+
+        Returns:
+            bytes: Message encodé
+
+        Raises:
+            TypeError: Si le message contient un type non supporté
+        """
+        out = bytearray((self.MAGIC, self.VERSION))
+        self.write_value(out, message, {})
+        return bytes(out)
+
+    def decode(self, data):
+        """Décode un message
+
+        Args:
+            data: Message encodé (bytes ou memoryview)
+
+        Returns:
+            Le message décodé
+
+        Raises:
+            ValueError: Si les données ne sont pas un message binaire valide
+        """
+        # Indexer des bytes est plus rapide qu'indexer une memoryview
+        data = bytes(data)
+        if len(data) < 2 or data[0] != self.MAGIC:
+            raise ValueError("Message binaire invalide")
+        if data[1] != self.VERSION:
+            raise ValueError(f"Version du codec binaire non supportée: {data[1]}")
+        try:
+            value, offset = self.read_value(data, 2, [])
+        except (struct.error, IndexError, KeyError, TypeError, UnicodeDecodeError, RecursionError) as e:
+            raise ValueError(f"Message binaire tronqué ou corrompu: {e!r}")
+        if offset != len(data):
+            raise ValueError("Données en trop après le message binaire")
+        return value
+
+    def write_value(self, out, value, strings):
+        """Écrit une valeur étiquetée à la fin de `out`
+
+        Args:
+            out: Tampon de sortie
+            value: Valeur à écrire
+            strings: Chaînes déjà écrites dans le message ({chaîne: index})
+        """
+        value_type = type(value)
+        if value_type is int:
+            if -128 <= value <= 127:
+                out += SMALL_INT_BYTES[value + 128]
+            else:
+                self.write_int(out, value)
+        elif value_type is str:
+            known = KNOWN_STRING_BYTES.get(value)
+            if known is None:
+                self.write_str(out, value, strings)
+            else:
+                out += known
+        elif value_type is dict:
+            self.write_dict(out, value, strings)
+        elif value is None:
+            out.append(TAG_NONE)
+        elif value_type is bool:
+            out.append(TAG_TRUE if value else TAG_FALSE)
+        elif value_type is list:
+            self.write_list(out, value, strings)
+        elif value_type is tuple:
+            if not self.write_patch(out, value, strings):
+                out.append(TAG_TUPLE)
+                self.write_items(out, value, strings)
+        elif value_type is float:
+            out.append(TAG_FLOAT)
+            out += FLOAT.pack(value)
+        elif isinstance(value, (bytes, bytearray)):
+            out.append(TAG_BYTES)
+            out += UINT32.pack(len(value))
+            out += value
+        elif isinstance(value, dict):
+            self.write_dict(out, dict(value), strings)
+        elif isinstance(value, list):
+            self.write_list(out, list(value), strings)
+        elif isinstance(value, tuple):
+            out.append(TAG_TUPLE)
+            self.write_items(out, value, strings)
+        else:
+            raise TypeError(f"Type non supporté par le codec binaire: {type(value).__name__}")
+
+    def write_int(self, out, value):
+        """Écrit un entier hors de [-128, 127] sur la plus petite taille possible"""
+        if -32768 <= value <= 32767:
+            out.append(TAG_INT16)
+            out += INT16.pack(value)
+        elif INT32_MIN <= value <= INT32_MAX:
+            out.append(TAG_INT32)
+            out += INT32.pack(value)
+        elif -2 ** 63 <= value < 2 ** 63:
+            out.append(TAG_INT64)
+            out += INT64.pack(value)
+        else:
+            out.append(TAG_BIGINT)
+            self.write_string(out, str(value))
+
+    def write_str(self, out, value, strings):
+        """Écrit une chaîne absente de KNOWN_STRINGS (référence si elle a déjà été écrite)"""
+        index = strings.get(value)
+        if index is not None:
+            out.append(TAG_STR_REF)
+            out += UINT16.pack(index)
+            return
+        if len(strings) <= 0xFFFF:
+            strings[value] = len(strings)
+        encoded = value.encode("utf-8")
+        if len(encoded) < 256:
+            out.append(TAG_SHORT_STR)
+            out.append(len(encoded))
+        else:
+            out.append(TAG_STR)
+            out += UINT32.pack(len(encoded))
+        out += encoded
+
+    def write_string(self, out, value):
+        """Écrit une chaîne (longueur sur 2 octets) sans étiquette"""
+        encoded = value.encode("utf-8")
+        out += UINT16.pack(len(encoded))
+        out += encoded
+
+    def write_dict(self, out, value, strings):
+        """Écrit un dictionnaire : enregistrement fixe, champs entiers, clés connues ou forme générique"""
+        if not value:
+            out += EMPTY_DICT_BYTES
+            return
+        record_tag, known_header, int_header, int_struct = dict_shape(tuple(value))
+        if record_tag is not None and self.write_record(out, value, record_tag):
+            return
+        write_value = self.write_value
+
+        if known_header is None:
+            out.append(TAG_DICT)
+            out += UINT32.pack(len(value))
+            for key, item in value.items():
+                known = KNOWN_STRING_BYTES.get(key) if type(key) is str else None
+                if known is None:
+                    write_value(out, key, strings)
+                else:
+                    out += known
+                if type(item) is int and -128 <= item <= 127:
+                    out += SMALL_INT_BYTES[item + 128]
+                else:
+                    write_value(out, item, strings)
+            return
+
+        values = tuple(value.values())
+        # Que des entiers (pas de booléens) : un seul appel à struct
+        if type(values[0]) is int and set(map(type, values)) == INT_TYPES:
+            try:
+                packed = int_struct.pack(*values)
+            except struct.error:
+                pass  # Entier hors de 32 bits : écrit valeur par valeur
+            else:
+                out += int_header
+                out += packed
+                return
+
+        # Cas les plus fréquents sans appel récursif : petit entier, patch
+        out += known_header
+        for item in values:
+            item_type = type(item)
+            if item_type is int and -128 <= item <= 127:
+                out += SMALL_INT_BYTES[item + 128]
+            elif item_type is not tuple or not self.write_patch(out, item, strings):
+                write_value(out, item, strings)
+
+    def write_list(self, out, value, strings):
+        """Écrit une liste (bloc de cases si possible)"""
+        if not value:
+            out += EMPTY_LIST_BYTES
+            return
+        if type(value[0]) is dict and self.write_square_list(out, value):
+            return
+        out.append(TAG_LIST)
+        self.write_items(out, value, strings)
+
+    def write_items(self, out, items, strings):
+        """Écrit le nombre d'éléments puis les éléments d'une liste ou d'un tuple"""
+        out += UINT32.pack(len(items))
+        write_value = self.write_value
+        write_dict = self.write_dict
+        for item in items:
+            item_type = type(item)
+            if item_type is int and -128 <= item <= 127:
+                out += SMALL_INT_BYTES[item + 128]
+            elif item_type is dict:
+                write_dict(out, item, strings)
+            else:
+                write_value(out, item, strings)
+
+    def write_patch(self, out, value, strings):
+        """Écrit un patch de network.delta avec son étiquette
+
+        Args:
+            out: Tampon de sortie
+            value: Tuple à écrire
+            strings: Chaînes déjà écrites dans le message
+
+        Returns:
+            bool: False si le tuple n'a pas la forme d'un patch (rien n'est écrit)
+        """
+        if not value:
+            return False
+        kind = value[0]
+        if kind == delta.DICT and type(kind) is str:
+            if len(value) != 4:
+                return False
+            _, set_values, patches, removed = value
+            if type(set_values) is not dict or type(patches) is not dict or type(removed) is not list:
+                return False
+            out.append(TAG_PATCH_DICT)
+            out.append((PATCH_HAS_VALUES if set_values else 0) | (PATCH_HAS_PATCHES if patches else 0)
+                       | (PATCH_HAS_REMOVED if removed else 0))
+            if set_values:
+                self.write_dict(out, set_values, strings)
+            if patches:
+                self.write_dict(out, patches, strings)
+            if removed:
+                self.write_list(out, removed, strings)
+            return True
+        if kind == delta.LIST and type(kind) is str:
+            if len(value) != 2 or type(value[1]) is not dict:
+                return False
+            patches = value[1]
+            if patches and (set(map(type, patches)) != INT_TYPES or min(patches) < 0 or max(patches) > 0xFFFF):
+                return False
+            out.append(TAG_PATCH_LIST)
+            out += UINT32.pack(len(patches))
+            for index, patch in patches.items():
+                out += UINT16.pack(index)
+                if type(patch) is not tuple or not self.write_patch(out, patch, strings):
+                    self.write_value(out, patch, strings)
+            return True
+        if kind == delta.REPLACE and type(kind) is str and len(value) == 2:
+            out.append(TAG_PATCH_REPLACE)
+            self.write_value(out, value[1], strings)
+            return True
+        return False
+
+    def write_square_list(self, out, squares):
+        """Écrit une liste de cases en un seul bloc (un seul appel à struct.pack)
+
+        Les champs sont extraits avec map() et zip() : aucune boucle Python par case.
+
+        Args:
+            out: Tampon de sortie
+            squares: Liste non vide dont le premier élément est un dictionnaire
+
+        Returns:
+            bool: False si la liste ne contient pas que des cases valides (rien n'est écrit)
+        """
+        # Tester le premier élément avant de parcourir toute la liste
+        if len(squares[0]) != len(SQUARE_FIELDS) or dict_shape(tuple(squares[0]))[0] != TAG_SQUARE:
+            return False
+        # Exactement cinq clés, qui contiennent toutes celles d'une case : ce sont celles d'une case
+        if set(map(type, squares)) != DICT_TYPES or set(map(len, squares)) != {len(SQUARE_FIELDS)}:
+            return False
+        try:
+            xs, ys, terrain_types, orchards, speeds = zip(*map(get_square_fields, squares))
+            terrain_codes = list(map(TERRAIN_TYPE_CODES.__getitem__, terrain_types))
+        except (KeyError, TypeError):
+            return False
+        if ({*map(type, xs), *map(type, ys), *map(type, speeds)} != INT_TYPES
+                or set(map(type, orchards)) != BOOL_TYPES):
+            return False
+        try:
+            packed = square_list_struct(len(squares)).pack(*xs, *ys, *terrain_codes, *orchards, *speeds)
+        except struct.error:
+            return False
+        out.append(TAG_SQUARE_LIST)
+        out += UINT32.pack(len(squares))
+        out += packed
+        return True
+
+    def write_record(self, out, value, record_tag):
+        """Écrit un animal, une case ou une ressource sous forme d'enregistrement fixe
+
+        Args:
+            out: Tampon de sortie
+            value: Dictionnaire à écrire, dont les clés sont celles de l'enregistrement
+            record_tag: Étiquette de l'enregistrement (voir RECORD_TAGS)
+
+        Returns:
+            bool: False si les valeurs ne tiennent pas dans l'enregistrement (rien n'est écrit)
+        """
+        if record_tag == TAG_ANIMAL:
+            if type(value["name"]) is not str or type(value["is_alive"]) is not bool:
+                return False
+            numbers = get_animal_numbers(value)
+            number_types = set(map(type, numbers))
+            if number_types == INT_TYPES:
+                float_mask = 0
+            elif number_types <= {int, float}:
+                float_mask = 0
+                for index, number in enumerate(numbers):
+                    if type(number) is float:
+                        float_mask |= 1 << index
+            else:
+                return False
+            try:
+                packed = animal_struct(float_mask).pack(*numbers)
+            except struct.error:
+                return False
+            out.append(TAG_ANIMAL)
+            self.write_string(out, value["name"])
+            out.append(value["is_alive"])
+            out += UINT16.pack(float_mask)
+            out += packed
+            return True
+
+        if record_tag == TAG_SQUARE:
+            if (type(value["x"]) is int and 0 <= value["x"] <= 0xFFFF
+                    and type(value["y"]) is int and 0 <= value["y"] <= 0xFFFF
+                    and value["terrain_type"] in TERRAIN_TYPE_CODES
+                    and type(value["is_orchard"]) is bool
+                    and type(value["speed_points"]) is int and -32768 <= value["speed_points"] <= 32767):
+                out.append(TAG_SQUARE)
+                out += SQUARE_STRUCT.pack(value["x"], value["y"], TERRAIN_TYPE_CODES[value["terrain_type"]],
+                                          value["is_orchard"], value["speed_points"])
+                return True
+            return False
+
+        # Ressource ou fruit
+        if not is_int32(value["position"]) or value["type"] not in RESOURCE_TYPE_CODES:
+            return False
+        type_code = RESOURCE_TYPE_CODES[value["type"]]
+        if record_tag == TAG_RESOURCE:
+            out.append(TAG_RESOURCE)
+            out += RESOURCE_STRUCT.pack(value["position"], type_code)
+            return True
+        if not all(is_int32(value[field]) for field in FRUIT_FIELDS):
+            return False
+        out.append(TAG_FRUIT)
+        out += FRUIT_STRUCT.pack(value["position"], type_code, *[value[field] for field in FRUIT_FIELDS])
+        return True
+
+    def read_value(self, data, offset, strings):
+        """Lit une valeur étiquetée
+
+        Args:
+            data: Message (bytes)
+            offset: Position de l'étiquette
+            strings: Chaînes déjà lues dans le message (dans l'ordre d'écriture)
+
+        Returns:
+            tuple: (valeur, position suivante)
+        """
+        tag = data[offset]
+        # Cas les plus fréquents sans appel supplémentaire
+        if tag == TAG_INT8:
+            value = data[offset + 1]
+            return (value - 256 if value > 127 else value), offset + 2
+        if tag == TAG_KNOWN_STR:
+            return KNOWN_STRINGS[data[offset + 1]], offset + 2
+        return self.readers[tag](data, offset + 1, strings)
+
+    def build_readers(self):
+        """Construit la table des fonctions de lecture, indexée par étiquette
+
+        Chaque fonction reçoit (data, position après l'étiquette, strings) et
+        retourne (valeur, position suivante).
+
+        Returns:
+            list: 256 fonctions de lecture
+        """
+        readers = [self.read_unknown] * 256
+        readers[TAG_NONE] = lambda data, offset, strings: (None, offset)
+        readers[TAG_FALSE] = lambda data, offset, strings: (False, offset)
+        readers[TAG_TRUE] = lambda data, offset, strings: (True, offset)
+        for tag, number in ((TAG_INT16, INT16), (TAG_INT32, INT32), (TAG_INT64, INT64), (TAG_FLOAT, FLOAT)):
+            readers[tag] = functools.partial(self.read_number, number)
+        readers[TAG_BIGINT] = self.read_bigint
+        readers[TAG_SHORT_STR] = self.read_short_str
+        readers[TAG_STR] = self.read_str
+        readers[TAG_STR_REF] = self.read_str_ref
+        readers[TAG_BYTES] = self.read_bytes_value
+        readers[TAG_LIST] = self.read_list
+        readers[TAG_TUPLE] = self.read_tuple
+        readers[TAG_DICT] = self.read_dict
+        readers[TAG_ANIMAL] = self.read_animal
+        readers[TAG_SQUARE] = self.read_square
+        readers[TAG_RESOURCE] = self.read_resource
+        readers[TAG_FRUIT] = self.read_fruit
+        readers[TAG_SQUARE_LIST] = self.read_square_list
+        readers[TAG_KNOWN_DICT] = self.read_known_dict
+        readers[TAG_INT_FIELDS] = self.read_int_fields
+        readers[TAG_PATCH_REPLACE] = self.read_patch_replace
+        readers[TAG_PATCH_DICT] = self.read_patch_dict
+        readers[TAG_PATCH_LIST] = self.read_patch_list
+        return readers
+
+    @staticmethod
+    def read_unknown(data, offset, strings):
+        """Refuse une étiquette inconnue"""
+        raise ValueError(f"Étiquette inconnue: {data[offset - 1]:#x}")
+
+    @staticmethod
+    def read_number(number, data, offset, strings):
+        """Lit un nombre de la structure `number`"""
+        return number.unpack_from(data, offset)[0], offset + number.size
+
+    def read_bigint(self, data, offset, strings):
+        """Lit un entier écrit en décimal"""
+        text, offset = self.read_string(data, offset)
+        return int(text), offset
+
+    def read_short_str(self, data, offset, strings):
+        """Lit une chaîne de moins de 256 octets"""
+        length = data[offset]
+        value = self.read_bytes(data, offset + 1, length).decode("utf-8")
+        strings.append(value)
+        return value, offset + 1 + length
+
+    def read_str(self, data, offset, strings):
+        """Lit une chaîne longue"""
+        length = UINT32.unpack_from(data, offset)[0]
+        value = self.read_bytes(data, offset + 4, length).decode("utf-8")
+        strings.append(value)
+        return value, offset + 4 + length
+
+    @staticmethod
+    def read_str_ref(data, offset, strings):
+        """Lit une référence à une chaîne déjà lue"""
+        return strings[UINT16.unpack_from(data, offset)[0]], offset + 2
+
+    def read_bytes_value(self, data, offset, strings):
+        """Lit une suite d'octets"""
+        length = UINT32.unpack_from(data, offset)[0]
+        return self.read_bytes(data, offset + 4, length), offset + 4 + length
+
+    def read_list(self, data, offset, strings):
+        """Lit une liste"""
+        count = self.read_count(data, offset, 1)
+        offset += 4
+        items = []
+        append = items.append
+        read_value = self.read_value
+        for _ in range(count):
+            item, offset = read_value(data, offset, strings)
+            append(item)
+        return items, offset
+
+    def read_tuple(self, data, offset, strings):
+        """Lit un tuple"""
+        items, offset = self.read_list(data, offset, strings)
+        return tuple(items), offset
+
+    def read_dict(self, data, offset, strings):
+        """Lit un dictionnaire générique"""
+        count = self.read_count(data, offset, 2)
+        offset += 4
+        value = {}
+        read_value = self.read_value
+        for _ in range(count):
+            key, offset = read_value(data, offset, strings)
+            value[key], offset = read_value(data, offset, strings)
+        return value, offset
+
+    def read_known_dict(self, data, offset, strings):
+        """Lit un dictionnaire dont les clés sont dans KNOWN_STRINGS"""
+        count = data[offset]
+        end = offset + 1 + count
+        if end > len(data):
+            raise ValueError("Message binaire tronqué")
+        keys = known_keys(data[offset + 1:end])
+        offset = end
+        values = []
+        append = values.append
+        read_value = self.read_value
+        for _ in range(count):
+            # Petits entiers et chaînes connues sans appel récursif
+            tag = data[offset]
+            if tag == TAG_INT8:
+                value = data[offset + 1]
+                append(value - 256 if value > 127 else value)
+                offset += 2
+            elif tag == TAG_KNOWN_STR:
+                append(KNOWN_STRINGS[data[offset + 1]])
+                offset += 2
+            else:
+                value, offset = read_value(data, offset, strings)
+                append(value)
+        return dict(zip(keys, values)), offset
+
+    @staticmethod
+    def read_int_fields(data, offset, strings):
+        """Lit un dictionnaire de champs entiers à clés connues"""
+        count = data[offset]
+        end = offset + 1 + count
+        if end > len(data):
+            raise ValueError("Message binaire tronqué")
+        keys = known_keys(data[offset + 1:end])
+        numbers = int_fields_struct(count)
+        return dict(zip(keys, numbers.unpack_from(data, end))), end + numbers.size
+
+    def read_patch_replace(self, data, offset, strings):
+        """Lit un patch ("r", valeur)"""
+        value, offset = self.read_value(data, offset, strings)
+        return (delta.REPLACE, value), offset
+
+    def read_patch_dict(self, data, offset, strings):
+        """Lit un patch ("d", valeurs, patches, clés supprimées)"""
+        parts = data[offset]
+        offset += 1
+        set_values = {}
+        patches = {}
+        removed = []
+        if parts & PATCH_HAS_VALUES:
+            set_values, offset = self.read_value(data, offset, strings)
+        if parts & PATCH_HAS_PATCHES:
+            patches, offset = self.read_value(data, offset, strings)
+        if parts & PATCH_HAS_REMOVED:
+            removed, offset = self.read_value(data, offset, strings)
+        if type(set_values) is not dict or type(patches) is not dict or type(removed) is not list:
+            raise ValueError("Patch de dictionnaire invalide")
+        return (delta.DICT, set_values, patches, removed), offset
+
+    def read_patch_list(self, data, offset, strings):
+        """Lit un patch ("l", {index: patch})"""
+        count = self.read_count(data, offset, 3)
+        offset += 4
+        patches = {}
+        read_value = self.read_value
+        for _ in range(count):
+            index = UINT16.unpack_from(data, offset)[0]
+            patches[index], offset = read_value(data, offset + 2, strings)
+        return (delta.LIST, patches), offset
+
+    @staticmethod
+    def read_square(data, offset, strings):
+        """Lit une case"""
+        x, y, terrain_code, is_orchard, speed_points = SQUARE_STRUCT.unpack_from(data, offset)
+        return {
+            "x": x,
+            "y": y,
+            "terrain_type": TERRAIN_TYPE_NAMES[terrain_code],
+            "is_orchard": is_orchard,
+            "speed_points": speed_points
+        }, offset + SQUARE_STRUCT.size
+
+    def read_square_list(self, data, offset, strings):
+        """Lit un bloc de cases écrit en colonnes"""
+        count = self.read_count(data, offset, SQUARE_STRUCT.size)
+        offset += 4
+        fields = square_list_struct(count).unpack_from(data, offset)
+        terrain_types = map(TERRAIN_TYPE_NAMES.__getitem__, fields[2 * count:3 * count])
+        squares = [
+            {"x": x, "y": y, "terrain_type": terrain_type, "is_orchard": is_orchard, "speed_points": speed}
+            for x, y, terrain_type, is_orchard, speed in zip(
+                fields[:count], fields[count:2 * count], terrain_types,
+                fields[3 * count:4 * count], fields[4 * count:]
+            )
+        ]
+        return squares, offset + count * SQUARE_STRUCT.size
+
+    def read_animal(self, data, offset, strings):
+        """Lit un animal"""
+        name, offset = self.read_string(data, offset)
+        is_alive = bool(data[offset])
+        float_mask = UINT16.unpack_from(data, offset + 1)[0]
+        offset += 3
+        numbers_struct = animal_struct(float_mask & ((1 << len(ANIMAL_NUMBER_FIELDS)) - 1))
+        value = dict(zip(ANIMAL_NUMBER_FIELDS, numbers_struct.unpack_from(data, offset)))
+        value["name"] = name
+        value["is_alive"] = is_alive
+        return value, offset + numbers_struct.size
+
+    @staticmethod
+    def read_resource(data, offset, strings):
+        """Lit une ressource"""
+        position, type_code = RESOURCE_STRUCT.unpack_from(data, offset)
+        return {"position": position, "type": RESOURCE_TYPE_NAMES[type_code]}, offset + RESOURCE_STRUCT.size
+
+    @staticmethod
+    def read_fruit(data, offset, strings):
+        """Lit un fruit"""
+        position, type_code, *amounts = FRUIT_STRUCT.unpack_from(data, offset)
+        value = {"position": position, "type": RESOURCE_TYPE_NAMES[type_code]}
+        value.update(zip(FRUIT_FIELDS, amounts))
+        return value, offset + FRUIT_STRUCT.size
+
+    @staticmethod
+    def read_count(data, offset, item_size):
+        """Lit un nombre d'éléments sur 4 octets en vérifiant qu'ils peuvent tenir dans le message
+
+        Args:
+            data: Message
+            offset: Position du nombre
+            item_size: Taille minimale (octets) d'un élément
+
+        Returns:
+            int: Nombre d'éléments
+
+        Raises:
+            ValueError: Si le nombre annoncé dépasse ce que le reste du message peut contenir
+        """
+        count = UINT32.unpack_from(data, offset)[0]
+        if count * item_size > len(data) - offset - 4:
+            raise ValueError(f"Nombre d'éléments trop grand pour le message: {count}")
+        return count
+
+    def read_string(self, data, offset):
+        """Lit une chaîne écrite par write_string
+
+        Returns:
+            tuple: (chaîne, position suivante)
+        """
+        length = UINT16.unpack_from(data, offset)[0]
+        offset += 2
+        return self.read_bytes(data, offset, length).decode("utf-8"), offset + length
+
+    @staticmethod
+    def read_bytes(data, offset, length):
+        """Lit `length` octets en vérifiant qu'ils sont bien présents"""
+        if offset + length > len(data):
+            raise ValueError("Message binaire tronqué")
+        return data[offset:offset + length]
+
+
+# Codecs disponibles, par nom et par premier octet
+CODECS = {codec.name: codec for codec in (BinaryCodec(), PickleCodec())}
+CODECS_BY_MAGIC = {codec.MAGIC: codec for codec in CODECS.values()}
+
+# Codec de départ de toute connexion
+DEFAULT_CODEC = CODECS[BinaryCodec.name]
+
+# Codec sûr pour les données d'un pair inconnu : toujours accepté par le serveur,
+# c'est celui de la poignée de main (set_codec, resume)
+SAFE_CODEC = CODECS[BinaryCodec.name]
+
+# Ordre de préférence lors de la négociation (pickle seulement si le serveur l'autorise et
+# qu'aucun codec sûr n'est commun)
+PREFERRED_CODECS = (BinaryCodec.name, PickleCodec.name)
+
+
+def get_codec(name):
+    """Retourne un codec par son nom
+
+    Args:
+        name: Nom du codec
+
+    Returns:
+        Le codec, ou None s'il est inconnu
+    """
+    return CODECS.get(name)
+
+
+def negotiate_codec(offered):
+    """Choisit le codec préféré parmi ceux proposés par le serveur
+
+    Args:
+        offered: Noms des codecs proposés
+
+    Returns:
+        Le codec choisi (DEFAULT_CODEC si aucun codec n'est commun)
+    """
+    for name in PREFERRED_CODECS:
+        if name in offered:
+            return CODECS[name]
+    return DEFAULT_CODEC
+
+
+def decode_message(data, allowed=None):
+    """Décode un message en reconnaissant son codec à son premier octet
+
+    Args:
+        data: Message encodé
+        allowed: Codecs acceptés (par défaut: tous)
+
+    Returns:
+        Le message décodé
+
+    Raises:
+        ValueError: Si le codec du message est inconnu ou n'est pas accepté
+    """
+    if not len(data):
+        raise ValueError("Message vide")
+    codec = CODECS_BY_MAGIC.get(data[0])
+    if codec is None or (allowed is not None and codec not in allowed):
+        raise ValueError(f"Codec non accepté pour ce message (premier octet {data[0]:#x})")
+    return codec.decode(data)
@@ -0,0 +1,211 @@
+"""
+Différences (deltas) entre deux états de jeu sérialisables.
+
+Un état de jeu est fait de dictionnaires, de listes et de valeurs simples
+(voir GameStateEncoder). Un patch décrit comment passer d'un état à un autre :
+
+- ("r", valeur) : remplacer la valeur entière
+- ("d", {clé: valeur}, {clé: patch}, [clés supprimées]) : modifier un dictionnaire
+- ("l", {index: patch}) : modifier certains éléments d'une liste de même longueur
+
+Les patches ne contiennent que des valeurs finales (jamais d'incréments) :
+appliquer un patch de la version A à la version C sur un état déjà en
+version B (A <= B <= C) donne bien la version C.
+"""
+import copy
+
+REPLACE = "r"
+DICT = "d"
+LIST = "l"
+
+
+def diff(old, new):
+    """Calcule le patch qui transforme `old` en `new`
+
+    Args:
+        old: Valeur de départ
+        new: Valeur d'arrivée
+
+    Returns:
+        tuple: Patch, ou None si les deux valeurs sont égales
+    """
+    if old is new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        return diff_dict(old, new, new.keys(), deletions=True)
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        patches = {}
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            patch = diff(old_item, new_item)
+            if patch is not None:
+                patches[index] = patch
+        return (LIST, patches) if patches else None
+    if type(old) is type(new) and old == new:
+        return None
+    return (REPLACE, copy.deepcopy(new))
+
+
+def diff_dict(old, new, keys, deletions=False):
+    """Calcule le patch d'un dictionnaire restreint à certaines clés
+
+    Args:
+        old: Dictionnaire de départ
+        new: Dictionnaire d'arrivée
+        keys: Clés de `new` à comparer
+        deletions: Si True, les clés de `old` absentes de `new` sont supprimées
+
+    Returns:
+        tuple: Patch ("d", ...), ou None si rien n'a changé
+    """
+    set_values = {}
+    patches = {}
+    for key in keys:
+        if key not in old:
+            set_values[key] = copy.deepcopy(new[key])
+            continue
+        patch = diff(old[key], new[key])
+        if patch is None:
+            continue
+        if patch[0] == REPLACE:
+            set_values[key] = patch[1]
+        else:
+            patches[key] = patch
+    removed = [key for key in old if key not in new] if deletions else []
+    if not set_values and not patches and not removed:
+        return None
+    return (DICT, set_values, patches, removed)
+
+
+def diff_update(old, update):
+    """Calcule le patch équivalent à old.update(update)
+
+    Args:
+        old: Dictionnaire de départ
+        update: Valeurs qui remplacent celles de `old` (les autres clés sont conservées)
+
+    Returns:
+        tuple: Patch ("d", ...), ou None si rien n'a changé
+    """
+    return diff_dict(old, update, update.keys())
+
+
+def apply(value, patch):
+    """Applique un patch à une valeur
+
+    Les dictionnaires et les listes sont modifiés sur place.
+
+    Args:
+        value: Valeur à modifier
+        patch: Patch produit par diff ou merge
+
+    Returns:
+        La nouvelle valeur
+
+    Raises:
+        ValueError: Si le patch ne correspond pas à la structure de la valeur
+    """
+    if patch is None:
+        return value
+    kind = patch[0]
+    if kind == REPLACE:
+        return copy.deepcopy(patch[1])
+    if kind == DICT:
+        if not isinstance(value, dict):
+            raise ValueError("Patch de dictionnaire appliqué à une autre valeur")
+        _, set_values, patches, removed = patch
+        for key in removed:
+            value.pop(key, None)
+        for key, new_value in set_values.items():
+            value[key] = copy.deepcopy(new_value)
+        for key, sub_patch in patches.items():
+            if key not in value:
+                raise ValueError(f"Clé absente de l'état: {key}")
+            value[key] = apply(value[key], sub_patch)
+        return value
+    if kind == LIST:
+        if not isinstance(value, list):
+            raise ValueError("Patch de liste appliqué à une autre valeur")
+        for index, sub_patch in patch[1].items():
+            if index >= len(value):
+                raise ValueError(f"Index absent de la liste: {index}")
+            value[index] = apply(value[index], sub_patch)
+        return value
+    raise ValueError(f"Type de patch inconnu: {kind}")
+
+
+def merge(first, second):
+    """Compose deux patches successifs en un seul
+
+    Args:
+        first: Patch de la version A à la version B
+        second: Patch de la version B à la version C
+
+    Returns:
+        tuple: Patch de la version A à la version C
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if second[0] == REPLACE:
+        return second
+    if first[0] == REPLACE:
+        return (REPLACE, apply(copy.deepcopy(first[1]), second))
+    if first[0] == DICT and second[0] == DICT:
+        _, set_values, patches, removed = first
+        set_values = dict(set_values)
+        patches = dict(patches)
+        removed = list(removed)
+        _, second_set, second_patches, second_removed = second
+        for key in second_removed:
+            set_values.pop(key, None)
+            patches.pop(key, None)
+            if key not in removed:
+                removed.append(key)
+        for key, new_value in second_set.items():
+            set_values[key] = new_value
+            patches.pop(key, None)
+            if key in removed:
+                removed.remove(key)
+        for key, sub_patch in second_patches.items():
+            if key in set_values:
+                set_values[key] = apply(copy.deepcopy(set_values[key]), sub_patch)
+            elif key in patches:
+                patches[key] = merge(patches[key], sub_patch)
+            else:
+                patches[key] = sub_patch
+        return (DICT, set_values, patches, removed)
+    if first[0] == LIST and second[0] == LIST:
+        patches = dict(first[1])
+        for index, sub_patch in second[1].items():
+            patches[index] = merge(patches[index], sub_patch) if index in patches else sub_patch
+        return (LIST, patches)
+    raise ValueError("Patches incompatibles")
+
+
+def expand_update(state, patch):
+    """Reconstruit les valeurs complètes d'un patch produit par diff_update
+
+    Les valeurs de `state` ne sont pas modifiées : les clés patchées sont copiées.
+
+    Args:
+        state: Dictionnaire auquel le patch s'applique
+        patch: Patch ("d", ...) produit par diff_update
+
+    Returns:
+        dict: Dictionnaire à passer à state.update()
+
+    Raises:
+        ValueError: Si le patch ne correspond pas à la structure de `state`
+    """
+    if patch is None:
+        return {}
+    if patch[0] != DICT:
+        raise ValueError("Patch de dictionnaire attendu")
+    _, set_values, patches, _ = patch
+    values = copy.deepcopy(set_values)
+    for key, sub_patch in patches.items():
+        if key not in state:
+            raise ValueError(f"Clé absente de l'état: {key}")
+        values[key] = apply(copy.deepcopy(state[key]), sub_patch)
+    return values
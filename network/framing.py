@@ -0,0 +1,155 @@
+"""
+Lecture et écriture des trames du protocole réseau.
+
+Une trame est la taille des données sur 4 octets big-endian suivie des
+données (voir network.codec). FrameReader lit les trames d'un socket avec
+recv_into dans un tampon réutilisé, sans concaténer de morceaux : lire une
+trame coûte un temps proportionnel à sa taille, quelle qu'elle soit.
+
+send_buffers écrit plusieurs tampons (en-tête et données, ou plusieurs
+trames en attente) en un seul appel système sendmsg, et set_nodelay
+désactive l'algorithme de Nagle : un petit message part immédiatement au
+lieu d'attendre l'accusé de réception TCP du précédent.
+"""
+import socket
+
+# Taille initiale du tampon de réception (agrandi au besoin, jamais réduit)
+INITIAL_BUFFER_SIZE = 64 * 1024
+
+# Taille maximale acceptée pour une trame
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+HEADER_SIZE = 4
+
+# Nombre maximal de tampons passés à un appel sendmsg (IOV_MAX vaut 1024 sous Linux)
+MAX_SEND_BUFFERS = 512
+
+
+class FrameReader:
+    """Lit les trames d'un socket dans un tampon réutilisable
+
+    Un timeout du socket (socket.timeout) peut interrompre read_frame à tout
+    moment : la lecture en cours est conservée et reprend à l'appel suivant.
+    Le socket peut donc garder le même timeout pendant toute la connexion.
+    """
+
+    def __init__(self, sock, initial_size=INITIAL_BUFFER_SIZE, max_frame_size=MAX_FRAME_SIZE):
+        """Initialise le lecteur
+
+        Args:
+            sock: Socket connecté
+            initial_size: Taille initiale du tampon de réception
+            max_frame_size: Taille maximale acceptée pour une trame
+        """
+        self.sock = sock
+        self.max_frame_size = max_frame_size
+        self.header = bytearray(HEADER_SIZE)
+        self.header_view = memoryview(self.header)
+        self.header_received = 0
+        self.buffer = bytearray(initial_size)
+        self.view = memoryview(self.buffer)
+        self.size = None  # Taille de la trame en cours (None tant que l'en-tête n'est pas complet)
+        self.received = 0
+
+    def read_frame(self):
+        """Lit la trame suivante
+
+        Returns:
+            memoryview: Données de la trame, valides jusqu'au prochain appel
+            (None si la connexion a été fermée entre deux trames)
+
+        Raises:
+            socket.timeout: Si le timeout du socket expire (la lecture reprendra au prochain appel)
+            ConnectionError: Si la connexion est fermée au milieu d'une trame
+            ValueError: Si la trame annoncée dépasse max_frame_size
+        """
+        while self.size is None:
+            count = self.sock.recv_into(self.header_view[self.header_received:])
+            if count == 0:
+                if self.header_received == 0:
+                    return None
+                raise ConnectionError("Connexion fermée au milieu d'un en-tête de trame")
+            self.header_received += count
+            if self.header_received == HEADER_SIZE:
+                size = int.from_bytes(self.header, byteorder='big')
+                if size > self.max_frame_size:
+                    raise ValueError(f"Trame trop grande: {size} octets (maximum {self.max_frame_size})")
+                self.reserve(size)
+                self.size = size
+                self.received = 0
+
+        while self.received < self.size:
+            count = self.sock.recv_into(self.view[self.received:self.size])
+            if count == 0:
+                raise ConnectionError("Connexion fermée au milieu d'une trame")
+            self.received += count
+
+        frame = self.view[:self.size]
+        self.size = None
+        self.header_received = 0
+        return frame
+
+    def reserve(self, size):
+        """Agrandit le tampon pour qu'il puisse contenir `size` octets
+
+        Un nouveau tampon est alloué (au moins deux fois plus grand) plutôt que
+        de redimensionner l'ancien, qui peut encore être référencé par la
+        dernière trame retournée.
+
+        Args:
+            size: Taille de la prochaine trame
+        """
+        if size <= len(self.buffer):
+            return
+        self.buffer = bytearray(max(size, 2 * len(self.buffer)))
+        self.view = memoryview(self.buffer)
+
+
+def set_nodelay(sock):
+    """Désactive l'algorithme de Nagle sur un socket TCP
+
+    Args:
+        sock: Socket TCP connecté
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError as e:
+        print(f"Impossible d'activer TCP_NODELAY: {e}")
+
+
+def send_buffers(sock, buffers, keep_going=None):
+    """Envoie une suite de tampons en un minimum d'appels système
+
+    Les tampons sont envoyés avec sendmsg (writev) quand la plateforme le
+    permet, sinon concaténés et envoyés avec sendall.
+
+    Args:
+        sock: Socket connecté
+        buffers: Tampons à envoyer dans l'ordre (bytes, bytearray ou memoryview)
+        keep_going: Fonction appelée quand le timeout du socket expire : l'envoi reprend
+            si elle retourne True (par défaut, socket.timeout est propagé)
+
+    Raises:
+        socket.timeout: Si le timeout du socket expire et que keep_going ne dit pas de continuer
+        OSError: Si l'envoi échoue
+    """
+    if not hasattr(sock, "sendmsg"):
+        # Windows : pas de sendmsg
+        sock.sendall(b"".join(buffers))
+        return
+
+    views = [memoryview(buffer) for buffer in buffers]
+    index = 0
+    while index < len(views):
+        try:
+            sent = sock.sendmsg(views[index:index + MAX_SEND_BUFFERS])
+        except socket.timeout:
+            if keep_going is not None and keep_going():
+                continue
+            raise
+        # Passer les tampons envoyés, et la partie envoyée du suivant
+        while index < len(views) and sent >= len(views[index]):
+            sent -= len(views[index])
+            index += 1
+        if sent:
+            views[index] = views[index][sent:]
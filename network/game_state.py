@@ -31,26 +31,7 @@ class GameStateEncoder:
             
             # Encoder les animaux
             for animal in game.animals:
-                animal_data = {
-                    "name": animal.name,
-                    "max_hp": animal.max_hp,
-                    "hp": animal.hp,
-                    "max_stamina": animal.max_stamina,
-                    "stamina": animal.stamina,
-                    "speed": animal.speed,
-                    "speed_points": animal.speed_points,
-                    "position": animal.position,
-                    "is_alive": animal.is_alive,
-                    "teeth": animal.teeth,
-                    "claws": animal.claws,
-                    "skin": animal.skin,
-                    "height": animal.height,
-                    "max_hunger": animal.max_hunger,
-                    "hunger": animal.hunger,
-                    "max_thirst": animal.max_thirst,
-                    "thirst": animal.thirst
-                }
-                state["animals"].append(animal_data)
+                state["animals"].append(GameStateEncoder.encode_animal(animal))
                 
                 # Ajouter l'animal à la liste des joueurs
                 player_data = {
@@ -61,21 +42,7 @@ class GameStateEncoder:
                 state["players"].append(player_data)
             
             # Encoder les ressources
-            for position, resource in game.terrain.resources.items():
-                resource_data = {
-                    "position": position,
-                    "type": resource.__class__.__name__
-                }
-                
-                # Ajouter des attributs spécifiques selon le type de ressource
-                if isinstance(resource, Fruit):
-                    resource_data.update({
-                        "heal_amount": resource.heal_amount,
-                        "stamina_recovery": resource.stamina_recovery,
-                        "hunger_recovery": resource.hunger_recovery
-                    })
-                
-                state["resources"].append(resource_data)
+            state["resources"] = GameStateEncoder.encode_resources(game.terrain)
             
             # Encoder le terrain
             terrain_data = {
@@ -87,15 +54,7 @@ class GameStateEncoder:
             # Encoder les cases du terrain
             for y in range(game.terrain.height):
                 for x in range(game.terrain.width):
-                    square = game.terrain.grid[y][x]
-                    square_data = {
-                        "x": square.x,
-                        "y": square.y,
-                        "terrain_type": square.terrain_type,
-                        "is_orchard": square.is_orchard,
-                        "speed_points": square.speed_points
-                    }
-                    terrain_data["squares"].append(square_data)
+                    terrain_data["squares"].append(GameStateEncoder.encode_square(game.terrain.grid[y][x]))
             
             state["terrain"] = terrain_data
             
@@ -120,6 +79,82 @@ class GameStateEncoder:
                 "error": str(e)
             }
     
+    @staticmethod
+    def encode_animal(animal):
+        """Encode un animal
+        
+        Args:
+            animal: Animal à encoder
+            
+        Returns:
+            dict: Caractéristiques et état de l'animal
+        """
+        return {
+            "name": animal.name,
+            "max_hp": animal.max_hp,
+            "hp": animal.hp,
+            "max_stamina": animal.max_stamina,
+            "stamina": animal.stamina,
+            "speed": animal.speed,
+            "speed_points": animal.speed_points,
+            "position": animal.position,
+            "is_alive": animal.is_alive,
+            "teeth": animal.teeth,
+            "claws": animal.claws,
+            "skin": animal.skin,
+            "height": animal.height,
+            "max_hunger": animal.max_hunger,
+            "hunger": animal.hunger,
+            "max_thirst": animal.max_thirst,
+            "thirst": animal.thirst
+        }
+    
+    @staticmethod
+    def encode_resources(terrain):
+        """Encode les ressources présentes sur le terrain
+        
+        Args:
+            terrain: Terrain de la partie
+            
+        Returns:
+            list: Ressources, dans l'ordre de terrain.resources
+        """
+        resources = []
+        for position, resource in terrain.resources.items():
+            resource_data = {
+                "position": position,
+                "type": resource.__class__.__name__
+            }
+            
+            # Ajouter des attributs spécifiques selon le type de ressource
+            if isinstance(resource, Fruit):
+                resource_data.update({
+                    "heal_amount": resource.heal_amount,
+                    "stamina_recovery": resource.stamina_recovery,
+                    "hunger_recovery": resource.hunger_recovery
+                })
+            
+            resources.append(resource_data)
+        return resources
+    
+    @staticmethod
+    def encode_square(square):
+        """Encode une case du terrain
+        
+        Args:
+            square: Case à encoder
+            
+        Returns:
+            dict: Coordonnées, type de terrain, verger et points de vitesse de la case
+        """
+        return {
+            "x": square.x,
+            "y": square.y,
+            "terrain_type": square.terrain_type,
+            "is_orchard": square.is_orchard,
+            "speed_points": square.speed_points
+        }
+    
     @staticmethod
     def decode_game_state(state, game):
         """Décode l'état du jeu à partir d'un dictionnaire
@@ -165,7 +200,7 @@ class GameStateEncoder:
             height = terrain_data.get("height", 10)
             
             # Réinitialiser le terrain
-            game.terrain = Terrain(width, height)
+            game.terrain = Terrain(width, height, rng=game.rng)
             
             # Mettre à jour les cases du terrain
             for square_data in terrain_data.get("squares", []):
@@ -176,6 +211,8 @@ class GameStateEncoder:
                     square.terrain_type = square_data.get("terrain_type", Square.TYPE_NORMAL)
                     square.is_orchard = square_data.get("is_orchard", False)
                     square.speed_points = square_data.get("speed_points", 0)
+            game.terrain.refresh_active_squares()
+            game.terrain.invalidate_passable_moves()
             
             # Réinitialiser les animaux
             game.animals = []
@@ -237,6 +274,9 @@ class GameStateEncoder:
                             game.winner = animal
                             break
             
+            # Les animaux ont été modifiés directement : oublier les actions mémorisées
+            game.invalidate_actions()
+            
             # Restaurer les indicateurs
             state["setup_complete"] = setup_complete
             state["game_started"] = game_started
@@ -0,0 +1,165 @@
+"""
+Files d'envoi par connexion.
+
+Chaque connexion a sa propre file de trames à envoyer, vidée par un écrivain
+dédié (un thread pour GameServer, une tâche asyncio pour AsyncGameServer) :
+un client lent ou bloqué ne retarde plus les autres clients ni la boucle
+d'acceptation.
+
+La file est bornée :
+- un nouvel état ("game_update" ou "game_delta") remplace l'état encore en
+  attente, si bien qu'un client en retard ne reçoit que le dernier état ;
+- une connexion dont la file dépasse high_water octets pendant plus de
+  stall_timeout secondes, ou max_bytes octets à tout moment, est coupée ;
+- une connexion dont l'envoi en cours est bloqué depuis plus de stall_timeout
+  secondes est coupée, même si la file ne contient qu'un état remplaçable.
+
+Les trames retirées par l'écrivain restent comptées dans les octets en attente
+jusqu'à ce qu'il signale leur envoi (sent).
+"""
+import collections
+import threading
+import time
+
+# Octets en attente au-delà desquels un client est considéré en retard
+OUTBOUND_HIGH_WATER = 1024 * 1024
+
+# Durée (secondes) pendant laquelle un client peut rester au-delà de OUTBOUND_HIGH_WATER
+OUTBOUND_STALL_TIMEOUT = 5.0
+
+# Octets en attente au-delà desquels le client est déconnecté immédiatement
+OUTBOUND_MAX_BYTES = 8 * 1024 * 1024
+
+# Types de messages dont seul le plus récent doit être envoyé
+STATE_MESSAGES = ("game_update", "game_delta")
+
+
+class OutboundQueue:
+    """File bornée des trames à envoyer sur une connexion (thread-safe)"""
+
+    def __init__(self, high_water=OUTBOUND_HIGH_WATER, stall_timeout=OUTBOUND_STALL_TIMEOUT,
+                 max_bytes=OUTBOUND_MAX_BYTES, wakeup=None):
+        """Initialise une file vide
+
+        Args:
+            high_water: Octets en attente au-delà desquels le client est en retard
+            stall_timeout: Durée maximale (secondes) d'un retard avant déconnexion
+            max_bytes: Octets en attente au-delà desquels le client est déconnecté
+            wakeup: Fonction appelée après chaque ajout (réveil d'un écrivain asyncio)
+        """
+        self.high_water = high_water
+        self.stall_timeout = stall_timeout
+        self.max_bytes = max_bytes
+        self.wakeup = wakeup
+        self.frames = collections.deque()  # [(coalescable, trame)]
+        self.queued_bytes = 0
+        self.sending_bytes = 0  # Octets retirés par l'écrivain et pas encore envoyés
+        self.sending_since = None  # Début de l'envoi en cours
+        self.high_water_since = None  # Début du dépassement de high_water
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def put(self, frame, coalesce=False):
+        """Ajoute une trame à la file
+
+        Args:
+            frame: Trame encodée (taille + données)
+            coalesce: Si True, la trame remplace la trame remplaçable encore en attente
+
+        Returns:
+            bool: False si la connexion est trop en retard et doit être coupée
+        """
+        with self.condition:
+            if self.closed:
+                return False
+            if coalesce:
+                for index, (queued_coalesce, queued_frame) in enumerate(self.frames):
+                    if queued_coalesce:
+                        del self.frames[index]
+                        self.queued_bytes -= len(queued_frame)
+                        break
+            self.frames.append((coalesce, frame))
+            self.queued_bytes += len(frame)
+
+            if self.pending_bytes > self.max_bytes or self.send_stalled():
+                return False
+            if self.pending_bytes > self.high_water:
+                now = time.monotonic()
+                if self.high_water_since is None:
+                    self.high_water_since = now
+                elif now - self.high_water_since > self.stall_timeout:
+                    return False
+            else:
+                self.high_water_since = None
+
+            self.condition.notify()
+        if self.wakeup is not None:
+            self.wakeup()
+        return True
+
+    @property
+    def pending_bytes(self):
+        """Octets en attente : trames dans la file et trames en cours d'envoi"""
+        return self.queued_bytes + self.sending_bytes
+
+    def pop_all(self):
+        """Retire toutes les trames en attente pour les envoyer
+
+        Les trames restent comptées dans pending_bytes jusqu'à l'appel de sent().
+
+        Returns:
+            list: Trames dans l'ordre d'envoi
+        """
+        with self.condition:
+            frames = [frame for _, frame in self.frames]
+            self.frames.clear()
+            if frames:
+                self.sending_bytes += self.queued_bytes
+                if self.sending_since is None:
+                    self.sending_since = time.monotonic()
+            self.queued_bytes = 0
+            return frames
+
+    def sent(self):
+        """Signale que les trames retirées par pop_all ont été envoyées"""
+        with self.condition:
+            self.sending_bytes = 0
+            self.sending_since = None
+            if self.queued_bytes <= self.high_water:
+                self.high_water_since = None
+
+    def send_stalled(self):
+        """Indique si l'envoi en cours est bloqué depuis plus de stall_timeout
+
+        Returns:
+            bool: True si la connexion doit être coupée
+        """
+        with self.condition:
+            return (self.sending_since is not None
+                    and time.monotonic() - self.sending_since > self.stall_timeout)
+
+    def wait(self, timeout=None):
+        """Attend des trames ou la fermeture de la file (écrivain à thread)
+
+        Args:
+            timeout: Durée maximale d'attente en secondes
+
+        Returns:
+            list: Trames retirées de la file (vide si fermée ou timeout)
+        """
+        with self.condition:
+            if not self.frames and not self.closed:
+                self.condition.wait(timeout)
+            return self.pop_all()
+
+    def close(self):
+        """Ferme la file et réveille l'écrivain"""
+        with self.condition:
+            self.closed = True
+            self.frames.clear()
+            self.queued_bytes = 0
+            self.sending_bytes = 0
+            self.sending_since = None
+            self.condition.notify_all()
+        if self.wakeup is not None:
+            self.wakeup()
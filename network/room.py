@@ -0,0 +1,268 @@
+"""
+Module définissant les salles (rooms) du serveur de jeu.
+Chaque salle héberge une partie indépendante : son propre état, ses propres
+identifiants de joueurs et son propre verrou.
+"""
+import collections
+import copy
+import threading
+import time
+
+from network import delta
+
+# Identifiant de la salle rejointe automatiquement à la connexion
+DEFAULT_ROOM_ID = "default"
+
+# Identifiant du hall où arrivent les clients quand la salle par défaut est complète
+LOBBY_ROOM_ID = "lobby"
+
+# Nombre de joueurs d'une partie
+ROOM_MAX_PLAYERS = 2
+
+# Nombre de versions dont le delta est conservé ; un client plus en retard reçoit l'état complet
+ROOM_HISTORY_SIZE = 64
+
+# Marque une clé absente de l'état avant une modification
+MISSING = object()
+
+
+class Room:
+    """Salle de jeu hébergeant une partie"""
+
+    shares_state = True  # L'état de la salle est diffusé à ses clients
+
+    def __init__(self, room_id, name=None, max_players=ROOM_MAX_PLAYERS):
+        """Initialise une salle vide
+
+        Args:
+            room_id: Identifiant unique de la salle
+            name: Nom affiché dans la liste des salles
+            max_players: Nombre de joueurs nécessaires pour démarrer la partie
+        """
+        self.room_id = room_id
+        self.name = name or f"Salle {room_id}"
+        self.max_players = max_players
+        self.clients = []  # Clients présents dans la salle
+        self.game_state = {"players": []}  # État de la partie, propre à la salle
+        self.lock = threading.RLock()  # Verrou pour l'accès concurrent à game_state et clients
+        self.version = 0  # Version de game_state, incrémentée à chaque modification
+        self.history = collections.deque(maxlen=ROOM_HISTORY_SIZE)  # [(version, patch depuis version - 1)]
+        self.authority = None  # AuthoritativeGame de la salle (mode autoritaire uniquement)
+        self.reserved_seats = {}  # {player_id: (jeton de session, expiration)} des joueurs déconnectés
+
+    @property
+    def is_full(self):
+        """Vérifie si la salle a atteint son nombre maximal de joueurs (places réservées comprises)"""
+        with self.lock:
+            return len(self.clients) + len(self.active_reservations()) >= self.max_players
+
+    @property
+    def is_empty(self):
+        """Vérifie si la salle n'a ni client ni place réservée"""
+        with self.lock:
+            return not self.clients and not self.active_reservations()
+
+    def active_reservations(self):
+        """Retourne les places réservées encore valides (les réservations expirées sont libérées)
+
+        Returns:
+            dict: {player_id: (jeton de session, expiration)}
+        """
+        with self.lock:
+            now = time.monotonic()
+            for player_id, (_, expires) in list(self.reserved_seats.items()):
+                if expires <= now:
+                    del self.reserved_seats[player_id]
+            return self.reserved_seats
+
+    def reserve_seat(self, player_id, token, ttl):
+        """Garde la place d'un joueur déconnecté pour qu'il puisse reprendre sa session
+
+        Args:
+            player_id: ID du joueur dans la salle
+            token: Jeton de session du joueur
+            ttl: Durée de la réservation en secondes
+        """
+        with self.lock:
+            self.reserved_seats[player_id] = (token, time.monotonic() + ttl)
+
+    def claim_seat(self, player_id, token):
+        """Libère la place réservée d'un joueur qui reprend sa session
+
+        Args:
+            player_id: ID du joueur dans la salle
+            token: Jeton de session présenté
+
+        Returns:
+            bool: True si la place était réservée à ce jeton et n'a pas expiré
+        """
+        with self.lock:
+            reservation = self.active_reservations().get(player_id)
+            if reservation is None or reservation[0] != token:
+                return False
+            del self.reserved_seats[player_id]
+            return True
+
+    def add_client(self, client_info, player_id=None):
+        """Ajoute un client à la salle et lui attribue un ID de joueur
+
+        L'ID est le plus petit numéro libre dans la salle (1 pour l'hôte, 2 pour
+        l'adversaire), ce qui reproduit la numérotation historique du serveur.
+        Les places réservées aux joueurs déconnectés ne sont pas attribuées.
+
+        Args:
+            client_info: Informations sur le client
+            player_id: ID imposé (reprise de session), None pour le plus petit ID libre
+
+        Returns:
+            int: ID du joueur dans la salle
+        """
+        with self.lock:
+            if player_id is None:
+                used_ids = {client["id"] for client in self.clients} | set(self.active_reservations())
+                player_id = 1
+                while player_id in used_ids:
+                    player_id += 1
+            client_info["id"] = player_id
+            client_info["room"] = self
+            client_info["acked_version"] = None  # Aucune version de cette salle reçue
+            self.clients.append(client_info)
+            return player_id
+
+    def remove_client(self, client_info):
+        """Retire un client de la salle
+
+        Args:
+            client_info: Informations sur le client
+
+        Returns:
+            bool: True si le client était dans la salle
+        """
+        with self.lock:
+            if client_info in self.clients:
+                self.clients.remove(client_info)
+                return True
+            return False
+
+    def snapshot(self, keys):
+        """Copie les valeurs de certaines clés de l'état avant de les modifier sur place
+
+        Args:
+            keys: Clés de game_state à copier
+
+        Returns:
+            dict: {clé: copie de la valeur, ou MISSING si la clé est absente}
+        """
+        with self.lock:
+            return {
+                key: copy.deepcopy(self.game_state[key]) if key in self.game_state else MISSING
+                for key in keys
+            }
+
+    def record_changes(self, before):
+        """Enregistre une nouvelle version de l'état à partir des valeurs précédentes
+
+        Args:
+            before: {clé: valeur avant modification, ou MISSING} pour toutes les clés modifiées
+
+        Returns:
+            int: Version courante de l'état
+        """
+        with self.lock:
+            old = {key: value for key, value in before.items() if value is not MISSING}
+            new = {key: self.game_state[key] for key in before if key in self.game_state}
+            patch = delta.diff(old, new)
+            if patch is not None:
+                self.version += 1
+                self.history.append((self.version, patch))
+            return self.version
+
+    def replace_state(self, state):
+        """Remplace tout l'état de la partie (les clients recevront l'état complet)
+
+        Args:
+            state: Nouvel état de la partie
+        """
+        with self.lock:
+            self.game_state = state
+            self.version += 1
+            self.history.clear()
+
+    def delta_since(self, base):
+        """Calcule le patch qui amène un client de la version `base` à la version courante
+
+        Args:
+            base: Dernière version acquittée par le client, antérieure à la version courante
+
+        Returns:
+            tuple: Patch à appliquer, ou None si l'historique ne remonte pas
+            jusqu'à `base` (il faut alors envoyer l'état complet)
+        """
+        with self.lock:
+            if base is None or base >= self.version:
+                return None
+            if not self.history or self.history[0][0] > base + 1:
+                return None
+            patch = None
+            for version, version_patch in self.history:
+                if version > base:
+                    patch = delta.merge(patch, version_patch)
+            return patch
+
+    def describe(self):
+        """Retourne un résumé de la salle pour la liste des salles
+
+        Returns:
+            dict: Identifiant, nom, nombre de joueurs et statut de la partie
+        """
+        with self.lock:
+            return {
+                "id": self.room_id,
+                "name": self.name,
+                "players": len(self.clients),
+                "max_players": self.max_players,
+                "game_started": self.game_state.get("game_started", False)
+            }
+
+
+class Lobby(Room):
+    """Hall des clients sans place de joueur
+
+    Les clients y attendent de créer ou de rejoindre une salle : ils n'ont pas
+    d'ID de joueur (0), le hall n'a pas de limite de clients et son état n'est
+    jamais diffusé, si bien qu'une connexion de plus ne coûte aucun envoi aux
+    clients déjà présents.
+    """
+
+    shares_state = False
+
+    def __init__(self, room_id=LOBBY_ROOM_ID, name="Hall"):
+        """Initialise le hall
+
+        Args:
+            room_id: Identifiant de la salle
+            name: Nom de la salle
+        """
+        super().__init__(room_id, name, max_players=None)
+
+    @property
+    def is_full(self):
+        """Le hall n'est jamais complet"""
+        return False
+
+    def add_client(self, client_info, player_id=None):
+        """Ajoute un client au hall, sans lui attribuer de place de joueur
+
+        Args:
+            client_info: Informations sur le client
+            player_id: Ignoré (aucune place n'est réservée dans le hall)
+
+        Returns:
+            int: 0 (pas d'ID de joueur)
+        """
+        with self.lock:
+            client_info["id"] = 0
+            client_info["room"] = self
+            client_info["acked_version"] = None
+            self.clients.append(client_info)
+            return 0
@@ -4,29 +4,94 @@ Gère la connexion des clients et la synchronisation du jeu.
 """
 import socket
 import threading
-import pickle
 import json
 import time
 import traceback
+import itertools
+import secrets
+
+from network import delta
+from network.authority import AuthoritativeGame, IntentError
+from network.codec import (
+    DEFAULT_CODEC, SAFE_CODEC, PREFERRED_CODECS, PickleCodec, get_codec, decode_message
+)
+from network.framing import FrameReader, send_buffers, set_nodelay
+from network.outbound import (
+    OutboundQueue, OUTBOUND_HIGH_WATER, OUTBOUND_STALL_TIMEOUT, OUTBOUND_MAX_BYTES, STATE_MESSAGES
+)
+from network.room import Room, Lobby, DEFAULT_ROOM_ID, MISSING
+
+# Messages auxquels le serveur ne répond pas par un accusé de réception
+NO_ACK_MESSAGES = ("state_ack",)
+
+# Messages de partie, refusés aux clients du hall (qui n'ont pas de place de joueur)
+GAME_MESSAGES = ("action", "intent", "state_ack", "resync")
+
+# Durée (secondes) pendant laquelle la place d'un joueur déconnecté lui reste réservée
+SESSION_TTL = 60
+
+# Clés de l'état que les clients peuvent encore modifier par un message "action" en mode
+# autoritaire (salle d'attente) : le reste de l'état n'est modifié que par les intentions
+LOBBY_ACTION_KEYS = ("game_started", "ready", "setup_complete", "host_ready", "client_ready")
 
 class GameServer:
     """Serveur de jeu pour le jeu des animaux"""
     
-    def __init__(self, host='0.0.0.0', port=5555):
+    def __init__(self, host='0.0.0.0', port=5555, authoritative=False, high_water=OUTBOUND_HIGH_WATER,
+                 stall_timeout=OUTBOUND_STALL_TIMEOUT, max_queued_bytes=OUTBOUND_MAX_BYTES, allow_pickle=False):
         """Initialise le serveur
         
         Args:
             host: Adresse IP du serveur (0.0.0.0 pour écouter sur toutes les interfaces)
             port: Port d'écoute du serveur
+            authoritative: Si True, le serveur exécute les règles du jeu et les clients
+                n'envoient que des intentions (voir network.authority)
+            high_water: Octets en attente d'envoi au-delà desquels un client est en retard
+            stall_timeout: Durée (secondes) au-delà de high_water avant de déconnecter le client
+            max_queued_bytes: Octets en attente d'envoi au-delà desquels le client est déconnecté
+            allow_pickle: Si True, le serveur annonce et accepte aussi pickle (à n'utiliser
+                qu'entre pairs de confiance) ; par défaut aucun message d'un client n'est
+                décodé par pickle.loads
         """
         print(f"Initialisation du serveur sur {host}:{port}")
         self.host = host
         self.port = port
+        self.authoritative = authoritative
         self.server_socket = None
-        self.clients = []  # Liste des connexions clients
-        self.game_state = {"players": []}  # État du jeu à synchroniser avec une liste de joueurs vide
+        self.clients = []  # Liste de toutes les connexions clients, toutes salles confondues
+        # Salles hébergées : chaque client arrive dans la salle par défaut et peut en changer
+        self.default_room = Room(DEFAULT_ROOM_ID, "Partie principale")
+        self.rooms = {DEFAULT_ROOM_ID: self.default_room}  # {room_id: Room}
+        # Hall des clients arrivés quand la salle par défaut est complète (aucun état diffusé)
+        self.lobby = Lobby()
+        self.room_ids = itertools.count(1)
+        # Codec négocié par chaque connexion ({connexion: codec}, DEFAULT_CODEC par défaut)
+        self.client_codecs = {}
+        # Codecs annoncés aux clients (pickle seulement sur demande explicite)
+        self.allow_pickle = allow_pickle
+        self.offered_codecs = tuple(name for name in PREFERRED_CODECS
+                                    if allow_pickle or name != PickleCodec.name)
+        # File d'envoi de chaque connexion ({connexion: OutboundQueue}, voir network.outbound)
+        self.outbound = {}
+        self.high_water = high_water
+        self.stall_timeout = stall_timeout
+        self.max_queued_bytes = max_queued_bytes
+        # Sessions des joueurs ({jeton: {"client", "room", "id", "expires"}}), pour reprendre
+        # sa place après une déconnexion (voir resume_session)
+        self.sessions = {}
+        self.session_ttl = SESSION_TTL
         self.running = False
-        self.lock = threading.Lock()  # Verrou pour l'accès concurrent à game_state
+        # Verrou pour l'accès concurrent à clients et rooms (réentrant : process_message diffuse en le tenant)
+        self.lock = threading.RLock()
+        
+    @property
+    def game_state(self):
+        """État du jeu de la salle par défaut (compatibilité avec le serveur à une seule partie)"""
+        return self.default_room.game_state
+    
+    @game_state.setter
+    def game_state(self, state):
+        self.default_room.game_state = state
         
     def start(self):
         """Démarre le serveur"""
@@ -67,6 +132,7 @@ class GameServer:
         print(f"Fermeture de {len(self.clients)} connexions clients...")
         for client in self.clients:
             try:
+                self.close_outbound(client["socket"])
                 client["socket"].close()
                 print(f"Connexion client {client['address']} fermée")
             except Exception as e:
@@ -110,51 +176,11 @@ class GameServer:
                 print("En attente d'une nouvelle connexion...")
                 client_socket, address = self.server_socket.accept()
                 print(f"Nouvelle connexion de {address}")
+                # Envoyer les petits messages (ack, deltas) sans attendre l'accusé TCP du précédent
+                set_nodelay(client_socket)
                 
-                # Créer un dictionnaire pour stocker les informations du client
-                client_info = {
-                    "socket": client_socket,
-                    "address": address,
-                    "id": len(self.clients) + 1  # ID du client (1 ou 2)
-                }
-                
-                # Ajouter le client à la liste
-                self.clients.append(client_info)
-                print(f"Client ajouté avec ID {client_info['id']}")
-                
-                # Mettre à jour la liste des joueurs dans l'état du jeu
-                with self.lock:
-                    if "players" not in self.game_state:
-                        self.game_state["players"] = []
-                    
-                    # Vérifier si le joueur existe déjà dans la liste
-                    player_found = False
-                    for player in self.game_state["players"]:
-                        if player["id"] == client_info["id"]:
-                            player_found = True
-                            break
-                    
-                    # Ajouter seulement l'hôte (ID 1) automatiquement
-                    if not player_found and client_info["id"] == 1:
-                        self.game_state["players"].append({
-                            "id": client_info["id"],
-                            "name": "Hôte",
-                            "ready": False
-                        })
-                
-                # Envoyer l'ID au client
-                print(f"Envoi de l'ID {client_info['id']} au client...")
-                self.send_to_client(client_socket, {
-                    "type": "connection",
-                    "id": client_info["id"]
-                })
-                
-                # Diffuser l'état du jeu mis à jour à tous les clients
-                print("Diffusion de l'état du jeu mis à jour à tous les clients...")
-                self.broadcast({
-                    "type": "game_update",
-                    "state": self.game_state
-                })
+                # Enregistrer le client et lui envoyer son ID
+                client_info = self.register_client(client_socket, address)
                 
                 # Démarrer un thread pour gérer ce client
                 print(f"Démarrage du thread de gestion pour le client {address}...")
@@ -164,10 +190,7 @@ class GameServer:
                 print(f"Thread de gestion démarré pour le client {address}")
                 
                 # Si nous avons 2 joueurs, démarrer la partie
-                if len(self.clients) == 2:
-                    print("Deux joueurs connectés, démarrage de la partie...")
-                    self.broadcast({"type": "game_start"})
-                    print("Signal de démarrage de partie envoyé aux clients")
+                self.start_game_if_ready()
                 
             except Exception as e:
                 print(f"Erreur lors de l'acceptation d'une connexion: {e}")
@@ -177,6 +200,309 @@ class GameServer:
         
         print("Fin de l'acceptation des connexions")
     
+    def register_client(self, connection, address):
+        """Enregistre un nouveau client, lui envoie son ID et diffuse l'état du jeu
+        
+        Partagé par le serveur à threads et le serveur asyncio (voir network.async_server).
+        
+        Args:
+            connection: Connexion du client (socket, ou StreamWriter en mode asyncio)
+            address: Adresse du client
+            
+        Returns:
+            dict: Informations sur le client
+        """
+        # Créer un dictionnaire pour stocker les informations du client
+        client_info = {
+            "socket": connection,
+            "address": address,
+            "session": secrets.token_urlsafe(16)  # Jeton présenté par le client pour reprendre sa place
+        }
+        with self.lock:
+            self.sessions[client_info["session"]] = {"client": client_info, "room": None, "id": None, "expires": None}
+        
+        # Ouvrir la file d'envoi avant le premier message
+        self.open_outbound(connection, address)
+        
+        # Ajouter le client à la liste et à la salle par défaut (ID 1 ou 2 dans la salle), ou
+        # au hall si elle est complète : une connexion ne provoque alors aucune diffusion
+        with self.lock:
+            self.clients.append(client_info)
+        self.join_room(client_info, self.lobby if self.default_room.is_full else self.default_room)
+        print(f"Client ajouté avec ID {client_info['id']}")
+        
+        return client_info
+    
+    def join_room(self, client_info, room):
+        """Fait entrer un client dans une salle
+        
+        Le client quitte sa salle actuelle, reçoit un ID de joueur propre à la
+        nouvelle salle, puis l'état de la salle est diffusé à ses occupants
+        (sauf pour le hall, dont l'état n'est pas diffusé).
+        
+        Args:
+            client_info: Informations sur le client
+            room: Salle à rejoindre
+            
+        Returns:
+            int: ID du joueur dans la salle
+        """
+        # Quitter la salle actuelle en libérant sa place de joueur
+        self.release_seat(client_info)
+        
+        player_id = room.add_client(client_info)
+        self.update_session(client_info)
+        
+        if not room.shares_state:
+            # Hall : pas de joueur ni d'état à diffuser (le message de bienvenue suit, voir send_initial_state)
+            print(f"Client {client_info['address']} placé dans le hall")
+            return player_id
+        
+        # Mettre à jour la liste des joueurs dans l'état de la salle
+        with room.lock:
+            before = room.snapshot(("players",))
+            if "players" not in room.game_state:
+                room.game_state["players"] = []
+            
+            # Vérifier si le joueur existe déjà dans la liste
+            player_found = False
+            for player in room.game_state["players"]:
+                if player["id"] == player_id:
+                    player_found = True
+                    break
+            
+            # Ajouter seulement l'hôte (ID 1) automatiquement
+            if not player_found and player_id == 1:
+                room.game_state["players"].append({
+                    "id": player_id,
+                    "name": "Hôte",
+                    "ready": False
+                })
+            room.record_changes(before)
+        
+        # Envoyer l'ID au client
+        print(f"Envoi de l'ID {player_id} au client (salle {room.room_id})...")
+        self.send_to_client(client_info["socket"], {
+            "type": "connection",
+            "id": player_id,
+            "session": client_info["session"],
+            "codecs": list(self.offered_codecs),
+            "authoritative": self.authoritative
+        })
+        
+        # Diffuser l'état du jeu mis à jour à tous les clients de la salle
+        print("Diffusion de l'état du jeu mis à jour à tous les clients de la salle...")
+        self.broadcast_state(room)
+        
+        return player_id
+    
+    def release_seat(self, client_info):
+        """Fait quitter sa salle à un client et retire son joueur de l'état de la salle
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        old_room = client_info.get("room")
+        if old_room is None:
+            return
+        self.leave_room(client_info)
+        if not old_room.shares_state:
+            return
+        with old_room.lock:
+            before = old_room.snapshot(("players",))
+            old_room.game_state["players"] = [
+                player for player in old_room.game_state.get("players", [])
+                if player["id"] != client_info["id"]
+            ]
+            old_room.record_changes(before)
+        self.broadcast_state(old_room)
+    
+    def leave_room(self, client_info):
+        """Fait sortir un client de sa salle
+        
+        Les salles autres que la salle par défaut sont supprimées quand elles
+        n'ont plus ni client ni place réservée (voir suspend_session).
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        room = client_info.get("room")
+        if room is None:
+            return
+        room.remove_client(client_info)
+        client_info["room"] = None
+        self.close_room_if_empty(room)
+    
+    def close_room_if_empty(self, room):
+        """Arrête la partie d'une salle sans client ni place réservée, et la supprime
+        (sauf la salle par défaut)
+        
+        Args:
+            room: Salle à vérifier
+        """
+        with room.lock:
+            if not room.is_empty:
+                return
+            # La partie exécutée par le serveur s'arrête quand la salle se vide
+            room.authority = None
+        with self.lock:
+            if room is not self.default_room and self.rooms.get(room.room_id) is room:
+                del self.rooms[room.room_id]
+                print(f"Salle {room.room_id} supprimée (vide)")
+    
+    def update_session(self, client_info):
+        """Enregistre la salle et l'ID de joueur actuels dans la session du client
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        with self.lock:
+            session = self.sessions.get(client_info.get("session"))
+            if session is not None:
+                session.update(client=client_info, room=client_info["room"], id=client_info["id"], expires=None)
+    
+    def suspend_session(self, client_info):
+        """Réserve la place d'un client qui se déconnecte pendant session_ttl secondes
+        
+        À appeler avant leave_room : le client pourra reprendre sa place avec
+        son jeton de session (message "resume").
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        token = client_info.get("session")
+        room = client_info.get("room")
+        with self.lock:
+            session = self.sessions.get(token)
+            if session is None or session["client"] is not client_info or room is None or not room.shares_state:
+                self.sessions.pop(token, None)
+            else:
+                session.update(client=None, expires=time.monotonic() + self.session_ttl)
+                room.reserve_seat(client_info["id"], token, self.session_ttl)
+                print(f"Place {client_info['id']} de la salle {room.room_id} réservée pendant {self.session_ttl} s")
+        self.purge_sessions()
+    
+    def purge_sessions(self):
+        """Oublie les sessions expirées et supprime les salles qui n'ont plus personne"""
+        now = time.monotonic()
+        with self.lock:
+            expired = [token for token, session in self.sessions.items()
+                       if session["expires"] is not None and session["expires"] <= now]
+            rooms = {}
+            for token in expired:
+                room = self.sessions.pop(token)["room"]
+                if room is not None:
+                    rooms[id(room)] = room
+        for room in rooms.values():
+            self.close_room_if_empty(room)
+    
+    def resume_session(self, client_info, message):
+        """Rend à un client reconnecté la place de sa session précédente
+        
+        Le client est retiré de la salle par défaut où il a été placé à la
+        connexion, retrouve son ID dans sa salle, puis reçoit "resumed" suivi
+        des versions manquées depuis message["version"] (un delta si
+        l'historique de la salle le permet, sinon l'état complet).
+        
+        Args:
+            client_info: Informations sur le client reconnecté
+            message: Message "resume" ({"session": jeton, "version": dernière version reçue})
+        """
+        token = message.get("session")
+        self.purge_sessions()
+        with self.lock:
+            session = self.sessions.get(token) if isinstance(token, str) else None
+            if session is not None:
+                room, player_id, previous_client = session["room"], session["id"], session["client"]
+        
+        if session is None or room is None or previous_client is client_info:
+            self.send_to_client(client_info["socket"], {"type": "resume_failed", "reason": "Session inconnue ou expirée"})
+            return
+        
+        if previous_client is not None:
+            # L'ancienne connexion n'a pas encore été détectée comme perdue : la remplacer
+            # (la place est réservée le temps de l'échange pour que la salle ne soit pas supprimée)
+            previous_client["session"] = None
+            room.reserve_seat(player_id, token, self.session_ttl)
+            self.leave_room(previous_client)
+            self.drop_connection(previous_client["socket"], f"session reprise par {client_info['address']}")
+        if not room.claim_seat(player_id, token):
+            self.send_to_client(client_info["socket"], {"type": "resume_failed", "reason": "Place expirée"})
+            return
+        
+        # Quitter la salle d'accueil et reprendre l'ancienne place
+        with self.lock:
+            self.sessions.pop(client_info["session"], None)
+        self.release_seat(client_info)
+        client_info["session"] = token
+        room.add_client(client_info, player_id)
+        self.update_session(client_info)
+        
+        with room.lock:
+            version = message.get("version")
+            if isinstance(version, int) and version <= room.version:
+                client_info["acked_version"] = version
+            catch_up = self.state_message(room, client_info["acked_version"])
+        print(f"Session reprise par {client_info['address']}: place {player_id} de la salle {room.room_id}")
+        self.send_to_client(client_info["socket"], {
+            "type": "resumed",
+            "room_id": room.room_id,
+            "id": player_id,
+            "session": token
+        })
+        if catch_up is not None:
+            self.send_to_client(client_info["socket"], catch_up)
+    
+    def create_room(self, name=None):
+        """Crée une nouvelle salle
+        
+        Args:
+            name: Nom de la salle
+            
+        Returns:
+            Room: La salle créée
+        """
+        with self.lock:
+            room_id = str(next(self.room_ids))
+            room = Room(room_id, name)
+            self.rooms[room_id] = room
+        print(f"Salle {room_id} créée")
+        return room
+    
+    def start_game_if_ready(self, room=None):
+        """Diffuse le signal de démarrage de partie dès que la salle est complète
+        
+        Args:
+            room: Salle à vérifier (par défaut: la salle par défaut)
+        """
+        room = room or self.default_room
+        if len(room.clients) == room.max_players:
+            print(f"Salle {room.room_id} complète, démarrage de la partie...")
+            self.broadcast_room(room, {"type": "game_start"})
+            print("Signal de démarrage de partie envoyé aux clients")
+    
+    def send_initial_state(self, client_info):
+        """Envoie le message de bienvenue et l'état actuel du jeu à un client
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        # Envoyer un message de bienvenue au client
+        room = client_info["room"]
+        welcome_message = {
+            "type": "connection",
+            "id": client_info["id"],
+            "room_id": room.room_id,
+            "session": client_info["session"],
+            "codecs": list(self.offered_codecs),
+            "authoritative": self.authoritative
+        }
+        self.send_to_client(client_info["socket"], welcome_message)
+        
+        # Envoyer l'état actuel de la salle du client (le hall n'a pas d'état)
+        if room.shares_state:
+            self.send_full_state(client_info)
+    
     def handle_client(self, client_info):
         """Gère un client connecté
         
@@ -189,29 +515,19 @@ class GameServer:
         
         print(f"Démarrage du gestionnaire pour le client {client_address} (ID: {client_id})")
         
-        # Envoyer un message de bienvenue au client
-        welcome_message = {
-            "type": "connection",
-            "id": client_id
-        }
-        self.send_to_client(client_socket, welcome_message)
+        # Envoyer le message de bienvenue et l'état actuel du jeu
+        self.send_initial_state(client_info)
         
-        # Envoyer l'état actuel du jeu
-        self.send_to_client(client_socket, {
-            "type": "game_update",
-            "state": self.game_state
-        })
+        # Timeout court pour pouvoir vérifier self.running régulièrement ; le
+        # lecteur de trames reprend une lecture interrompue par ce timeout
+        client_socket.settimeout(1)
+        reader = FrameReader(client_socket)
         
         # Boucle de réception des messages
         while self.running:
             try:
-                # Recevoir la taille des données
-                client_socket.settimeout(1)  # Timeout court pour pouvoir vérifier self.running régulièrement
                 try:
-                    size_bytes = client_socket.recv(4)
-                    if not size_bytes:
-                        print(f"Client {client_address} déconnecté (aucune donnée)")
-                        break
+                    data = reader.read_frame()
                 except socket.timeout:
                     # Timeout normal, continuer la boucle
                     continue
@@ -219,45 +535,33 @@ class GameServer:
                     print(f"Connexion réinitialisée par le client {client_address}")
                     break
                 except Exception as e:
-                    print(f"Erreur lors de la réception de la taille des données du client {client_address}: {e}")
+                    print(f"Erreur lors de la réception des données du client {client_address}: {e}")
                     break
                 
-                # Remettre en mode bloquant pour la réception des données
-                client_socket.settimeout(None)
-                
-                size = int.from_bytes(size_bytes, byteorder='big')
-                print(f"Réception de {size} octets du client {client_address}")
-                
-                # Recevoir les données
-                data = b""
-                while len(data) < size:
-                    try:
-                        chunk = client_socket.recv(min(size - len(data), 4096))
-                        if not chunk:
-                            print(f"Client {client_address} déconnecté pendant la réception des données")
-                            break
-                        data += chunk
-                    except Exception as e:
-                        print(f"Erreur lors de la réception des données du client {client_address}: {e}")
-                        break
-                
-                if len(data) < size:
-                    # Données incomplètes, considérer le client comme déconnecté
+                if data is None:
+                    print(f"Client {client_address} déconnecté (aucune donnée)")
                     break
+                print(f"Réception de {len(data)} octets du client {client_address}")
+                
+                # Désérialiser les données (seuls les codecs acceptés pour ce client sont décodés)
+                try:
+                    message = decode_message(data, self.accepted_codecs(client_socket))
+                except Exception as e:
+                    print(f"Message refusé du client {client_address}: {e}")
+                    continue
                 
-                # Désérialiser les données
                 try:
-                    message = pickle.loads(data)
                     # Traiter le message
                     self.process_message(client_info, message)
                     
                     # Envoyer une confirmation de réception au client
                     # Cela permet de maintenir la connexion active et d'éviter les timeouts
-                    ack_message = {
-                        "type": "ack",
-                        "message_type": message.get("type", "unknown")
-                    }
-                    self.send_to_client(client_socket, ack_message)
+                    if message.get("type") not in NO_ACK_MESSAGES:
+                        ack_message = {
+                            "type": "ack",
+                            "message_type": message.get("type", "unknown")
+                        }
+                        self.send_to_client(client_socket, ack_message)
                     
                 except Exception as e:
                     print(f"Erreur lors du traitement du message du client {client_address}: {e}")
@@ -268,11 +572,19 @@ class GameServer:
                 traceback.print_exc()
                 break
         
-        # Supprimer le client de la liste
+        # Supprimer le client de la liste et de sa salle (sa place lui reste réservée)
+        self.suspend_session(client_info)
+        self.leave_room(client_info)
         with self.lock:
             if client_info in self.clients:
                 self.clients.remove(client_info)
                 print(f"Client {client_address} supprimé de la liste")
+            self.client_codecs.pop(client_socket, None)
+        self.close_outbound(client_socket)
+        try:
+            client_socket.close()
+        except OSError:
+            pass
             
         print(f"Client {client_address} déconnecté")
     
@@ -285,38 +597,71 @@ class GameServer:
         """
         client_address = client_info["address"]
         client_id = client_info["id"]
+        room = client_info["room"]
         message_type = message.get("type")
         
         print(f"Traitement du message de type '{message_type}' du client {client_address} (ID: {client_id})")
         
+        if message_type in GAME_MESSAGES and not room.shares_state:
+            # Les clients du hall doivent d'abord créer ou rejoindre une salle
+            self.send_to_client(client_info["socket"], {
+                "type": "room_error",
+                "message": "Créez ou rejoignez une salle pour jouer"
+            })
+            return
+        
         if message_type == "action":
             # Le client a effectué une action dans le jeu
             # Mettre à jour l'état du jeu
             print(f"Action reçue du client {client_address}, mise à jour de l'état du jeu...")
-            with self.lock:
+            with room.lock:
                 # Mettre à jour l'état du jeu avec les données reçues
-                action_data = message.get("data", {})
+                action_data = message.get("data")
+                if action_data is None:
+                    # Le client n'envoie que ce qui a changé depuis la dernière version reçue
+                    base = message.get("base")
+                    if base != room.version:
+                        # Delta calculé sur un état périmé : l'appliquer écraserait les changements des autres
+                        print(f"Delta du client {client_address} basé sur la version {base} "
+                              f"(version actuelle {room.version}), renvoi de l'état complet")
+                        self.send_full_state(client_info)
+                        return
+                    try:
+                        action_data = delta.expand_update(room.game_state, message.get("delta"))
+                    except (ValueError, KeyError, IndexError, TypeError) as e:
+                        print(f"Delta du client {client_address} inapplicable ({e}), renvoi de l'état complet")
+                        self.send_full_state(client_info)
+                        return
+                
+                if self.authoritative:
+                    # L'état de la partie n'est modifié que par les intentions validées
+                    action_data = {key: value for key, value in action_data.items() if key in LOBBY_ACTION_KEYS}
+                
+                # Valeurs avant modification : les clés de action_data sont remplacées par
+                # update(), seules "players" et "game_started" sont modifiées sur place
+                before = {key: room.game_state.get(key, MISSING) for key in action_data}
+                before.update(room.snapshot(("players", "game_started")))
                 
                 # Gérer le démarrage de la partie par l'hôte
                 if "game_started" in action_data and client_id == 1:  # Seul l'hôte (ID 1) peut démarrer la partie
                     print(f"L'hôte a démarré la partie")
-                    self.game_state["game_started"] = True
+                    room.game_state["game_started"] = True
                     
                     # Informer tous les clients que la partie commence
                     print("Diffusion du signal de démarrage de partie à tous les clients...")
-                    self.broadcast({"type": "game_start"})
+                    self.broadcast_room(room, {"type": "game_start"})
                 
                 # Gérer le statut "prêt" du joueur
                 if "ready" in action_data:
                     # Si le jeu n'a pas encore commencé, mettre à jour le statut du joueur
-                    if not self.game_state.get("game_started", False):
+                    if not room.game_state.get("game_started", False):
                         # Initialiser la liste des joueurs si elle n'existe pas
-                        if "players" not in self.game_state:
-                            self.game_state["players"] = []
+                        if "players" not in room.game_state:
+                            room.game_state["players"] = []
                         
                         # Mettre à jour le statut du joueur
                         player_found = False
-                        for player in self.game_state["players"]:
+                        for player in room.game_state["players"]:
                             if player["id"] == client_id:
                                 player["ready"] = action_data["ready"]
                                 player_found = True
@@ -326,13 +671,13 @@ class GameServer:
                         if not player_found:
                             # Vérifier que le client est bien connecté
                             client_connected = False
-                            for client in self.clients:
+                            for client in room.clients:
                                 if client["id"] == client_id:
                                     client_connected = True
                                     break
                             
                             if client_connected:
-                                self.game_state["players"].append({
+                                room.game_state["players"].append({
                                     "id": client_id,
                                     "name": f"Joueur {client_id}",
                                     "ready": action_data["ready"]
@@ -341,36 +686,179 @@ class GameServer:
                 # Si le message contient un indicateur de configuration terminée
                 if "setup_complete" in action_data:
                     # Mettre à jour le statut du joueur
-                    if "players" in self.game_state:
-                        for player in self.game_state["players"]:
+                    if "players" in room.game_state:
+                        for player in room.game_state["players"]:
                             if player["id"] == client_id:
                                 player["ready"] = True
                                 break
                 
                 # Mettre à jour le reste de l'état du jeu
-                self.game_state.update(action_data)
-                print(f"État du jeu mis à jour avec les données du client {client_address}")
+                room.game_state.update(action_data)
+                version = room.record_changes(before)
+                print(f"État du jeu mis à jour avec les données du client {client_address} (version {version})")
             
-            # Diffuser la mise à jour à tous les clients
-            print("Diffusion de la mise à jour à tous les clients...")
-            self.broadcast({
-                "type": "game_update",
-                "state": self.game_state
-            })
+            # Diffuser la mise à jour à tous les clients de la salle
+            print("Diffusion de la mise à jour à tous les clients de la salle...")
+            self.broadcast_state(room)
             print("Mise à jour diffusée à tous les clients")
         
+        elif message_type == "set_codec":
+            # Le client a choisi un codec parmi ceux annoncés dans le message "connection"
+            codec = get_codec(message.get("codec"))
+            if codec is None or codec.name not in self.offered_codecs:
+                print(f"Codec inconnu demandé par le client {client_address}: {message.get('codec')}")
+            else:
+                with self.lock:
+                    self.client_codecs[client_info["socket"]] = codec
+                print(f"Codec '{codec.name}' utilisé pour le client {client_address}")
+        
+        elif message_type == "state_ack":
+            # Le client a appliqué une version de l'état : les prochains deltas partiront de là
+            version = message.get("version")
+            if isinstance(version, int) and version <= room.version:
+                if client_info.get("acked_version") is None or version > client_info["acked_version"]:
+                    client_info["acked_version"] = version
+        
+        elif message_type == "resync":
+            # Le client n'a pas pu appliquer un delta : lui renvoyer l'état complet
+            print(f"Resynchronisation demandée par le client {client_address}")
+            self.send_full_state(client_info)
+        
+        elif message_type == "resume":
+            # Reconnexion : reprendre la place de la session précédente
+            self.resume_session(client_info, message)
+        
+        elif message_type == "intent":
+            # Intention d'un joueur, validée et appliquée par le serveur (mode autoritaire)
+            self.process_intent(client_info, room, message)
+        
         elif message_type == "chat":
-            # Message de chat à diffuser à tous les clients
+            # Message de chat à diffuser à tous les clients de la salle
             print(f"Message de chat reçu du client {client_address}, diffusion...")
-            self.broadcast({
+            self.broadcast_room(room, {
                 "type": "chat",
                 "sender_id": client_info["id"],
                 "message": message.get("message", "")
             })
             print("Message de chat diffusé à tous les clients")
+        
+        elif message_type == "list_rooms":
+            # Liste des salles disponibles
+            with self.lock:
+                rooms = list(self.rooms.values())
+            self.send_to_client(client_info["socket"], {
+                "type": "room_list",
+                "rooms": [r.describe() for r in rooms]
+            })
+        
+        elif message_type == "create_room":
+            # Créer une salle et y entrer comme hôte
+            new_room = self.create_room(message.get("name"))
+            self.send_room_joined(client_info, new_room)
+        
+        elif message_type == "join_room":
+            # Rejoindre une salle existante
+            with self.lock:
+                target_room = self.rooms.get(str(message.get("room_id")))
+            if target_room is None:
+                self.send_to_client(client_info["socket"], {
+                    "type": "room_error",
+                    "message": f"Salle {message.get('room_id')} introuvable"
+                })
+            elif target_room is room:
+                self.send_to_client(client_info["socket"], {
+                    "type": "room_error",
+                    "message": f"Déjà dans la salle {room.room_id}"
+                })
+            elif target_room.is_full:
+                self.send_to_client(client_info["socket"], {
+                    "type": "room_error",
+                    "message": f"Salle {target_room.room_id} complète"
+                })
+            else:
+                self.send_room_joined(client_info, target_room)
+                self.start_game_if_ready(target_room)
+    
+    def process_intent(self, client_info, room, message):
+        """Valide et applique l'intention d'un joueur, puis diffuse le nouvel état
+        
+        Args:
+            client_info: Informations sur le client
+            room: Salle du client
+            message: Message "intent" ({"action": ..., "target": ...} ou {"action": "setup", "animal": ...})
+        """
+        client_id = client_info["id"]
+        action = message.get("action")
+        
+        if not self.authoritative:
+            self.send_to_client(client_info["socket"], {
+                "type": "intent_rejected",
+                "action": action,
+                "reason": "Le serveur n'est pas en mode autoritaire"
+            })
+            return
+        
+        with room.lock:
+            if room.authority is None:
+                room.authority = AuthoritativeGame(players=room.max_players)
+            authority = room.authority
+            try:
+                if action == "setup":
+                    authority.add_player(client_id, message.get("animal"))
+                else:
+                    authority.apply_intent(client_id, action, message.get("target"))
+            except IntentError as e:
+                print(f"Intention '{action}' du client {client_info['address']} refusée: {e}")
+                self.send_to_client(client_info["socket"], {
+                    "type": "intent_rejected",
+                    "action": action,
+                    "reason": str(e)
+                })
+                return
+            
+            before = room.snapshot(("players",))
+            if action == "setup":
+                # Animal configuré : marquer ce joueur prêt
+                players = room.game_state.setdefault("players", [])
+                for player in players:
+                    if player["id"] == client_id:
+                        player["ready"] = True
+                        break
+                else:
+                    players.append({"id": client_id, "name": f"Joueur {client_id}", "ready": True})
+            if authority.started:
+                state = authority.encode()
+                before.update({key: room.game_state.get(key, MISSING) for key in state})
+                room.game_state.update(state)
+            version = room.record_changes(before)
+            print(f"Intention '{action}' du client {client_info['address']} appliquée (version {version})")
+            if authority.started and authority.game.game_over:
+                # Partie terminée : les prochains "setup" préparent une nouvelle partie
+                print(f"Partie de la salle {room.room_id} terminée")
+                room.authority = None
+        
+        self.broadcast_state(room)
+    
+    def send_room_joined(self, client_info, room):
+        """Fait entrer un client dans une salle et lui confirme son entrée
+        
+        Args:
+            client_info: Informations sur le client
+            room: Salle rejointe
+        """
+        player_id = self.join_room(client_info, room)
+        with room.lock:
+            state, version = room.game_state, room.version
+        self.send_to_client(client_info["socket"], {
+            "type": "room_joined",
+            "room_id": room.room_id,
+            "id": player_id,
+            "state": state,
+            "version": version
+        })
     
     def broadcast(self, message):
-        """Diffuse un message à tous les clients
+        """Diffuse un message à tous les clients, toutes salles confondues
         
         Args:
             message: Message à diffuser
@@ -381,38 +869,247 @@ class GameServer:
         with self.lock:
             clients_copy = self.clients.copy()
         
-        # Envoyer le message à chaque client
-        for client_info in clients_copy:
+        self.send_to_clients(clients_copy, message)
+        print("Message diffusé à tous les clients")
+    
+    def broadcast_room(self, room, message):
+        """Diffuse un message aux clients d'une salle
+        
+        Args:
+            room: Salle destinataire
+            message: Message à diffuser
+        """
+        print(f"Diffusion d'un message de type '{message.get('type')}' à la salle {room.room_id}...")
+        
+        with room.lock:
+            clients_copy = room.clients.copy()
+        
+        self.send_to_clients(clients_copy, message)
+    
+    def broadcast_state(self, room):
+        """Diffuse l'état d'une salle à ses clients sous forme de deltas
+        
+        Chaque client reçoit uniquement ce qui a changé depuis la dernière version
+        qu'il a acquittée ("game_delta"), ou l'état complet ("game_update") si
+        l'historique de la salle ne remonte pas jusqu'à cette version.
+        
+        Args:
+            room: Salle dont l'état a changé
+        """
+        if not room.shares_state:
+            return
+        messages = []
+        with room.lock:
+            # Regrouper les clients par version acquittée : un seul delta par version
+            groups = {}
+            for client_info in room.clients:
+                groups.setdefault(client_info.get("acked_version"), []).append(client_info)
+            
+            for base, clients in groups.items():
+                message = self.state_message(room, base)
+                if message is not None:
+                    messages.append((clients, message))
+        
+        for clients, message in messages:
+            self.send_to_clients(clients, message)
+    
+    @staticmethod
+    def state_message(room, base):
+        """Construit le message qui amène un client de la version `base` à la version courante
+        
+        Args:
+            room: Salle du client
+            base: Dernière version acquittée par le client (None si aucune)
+            
+        Returns:
+            dict: "game_delta" si l'historique remonte jusqu'à `base`, sinon "game_update"
+            (None si le client a déjà la version courante)
+        """
+        with room.lock:
+            if base == room.version:
+                return None
+            try:
+                patch = room.delta_since(base)
+            except ValueError:
+                patch = None
+            if patch is None:
+                return {"type": "game_update", "state": room.game_state, "version": room.version}
+            return {"type": "game_delta", "base": base, "version": room.version, "delta": patch}
+    
+    def send_full_state(self, client_info):
+        """Envoie l'état complet de sa salle à un client
+        
+        Args:
+            client_info: Informations sur le client
+        """
+        room = client_info["room"]
+        with room.lock:
+            message = {"type": "game_update", "state": room.game_state, "version": room.version}
+        self.send_to_client(client_info["socket"], message)
+    
+    def send_to_clients(self, clients, message):
+        """Envoie un message à une liste de clients
+        
+        Le message n'est sérialisé qu'une fois par codec, quel que soit le nombre de clients.
+        
+        Args:
+            clients: Liste des informations des clients destinataires
+            message: Message à envoyer
+        """
+        coalesce = message.get("type") in STATE_MESSAGES
+        frames = {}
+        for client_info in clients:
             try:
-                self.send_to_client(client_info["socket"], message)
+                codec = self.codec_for(client_info["socket"])
+                if codec not in frames:
+                    data = codec.encode(message)
+                    frames[codec] = len(data).to_bytes(4, byteorder='big') + data
+                self.send_frame(client_info["socket"], frames[codec], coalesce)
             except Exception as e:
                 print(f"Erreur lors de la diffusion au client {client_info['address']}: {e}")
                 # Ne pas supprimer le client ici, cela sera fait dans le thread de gestion du client
+    
+    def codec_for(self, connection):
+        """Retourne le codec négocié par une connexion
         
-        print("Message diffusé à tous les clients")
+        Args:
+            connection: Connexion du client (socket, ou StreamWriter en mode asyncio)
+            
+        Returns:
+            Codec de la connexion (DEFAULT_CODEC tant qu'aucun autre n'a été négocié)
+        """
+        return self.client_codecs.get(connection, DEFAULT_CODEC)
+    
+    def accepted_codecs(self, connection):
+        """Retourne les codecs acceptés pour les messages reçus d'une connexion
+        
+        Le codec sûr est toujours accepté : le client l'utilise pour la poignée
+        de main (set_codec, resume), avant de connaître les codecs du serveur.
+        
+        Args:
+            connection: Connexion du client
+            
+        Returns:
+            tuple: Codec négocié par la connexion et codec sûr
+        """
+        return (self.codec_for(connection), SAFE_CODEC)
     
     def send_to_client(self, client_socket, message):
         """Envoie un message à un client
         
+        Le message est placé dans la file d'envoi du client : l'appel ne bloque
+        jamais, même si le client lit lentement.
+        
         Args:
             client_socket: Socket du client
             message: Message à envoyer
             
+        Returns:
+            bool: True si le message a été mis en file, False si le client est déconnecté
+            
         Raises:
-            Exception: Si l'envoi échoue
+            Exception: Si la sérialisation échoue
         """
         try:
-            # Sérialiser le message
-            data = pickle.dumps(message)
+            # Sérialiser le message avec le codec du client
+            data = self.codec_for(client_socket).encode(message)
             
-            # Envoyer la taille des données suivie des données
-            client_socket.sendall(len(data).to_bytes(4, byteorder='big'))
-            client_socket.sendall(data)
-            return True
+            # Taille des données suivie des données
+            frame = len(data).to_bytes(4, byteorder='big') + data
+            return self.send_frame(client_socket, frame, message.get("type") in STATE_MESSAGES)
         except Exception as e:
             print(f"Erreur lors de l'envoi d'un message: {e}")
             raise
     
+    def send_frame(self, connection, frame, coalesce=False):
+        """Place une trame déjà encodée dans la file d'envoi d'une connexion
+        
+        Un client dont la file reste trop longtemps au-delà de high_water, ou
+        dépasse max_queued_bytes, est déconnecté.
+        
+        Args:
+            connection: Connexion du client
+            frame: Taille sur 4 octets suivie des données
+            coalesce: Si True, la trame remplace l'état encore en attente (game_update, game_delta)
+            
+        Returns:
+            bool: True si la trame a été mise en file, False si le client est déconnecté
+        """
+        queue = self.outbound.get(connection)
+        if queue is None:
+            return False
+        if not queue.put(frame, coalesce):
+            self.drop_connection(connection, f"{queue.pending_bytes} octets en attente d'envoi")
+            return False
+        return True
+    
+    def open_outbound(self, connection, address):
+        """Crée la file d'envoi d'une connexion et démarre son thread d'écriture
+        
+        Args:
+            connection: Socket du client
+            address: Adresse du client
+        """
+        queue = OutboundQueue(self.high_water, self.stall_timeout, self.max_queued_bytes)
+        with self.lock:
+            self.outbound[connection] = queue
+        writer_thread = threading.Thread(target=self.write_outbound, args=(connection, queue, address))
+        writer_thread.daemon = True
+        writer_thread.start()
+    
+    def write_outbound(self, client_socket, queue, address):
+        """Envoie les trames de la file d'une connexion jusqu'à sa fermeture (thread d'écriture)
+        
+        Args:
+            client_socket: Socket du client
+            queue: File d'envoi de la connexion
+            address: Adresse du client
+        """
+        while not queue.closed:
+            # Toutes les trames en attente partent en un seul appel sendmsg ; le timeout
+            # du socket (réglé pour la réception) n'interrompt l'envoi que s'il est bloqué
+            # depuis plus de stall_timeout
+            frames = queue.wait(1)
+            try:
+                if frames:
+                    send_buffers(client_socket, frames,
+                                 keep_going=lambda: not queue.closed and not queue.send_stalled())
+                    queue.sent()
+            except socket.timeout:
+                if not queue.closed:
+                    self.drop_connection(client_socket, f"envoi vers {address} bloqué depuis plus de "
+                                                        f"{queue.stall_timeout} s")
+                break
+            except OSError as e:
+                if not queue.closed:
+                    self.drop_connection(client_socket, f"erreur d'envoi vers {address}: {e}")
+                break
+    
+    def close_outbound(self, connection):
+        """Ferme la file d'envoi d'une connexion (les trames en attente sont abandonnées)
+        
+        Args:
+            connection: Connexion du client
+        """
+        with self.lock:
+            queue = self.outbound.pop(connection, None)
+        if queue is not None:
+            queue.close()
+    
+    def drop_connection(self, connection, reason):
+        """Coupe la connexion d'un client (le thread de gestion termine le nettoyage)
+        
+        Args:
+            connection: Socket du client
+            reason: Raison de la déconnexion
+        """
+        print(f"Déconnexion d'un client: {reason}")
+        self.close_outbound(connection)
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    
     def update_game_state(self, new_state):
         """Met à jour l'état du jeu
         
@@ -420,16 +1117,12 @@ class GameServer:
             new_state: Nouvel état du jeu
         """
         print("Mise à jour de l'état du jeu...")
-        with self.lock:
-            self.game_state = new_state
-            print("État du jeu mis à jour")
+        self.default_room.replace_state(new_state)
+        print("État du jeu mis à jour")
             
-        # Diffuser la mise à jour à tous les clients
+        # Diffuser la mise à jour à tous les clients de la salle par défaut
         print("Diffusion de la mise à jour à tous les clients...")
-        self.broadcast({
-            "type": "game_update",
-            "state": self.game_state
-        })
+        self.broadcast_state(self.default_room)
         print("Mise à jour diffusée à tous les clients")
 
     def check_server_accessibility(self):
@@ -8,6 +8,8 @@ import traceback
 import socket
 import time
 from network.server import GameServer
+from network.async_server import AsyncGameServer
+from network.outbound import OUTBOUND_HIGH_WATER, OUTBOUND_STALL_TIMEOUT
 
 def main():
     """Fonction principale"""
@@ -17,6 +19,16 @@ def main():
         parser = argparse.ArgumentParser(description="Serveur de jeu des animaux")
         parser.add_argument("--host", default="0.0.0.0", help="Adresse IP du serveur (par défaut: 0.0.0.0 pour écouter sur toutes les interfaces)")
         parser.add_argument("--port", type=int, default=5555, help="Port d'écoute du serveur (par défaut: 5555)")
+        parser.add_argument("--async", dest="use_async", action="store_true",
+                            help="Utiliser le serveur asyncio (une seule boucle pour toutes les connexions)")
+        parser.add_argument("--authoritative", action="store_true",
+                            help="Exécuter les règles du jeu sur le serveur (les clients n'envoient que leurs intentions)")
+        parser.add_argument("--high-water", type=int, default=OUTBOUND_HIGH_WATER,
+                            help=f"Octets en attente d'envoi au-delà desquels un client est en retard (par défaut: {OUTBOUND_HIGH_WATER})")
+        parser.add_argument("--stall-timeout", type=float, default=OUTBOUND_STALL_TIMEOUT,
+                            help=f"Secondes de retard avant de déconnecter un client (par défaut: {OUTBOUND_STALL_TIMEOUT})")
+        parser.add_argument("--pickle", dest="allow_pickle", action="store_true",
+                            help="Accepter aussi les messages pickle des clients (seulement entre pairs de confiance)")
         args = parser.parse_args()
         
         print(f"Configuration du serveur sur {args.host}:{args.port}")
@@ -33,7 +45,10 @@ def main():
             sys.exit(1)
         
         # Créer et démarrer le serveur
-        server = GameServer(args.host, args.port)
+        server_class = AsyncGameServer if args.use_async else GameServer
+        server = server_class(args.host, args.port, authoritative=args.authoritative,
+                              high_water=args.high_water, stall_timeout=args.stall_timeout,
+                              allow_pickle=args.allow_pickle)
         if not server.start():
             print("Impossible de démarrer le serveur")
             sys.exit(1)
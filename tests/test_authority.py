@@ -0,0 +1,180 @@
+"""
+Tests du mode autoritaire (network.authority) : validation des intentions et encodage incrémental.
+"""
+import random
+import unittest
+
+from game.sim import aggressive_policy
+from network.authority import AuthoritativeGame, IntentError, MAX_NAME_LENGTH, ANIMAL_TARGET_ACTIONS
+from network.game_state import GameStateEncoder
+from tests.test_delta import RecordingServer
+
+# Animal valide pour l'écran de configuration
+ANIMAL = {"name": "A", "hp": 10, "stamina": 10, "speed": 3, "teeth": 5, "claws": 3, "skin": 2, "height": 20}
+
+
+def started_game(seed=0):
+    """Retourne une partie autoritaire dont les deux animaux sont configurés"""
+    authority = AuthoritativeGame(seed=seed)
+    authority.add_player(1, dict(ANIMAL, name="Lion"))
+    authority.add_player(2, dict(ANIMAL, name="Tigre"))
+    return authority
+
+
+def policy_intent(authority, rng):
+    """Intention (joueur, action, cible) choisie par la politique agressive pour l'animal qui doit jouer"""
+    animal = authority.current_animal
+    action, target = aggressive_policy(authority.game, animal, rng)
+    if action in ANIMAL_TARGET_ACTIONS:
+        target = authority.player_of(target)
+    return authority.player_of(animal), action, target
+
+
+class SetupIntentTest(unittest.TestCase):
+    """Refus des animaux invalides à la configuration"""
+
+    def setUp(self):
+        self.authority = AuthoritativeGame(seed=0)
+
+    def assertRefused(self, player_id, animal_data):
+        with self.assertRaises(IntentError):
+            self.authority.add_player(player_id, animal_data)
+        self.assertEqual(self.authority.builds, {})
+
+    def test_valid_animals_start_the_game(self):
+        self.authority.add_player(1, ANIMAL)
+        self.assertFalse(self.authority.started)
+        self.authority.add_player(2, {key: value for key, value in ANIMAL.items() if key != "name"})
+        self.assertTrue(self.authority.started)
+        self.assertEqual([animal.name for animal in self.authority.game.animals], ["A", "Joueur 2"])
+        self.assertIsNotNone(self.authority.current_animal)
+
+    def test_invalid_names_are_refused(self):
+        for name in ("", "x" * (MAX_NAME_LENGTH + 1), None, 42, ["A"]):
+            self.assertRefused(1, dict(ANIMAL, name=name))
+
+    def test_stats_out_of_range_are_refused(self):
+        for stat, value in (("hp", -1), ("speed", 10 ** 6), ("teeth", 2.5), ("claws", True), ("skin", "2")):
+            self.assertRefused(1, dict(ANIMAL, **{stat: value}))
+        self.assertRefused(1, {key: value for key, value in ANIMAL.items() if key != "hp"})
+
+    def test_too_many_points_are_refused(self):
+        self.assertRefused(1, dict(ANIMAL, hp=100, stamina=100, teeth=100))
+
+    def test_unknown_player_or_missing_animal_is_refused(self):
+        self.assertRefused(3, ANIMAL)
+        self.assertRefused("1", ANIMAL)
+        self.assertRefused(1, None)
+
+    def test_setup_after_start_is_refused(self):
+        authority = started_game()
+        with self.assertRaises(IntentError):
+            authority.add_player(1, ANIMAL)
+
+
+class GameIntentTest(unittest.TestCase):
+    """Refus des actions jouées hors de son tour ou impossibles"""
+
+    def setUp(self):
+        self.authority = started_game()
+        self.player = self.authority.player_of(self.authority.current_animal)
+        self.other = 3 - self.player
+
+    def test_action_before_start_is_refused(self):
+        with self.assertRaises(IntentError):
+            AuthoritativeGame(seed=0).apply_intent(1, "wait")
+
+    def test_action_out_of_turn_is_refused(self):
+        with self.assertRaises(IntentError):
+            self.authority.apply_intent(self.other, "wait")
+
+    def test_unknown_or_impossible_actions_are_refused(self):
+        version = self.authority.game.version
+        for action, target in (("fly", None), ("walk", -1), ("walk", None), ("bite", self.other), ("bite", "2")):
+            with self.assertRaises(IntentError):
+                self.authority.apply_intent(self.player, action, target)
+        self.assertEqual(self.authority.game.version, version)
+
+    def test_wait_passes_the_turn(self):
+        animal = self.authority.current_animal
+        self.authority.apply_intent(self.player, "wait")
+        self.assertLess(animal.speed_points, 100)
+
+    def test_finished_game_refuses_actions(self):
+        rng = random.Random(0)
+        while not self.authority.game.game_over:
+            self.authority.apply_intent(*policy_intent(self.authority, rng))
+        with self.assertRaises(IntentError):
+            self.authority.apply_intent(1, "wait")
+
+
+class IncrementalEncodeTest(unittest.TestCase):
+    """encode ne réencode que ce qui a changé, sans modifier les états déjà renvoyés"""
+
+    def test_incremental_encode_matches_full_encode(self):
+        for seed in range(3):
+            authority = started_game(seed)
+            rng = random.Random(seed)
+            previous = None
+            while True:
+                state = authority.encode()
+                full = GameStateEncoder.encode_game_state(authority.game)
+                full.pop("players", None)
+                full["current_player"] = authority.player_of(authority.current_animal)
+                self.assertEqual(state, full)
+                if previous is not None:
+                    # L'état précédent n'a pas été modifié par le nouvel encodage
+                    self.assertEqual(previous[0], previous[1])
+                if authority.game.game_over:
+                    break
+                previous = (state, GameStateEncoder.encode_game_state(authority.game))
+                previous[1].pop("players", None)
+                previous[1]["current_player"] = state["current_player"]
+                authority.apply_intent(*policy_intent(authority, rng))
+
+
+class ServerIntentTest(unittest.TestCase):
+    """process_intent refuse les intentions invalides et libère la partie terminée"""
+
+    def setUp(self):
+        self.server = RecordingServer()
+        self.server.authoritative = True
+        self.room = self.server.default_room
+        self.clients = []
+        for address in (("lion", 1), ("tigre", 2)):
+            client_info = {"socket": object(), "address": address, "session": None}
+            self.room.add_client(client_info)
+            self.clients.append(client_info)
+
+    def intent(self, client_info, **message):
+        self.server.sent.clear()
+        self.server.process_message(client_info, dict(message, type="intent"))
+        return [sent for connection, sent in self.server.sent if connection is client_info["socket"]]
+
+    def test_invalid_setup_is_rejected(self):
+        messages = self.intent(self.clients[0], action="setup", animal=dict(ANIMAL, name=""))
+        self.assertEqual([message["type"] for message in messages], ["intent_rejected"])
+        self.assertEqual(self.room.authority.builds, {})
+
+    def test_finished_game_is_reset(self):
+        for client_info in self.clients:
+            self.intent(client_info, action="setup", animal=ANIMAL)
+        authority = self.room.authority
+        self.assertTrue(authority.started)
+        self.assertEqual(self.room.game_state["current_player"], authority.player_of(authority.current_animal))
+
+        rng = random.Random(0)
+        while self.room.authority is not None:
+            player_id, action, target = policy_intent(authority, rng)
+            messages = self.intent(self.clients[player_id - 1], action=action, target=target)
+            self.assertNotIn("intent_rejected", [message["type"] for message in messages])
+        self.assertTrue(self.room.game_state["game_over"])
+
+        # Une nouvelle configuration prépare une nouvelle partie
+        self.intent(self.clients[0], action="setup", animal=ANIMAL)
+        self.assertIsNot(self.room.authority, authority)
+        self.assertFalse(self.room.authority.started)
+
+
+if __name__ == "__main__":
+    unittest.main()
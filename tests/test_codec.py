@@ -0,0 +1,161 @@
+"""
+Tests des codecs réseau (network.codec) et de leur négociation.
+"""
+import pickle
+import random
+import struct
+import time
+import unittest
+
+from network import delta
+from network.client import GameClient
+from network.codec import (
+    BinaryCodec, PickleCodec, CODECS, DEFAULT_CODEC, SAFE_CODEC,
+    TAG_LIST, TAG_DICT, TAG_SHORT_STR, negotiate_codec, decode_message
+)
+from network.server import GameServer
+from tests.test_delta import play_states, RecordingServer
+from tests.test_outbound import free_port, EVICTION_DEADLINE
+
+
+def game_messages():
+    """Messages "game_update" et "game_delta" envoyés pendant une vraie partie"""
+    states = play_states(30, seed=1)
+    messages = []
+    for version, (old, new) in enumerate(zip(states, states[1:]), start=1):
+        messages.append({"type": "game_update", "state": new, "version": version})
+        messages.append({"type": "game_delta", "base": version - 1, "version": version,
+                         "delta": delta.diff(old, new)})
+    return messages
+
+
+class BinaryCodecTest(unittest.TestCase):
+    """Aller-retour du codec binaire et refus des messages invalides"""
+
+    codec = CODECS[BinaryCodec.name]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.messages = game_messages()
+
+    def round_trip(self, value):
+        return self.codec.decode(self.codec.encode(value))
+
+    def test_game_messages_round_trip(self):
+        for message in self.messages:
+            self.assertEqual(self.round_trip(message), message)
+
+    def test_binary_is_smaller_than_pickle(self):
+        binary = sum(len(self.codec.encode(message)) for message in self.messages)
+        pickled = sum(len(PickleCodec().encode(message)) for message in self.messages)
+        self.assertLess(binary, pickled)
+
+    def test_generic_values_round_trip(self):
+        value = {
+            "entiers": [0, -1, 127, -128, 128, -32769, 2 ** 31, -2 ** 63, 2 ** 80, -2 ** 80],
+            "flottants": [0.5, -1e300, float("inf")],
+            "chaînes": ["", "été", "x" * 300, "répété", "répété"],
+            "octets": b"\x00\xff",
+            "tuple": (1, "a", None, True, False),
+            "faux patch": ("d", 1),
+            "patches": [("r", [1, 2]), ("l", {0: ("r", 3)}), ("d", {}, {}, []), ("d", {"a": 1}, {}, ["b"])],
+            1: "clé entière",
+            "animal presque": {"name": "A", "hp": 1.5},
+            "case hors format": {"x": -1, "y": 0, "terrain_type": "lave", "is_orchard": False, "speed_points": 0},
+        }
+        self.assertEqual(self.round_trip(value), value)
+
+    def test_unsupported_type_is_refused(self):
+        with self.assertRaises(TypeError):
+            self.codec.encode({"objet": object()})
+
+    def test_truncated_or_corrupted_messages_raise_value_error(self):
+        rng = random.Random(0)
+        encoded = [self.codec.encode(message) for message in self.messages]
+        for _ in range(2000):
+            data = bytearray(rng.choice(encoded))
+            for _ in range(rng.randint(1, 4)):
+                data[rng.randrange(2, len(data))] = rng.randrange(256)
+            if rng.random() < 0.3:
+                data = data[:rng.randrange(2, len(data))]
+            try:
+                self.codec.decode(bytes(data))
+            except ValueError:
+                pass
+
+    def test_invalid_headers_are_refused(self):
+        valid = self.codec.encode({"type": "chat"})
+        for data in (b"", b"\xb1", b"\x80" + valid[1:], valid[:1] + b"\x63" + valid[2:], valid + b"\x00"):
+            with self.assertRaises(ValueError):
+                self.codec.decode(data)
+
+    def test_oversized_counts_are_refused_without_allocating(self):
+        header = bytes((BinaryCodec.MAGIC, BinaryCodec.VERSION))
+        for tag in (TAG_LIST, TAG_DICT):
+            with self.assertRaises(ValueError):
+                self.codec.decode(header + bytes((tag,)) + struct.pack("<I", 2 ** 32 - 1))
+        with self.assertRaises(ValueError):
+            self.codec.decode(header + bytes((TAG_SHORT_STR, 200)) + b"abc")
+
+    def test_deep_nesting_is_refused(self):
+        depth = 100000
+        data = bytes((BinaryCodec.MAGIC, BinaryCodec.VERSION)) + (bytes((TAG_LIST,)) + struct.pack("<I", 1)) * depth
+        with self.assertRaises(ValueError):
+            self.codec.decode(data + bytes((TAG_LIST, 0, 0, 0, 0)))
+
+
+class CodecNegotiationTest(unittest.TestCase):
+    """Le binaire est le codec par défaut ; pickle n'est accepté que sur demande explicite"""
+
+    def test_binary_is_preferred(self):
+        self.assertIs(DEFAULT_CODEC, CODECS[BinaryCodec.name])
+        self.assertIs(SAFE_CODEC, CODECS[BinaryCodec.name])
+        self.assertIs(negotiate_codec([PickleCodec.name, BinaryCodec.name]), CODECS[BinaryCodec.name])
+        self.assertIs(negotiate_codec([PickleCodec.name]), CODECS[PickleCodec.name])
+        self.assertIs(negotiate_codec([]), DEFAULT_CODEC)
+
+    def test_server_without_pickle_refuses_it(self):
+        server = RecordingServer()
+        self.assertFalse(server.allow_pickle)
+        self.assertEqual(server.offered_codecs, (BinaryCodec.name,))
+        client_info = {"socket": object(), "address": ("test", 0), "session": None}
+        server.default_room.add_client(client_info)
+
+        # Ni set_codec vers pickle, ni message pickle
+        server.process_message(client_info, {"type": "set_codec", "codec": PickleCodec.name})
+        self.assertIs(server.codec_for(client_info["socket"]), CODECS[BinaryCodec.name])
+        data = pickle.dumps({"type": "chat", "message": "x"})
+        with self.assertRaises(ValueError):
+            decode_message(data, server.accepted_codecs(client_info["socket"]))
+
+    def test_server_with_pickle_accepts_it_on_request(self):
+        server = GameServer("127.0.0.1", 0, allow_pickle=True)
+        server.send_to_client = lambda client_socket, message: True
+        self.assertEqual(server.offered_codecs, (BinaryCodec.name, PickleCodec.name))
+        client_info = {"socket": object(), "address": ("test", 0), "session": None}
+        server.default_room.add_client(client_info)
+        server.process_message(client_info, {"type": "set_codec", "codec": PickleCodec.name})
+        self.assertIs(server.codec_for(client_info["socket"]), CODECS[PickleCodec.name])
+        data = pickle.dumps({"type": "chat", "message": "x"})
+        self.assertEqual(decode_message(data, server.accepted_codecs(client_info["socket"]))["type"], "chat")
+
+    def test_client_and_server_agree_on_binary(self):
+        server = GameServer("127.0.0.1", free_port())
+        self.assertTrue(server.start())
+        client = GameClient("127.0.0.1", server.port)
+        try:
+            self.assertTrue(client.connect())
+            deadline = time.monotonic() + EVICTION_DEADLINE
+            while client.client_id is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIs(client.codec, CODECS[BinaryCodec.name])
+            with server.lock:
+                connections = [client_info["socket"] for client_info in server.clients]
+            self.assertEqual([server.codec_for(connection).name for connection in connections], [BinaryCodec.name])
+        finally:
+            client.disconnect()
+            server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests des deltas d'état (network.delta), de l'historique des salles et du refus des actions périmées.
+"""
+import copy
+import random
+import unittest
+
+from game.sim import create_match, aggressive_policy, LION_BUILD, TIGER_BUILD
+from network import delta
+from network.game_state import GameStateEncoder
+from network.room import Room, MISSING, ROOM_HISTORY_SIZE
+from network.server import GameServer
+
+
+def play_states(turns, seed=0):
+    """Joue une partie et retourne l'état encodé avant le premier tour puis après chaque tour"""
+    game, _, _ = create_match(LION_BUILD, TIGER_BUILD, seed=seed)
+    rng = random.Random(seed)
+    states = [GameStateEncoder.encode_game_state(game)]
+    while len(states) <= turns and not game.game_over:
+        animal = game.get_next_animal_to_play()
+        if animal is None:
+            continue
+        action, target = aggressive_policy(game, animal, rng)
+        if target is None:
+            game.play_turn(animal, action)
+        else:
+            game.play_turn(animal, action, target)
+        states.append(GameStateEncoder.encode_game_state(game))
+    return states
+
+
+def record_state(room, state):
+    """Remplace l'état d'une salle par `state` en enregistrant une nouvelle version"""
+    with room.lock:
+        before = {key: room.game_state.get(key, MISSING) for key in state}
+        room.game_state.update(copy.deepcopy(state))
+        return room.record_changes(before)
+
+
+class RecordingServer(GameServer):
+    """Serveur non démarré qui garde les messages envoyés au lieu de les écrire"""
+
+    def __init__(self):
+        super().__init__("127.0.0.1", 0)
+        self.sent = []
+
+    def send_to_client(self, client_socket, message):
+        self.sent.append((client_socket, message))
+        return True
+
+    def send_to_clients(self, clients, message):
+        for client_info in clients:
+            self.sent.append((client_info["socket"], message))
+
+
+class DeltaTest(unittest.TestCase):
+    """diff, apply et merge sur les états d'une vraie partie"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.states = play_states(40)
+
+    def test_diff_then_apply_gives_new_state(self):
+        for old, new in zip(self.states, self.states[1:]):
+            patch = delta.diff(old, new)
+            self.assertEqual(delta.apply(copy.deepcopy(old), patch), new)
+
+    def test_equal_states_have_no_patch(self):
+        self.assertIsNone(delta.diff(self.states[5], copy.deepcopy(self.states[5])))
+
+    def test_merged_patches_skip_versions(self):
+        merged = None
+        for old, new in zip(self.states, self.states[1:]):
+            merged = delta.merge(merged, delta.diff(old, new))
+        self.assertEqual(delta.apply(copy.deepcopy(self.states[0]), merged), self.states[-1])
+
+    def test_patch_applies_to_newer_base(self):
+        # Un patch de A à C appliqué à un état déjà en B (A <= B <= C) donne C
+        patch = delta.merge(delta.diff(self.states[0], self.states[1]), delta.diff(self.states[1], self.states[2]))
+        self.assertEqual(delta.apply(copy.deepcopy(self.states[1]), patch), self.states[2])
+
+    def test_diff_update_expands_to_update_values(self):
+        old = self.states[3]
+        update = {"animals": self.states[4]["animals"], "ready": True}
+        values = delta.expand_update(old, delta.diff_update(old, update))
+        self.assertEqual(values, update)
+
+    def test_mismatched_patch_is_refused(self):
+        with self.assertRaises(ValueError):
+            delta.apply([1, 2], (delta.DICT, {"a": 1}, {}, []))
+
+
+class RoomHistoryTest(unittest.TestCase):
+    """Room.delta_since rejoue les versions manquées depuis n'importe quelle version de l'historique"""
+
+    def setUp(self):
+        self.states = play_states(30, seed=3)
+        self.room = Room("test")
+        self.room.replace_state(copy.deepcopy(self.states[0]))
+        self.first_version = self.room.version
+        for state in self.states[1:]:
+            record_state(self.room, state)
+
+    def test_delta_since_each_version_catches_up(self):
+        for index, state in enumerate(self.states[:-1]):
+            patch = self.room.delta_since(self.first_version + index)
+            self.assertEqual(delta.apply(copy.deepcopy(state), patch), self.room.game_state)
+
+    def test_current_version_needs_nothing(self):
+        self.assertIsNone(self.room.delta_since(self.room.version))
+
+    def test_version_older_than_history_needs_full_state(self):
+        room = Room("courte")
+        room.replace_state({"counter": 0})
+        base = room.version
+        for value in range(1, ROOM_HISTORY_SIZE + 2):
+            record_state(room, {"counter": value})
+        self.assertIsNone(room.delta_since(base))
+        self.assertEqual(room.delta_since(room.version - 1), (delta.DICT, {"counter": ROOM_HISTORY_SIZE + 1}, {}, []))
+
+
+class StaleActionTest(unittest.TestCase):
+    """Une action calculée sur une version périmée n'écrase pas l'état de la salle"""
+
+    def setUp(self):
+        self.server = RecordingServer()
+        self.room = self.server.default_room
+        self.client_info = {"socket": object(), "address": ("test", 0), "session": None}
+        self.room.add_client(self.client_info)
+        record_state(self.room, {"turn": 1})
+        record_state(self.room, {"turn": 2})
+
+    def send_delta(self, base, update):
+        self.server.process_message(self.client_info, {
+            "type": "action",
+            "base": base,
+            "delta": delta.diff_update(self.room.game_state, update)
+        })
+
+    def test_stale_base_gets_full_state(self):
+        version = self.room.version
+        self.send_delta(version - 1, {"turn": 1})
+        self.assertEqual(self.room.game_state["turn"], 2)
+        self.assertEqual(self.room.version, version)
+        self.assertEqual([message["type"] for _, message in self.server.sent], ["game_update"])
+
+    def test_current_base_is_applied(self):
+        self.send_delta(self.room.version, {"turn": 3})
+        self.assertEqual(self.room.game_state["turn"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests des règles de Game : planification des tours et représentations du terrain.
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from game.animal import Animal
+from game.array_terrain import np
+from game.config import TERRAIN_WIDTH, TERRAIN_HEIGHT
+from game.game import Game
+from game.sim import create_match, aggressive_policy, LION_BUILD, TIGER_BUILD
+from game.square import Square
+from network.game_state import GameStateEncoder
+
+
+def play_game(seed, scheduler=Game.SCHEDULER_EVENT, terrain_backend=Game.TERRAIN_OBJECTS, reseed=False,
+              width=TERRAIN_WIDTH, height=TERRAIN_HEIGHT):
+    """Joue une partie complète avec la politique agressive
+
+    Args:
+        seed: Graine de la partie
+        scheduler: Mode de planification des tours
+        terrain_backend: Représentation du terrain
+        reseed: Si True, réinitialise le générateur de la partie avant chaque tour, pour que
+            les tirages d'un tour ne dépendent pas du nombre de ticks écoulés avant lui
+        width: Largeur de la carte
+        height: Hauteur de la carte
+
+    Returns:
+        list: État encodé après chaque tour
+    """
+    game, _, _ = create_match(LION_BUILD, TIGER_BUILD, seed, width, height, terrain_backend)
+    game.scheduler = scheduler
+    rng = random.Random(seed)
+    states = []
+    while not game.game_over:
+        animal = game.get_next_animal_to_play()
+        if animal is None:
+            continue
+        if reseed:
+            game.rng.seed(f"{seed}:{len(states)}")
+        action, target = aggressive_policy(game, animal, rng)
+        if target is None:
+            game.play_turn(animal, action)
+        else:
+            game.play_turn(animal, action, target)
+        states.append(GameStateEncoder.encode_game_state(game))
+    return states
+
+
+class SchedulerTest(unittest.TestCase):
+    """Le mode événementiel saute les ticks sans changer le déroulement de la partie"""
+
+    def test_event_mode_plays_the_same_game_as_tick_mode(self):
+        # Les vergers tirent leurs fruits une fois par tick en mode tick, une fois par tour en mode
+        # événementiel : sans fruit ni tirage dépendant du nombre de ticks, les parties sont identiques
+        with mock.patch.object(Square, "FRUIT_PROBABILITY", 0):
+            for seed in range(5):
+                tick_states = play_game(seed, Game.SCHEDULER_TICK, reseed=True)
+                event_states = play_game(seed, Game.SCHEDULER_EVENT, reseed=True)
+                self.assertEqual(tick_states, event_states)
+
+    def test_ticks_until_next_turn(self):
+        game = Game(verbose=False, seed=0)
+        fast, slow, still = (Animal(name, hp=10, stamina=10, speed=speed, position=1)
+                             for name, speed in (("A", 7), ("B", 3), ("C", 0)))
+        slow.speed_points = 94
+        self.assertEqual(game.ticks_until_next_turn([fast, slow, still]), 2)
+        self.assertEqual(game.ticks_until_next_turn([fast, still]), 14)  # 7 points au départ, 93 restants
+        self.assertIsNone(game.ticks_until_next_turn([still]))
+
+    def test_advance_speed_points_matches_repeated_ticks(self):
+        for speed_points in (0, 37, 99, 100, 140):
+            for ticks in (1, 5, 40):
+                bulk, stepped = Square(0, 0), Square(0, 0)
+                bulk.speed_points = stepped.speed_points = speed_points
+                ready_ticks = bulk.advance_speed_points(ticks)
+                self.assertEqual(ready_ticks, sum(stepped.add_speed_points() for _ in range(ticks)))
+                self.assertEqual(bulk.speed_points, stepped.speed_points)
+
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TerrainBackendTest(unittest.TestCase):
+    """ArrayTerrain joue les mêmes parties que Terrain pour une même graine"""
+
+    def test_backends_play_the_same_games(self):
+        for scheduler in (Game.SCHEDULER_TICK, Game.SCHEDULER_EVENT):
+            for seed in range(5):
+                self.assertEqual(play_game(seed, scheduler, Game.TERRAIN_OBJECTS),
+                                 play_game(seed, scheduler, Game.TERRAIN_ARRAY))
+
+    def test_backends_play_the_same_games_on_a_large_map(self):
+        self.assertEqual(play_game(1, terrain_backend=Game.TERRAIN_OBJECTS, width=30, height=20),
+                         play_game(1, terrain_backend=Game.TERRAIN_ARRAY, width=30, height=20))
+
+    def test_square_views_write_to_the_planes(self):
+        game, animal, _ = create_match(LION_BUILD, TIGER_BUILD, 0, terrain_backend=Game.TERRAIN_ARRAY)
+        terrain = game.terrain
+        x, y = 4, 5
+        square = terrain.grid[y][x]
+        square.speed_points = 42
+        square.terrain_type = Square.TYPE_FOREST
+        self.assertEqual(terrain.speed_plane[y, x], 42)
+        self.assertEqual(terrain.get_square(square.position).terrain_type, Square.TYPE_FOREST)
+
+        position = animal.position
+        ax, ay = terrain.position_to_coordinates(position)
+        self.assertIs(terrain.grid[ay][ax].animal, animal)
+        terrain.remove_animal(animal)
+        self.assertIsNone(terrain.get_animal_at(position))
+        self.assertEqual(terrain.animal_free_slots, [0])
+
+    def test_planes_are_smaller_than_square_objects(self):
+        game, _, _ = create_match(LION_BUILD, TIGER_BUILD, 0, width=100, height=100,
+                                  terrain_backend=Game.TERRAIN_ARRAY)
+        # Au moins 10 fois moins que les seuls objets Square, sans compter leurs listes ni leurs chaînes
+        square_objects = sys.getsizeof(Square(0, 0)) * 100 * 100
+        self.assertLess(game.terrain.memory_footprint() * 10, square_objects)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests des files d'envoi (network.outbound) et de la déconnexion des clients bloqués.
+"""
+import socket
+import time
+import unittest
+
+from network.async_server import AsyncGameServer
+from network.outbound import OutboundQueue
+from network.server import GameServer
+
+# Durée maximale (secondes) d'attente de la déconnexion d'un client bloqué
+EVICTION_DEADLINE = 10
+
+
+def free_port():
+    """Retourne un port TCP libre sur la boucle locale"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class OutboundQueueTest(unittest.TestCase):
+    """Comptage des octets en attente et détection d'un envoi bloqué"""
+
+    def test_coalesce_keeps_latest_state(self):
+        queue = OutboundQueue()
+        queue.put(b"old", coalesce=True)
+        queue.put(b"chat")
+        queue.put(b"new", coalesce=True)
+        self.assertEqual(queue.pop_all(), [b"chat", b"new"])
+
+    def test_in_flight_bytes_stay_pending_until_sent(self):
+        queue = OutboundQueue(high_water=10, stall_timeout=60)
+        queue.put(b"x" * 8)
+        queue.pop_all()
+        self.assertEqual(queue.pending_bytes, 8)
+        queue.put(b"y" * 8)
+        self.assertIsNotNone(queue.high_water_since)
+        queue.sent()
+        self.assertEqual(queue.pending_bytes, 8)
+        self.assertIsNone(queue.high_water_since)
+
+    def test_blocked_send_refuses_new_frames(self):
+        queue = OutboundQueue(stall_timeout=0.05)
+        queue.put(b"state", coalesce=True)
+        queue.pop_all()
+        self.assertTrue(queue.put(b"state", coalesce=True))
+        time.sleep(0.1)
+        self.assertTrue(queue.send_stalled())
+        self.assertFalse(queue.put(b"state", coalesce=True))
+
+
+class StalledPeerTest(unittest.TestCase):
+    """Un client qui ne lit jamais est déconnecté, même s'il ne reçoit que des états remplaçables"""
+
+    server_class = GameServer
+
+    def setUp(self):
+        self.server = self.server_class("127.0.0.1", free_port(), high_water=1024 * 1024, stall_timeout=0.5)
+        self.assertTrue(self.server.start())
+        # Client qui se connecte puis ne lit plus rien, avec un petit tampon de réception
+        self.peer = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.peer.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        self.peer.connect(("127.0.0.1", self.server.port))
+
+    def tearDown(self):
+        self.peer.close()
+        self.server.stop()
+
+    def wait_for_connection(self):
+        deadline = time.monotonic() + EVICTION_DEADLINE
+        while time.monotonic() < deadline:
+            with self.server.lock:
+                if self.server.clients:
+                    return self.server.clients[0]["socket"]
+            time.sleep(0.01)
+        self.fail("Le client n'a jamais été enregistré")
+
+    def test_peer_that_never_reads_is_evicted(self):
+        connection = self.wait_for_connection()
+        # Chaque état remplace le précédent : la file reste sous high_water, seul l'envoi est bloqué
+        state = {"blob": "x" * 256 * 1024}
+        deadline = time.monotonic() + EVICTION_DEADLINE
+        version = 0
+        while connection in self.server.outbound:
+            self.assertLess(time.monotonic(), deadline, "Le client bloqué n'a pas été déconnecté")
+            version += 1
+            self.server.send_to_client(connection, {"type": "game_update", "state": state, "version": version})
+            time.sleep(0.01)
+
+
+class AsyncStalledPeerTest(StalledPeerTest):
+    """Même scénario avec le serveur asyncio"""
+
+    server_class = AsyncGameServer
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests de la reprise de session (network.server.resume_session) après une déconnexion.
+"""
+import unittest
+
+from network import delta
+from tests.test_delta import RecordingServer, record_state
+
+
+class SessionServer(RecordingServer):
+    """Serveur non démarré dont les connexions sont de simples objets, sans file d'envoi"""
+
+    def __init__(self):
+        super().__init__()
+        self.dropped = []
+
+    def open_outbound(self, connection, address):
+        pass
+
+    def drop_connection(self, connection, reason):
+        self.dropped.append(connection)
+
+    def connect(self, address):
+        """Enregistre un nouveau client comme le ferait accept_connections"""
+        self.sent.clear()
+        return self.register_client(object(), address)
+
+    def disconnect(self, client_info):
+        """Retire un client comme à la fin de handle_client (sa place reste réservée)"""
+        self.suspend_session(client_info)
+        self.leave_room(client_info)
+        with self.lock:
+            self.clients.remove(client_info)
+
+    def resume(self, client_info, token, version):
+        self.sent.clear()
+        self.process_message(client_info, {"type": "resume", "session": token, "version": version})
+        return [message for connection, message in self.sent if connection is client_info["socket"]]
+
+
+class SessionResumeTest(unittest.TestCase):
+    """Un client reconnecté retrouve sa place et reçoit les versions manquées"""
+
+    def setUp(self):
+        self.server = SessionServer()
+        self.room = self.server.default_room
+        self.host = self.server.connect(("hôte", 1))
+        self.guest = self.server.connect(("invité", 2))
+        self.token = self.host["session"]
+        self.version = self.room.version
+
+    def test_resume_restores_seat_and_sends_missed_versions(self):
+        self.server.disconnect(self.host)
+        self.assertIn(1, self.room.active_reservations())
+        record_state(self.room, {"turn": 1})
+
+        # La nouvelle connexion arrive dans le hall, la salle par défaut gardant la place réservée
+        client_info = self.server.connect(("hôte", 3))
+        self.assertIs(client_info["room"], self.server.lobby)
+        messages = self.server.resume(client_info, self.token, self.version)
+
+        self.assertEqual([message["type"] for message in messages], ["resumed", "game_delta"])
+        self.assertEqual(messages[0]["id"], 1)
+        self.assertEqual(messages[0]["session"], self.token)
+        self.assertEqual(messages[1]["base"], self.version)
+        self.assertEqual(messages[1]["version"], self.room.version)
+        self.assertEqual(delta.apply({}, messages[1]["delta"])["turn"], 1)
+        self.assertIs(client_info["room"], self.room)
+        self.assertEqual(client_info["id"], 1)
+        self.assertNotIn(1, self.room.active_reservations())
+        self.assertNotIn(client_info, self.server.lobby.clients)
+
+    def test_resume_at_current_version_sends_no_state(self):
+        self.server.disconnect(self.host)
+        client_info = self.server.connect(("hôte", 3))
+        messages = self.server.resume(client_info, self.token, self.room.version)
+        self.assertEqual([message["type"] for message in messages], ["resumed"])
+
+    def test_reserved_seat_is_not_given_away(self):
+        self.server.disconnect(self.host)
+        self.server.disconnect(self.guest)
+        client_info = self.server.connect(("autre", 4))
+        self.assertIs(client_info["room"], self.server.lobby)
+
+    def test_resume_replaces_a_connection_not_yet_detected_as_lost(self):
+        client_info = self.server.connect(("hôte", 3))
+        messages = self.server.resume(client_info, self.token, self.version)
+        self.assertEqual(messages[0]["type"], "resumed")
+        self.assertEqual(self.server.dropped, [self.host["socket"]])
+        self.assertEqual([client["id"] for client in self.room.clients], [2, 1])
+
+    def test_unknown_token_is_refused(self):
+        client_info = self.server.connect(("inconnu", 5))
+        messages = self.server.resume(client_info, "jeton inconnu", self.version)
+        self.assertEqual([message["type"] for message in messages], ["resume_failed"])
+        self.assertIs(client_info["room"], self.server.lobby)
+
+    def test_expired_session_is_refused(self):
+        self.server.session_ttl = 0
+        self.server.disconnect(self.host)
+        client_info = self.server.connect(("hôte", 3))
+        messages = self.server.resume(client_info, self.token, self.version)
+        self.assertEqual([message["type"] for message in messages], ["resume_failed"])
+        self.assertEqual(self.room.active_reservations(), {})
+
+    def test_second_resume_takes_the_seat_over(self):
+        self.server.disconnect(self.host)
+        first = self.server.connect(("hôte", 3))
+        self.server.resume(first, self.token, self.version)
+        second = self.server.connect(("intrus", 6))
+        messages = self.server.resume(second, self.token, self.version)
+        # La seconde reprise remplace la première connexion : un seul client garde la place
+        self.assertEqual(messages[0]["type"], "resumed")
+        self.assertEqual([client["id"] for client in self.room.clients].count(1), 1)
+        self.assertIs(first["room"], None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+"""
+Module de l'atlas des sprites partagé par les écrans du jeu.
+
+Les images des animaux et des fruits étaient redessinées à chaque création
+d'un écran (GUI.load_images, SetupScreen.load_animal_images), sous forme de
+surfaces séparées gardées dans le format SRCALPHA, plus lent à blitter que
+le format de l'écran. Elles sont maintenant dessinées une seule fois par
+taille de case, rangées dans une seule surface (l'atlas) convertie avec
+convert_alpha(), et chaque écran reçoit des sous-surfaces de cet atlas.
+
+Les sprites retournés sont partagés : il faut les blitter, jamais les modifier.
+"""
+import pygame
+
+from game.config import BLACK, BROWN, ORANGE, YELLOW
+from ui.text_cache import get_font, render_text
+
+# Largeur maximale (pixels) d'une rangée de l'atlas
+ATLAS_MAX_WIDTH = 512
+
+# Groupes de sprites : plateau de jeu (dépend de la taille des cases) et écran de configuration
+BOARD_SPRITES = "board"
+SETUP_SPRITES = "setup"
+
+
+class SpriteAtlas:
+    """Surface unique contenant plusieurs sprites, rangés par rangées"""
+
+    def __init__(self, sprites, max_width=ATLAS_MAX_WIDTH):
+        """Range les sprites dans l'atlas et les dessine
+
+        Args:
+            sprites: [(groupe, nom, (largeur, hauteur), fonction de dessin)], la
+                fonction recevant la surface du sprite, transparente, à remplir
+            max_width: Largeur maximale d'une rangée
+        """
+        self.rects = {}  # {(groupe, nom): rectangle du sprite dans l'atlas}
+
+        # Rangement en rangées, des sprites les plus hauts aux plus bas
+        x = y = row_height = width = 0
+        for group, name, (w, h), _ in sorted(sprites, key=lambda sprite: -sprite[2][1]):
+            if x and x + w > max_width:
+                x, y, row_height = 0, y + row_height, 0
+            self.rects[group, name] = pygame.Rect(x, y, w, h)
+            x += w
+            row_height = max(row_height, h)
+            width = max(width, x)
+
+        self.surface = pygame.Surface((max(1, width), max(1, y + row_height)), pygame.SRCALPHA)
+        for group, name, _, draw in sprites:
+            draw(self.surface.subsurface(self.rects[group, name]))
+
+        # Convertir au format de l'écran, une fois pour tous les sprites
+        self.converted = pygame.display.get_surface() is not None
+        if self.converted:
+            self.surface = self.surface.convert_alpha()
+
+        self.groups = {}  # {groupe: {nom: sous-surface de l'atlas}}
+        for (group, name), rect in self.rects.items():
+            self.groups.setdefault(group, {})[name] = self.surface.subsurface(rect)
+
+    def get_group(self, group):
+        """Retourne les sprites d'un groupe
+
+        Args:
+            group: Nom du groupe (BOARD_SPRITES ou SETUP_SPRITES)
+
+        Returns:
+            dict: {nom: sprite}, une nouvelle table à chaque appel (les sprites sont partagés)
+        """
+        return dict(self.groups.get(group, {}))
+
+
+# Atlas construits, indexés par taille de case
+_atlases = {}
+
+# True si clear() est inscrite auprès de pygame.quit() (pygame oublie les inscriptions à chaque arrêt)
+_quit_registered = False
+
+
+def get_atlas(cell_size):
+    """Retourne l'atlas des sprites pour une taille de case, construit au premier appel
+
+    L'écran doit déjà être créé (pygame.display.set_mode) pour que l'atlas
+    soit converti à son format.
+
+    Args:
+        cell_size: Taille d'une case du plateau en pixels
+
+    Returns:
+        SpriteAtlas: Atlas partagé
+    """
+    atlas = _atlases.get(cell_size)
+    # Un atlas construit avant la création de l'écran est reconstruit pour être converti
+    if atlas is None or (not atlas.converted and pygame.display.get_surface() is not None):
+        register_quit()
+        atlas = SpriteAtlas(sprite_list(cell_size))
+        _atlases[cell_size] = atlas
+    return atlas
+
+
+def get_sprites(group, cell_size):
+    """Retourne les sprites d'un groupe de l'atlas (voir SpriteAtlas.get_group)"""
+    return get_atlas(cell_size).get_group(group)
+
+
+def sprite_list(cell_size):
+    """Décrit les sprites de l'atlas pour une taille de case
+
+    Args:
+        cell_size: Taille d'une case du plateau en pixels
+
+    Returns:
+        list: [(groupe, nom, (largeur, hauteur), fonction de dessin)]
+    """
+    animal_size = (cell_size - 10, cell_size - 10)
+    fruit_size = (cell_size - 20, cell_size - 20)
+    return [
+        # Lion : corps jaune, tête plus foncée, pattes marron
+        (BOARD_SPRITES, "Lion", animal_size,
+         lambda surface: draw_board_animal(surface, cell_size, (255, 220, 100), (230, 190, 80), (150, 100, 50))),
+        # Tigre : corps orange avec des rayures noires
+        (BOARD_SPRITES, "Tiger", animal_size,
+         lambda surface: draw_board_animal(surface, cell_size, (255, 165, 0), (220, 140, 0), (120, 80, 40),
+                                           stripes=True)),
+        # Animal personnalisé du joueur : corps bleu, pattes grises
+        (BOARD_SPRITES, "default", animal_size,
+         lambda surface: draw_board_animal(surface, cell_size, (100, 150, 255), (80, 120, 220), (100, 100, 100))),
+        # Fruit : cercle rouge avec tige verte
+        (BOARD_SPRITES, "Fruit", fruit_size,
+         lambda surface: draw_fruit(surface, cell_size, (255, 50, 50), (50, 150, 50), (50, 200, 50))),
+        # Fruit vert : "+" pour la régénération de HP
+        (BOARD_SPRITES, "GreenFruit", fruit_size,
+         lambda surface: draw_fruit(surface, cell_size, (50, 200, 50), (139, 69, 19), (100, 255, 100), "+")),
+        # Fruit rouge : "S" pour la régénération de Stamina
+        (BOARD_SPRITES, "RedFruit", fruit_size,
+         lambda surface: draw_fruit(surface, cell_size, (255, 50, 50), (50, 150, 50), (50, 200, 50), "S")),
+        # Grandes images de l'écran de configuration
+        (SETUP_SPRITES, "Lion", (100, 100), draw_setup_lion),
+        (SETUP_SPRITES, "Tiger", (100, 100), draw_setup_tiger)
+    ]
+
+
+def draw_board_animal(surface, cell_size, body_color, head_color, leg_color, stripes=False):
+    """Dessine un animal du plateau (corps, tête, rayures éventuelles et pattes)
+
+    Args:
+        surface: Surface du sprite
+        cell_size: Taille d'une case du plateau en pixels
+        body_color: Couleur du corps
+        head_color: Couleur de la tête
+        leg_color: Couleur des pattes
+        stripes: Si True, ajoute les rayures noires du tigre
+    """
+    # Corps
+    body_radius = (cell_size - 20) // 2
+    body_center = (surface.get_width() // 2, surface.get_height() // 2)
+    pygame.draw.circle(surface, body_color, body_center, body_radius)
+    # Tête (cercle plus petit et plus foncé)
+    head_radius = body_radius // 2
+    head_center = (body_center[0] - body_radius // 2, body_center[1] - body_radius // 2)
+    pygame.draw.circle(surface, head_color, head_center, head_radius)
+    # Rayures (lignes noires)
+    if stripes:
+        for i in range(3):
+            offset = i * body_radius // 2
+            pygame.draw.line(surface, BLACK,
+                             (body_center[0] - body_radius // 2 + offset, body_center[1] - body_radius // 2),
+                             (body_center[0] - body_radius // 2 + offset, body_center[1] + body_radius // 2),
+                             2)
+    # Pattes (petits rectangles) : avant gauche, avant droite, arrière gauche, arrière droite
+    leg_width, leg_height = body_radius // 3, body_radius // 2
+    leg_y = body_center[1] + body_radius - leg_height // 2
+    for leg_x in (body_center[0] - body_radius + leg_width,
+                  body_center[0] - leg_width * 2,
+                  body_center[0] + body_radius - leg_width * 2,
+                  body_center[0] + body_radius - leg_width * 4):
+        pygame.draw.rect(surface, leg_color, (leg_x, leg_y, leg_width, leg_height))
+
+
+def draw_fruit(surface, cell_size, body_color, stem_color, leaf_color, symbol=None):
+    """Dessine un fruit (corps, tige, feuille et symbole éventuel)
+
+    Args:
+        surface: Surface du sprite
+        cell_size: Taille d'une case du plateau en pixels
+        body_color: Couleur du fruit
+        stem_color: Couleur de la tige
+        leaf_color: Couleur de la feuille
+        symbol: Texte affiché sur le fruit (effet du fruit), None pour aucun
+    """
+    center_x = surface.get_width() // 2
+    # Corps du fruit
+    pygame.draw.circle(surface, body_color, (center_x, surface.get_height() // 2 + 5), (cell_size - 30) // 2)
+    # Tige
+    pygame.draw.rect(surface, stem_color, (center_x - 2, 5, 4, 10))
+    # Feuille (petit cercle)
+    pygame.draw.circle(surface, leaf_color, (center_x + 5, 10), 5)
+    if symbol:
+        text = render_text(get_font(20), symbol, (255, 255, 255))
+        surface.blit(text, text.get_rect(center=(center_x, surface.get_height() // 2 + 5)))
+
+
+def draw_setup_lion(surface):
+    """Dessine le Lion de l'écran de configuration (100x100)"""
+    # Corps du Lion (cercle jaune)
+    pygame.draw.circle(surface, YELLOW, (50, 50), 40)
+    # Tête du Lion (cercle plus petit et plus foncé)
+    pygame.draw.circle(surface, (200, 180, 0), (30, 30), 20)
+    # Pattes du Lion (petits rectangles marron)
+    pygame.draw.rect(surface, BROWN, (30, 80, 10, 20))
+    pygame.draw.rect(surface, BROWN, (60, 80, 10, 20))
+    pygame.draw.rect(surface, BROWN, (20, 60, 10, 20))
+    pygame.draw.rect(surface, BROWN, (70, 60, 10, 20))
+
+
+def draw_setup_tiger(surface):
+    """Dessine le Tigre de l'écran de configuration (100x100)"""
+    # Corps du Tigre (cercle orange)
+    pygame.draw.circle(surface, ORANGE, (50, 50), 40)
+    # Tête du Tigre (cercle plus petit et plus foncé)
+    pygame.draw.circle(surface, (200, 100, 0), (30, 30), 20)
+    # Rayures du Tigre (lignes noires)
+    for i in range(5):
+        pygame.draw.line(surface, BLACK, (30 + i * 10, 20), (30 + i * 10, 80), 3)
+    # Pattes du Tigre (petits rectangles marron-orange)
+    pygame.draw.rect(surface, (150, 80, 0), (30, 80, 10, 20))
+    pygame.draw.rect(surface, (150, 80, 0), (60, 80, 10, 20))
+    pygame.draw.rect(surface, (150, 80, 0), (20, 60, 10, 20))
+    pygame.draw.rect(surface, (150, 80, 0), (70, 60, 10, 20))
+
+
+def register_quit():
+    """Inscrit clear() auprès de pygame.quit(), une seule fois par démarrage de pygame"""
+    global _quit_registered
+    if not _quit_registered:
+        pygame.register_quit(clear)
+        _quit_registered = True
+
+
+def clear():
+    """Oublie les atlas construits
+
+    Appelée automatiquement par pygame.quit() : les surfaces converties au
+    format d'un écran ne sont plus valides une fois pygame arrêté.
+    """
+    global _quit_registered
+    _quit_registered = False
+    _atlases.clear()
@@ -0,0 +1,107 @@
+"""
+Module de l'horloge de simulation à pas fixe de l'interface graphique.
+
+La simulation avance par ticks de durée fixe (1/60 s de temps de jeu),
+indépendamment du rythme d'affichage : une frame lente rattrape les ticks
+en retard au lieu de ralentir la partie, et la vitesse de simulation peut
+être multipliée (x10) ou illimitée (autant de ticks que le budget d'une
+frame le permet). La fraction du tick suivant déjà écoulée (alpha) sert à
+interpoler l'affichage entre deux ticks.
+"""
+import time
+
+# Nombre de ticks de simulation par seconde de jeu à la vitesse x1
+SIMULATION_TICK_RATE = 60
+
+# Vitesses de simulation proposées (None : illimitée)
+SIMULATION_SPEEDS = (1, 10, None)
+
+# Retard maximal (secondes) rattrapé après une frame lente
+MAX_CATCH_UP = 0.25
+
+# Temps de calcul (secondes) consacré à la simulation par frame en vitesse illimitée
+UNLIMITED_FRAME_BUDGET = 0.012
+
+
+class SimulationClock:
+    """Horloge à pas fixe qui décide combien de ticks de simulation exécuter à chaque frame"""
+
+    def __init__(self, tick_rate=SIMULATION_TICK_RATE, speed=1, timer=time.perf_counter):
+        """Initialise l'horloge
+
+        Args:
+            tick_rate: Nombre de ticks par seconde de jeu à la vitesse x1
+            speed: Multiplicateur de vitesse (None pour une vitesse illimitée)
+            timer: Fonction retournant le temps courant en secondes
+        """
+        self.tick_duration = 1 / tick_rate
+        self.speed = speed
+        self.timer = timer
+        self.accumulator = 0.0  # Temps de jeu écoulé pas encore simulé (secondes)
+        self.last_time = None
+        self.ticks = 0  # Nombre total de ticks exécutés
+        self.waiting = False  # True si le dernier tick tenté a été refusé (simulation bloquée)
+
+    @property
+    def alpha(self):
+        """Fraction (entre 0 et 1) du tick suivant déjà écoulée, pour interpoler l'affichage"""
+        return min(1.0, self.accumulator / self.tick_duration)
+
+    def set_speed(self, speed):
+        """Change la vitesse de simulation
+
+        Args:
+            speed: Multiplicateur de vitesse (None pour une vitesse illimitée)
+        """
+        self.speed = speed
+        self.accumulator = 0.0
+
+    def resume(self):
+        """Reprend après une attente bloquante de la boucle d'affichage
+
+        Le temps passé à attendre un événement n'est pas du temps de jeu : il
+        n'est pas rattrapé, et la simulation est de nouveau tentée dès la
+        frame suivante.
+        """
+        self.last_time = None
+        self.accumulator = 0.0
+        self.waiting = False
+
+    def advance(self, step):
+        """Exécute les ticks de simulation dus depuis le dernier appel
+
+        Args:
+            step: Fonction exécutant un tick, qui retourne False si la simulation
+                est bloquée (par exemple en attente d'un joueur humain)
+
+        Returns:
+            int: Nombre de ticks exécutés
+        """
+        now = self.timer()
+        elapsed = 0.0 if self.last_time is None else min(now - self.last_time, MAX_CATCH_UP)
+        self.last_time = now
+
+        ticks = 0
+        if self.speed is None:
+            # Vitesse illimitée : simuler jusqu'à épuisement du budget de la frame
+            deadline = now + UNLIMITED_FRAME_BUDGET
+            self.waiting = True
+            while step():
+                ticks += 1
+                if self.timer() >= deadline:
+                    self.waiting = False
+                    break
+            self.accumulator = 0.0
+        else:
+            self.accumulator += elapsed * self.speed
+            while self.accumulator >= self.tick_duration:
+                self.waiting = not step()
+                if self.waiting:
+                    # L'attente d'un joueur n'est pas rattrapée ensuite
+                    self.accumulator = 0.0
+                    break
+                self.accumulator -= self.tick_duration
+                ticks += 1
+
+        self.ticks += ticks
+        return ticks
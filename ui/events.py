@@ -0,0 +1,77 @@
+"""
+Module de la boucle d'événements des écrans du jeu.
+
+Quand rien n'évolue à l'écran (pas d'animation, de message temporaire ni de
+simulation en cours), les écrans ne redessinent plus à 60 FPS : ils dorment
+jusqu'au prochain événement, ou jusqu'à un délai de sécurité. Le thread réseau
+réveille aussitôt la boucle en postant NETWORK_EVENT à chaque message reçu du
+serveur.
+
+pygame.event.wait n'est pas utilisé pour l'attente : pygame le réimplémente
+par une boucle qui lit les événements toutes les millisecondes, ce qui coûte
+plus de CPU que l'ancienne boucle à 60 FPS. L'attente lit donc les événements
+toutes les IDLE_POLL_INTERVAL secondes et dort entre deux lectures sur un
+threading.Event que le thread réseau peut signaler.
+"""
+import threading
+import time
+
+import pygame
+
+# Événement posté par le thread réseau à chaque message reçu (ou à la déconnexion)
+NETWORK_EVENT = pygame.event.custom_type()
+
+# Délai maximal (millisecondes) d'une attente, pour les vérifications périodiques
+IDLE_TIMEOUT = 1000
+
+# Intervalle (secondes) entre deux lectures des événements pendant une attente
+IDLE_POLL_INTERVAL = 0.05
+
+# Signalé par le thread réseau pour interrompre une attente
+_wakeup = threading.Event()
+
+
+def wait_for_events(idle, timeout=IDLE_TIMEOUT):
+    """Retourne les événements en attente, en dormant jusqu'au prochain si l'écran est inactif
+
+    Args:
+        idle: Si True, attendre un événement au lieu de retourner immédiatement
+        timeout: Durée maximale de l'attente en millisecondes
+
+    Returns:
+        list: Événements reçus (vide si le délai a expiré)
+    """
+    if not idle:
+        return pygame.event.get()
+
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        events = pygame.event.get()
+        remaining = deadline - time.monotonic()
+        if events or remaining <= 0:
+            return events
+        # Dormir sans lire les événements, sauf si le thread réseau nous réveille
+        if _wakeup.wait(min(IDLE_POLL_INTERVAL, remaining)):
+            _wakeup.clear()
+
+
+def post_network_event(message=None):
+    """Réveille la boucle d'affichage après un message du serveur
+
+    Appelée depuis le thread réseau (callbacks "message" et "disconnect" de
+    GameClient). Un seul NETWORK_EVENT est gardé dans la file : la boucle
+    relit de toute façon l'état complet du client à son réveil.
+
+    Args:
+        message: Message reçu du serveur, None pour une déconnexion
+    """
+    try:
+        if not pygame.display.get_init():
+            return
+        # pump=False : seul le thread principal peut lire les événements du système
+        if not pygame.event.peek(NETWORK_EVENT, pump=False):
+            message_type = message.get("type") if message else "disconnect"
+            pygame.event.post(pygame.event.Event(NETWORK_EVENT, message_type=message_type))
+    except pygame.error as e:
+        print(f"Impossible de poster l'événement réseau: {e}")
+    _wakeup.set()
@@ -1,4 +1,5 @@
 import pygame
+import random
 import sys
 import os
 
@@ -31,6 +32,10 @@ from game.config import (
 )
 
 from game.square import Square
+from ui.assets import BOARD_SPRITES, SETUP_SPRITES, get_sprites
+from ui.clock import SimulationClock
+from ui.events import wait_for_events
+from ui.text_cache import get_font, render_text
 
 # Tailles et dimensions
 CELL_SIZE = 60
@@ -39,6 +44,13 @@ INFO_WIDTH = 300
 BUTTON_HEIGHT = 50
 BUTTON_MARGIN = 10
 
+# Touches de changement de vitesse de la simulation (None : illimitée)
+SPEED_KEYS = {pygame.K_1: 1, pygame.K_2: 10, pygame.K_3: None}
+
+# Couleurs des cases du terrain
+WATER_COLOR = (100, 150, 255)  # Bleu pour l'eau
+WALK_COLOR = (180, 180, 255)  # Bleu clair pour les cases accessibles en marchant
+
 class Slider:
     def __init__(self, x, y, width, height, min_value, max_value, initial_value, label, color=BLUE, step=1):
         self.rect = pygame.Rect(x, y, width, height)
@@ -68,7 +80,7 @@ class Slider:
         pygame.draw.circle(screen, BLACK, handle_pos, self.handle_radius, 2)
         
         # Dessiner le label et la valeur
-        label_text = font.render(f"{self.label}: {self.value}", True, BLACK)
+        label_text = render_text(font, f"{self.label}: {self.value}", BLACK)
         label_rect = label_text.get_rect(midleft=(self.rect.x, self.rect.y - 20))
         screen.blit(label_text, label_rect)
     
@@ -121,10 +133,10 @@ class SetupScreen:
         pygame.display.set_caption("Configuration des Animaux")
         
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 36)
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.small_font = pygame.font.SysFont(None, 24)
-        self.button_font = pygame.font.SysFont(None, 30)  # Ensure this is always initialized
+        self.font = get_font(36)
+        self.title_font = get_font(48)
+        self.small_font = get_font(24)
+        self.button_font = get_font(30)  # Ensure this is always initialized
         
         # Calculer les points minimums requis pour chaque animal
         min_points = (
@@ -330,45 +342,8 @@ class SetupScreen:
         self.bar_width = bar_width
     
     def load_animal_images(self):
-        """Charge les images des animaux"""
-        # Créer une surface pour le Lion
-        lion_img = pygame.Surface((100, 100), pygame.SRCALPHA)
-        
-        # Corps du Lion (cercle jaune)
-        pygame.draw.circle(lion_img, YELLOW, (50, 50), 40)
-        
-        # Tête du Lion (cercle plus petit et plus foncé)
-        pygame.draw.circle(lion_img, (200, 180, 0), (30, 30), 20)
-        
-        # Pattes du Lion (petits rectangles marron)
-        pygame.draw.rect(lion_img, BROWN, (30, 80, 10, 20))
-        pygame.draw.rect(lion_img, BROWN, (60, 80, 10, 20))
-        pygame.draw.rect(lion_img, BROWN, (20, 60, 10, 20))
-        pygame.draw.rect(lion_img, BROWN, (70, 60, 10, 20))
-        
-        # Créer une surface pour le Tigre
-        tiger_img = pygame.Surface((100, 100), pygame.SRCALPHA)
-        
-        # Corps du Tigre (cercle orange)
-        pygame.draw.circle(tiger_img, ORANGE, (50, 50), 40)
-        
-        # Tête du Tigre (cercle plus petit et plus foncé)
-        pygame.draw.circle(tiger_img, (200, 100, 0), (30, 30), 20)
-        
-        # Rayures du Tigre (lignes noires)
-        for i in range(5):
-            pygame.draw.line(tiger_img, BLACK, (30 + i * 10, 20), (30 + i * 10, 80), 3)
-        
-        # Pattes du Tigre (petits rectangles marron-orange)
-        pygame.draw.rect(tiger_img, (150, 80, 0), (30, 80, 10, 20))
-        pygame.draw.rect(tiger_img, (150, 80, 0), (60, 80, 10, 20))
-        pygame.draw.rect(tiger_img, (150, 80, 0), (20, 60, 10, 20))
-        pygame.draw.rect(tiger_img, (150, 80, 0), (70, 60, 10, 20))
-        
-        self.animal_images = {
-            "Lion": lion_img,
-            "Tiger": tiger_img
-        }
+        """Charge les images des animaux depuis l'atlas partagé"""
+        self.animal_images = get_sprites(SETUP_SPRITES, CELL_SIZE)
     
     def update_remaining_points(self):
         """Met à jour le nombre de points restants"""
@@ -449,7 +424,7 @@ class SetupScreen:
         
         # Dessiner le titre principal
         phase_text = f"Configuration de l'animal - Joueur {self.current_phase}"
-        title_text = self.title_font.render(phase_text, True, BLACK)
+        title_text = render_text(self.title_font, phase_text, BLACK)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, self.title_y + self.title_font.get_height() // 2))
         self.screen.blit(title_text, title_rect)
         
@@ -465,7 +440,7 @@ class SetupScreen:
             self.screen.blit(animal_img, img_rect)
         
         # Dessiner le champ de saisie du nom de l'animal
-        name_label = self.font.render("Nom de votre animal:", True, BLACK)
+        name_label = render_text(self.font, "Nom de votre animal:", BLACK)
         name_label_rect = name_label.get_rect(right=self.name_input_rect.left - 10, centery=self.name_input_rect.centery)
         self.screen.blit(name_label, name_label_rect)
         
@@ -475,23 +450,23 @@ class SetupScreen:
         
         # Afficher le nom de l'animal actuel
         if self.current_phase == 1:
-            name_text = self.font.render(self.player1_animal_name, True, BLACK)
+            name_text = render_text(self.font, self.player1_animal_name, BLACK)
         else:
-            name_text = self.font.render(self.player2_animal_name, True, BLACK)
+            name_text = render_text(self.font, self.player2_animal_name, BLACK)
         name_text_rect = name_text.get_rect(left=self.name_input_rect.left + 10, centery=self.name_input_rect.centery)
         self.screen.blit(name_text, name_text_rect)
         
         # Dessiner le titre du tableau des statistiques
         if self.current_animal == "player":
-            stats_title = self.font.render(f"Statistiques de {current_name}", True, BLACK)
+            stats_title = render_text(self.font, f"Statistiques de {current_name}", BLACK)
         else:
-            stats_title = self.font.render(f"Statistiques du {self.current_animal}", True, BLACK)
+            stats_title = render_text(self.font, f"Statistiques du {self.current_animal}", BLACK)
         stats_title_rect = stats_title.get_rect(left=self.table_x, top=self.table_y - 40)
         self.screen.blit(stats_title, stats_title_rect)
         
         # Dessiner les points restants
-        remaining_text = self.font.render(f"Points restants: {self.remaining_points}", True, 
-                                         GREEN if self.remaining_points >= 0 else RED)
+        remaining_text = render_text(self.font, f"Points restants: {self.remaining_points}", 
+                                     GREEN if self.remaining_points >= 0 else RED)
         remaining_rect = remaining_text.get_rect(right=self.table_x + self.table_width, top=self.table_y - 40)
         self.screen.blit(remaining_text, remaining_rect)
         
@@ -513,14 +488,14 @@ class SetupScreen:
             stat_key = stat_info["key"]
             
             # Nom de la statistique
-            stat_text = self.small_font.render(stat_info["name"], True, BLACK)
+            stat_text = render_text(self.small_font, stat_info["name"], BLACK)
             stat_text_rect = stat_text.get_rect(left=self.table_x, centery=y + row_height // 2)
             self.screen.blit(stat_text, stat_text_rect)
             
             # Valeur de la statistique (points bruts et valeur convertie)
             raw_value = params[stat_key]
             converted_value = raw_value // stat_info["conversion"]
-            value_text = self.small_font.render(f"{raw_value} ({converted_value})", True, BLACK)
+            value_text = render_text(self.small_font, f"{raw_value} ({converted_value})", BLACK)
             
             # Récupérer les positions des boutons
             minus_button = self.minus_buttons[stat_key]
@@ -574,9 +549,13 @@ class SetupScreen:
         """Exécute l'écran de configuration"""
         running = True
         
+        needs_redraw = True  # Dessiner la première frame sans attendre
         while running:
+            # L'écran ne change qu'en réponse au joueur : attendre le prochain événement
+            events = wait_for_events(idle=not needs_redraw)
+            
             # Gérer les événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return None, None  # Quitter sans démarrer le jeu
                 
@@ -649,6 +628,11 @@ class SetupScreen:
                             elif self.current_phase == 2 and len(self.player2_animal_name) < 20:
                                 self.player2_animal_name += event.unicode
             
+            # Rien n'a changé depuis la dernière frame (délai d'attente expiré)
+            if not events and not needs_redraw:
+                continue
+            needs_redraw = False
+            
             # Mettre à jour les boutons
             mouse_pos = pygame.mouse.get_pos()
             
@@ -682,7 +666,7 @@ class SetupScreen:
             except AttributeError:
                 # Si button_font n'est pas défini, le créer
                 print("Erreur: button_font non défini, création d'une nouvelle instance")
-                self.button_font = pygame.font.SysFont(None, 30)
+                self.button_font = get_font(30)
                 self.start_button.draw(self.screen, self.button_font)
             
             # Mettre à jour l'affichage
@@ -700,7 +684,7 @@ class SetupScreen:
         # Vérifier que la police des boutons est initialisée
         if not hasattr(self, 'button_font') or self.button_font is None:
             print("Initialisation de button_font dans run_single_player")
-            self.button_font = pygame.font.SysFont(None, 30)
+            self.button_font = get_font(30)
             
         # Créer un bouton de démarrage
         button_width = 200
@@ -710,9 +694,13 @@ class SetupScreen:
         self.start_button = Button(button_x, button_y, button_width, button_height, "Démarrer", GREEN, (150, 255, 150))
         
         running = True
+        needs_redraw = True  # Dessiner la première frame sans attendre
         while running:
+            # L'écran ne change qu'en réponse au joueur : attendre le prochain événement
+            events = wait_for_events(idle=not needs_redraw)
+            
             # Gérer les événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return None
                 
@@ -734,6 +722,11 @@ class SetupScreen:
                         if button["rect"].collidepoint(event.pos):
                             self.handle_stat_change(button["stat"], button["change"])
             
+            # Rien n'a changé depuis la dernière frame (délai d'attente expiré)
+            if not events and not needs_redraw:
+                continue
+            needs_redraw = False
+            
             # Mettre à jour les sliders
             mouse_pos = pygame.mouse.get_pos()
             for slider in self.sliders:
@@ -749,7 +742,7 @@ class SetupScreen:
             self.screen.fill(WHITE)
             
             # Dessiner le titre
-            title = self.title_font.render("Configuration de l'Animal", True, BLACK)
+            title = render_text(self.title_font, "Configuration de l'Animal", BLACK)
             title_rect = title.get_rect(center=(self.screen_width // 2, 30))
             self.screen.blit(title, title_rect)
             
@@ -759,7 +752,7 @@ class SetupScreen:
             # Vérifier à nouveau que button_font est initialisé avant de dessiner le bouton
             if not hasattr(self, 'button_font') or self.button_font is None:
                 print("Réinitialisation de button_font avant de dessiner le bouton")
-                self.button_font = pygame.font.SysFont(None, 30)
+                self.button_font = get_font(30)
             
             try:
                 # Dessiner le bouton de démarrage avec gestion d'erreur
@@ -767,7 +760,7 @@ class SetupScreen:
             except AttributeError as e:
                 print(f"Erreur lors du dessin du bouton: {e}")
                 # Si button_font n'est pas défini, le créer
-                self.button_font = pygame.font.SysFont(None, 30)
+                self.button_font = get_font(30)
                 self.start_button.draw(self.screen, self.button_font)
             
             # Mettre à jour l'affichage
@@ -792,7 +785,7 @@ class Button:
         pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=5)
         
         # Dessiner le texte
-        text_surface = font.render(self.text, True, self.text_color)
+        text_surface = render_text(font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -806,9 +799,17 @@ class Button:
             self.current_color = self.color
 
 class GUI:
-    def __init__(self, game):
+    def __init__(self, game, policies=None, speed=1):
+        """Initialise l'interface graphique du jeu
+        
+        Args:
+            game: Instance de la classe Game
+            policies: {animal: politique} des animaux joués par l'ordinateur, une
+                politique étant une fonction (game, animal, rng) -> (action, cible)
+                comme celles de game.sim
+            speed: Vitesse de la simulation (1, 10 ou None pour illimitée)
+        """
         self.game = game
-        self.terrain = game.terrain
         
         # Initialiser pygame
         pygame.init()
@@ -822,8 +823,8 @@ class GUI:
         pygame.display.set_caption("Jeu des Animaux")
         
         # Initialiser les polices
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = get_font(36)
+        self.small_font = get_font(24)
         
         # Initialiser les variables de jeu
         self.clock = pygame.time.Clock()
@@ -839,13 +840,28 @@ class GUI:
         self.animating_animal = None
         self.animation_start_pos = None
         self.animation_end_pos = None
-        self.animation_frames = 30  # Nombre de frames pour l'animation
+        self.animation_frames = 30  # Durée de l'animation en ticks de simulation
         self.animation_current_frame = 0
         
         # Variables pour les messages d'information
         self.info_message = None
         self.info_message_timer = 0
         
+        # Simulation à pas fixe, indépendante du rythme d'affichage
+        self.sim_clock = SimulationClock(speed=speed)
+        self.policies = policies or {}
+        self.policy_rng = random.Random()
+        
+        # Rendu incrémental : fond pré-rendu et état affiché à la frame précédente
+        self.background = None  # Surface des cases vides, de l'eau, des vergers et de la grille
+        self.background_key = None  # (id du terrain, version du terrain) au dernier relevé du fond
+        self.background_layout = None  # Disposition (eau, vergers) dessinée dans le fond
+        self.drawn_cells = {}  # {position: état} des cases qui diffèrent du fond
+        self.drawn_animals = {}  # {état de l'animal: rectangle à l'écran}
+        self.drawn_info_panel = None  # Contenu affiché du panneau d'information
+        self.drawn_speed_bar = None  # Contenu affiché de la barre de vitesse
+        self.full_redraw = True  # Redessiner toute la fenêtre à la prochaine frame
+        
         # Charger les images
         self.load_images()
         
@@ -875,7 +891,7 @@ class GUI:
         
         # S'assurer que button_font est initialisé
         if not hasattr(setup_screen, 'button_font') or setup_screen.button_font is None:
-            setup_screen.button_font = pygame.font.SysFont(None, 30)
+            setup_screen.button_font = get_font(30)
         
         # En mode multijoueur, on ne configure qu'un seul animal
         if setup_complete_callback:
@@ -989,14 +1005,21 @@ class GUI:
             self.selected_animal = self.current_animal
             self.update_highlights()
             
-        # Compteur de frames pour les mises à jour périodiques
-        frame_count = 0
-            
         while self.running:
+            # Attendre le prochain événement si rien n'évolue à l'écran
+            idle = self.is_idle()
+            events = wait_for_events(idle)
+            if idle and events:
+                # Le temps passé à attendre n'est pas du temps de jeu
+                self.sim_clock.resume()
+            
             # Gérer les événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # La fenêtre a été recouverte : la redessiner entièrement
+                    self.invalidate()
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     # Vérifier si Shift est enfoncé
                     shift_pressed = pygame.key.get_mods() & (pygame.KMOD_LSHIFT | pygame.KMOD_RSHIFT)
@@ -1005,38 +1028,23 @@ class GUI:
                 elif event.type == pygame.MOUSEMOTION:
                     # Mettre à jour les boutons au survol (plus nécessaire, mais gardé pour compatibilité)
                     self.update_buttons(event.pos)
+                elif event.type == pygame.KEYDOWN and event.key in SPEED_KEYS:
+                    # Changer la vitesse de la simulation
+                    self.sim_clock.set_speed(SPEED_KEYS[event.key])
             
-            # Mettre à jour l'animation si nécessaire
-            if self.animation_in_progress:
-                self.update_animation()
-            
-            # Incrémenter le compteur de frames
-            frame_count += 1
-            
-            # Mettre à jour l'animal actuel si nécessaire
-            if not self.animation_in_progress:  # Ne pas changer d'animal pendant une animation
-                previous_animal = self.current_animal
-                self.current_animal = self.game.get_next_animal_to_play()
-                
-                # Si un nouvel animal est prêt à jouer, le sélectionner automatiquement
-                if self.current_animal and self.current_animal != previous_animal:
-                    self.selected_animal = self.current_animal
-                    self.show_info_message(f"C'est au tour de {self.current_animal.name}")
-                    self.update_highlights()
+            # Faire avancer la simulation selon son horloge, quel que soit le rythme des frames
+            self.sim_clock.advance(self.simulation_tick)
             
             # Décrémenter le timer du message d'information
             if self.info_message_timer > 0:
                 self.info_message_timer -= 1
             
-            # Dessiner l'écran
-            self.draw_terrain()
-            self.draw_info_panel()
-            
-            # Dessiner la barre de vitesse
-            self.draw_speed_bar()
+            # Dessiner l'écran : seules les zones modifiées sont redessinées
+            dirty_rects = self.draw_frame()
             
             # Mettre à jour l'écran
-            pygame.display.flip()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
             
             # Limiter à 60 FPS
             self.clock.tick(60)
@@ -1044,399 +1052,488 @@ class GUI:
         pygame.quit()
 
     def load_images(self):
-        """Charge les images pour les animaux et les ressources"""
-        # Créer des surfaces pour les images
-        self.images = {}
+        """Charge les images pour les animaux et les ressources depuis l'atlas partagé"""
+        self.images = get_sprites(BOARD_SPRITES, CELL_SIZE)
+
+    @property
+    def terrain(self):
+        """Terrain affiché : celui du jeu, qu'une mise à jour réseau peut remplacer"""
+        return self.game.terrain
+
+    def invalidate(self):
+        """Force le redessin complet de la fenêtre à la prochaine frame
         
-        # Image pour le Lion (corps jaune, tête plus foncée, pattes marron)
-        lion_img = pygame.Surface((CELL_SIZE - 10, CELL_SIZE - 10), pygame.SRCALPHA)
-        # Corps (cercle jaune)
-        body_radius = (CELL_SIZE - 20) // 2
-        body_center = (lion_img.get_width() // 2, lion_img.get_height() // 2)
-        pygame.draw.circle(lion_img, (255, 220, 100), body_center, body_radius)
-        # Tête (cercle plus petit et plus foncé)
-        head_radius = body_radius // 2
-        head_center = (body_center[0] - body_radius // 2, body_center[1] - body_radius // 2)
-        pygame.draw.circle(lion_img, (230, 190, 80), head_center, head_radius)
-        # Pattes (petits rectangles marron)
-        leg_width, leg_height = body_radius // 3, body_radius // 2
-        # Patte avant gauche
-        pygame.draw.rect(lion_img, (150, 100, 50), 
-                         (body_center[0] - body_radius + leg_width, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte avant droite
-        pygame.draw.rect(lion_img, (150, 100, 50), 
-                         (body_center[0] - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière gauche
-        pygame.draw.rect(lion_img, (150, 100, 50), 
-                         (body_center[0] + body_radius - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière droite
-        pygame.draw.rect(lion_img, (150, 100, 50), 
-                         (body_center[0] + body_radius - leg_width * 4, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        self.images["Lion"] = lion_img
-        
-        # Image pour le Tigre (corps orange avec des rayures noires)
-        tiger_img = pygame.Surface((CELL_SIZE - 10, CELL_SIZE - 10), pygame.SRCALPHA)
-        # Corps (cercle orange)
-        pygame.draw.circle(tiger_img, (255, 165, 0), body_center, body_radius)
-        # Tête (cercle plus petit et plus foncé)
-        pygame.draw.circle(tiger_img, (220, 140, 0), head_center, head_radius)
-        # Rayures (lignes noires)
-        for i in range(3):
-            offset = i * body_radius // 2
-            pygame.draw.line(tiger_img, BLACK, 
-                            (body_center[0] - body_radius // 2 + offset, body_center[1] - body_radius // 2),
-                            (body_center[0] - body_radius // 2 + offset, body_center[1] + body_radius // 2),
-                            2)
-        # Pattes (petits rectangles marron foncé)
-        # Patte avant gauche
-        pygame.draw.rect(tiger_img, (120, 80, 40), 
-                         (body_center[0] - body_radius + leg_width, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte avant droite
-        pygame.draw.rect(tiger_img, (120, 80, 40), 
-                         (body_center[0] - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière gauche
-        pygame.draw.rect(tiger_img, (120, 80, 40), 
-                         (body_center[0] + body_radius - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière droite
-        pygame.draw.rect(tiger_img, (120, 80, 40), 
-                         (body_center[0] + body_radius - leg_width * 4, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        self.images["Tiger"] = tiger_img
-        
-        # Image par défaut pour l'animal personnalisé du joueur (corps bleu)
-        player_img = pygame.Surface((CELL_SIZE - 10, CELL_SIZE - 10), pygame.SRCALPHA)
-        # Corps (cercle bleu)
-        pygame.draw.circle(player_img, (100, 150, 255), body_center, body_radius)
-        # Tête (cercle plus petit et plus foncé)
-        pygame.draw.circle(player_img, (80, 120, 220), head_center, head_radius)
-        # Pattes (petits rectangles gris)
-        # Patte avant gauche
-        pygame.draw.rect(player_img, (100, 100, 100), 
-                         (body_center[0] - body_radius + leg_width, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte avant droite
-        pygame.draw.rect(player_img, (100, 100, 100), 
-                         (body_center[0] - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière gauche
-        pygame.draw.rect(player_img, (100, 100, 100), 
-                         (body_center[0] + body_radius - leg_width * 2, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Patte arrière droite
-        pygame.draw.rect(player_img, (100, 100, 100), 
-                         (body_center[0] + body_radius - leg_width * 4, 
-                          body_center[1] + body_radius - leg_height // 2, 
-                          leg_width, leg_height))
-        # Ajouter cette image comme image par défaut
-        self.images["default"] = player_img
-        
-        # Image pour le Fruit (cercle rouge avec tige verte)
-        fruit_img = pygame.Surface((CELL_SIZE - 20, CELL_SIZE - 20), pygame.SRCALPHA)
-        # Corps du fruit (cercle rouge)
-        pygame.draw.circle(fruit_img, (255, 50, 50), (fruit_img.get_width() // 2, fruit_img.get_height() // 2 + 5), (CELL_SIZE - 30) // 2)
-        # Tige (rectangle vert)
-        pygame.draw.rect(fruit_img, (50, 150, 50), (fruit_img.get_width() // 2 - 2, 5, 4, 10))
-        # Feuille (petit cercle vert)
-        pygame.draw.circle(fruit_img, (50, 200, 50), (fruit_img.get_width() // 2 + 5, 10), 5)
-        self.images["Fruit"] = fruit_img
-        
-        # Image pour le Fruit Vert (cercle vert avec tige marron)
-        green_fruit_img = pygame.Surface((CELL_SIZE - 20, CELL_SIZE - 20), pygame.SRCALPHA)
-        # Corps du fruit (cercle vert)
-        pygame.draw.circle(green_fruit_img, (50, 200, 50), (green_fruit_img.get_width() // 2, green_fruit_img.get_height() // 2 + 5), (CELL_SIZE - 30) // 2)
-        # Tige (rectangle marron)
-        pygame.draw.rect(green_fruit_img, (139, 69, 19), (green_fruit_img.get_width() // 2 - 2, 5, 4, 10))
-        # Feuille (petit cercle vert clair)
-        pygame.draw.circle(green_fruit_img, (100, 255, 100), (green_fruit_img.get_width() // 2 + 5, 10), 5)
-        # Ajouter un symbole "+" pour indiquer la régénération de HP
-        hp_font = pygame.font.SysFont(None, 20)
-        hp_text = hp_font.render("+", True, (255, 255, 255))
-        text_rect = hp_text.get_rect(center=(green_fruit_img.get_width() // 2, green_fruit_img.get_height() // 2 + 5))
-        green_fruit_img.blit(hp_text, text_rect)
-        self.images["GreenFruit"] = green_fruit_img
-        
-        # Image pour le Fruit Rouge (cercle rouge avec tige verte)
-        red_fruit_img = pygame.Surface((CELL_SIZE - 20, CELL_SIZE - 20), pygame.SRCALPHA)
-        # Corps du fruit (cercle rouge)
-        pygame.draw.circle(red_fruit_img, (255, 50, 50), (red_fruit_img.get_width() // 2, red_fruit_img.get_height() // 2 + 5), (CELL_SIZE - 30) // 2)
-        # Tige (rectangle vert)
-        pygame.draw.rect(red_fruit_img, (50, 150, 50), (red_fruit_img.get_width() // 2 - 2, 5, 4, 10))
-        # Feuille (petit cercle vert)
-        pygame.draw.circle(red_fruit_img, (50, 200, 50), (red_fruit_img.get_width() // 2 + 5, 10), 5)
-        # Ajouter un symbole "S" pour indiquer la régénération de Stamina
-        stamina_font = pygame.font.SysFont(None, 20)
-        stamina_text = stamina_font.render("S", True, (255, 255, 255))
-        text_rect = stamina_text.get_rect(center=(red_fruit_img.get_width() // 2, red_fruit_img.get_height() // 2 + 5))
-        red_fruit_img.blit(stamina_text, text_rect)
-        self.images["RedFruit"] = red_fruit_img
+        À appeler après avoir dessiné sur l'écran en dehors de draw_frame
+        (par exemple un message plein écran).
+        """
+        self.full_redraw = True
 
-    def draw_terrain(self):
-        # Dessiner le fond du terrain
-        self.screen.fill(WHITE)
+    def draw_frame(self):
+        """Dessine la frame courante en ne redessinant que ce qui a changé
+        
+        Returns:
+            list: Rectangles de l'écran modifiés, à passer à pygame.display.update
+        """
+        dirty_rects = self.draw_terrain() + self.draw_info_panel() + self.draw_speed_bar()
+        if self.full_redraw:
+            self.full_redraw = False
+            return [self.screen.get_rect()]
+        return dirty_rects
+
+    def terrain_layout(self):
+        """Relève la disposition fixe du terrain : cases d'eau et vergers
+        
+        Returns:
+            tuple: (largeur, hauteur, {position: couleur de fond} des cases d'eau et des vergers)
+        """
+        terrain = self.terrain
+        colors = {}
+        for row in terrain.grid:
+            for square in row:
+                if square.terrain_type == Square.TYPE_WATER:
+                    colors[terrain.coordinates_to_position(square.x, square.y)] = WATER_COLOR
+                elif square.is_orchard:
+                    colors[terrain.coordinates_to_position(square.x, square.y)] = LIGHT_RED
+        return terrain.width, terrain.height, colors
+
+    def update_background(self):
+        """Reconstruit le fond pré-rendu du terrain si sa disposition a changé
+        
+        Le fond contient les cases vides, l'eau, les vergers et la grille. La
+        disposition n'est relevée que lorsque le terrain change (nouvel objet ou
+        nouvelle version), et le fond n'est redessiné que si l'eau ou les
+        vergers ont bougé.
+        
+        Returns:
+            bool: True si le fond a été reconstruit
+        """
+        key = (id(self.terrain), self.terrain.version)
+        if self.background is not None and key == self.background_key:
+            return False
+        self.background_key = key
         
-        # PREMIÈRE PASSE : Dessiner la grille, les cases et les ressources
-        for y in range(self.terrain.height):
-            for x in range(self.terrain.width):
+        layout = self.terrain_layout()
+        if self.background is not None and layout == self.background_layout:
+            return False
+        self.background_layout = layout
+        
+        width, height, colors = layout
+        self.background = pygame.Surface((width * CELL_SIZE, height * CELL_SIZE)).convert()
+        self.background.fill(WHITE)
+        for y in range(height):
+            for x in range(width):
                 rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                position = self.terrain.coordinates_to_position(x, y)
-                square = self.terrain.get_square(position)
-                
-                # Déterminer la couleur de la case
-                cell_color = WHITE
-                
-                # Si la case est une tuile d'eau, lui donner un fond bleu
-                if square and square.terrain_type == Square.TYPE_WATER:
-                    cell_color = (100, 150, 255)  # Bleu pour l'eau
-                # Si la case est un verger (peut produire des fruits), lui donner un fond légèrement rouge
-                elif square and square.is_orchard:
-                    # Si la case a atteint 100 points de vitesse, utiliser une couleur plus vive
-                    if square.speed_points >= 100:
-                        cell_color = READY_RED
-                    else:
-                        cell_color = LIGHT_RED
-                
-                # Si un animal est sélectionné et que c'est son tour, montrer les déplacements possibles
-                if self.selected_animal and self.selected_animal == self.current_animal:
-                    actions = self.game.get_animal_possible_actions(self.selected_animal)
-                    
-                    # Colorer les cases accessibles pour marcher
-                    if "walk" in actions and position in actions["walk"]:
-                        cell_color = (180, 180, 255)  # Bleu clair pour "walk"
-                    
-                    # Les cases accessibles pour courir sont les mêmes que pour marcher
-                    # puisque run ne déplace que d'une case maintenant
-                
-                # Dessiner la case
-                pygame.draw.rect(self.screen, cell_color, rect)
-                pygame.draw.rect(self.screen, BLACK, rect, 1)
-                
-                # Dessiner les ressources (mais pas les animaux)
-                resource = self.terrain.get_resource_at(position)
-                if resource:
-                    # Dessiner l'image de la ressource
-                    resource_img = self.images[resource.name]
-                    img_rect = resource_img.get_rect(center=(x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2))
-                    self.screen.blit(resource_img, img_rect)
-        
-        # DEUXIÈME PASSE : Dessiner tous les animaux et leurs barres de vie
-        for y in range(self.terrain.height):
-            for x in range(self.terrain.width):
-                position = self.terrain.coordinates_to_position(x, y)
-                animal = self.terrain.get_animal_at(position)
-                
-                if animal and (not self.animation_in_progress or animal != self.animating_animal):
-                    # Calculer le centre de la cellule
-                    cell_center_x = x * CELL_SIZE + CELL_SIZE // 2
-                    cell_center_y = y * CELL_SIZE + CELL_SIZE // 2
-                    
-                    # Dessiner l'image de l'animal
-                    # Utiliser l'image par défaut si l'animal n'a pas d'image spécifique
-                    if animal.name in self.images:
-                        animal_img = self.images[animal.name]
-                    else:
-                        animal_img = self.images["default"]
-                    img_rect = animal_img.get_rect(center=(cell_center_x, cell_center_y))
-                    self.screen.blit(animal_img, img_rect)
-                    
-                    # Calculer les coordonnées pour la tête et le corps
-                    body_radius = (CELL_SIZE - 20) // 2
-                    body_center = (cell_center_x, cell_center_y)
-                    head_radius = body_radius // 2
-                    head_center = (body_center[0] - body_radius // 2, body_center[1] - body_radius // 2)
-                    
-                    # Si l'animal est sélectionné, dessiner un contour
-                    if animal == self.selected_animal:
-                        pygame.draw.circle(self.screen, (0, 255, 0), body_center, body_radius + 2, 2)
-                    
-                    # Si l'animal peut être attaqué, mettre en évidence
-                    if self.selected_animal and animal != self.selected_animal and self.selected_animal == self.current_animal:
-                        actions = self.game.get_animal_possible_actions(self.selected_animal)
-                        
-                        # Mettre en évidence l'animal si on peut l'attaquer
-                        if ("bite" in actions and animal in actions["bite"]) or ("slap" in actions and animal in actions["slap"]):
-                            pygame.draw.circle(self.screen, RED, body_center, body_radius + 2, 2)
-                    
-                    # Dessiner les barres de vie et de stamina
-                    bar_width = CELL_SIZE - 10  # Barres plus longues
-                    bar_height = 10
-                    bar_x = x * CELL_SIZE + 5  # Commencer plus à gauche
-                    
-                    # Barre de vie (verte) - positionnée 6 pixels plus bas
-                    hp_bar_y = y * CELL_SIZE + CELL_SIZE - 19  # -25 + 6 = -19
-                    hp_ratio = animal.hp / animal.max_hp
-                    
-                    # Dessiner une petite icône de cœur pour la vie
-                    heart_size = 8
-                    heart_x = bar_x - heart_size - 2
-                    heart_y = hp_bar_y + bar_height // 2 - heart_size // 2
-                    
-                    # Dessiner un cœur rouge
-                    pygame.draw.circle(self.screen, (255, 0, 0), (heart_x + heart_size // 3, heart_y + heart_size // 3), heart_size // 3)
-                    pygame.draw.circle(self.screen, (255, 0, 0), (heart_x + heart_size - heart_size // 3, heart_y + heart_size // 3), heart_size // 3)
-                    pygame.draw.polygon(self.screen, (255, 0, 0), [
-                        (heart_x, heart_y + heart_size // 3),
-                        (heart_x + heart_size, heart_y + heart_size // 3),
-                        (heart_x + heart_size // 2, heart_y + heart_size)
-                    ])
-                    
-                    # Fond de la barre (gris)
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, hp_bar_y, bar_width, bar_height))
-                    # Barre de vie (verte)
-                    hp_bar_width = max(int(bar_width * hp_ratio), 1)  # Au moins 1 pixel de large
-                    pygame.draw.rect(self.screen, GREEN, (bar_x, hp_bar_y, hp_bar_width, bar_height))
-                    # Contour de la barre
-                    pygame.draw.rect(self.screen, BLACK, (bar_x, hp_bar_y, bar_width, bar_height), 1)
-                    
-                    # Barre de stamina (bleue) - positionnée 6 pixels plus bas
-                    stamina_bar_y = y * CELL_SIZE + CELL_SIZE - 6  # -12 + 6 = -6
-                    stamina_ratio = animal.stamina / animal.max_stamina
-                    
-                    # Dessiner une petite icône d'éclair pour la stamina
-                    bolt_size = 8
-                    bolt_x = bar_x - bolt_size - 2
-                    bolt_y = stamina_bar_y + bar_height // 2 - bolt_size // 2
-                    
-                    # Dessiner un éclair jaune
-                    pygame.draw.polygon(self.screen, YELLOW, [
-                        (bolt_x + bolt_size // 2, bolt_y),
-                        (bolt_x + bolt_size, bolt_y + bolt_size // 2),
-                        (bolt_x + bolt_size // 2, bolt_y + bolt_size // 2),
-                        (bolt_x + bolt_size // 2, bolt_y + bolt_size),
-                        (bolt_x, bolt_y + bolt_size // 2),
-                        (bolt_x + bolt_size // 2, bolt_y + bolt_size // 2)
-                    ])
-                    
-                    # Fond de la barre (gris)
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, stamina_bar_y, bar_width, bar_height))
-                    # Barre de stamina (bleue)
-                    stamina_bar_width = max(int(bar_width * stamina_ratio), 1)  # Au moins 1 pixel de large
-                    pygame.draw.rect(self.screen, BLUE, (bar_x, stamina_bar_y, stamina_bar_width, bar_height))
-                    # Contour de la barre
-                    pygame.draw.rect(self.screen, BLACK, (bar_x, stamina_bar_y, bar_width, bar_height), 1)
-                    
-                    # Afficher les valeurs numériques à l'intérieur des barres
-                    hp_font = pygame.font.SysFont(None, 14)
-                    hp_text = hp_font.render(f"{animal.hp}/{animal.max_hp}", True, BLACK)
-                    stamina_text = hp_font.render(f"{animal.stamina}/{animal.max_stamina}", True, BLACK)
-                    
-                    # Centrer les textes dans les barres
-                    hp_text_rect = hp_text.get_rect(center=(bar_x + bar_width // 2, hp_bar_y + bar_height // 2))
-                    stamina_text_rect = stamina_text.get_rect(center=(bar_x + bar_width // 2, stamina_bar_y + bar_height // 2))
-                    
-                    self.screen.blit(hp_text, hp_text_rect)
-                    self.screen.blit(stamina_text, stamina_text_rect)
-                    
-                    # Ajouter des barres de faim et de soif
-                    hunger_bar_y = stamina_bar_y + bar_height + 2
-                    thirst_bar_y = hunger_bar_y + bar_height + 2
-                    
-                    # Calculer les ratios
-                    hunger_ratio = animal.hunger / animal.max_hunger
-                    thirst_ratio = animal.thirst / animal.max_thirst
-                    
-                    # Dessiner une icône de nourriture pour la faim
-                    food_size = 8
-                    food_x = bar_x - food_size - 2
-                    food_y = hunger_bar_y + bar_height // 2 - food_size // 2
-                    
-                    # Dessiner une pomme rouge
-                    pygame.draw.circle(self.screen, (255, 0, 0), (food_x + food_size // 2, food_y + food_size // 2), food_size // 2)
-                    pygame.draw.rect(self.screen, (0, 100, 0), (food_x + food_size // 2 - 1, food_y, 2, food_size // 3))
-                    
-                    # Dessiner une icône d'eau pour la soif
-                    water_size = 8
-                    water_x = bar_x - water_size - 2
-                    water_y = thirst_bar_y + bar_height // 2 - water_size // 2
-                    
-                    # Dessiner une goutte d'eau bleue
-                    pygame.draw.polygon(self.screen, (0, 100, 255), [
-                        (water_x + water_size // 2, water_y),
-                        (water_x + water_size, water_y + water_size // 2),
-                        (water_x + water_size // 2, water_y + water_size),
-                        (water_x, water_y + water_size // 2)
-                    ])
-                    
-                    # Fond de la barre de faim (gris)
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, hunger_bar_y, bar_width, bar_height))
-                    # Barre de faim (orange)
-                    hunger_bar_width = max(int(bar_width * hunger_ratio), 1)  # Au moins 1 pixel de large
-                    pygame.draw.rect(self.screen, ORANGE, (bar_x, hunger_bar_y, hunger_bar_width, bar_height))
-                    # Contour de la barre
-                    pygame.draw.rect(self.screen, BLACK, (bar_x, hunger_bar_y, bar_width, bar_height), 1)
-                    
-                    # Fond de la barre de soif (gris)
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, thirst_bar_y, bar_width, bar_height))
-                    # Barre de soif (bleu clair)
-                    thirst_bar_width = max(int(bar_width * thirst_ratio), 1)  # Au moins 1 pixel de large
-                    pygame.draw.rect(self.screen, LIGHT_BLUE, (bar_x, thirst_bar_y, thirst_bar_width, bar_height))
-                    # Contour de la barre
-                    pygame.draw.rect(self.screen, BLACK, (bar_x, thirst_bar_y, bar_width, bar_height), 1)
-                    
-                    # Afficher les valeurs numériques à l'intérieur des barres de faim et de soif
-                    hunger_text = hp_font.render(f"{int(animal.hunger / animal.max_hunger * 100)}%", True, BLACK)
-                    thirst_text = hp_font.render(f"{int(animal.thirst)}%", True, BLACK)
-                    
-                    # Centrer les textes dans les barres
-                    hunger_text_rect = hunger_text.get_rect(center=(bar_x + bar_width // 2, hunger_bar_y + bar_height // 2))
-                    thirst_text_rect = thirst_text.get_rect(center=(bar_x + bar_width // 2, thirst_bar_y + bar_height // 2))
-                    
-                    self.screen.blit(hunger_text, hunger_text_rect)
-                    self.screen.blit(thirst_text, thirst_text_rect)
+                color = colors.get(self.terrain.coordinates_to_position(x, y))
+                if color:
+                    pygame.draw.rect(self.background, color, rect)
+                pygame.draw.rect(self.background, BLACK, rect, 1)
+        return True
+
+    def current_targets(self):
+        """Retourne les cibles de l'animal sélectionné, si c'est son tour
         
-        # Dessiner l'animal en cours d'animation
-        if self.animation_in_progress and self.animating_animal:
-            # Calculer la position intermédiaire
-            progress = self.animation_current_frame / self.animation_frames
-            start_x, start_y = self.terrain.position_to_coordinates(self.animation_start_pos)
-            end_x, end_y = self.terrain.position_to_coordinates(self.animation_end_pos)
+        Returns:
+            tuple: (positions accessibles en marchant, animaux attaquables)
+        """
+        if not self.is_human_turn():
+            return set(), []
+        actions = self.game.get_animal_possible_actions(self.selected_animal)
+        return set(actions.get("walk", ())), actions.get("bite", []) + actions.get("slap", [])
+
+    def cell_states(self, walk_positions):
+        """Calcule l'état affiché des cases qui diffèrent du fond pré-rendu
+        
+        Args:
+            walk_positions: Positions accessibles en marchant pour l'animal sélectionné
             
-            current_x = start_x + (end_x - start_x) * progress
-            current_y = start_y + (end_y - start_y) * progress
+        Returns:
+            dict: {position: (couleur de la case, nom de la ressource ou None)}
+        """
+        terrain = self.terrain
+        colors = self.background_layout[2]
+        states = {}
+        
+        # Vergers ayant atteint 100 points de vitesse : couleur plus vive
+        for position, color in colors.items():
+            if color == LIGHT_RED and terrain.get_square(position).speed_points >= 100:
+                states[position] = (READY_RED, None)
+        
+        # Cases accessibles pour marcher (courir n'avance aussi que d'une case)
+        for position in walk_positions:
+            states[position] = (WALK_COLOR, None)
+        
+        # Ressources, dessinées sur la couleur de leur case (un fruit mangé est retiré
+        # de sa case mais peut rester dans terrain.resources : la case fait foi)
+        for position in terrain.resources:
+            resource = terrain.get_resource_at(position)
+            if resource:
+                color = states[position][0] if position in states else colors.get(position, WHITE)
+                states[position] = (color, resource.name)
+        return states
+
+    def animal_states(self, attackable):
+        """Calcule l'état affiché de chaque animal, dans l'ordre de dessin
+        
+        Args:
+            attackable: Animaux que l'animal sélectionné peut attaquer
             
-            # Calculer le centre de la cellule pour l'animation
-            cell_center_x = current_x * CELL_SIZE + CELL_SIZE // 2
-            cell_center_y = current_y * CELL_SIZE + CELL_SIZE // 2
+        Returns:
+            list: [(état, rectangle couvert à l'écran, animal)]
+        """
+        terrain = self.terrain
+        states = []
+        for position in sorted(terrain.animals):
+            animal = terrain.animals[position]
+            if self.animation_in_progress and animal == self.animating_animal:
+                continue
+            x, y = terrain.position_to_coordinates(position)
+            state = (
+                x, y, self.animal_image_name(animal),
+                animal == self.selected_animal, animal != self.selected_animal and animal in attackable,
+                animal.hp, animal.max_hp, animal.stamina, animal.max_stamina,
+                animal.hunger, animal.max_hunger, animal.thirst, animal.max_thirst
+            )
+            # Les icônes débordent à gauche de la case et les barres sur la case du dessous
+            rect = pygame.Rect(x * CELL_SIZE - MARGIN - 1, y * CELL_SIZE + MARGIN - 1, CELL_SIZE + 2, CELL_SIZE + 26)
+            states.append((state, rect, animal))
+        
+        # L'animal en cours d'animation est dessiné par-dessus les autres
+        if self.animation_in_progress and self.animating_animal:
+            rect = self.animation_rect()
+            states.append((("moving", self.animal_image_name(self.animating_animal), tuple(rect)), rect, self.animating_animal))
+        return states
+
+    def animal_image_name(self, animal):
+        """Retourne le nom de l'image d'un animal (image par défaut si l'animal n'en a pas)"""
+        return animal.name if animal.name in self.images else "default"
+
+    def animation_rect(self):
+        """Calcule le rectangle de l'image de l'animal en cours d'animation"""
+        # Calculer la position intermédiaire, interpolée entre deux ticks de simulation
+        progress = min(1.0, (self.animation_current_frame + self.sim_clock.alpha) / self.animation_frames)
+        start_x, start_y = self.terrain.position_to_coordinates(self.animation_start_pos)
+        end_x, end_y = self.terrain.position_to_coordinates(self.animation_end_pos)
+        
+        current_x = start_x + (end_x - start_x) * progress
+        current_y = start_y + (end_y - start_y) * progress
+        
+        # Calculer le centre de la cellule pour l'animation
+        cell_center_x = current_x * CELL_SIZE + CELL_SIZE // 2
+        cell_center_y = current_y * CELL_SIZE + CELL_SIZE // 2
+        return self.images[self.animal_image_name(self.animating_animal)].get_rect(center=(cell_center_x, cell_center_y))
+
+    def cell_rect(self, position):
+        """Retourne le rectangle d'une case à l'écran"""
+        x, y = self.terrain.position_to_coordinates(position)
+        return pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+    def draw_terrain(self):
+        """Dessine les zones du terrain qui ont changé depuis la frame précédente
+        
+        Le fond pré-rendu est recopié sous chaque zone modifiée, puis les cases
+        et les animaux qui la recouvrent y sont redessinés dans l'ordre habituel
+        (cases, animaux, animal en cours d'animation).
+        
+        Returns:
+            list: Rectangles de l'écran redessinés
+        """
+        if self.update_background():
+            self.full_redraw = True
+        
+        walk_positions, attackable = self.current_targets()
+        cells = self.cell_states(walk_positions)
+        animals = self.animal_states(attackable)
+        drawn_animals = {state: rect for state, rect, _ in animals}
+        terrain_rect = self.background.get_rect()
+        
+        if self.full_redraw:
+            dirty_rects = [terrain_rect]
+        else:
+            dirty_rects = [
+                self.cell_rect(position) for position in cells.keys() | self.drawn_cells.keys()
+                if cells.get(position) != self.drawn_cells.get(position)
+            ]
+            dirty_rects += [rect for state, rect in drawn_animals.items() if state not in self.drawn_animals]
+            dirty_rects += [rect for state, rect in self.drawn_animals.items() if state not in drawn_animals]
+            dirty_rects = [self.expand_dirty_area(rect, animals).clip(terrain_rect) for rect in dirty_rects]
+            dirty_rects = [rect for rect in dirty_rects if rect.width and rect.height]
+        self.drawn_cells = cells
+        self.drawn_animals = drawn_animals
+        
+        for area in dirty_rects:
+            self.screen.set_clip(area)
+            self.screen.blit(self.background, area, area)
+            for position, state in cells.items():
+                rect = self.cell_rect(position)
+                if rect.colliderect(area):
+                    self.draw_cell(rect, state)
+            for state, rect, animal in animals:
+                if not rect.colliderect(area):
+                    continue
+                if state[0] == "moving":
+                    self.screen.blit(self.images[state[1]], rect)
+                else:
+                    self.draw_animal(animal, state[0], state[1], state[3], state[4])
+        self.screen.set_clip(None)
+        return dirty_rects
+
+    @staticmethod
+    def expand_dirty_area(area, animals):
+        """Agrandit une zone à redessiner jusqu'à contenir entièrement ce qu'elle touche
+        
+        La zone est alignée sur la grille et étendue aux animaux qui la
+        recouvrent : une zone de découpe qui coupe un contour peut laisser un
+        trait parasite sur son bord.
+        
+        Args:
+            area: Zone modifiée
+            animals: [(état, rectangle, animal)] des animaux affichés
             
-            # Dessiner l'image de l'animal en animation
-            if self.animating_animal.name in self.images:
-                animal_img = self.images[self.animating_animal.name]
-            else:
-                animal_img = self.images["default"]
-            img_rect = animal_img.get_rect(center=(cell_center_x, cell_center_y))
-            self.screen.blit(animal_img, img_rect)
+        Returns:
+            pygame.Rect: Zone à redessiner
+        """
+        while True:
+            left = area.left // CELL_SIZE * CELL_SIZE
+            top = area.top // CELL_SIZE * CELL_SIZE
+            right = -(-area.right // CELL_SIZE) * CELL_SIZE
+            bottom = -(-area.bottom // CELL_SIZE) * CELL_SIZE
+            grown = pygame.Rect(left, top, right - left, bottom - top)
+            for _, rect, _ in animals:
+                if rect.colliderect(grown):
+                    grown.union_ip(rect)
+            if grown == area:
+                return area
+            area = grown
+
+    def draw_cell(self, rect, state):
+        """Dessine une case qui diffère du fond et sa ressource
+        
+        Args:
+            rect: Rectangle de la case à l'écran
+            state: (couleur de la case, nom de la ressource ou None)
+        """
+        cell_color, resource_name = state
+        pygame.draw.rect(self.screen, cell_color, rect)
+        pygame.draw.rect(self.screen, BLACK, rect, 1)
+        
+        if resource_name:
+            # Dessiner l'image de la ressource
+            resource_img = self.images[resource_name]
+            img_rect = resource_img.get_rect(center=rect.center)
+            self.screen.blit(resource_img, img_rect)
+
+    def draw_animal(self, animal, x, y, selected, attackable):
+        """Dessine un animal et ses barres de vie, stamina, faim et soif
+        
+        Args:
+            animal: Animal à dessiner
+            x: Colonne de la case de l'animal
+            y: Ligne de la case de l'animal
+            selected: True si l'animal est sélectionné
+            attackable: True si l'animal sélectionné peut l'attaquer
+        """
+        # Calculer le centre de la cellule
+        cell_center_x = x * CELL_SIZE + CELL_SIZE // 2
+        cell_center_y = y * CELL_SIZE + CELL_SIZE // 2
+        
+        # Dessiner l'image de l'animal
+        # Utiliser l'image par défaut si l'animal n'a pas d'image spécifique
+        if animal.name in self.images:
+            animal_img = self.images[animal.name]
+        else:
+            animal_img = self.images["default"]
+        img_rect = animal_img.get_rect(center=(cell_center_x, cell_center_y))
+        self.screen.blit(animal_img, img_rect)
+        
+        # Calculer les coordonnées pour la tête et le corps
+        body_radius = (CELL_SIZE - 20) // 2
+        body_center = (cell_center_x, cell_center_y)
+        head_radius = body_radius // 2
+        head_center = (body_center[0] - body_radius // 2, body_center[1] - body_radius // 2)
+        
+        # Si l'animal est sélectionné, dessiner un contour
+        if selected:
+            pygame.draw.circle(self.screen, (0, 255, 0), body_center, body_radius + 2, 2)
+        
+        # Si l'animal peut être attaqué, mettre en évidence
+        if attackable:
+            pygame.draw.circle(self.screen, RED, body_center, body_radius + 2, 2)
+        
+        # Dessiner les barres de vie et de stamina
+        bar_width = CELL_SIZE - 10  # Barres plus longues
+        bar_height = 10
+        bar_x = x * CELL_SIZE + 5  # Commencer plus à gauche
+        
+        # Barre de vie (verte) - positionnée 6 pixels plus bas
+        hp_bar_y = y * CELL_SIZE + CELL_SIZE - 19  # -25 + 6 = -19
+        hp_ratio = animal.hp / animal.max_hp
+        
+        # Dessiner une petite icône de cœur pour la vie
+        heart_size = 8
+        heart_x = bar_x - heart_size - 2
+        heart_y = hp_bar_y + bar_height // 2 - heart_size // 2
+        
+        # Dessiner un cœur rouge
+        pygame.draw.circle(self.screen, (255, 0, 0), (heart_x + heart_size // 3, heart_y + heart_size // 3), heart_size // 3)
+        pygame.draw.circle(self.screen, (255, 0, 0), (heart_x + heart_size - heart_size // 3, heart_y + heart_size // 3), heart_size // 3)
+        pygame.draw.polygon(self.screen, (255, 0, 0), [
+            (heart_x, heart_y + heart_size // 3),
+            (heart_x + heart_size, heart_y + heart_size // 3),
+            (heart_x + heart_size // 2, heart_y + heart_size)
+        ])
+        
+        # Fond de la barre (gris)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, hp_bar_y, bar_width, bar_height))
+        # Barre de vie (verte)
+        hp_bar_width = max(int(bar_width * hp_ratio), 1)  # Au moins 1 pixel de large
+        pygame.draw.rect(self.screen, GREEN, (bar_x, hp_bar_y, hp_bar_width, bar_height))
+        # Contour de la barre
+        pygame.draw.rect(self.screen, BLACK, (bar_x, hp_bar_y, bar_width, bar_height), 1)
+        
+        # Barre de stamina (bleue) - positionnée 6 pixels plus bas
+        stamina_bar_y = y * CELL_SIZE + CELL_SIZE - 6  # -12 + 6 = -6
+        stamina_ratio = animal.stamina / animal.max_stamina
+        
+        # Dessiner une petite icône d'éclair pour la stamina
+        bolt_size = 8
+        bolt_x = bar_x - bolt_size - 2
+        bolt_y = stamina_bar_y + bar_height // 2 - bolt_size // 2
+        
+        # Dessiner un éclair jaune
+        pygame.draw.polygon(self.screen, YELLOW, [
+            (bolt_x + bolt_size // 2, bolt_y),
+            (bolt_x + bolt_size, bolt_y + bolt_size // 2),
+            (bolt_x + bolt_size // 2, bolt_y + bolt_size // 2),
+            (bolt_x + bolt_size // 2, bolt_y + bolt_size),
+            (bolt_x, bolt_y + bolt_size // 2),
+            (bolt_x + bolt_size // 2, bolt_y + bolt_size // 2)
+        ])
+        
+        # Fond de la barre (gris)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, stamina_bar_y, bar_width, bar_height))
+        # Barre de stamina (bleue)
+        stamina_bar_width = max(int(bar_width * stamina_ratio), 1)  # Au moins 1 pixel de large
+        pygame.draw.rect(self.screen, BLUE, (bar_x, stamina_bar_y, stamina_bar_width, bar_height))
+        # Contour de la barre
+        pygame.draw.rect(self.screen, BLACK, (bar_x, stamina_bar_y, bar_width, bar_height), 1)
+        
+        # Afficher les valeurs numériques à l'intérieur des barres
+        hp_font = get_font(14)
+        hp_text = render_text(hp_font, f"{animal.hp}/{animal.max_hp}", BLACK)
+        stamina_text = render_text(hp_font, f"{animal.stamina}/{animal.max_stamina}", BLACK)
+        
+        # Centrer les textes dans les barres
+        hp_text_rect = hp_text.get_rect(center=(bar_x + bar_width // 2, hp_bar_y + bar_height // 2))
+        stamina_text_rect = stamina_text.get_rect(center=(bar_x + bar_width // 2, stamina_bar_y + bar_height // 2))
+        
+        self.screen.blit(hp_text, hp_text_rect)
+        self.screen.blit(stamina_text, stamina_text_rect)
+        
+        # Ajouter des barres de faim et de soif
+        hunger_bar_y = stamina_bar_y + bar_height + 2
+        thirst_bar_y = hunger_bar_y + bar_height + 2
+        
+        # Calculer les ratios
+        hunger_ratio = animal.hunger / animal.max_hunger
+        thirst_ratio = animal.thirst / animal.max_thirst
+        
+        # Dessiner une icône de nourriture pour la faim
+        food_size = 8
+        food_x = bar_x - food_size - 2
+        food_y = hunger_bar_y + bar_height // 2 - food_size // 2
+        
+        # Dessiner une pomme rouge
+        pygame.draw.circle(self.screen, (255, 0, 0), (food_x + food_size // 2, food_y + food_size // 2), food_size // 2)
+        pygame.draw.rect(self.screen, (0, 100, 0), (food_x + food_size // 2 - 1, food_y, 2, food_size // 3))
+        
+        # Dessiner une icône d'eau pour la soif
+        water_size = 8
+        water_x = bar_x - water_size - 2
+        water_y = thirst_bar_y + bar_height // 2 - water_size // 2
+        
+        # Dessiner une goutte d'eau bleue
+        pygame.draw.polygon(self.screen, (0, 100, 255), [
+            (water_x + water_size // 2, water_y),
+            (water_x + water_size, water_y + water_size // 2),
+            (water_x + water_size // 2, water_y + water_size),
+            (water_x, water_y + water_size // 2)
+        ])
+        
+        # Fond de la barre de faim (gris)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, hunger_bar_y, bar_width, bar_height))
+        # Barre de faim (orange)
+        hunger_bar_width = max(int(bar_width * hunger_ratio), 1)  # Au moins 1 pixel de large
+        pygame.draw.rect(self.screen, ORANGE, (bar_x, hunger_bar_y, hunger_bar_width, bar_height))
+        # Contour de la barre
+        pygame.draw.rect(self.screen, BLACK, (bar_x, hunger_bar_y, bar_width, bar_height), 1)
+        
+        # Fond de la barre de soif (gris)
+        pygame.draw.rect(self.screen, LIGHT_GRAY, (bar_x, thirst_bar_y, bar_width, bar_height))
+        # Barre de soif (bleu clair)
+        thirst_bar_width = max(int(bar_width * thirst_ratio), 1)  # Au moins 1 pixel de large
+        pygame.draw.rect(self.screen, LIGHT_BLUE, (bar_x, thirst_bar_y, thirst_bar_width, bar_height))
+        # Contour de la barre
+        pygame.draw.rect(self.screen, BLACK, (bar_x, thirst_bar_y, bar_width, bar_height), 1)
+        
+        # Afficher les valeurs numériques à l'intérieur des barres de faim et de soif
+        hunger_text = render_text(hp_font, f"{int(animal.hunger / animal.max_hunger * 100)}%", BLACK)
+        thirst_text = render_text(hp_font, f"{int(animal.thirst)}%", BLACK)
+        
+        # Centrer les textes dans les barres
+        hunger_text_rect = hunger_text.get_rect(center=(bar_x + bar_width // 2, hunger_bar_y + bar_height // 2))
+        thirst_text_rect = thirst_text.get_rect(center=(bar_x + bar_width // 2, thirst_bar_y + bar_height // 2))
+        
+        self.screen.blit(hunger_text, hunger_text_rect)
+        self.screen.blit(thirst_text, thirst_text_rect)
+
+    def info_panel_state(self):
+        """Relève le contenu du panneau d'information
+        
+        Returns:
+            tuple: Tout ce qu'affiche le panneau, comparé d'une frame à l'autre
+        """
+        animal = self.selected_animal
+        animal_state = None
+        if animal:
+            animal_state = (
+                animal.name, animal.hp, animal.max_hp, animal.stamina, animal.max_stamina,
+                animal.speed, animal.speed_points, animal.teeth, animal.claws, animal.skin, animal.height,
+                int(animal.hunger), animal.max_hunger, int(animal.thirst), animal.max_thirst,
+                animal == self.current_animal
+            )
+        message = self.info_message if self.info_message and self.info_message_timer > 0 else None
+        winner = self.game.winner.name if self.game.game_over and self.game.winner else None
+        return self.terrain.width, animal_state, message, self.game.game_over, winner
 
     def draw_info_panel(self):
+        """Dessine le panneau d'information s'il a changé depuis la frame précédente
+        
+        Returns:
+            list: Rectangles de l'écran redessinés
+        """
+        state = self.info_panel_state()
+        if state == self.drawn_info_panel and not self.full_redraw:
+            return []
+        self.drawn_info_panel = state
+        
+        # Le bas du panneau est recouvert par la barre de vitesse ; le trait de
+        # séparation déborde d'un pixel sur le terrain
+        panel_rect = pygame.Rect(self.terrain.width * CELL_SIZE - 1, 0, INFO_WIDTH + 1, self.terrain.height * CELL_SIZE)
+        self.screen.set_clip(panel_rect)
+        
         # Dessiner le fond du panneau d'information
         info_rect = pygame.Rect(self.terrain.width * CELL_SIZE, 0, INFO_WIDTH, self.height)
         pygame.draw.rect(self.screen, WHITE, info_rect)
         pygame.draw.line(self.screen, BLACK, (self.terrain.width * CELL_SIZE, 0), (self.terrain.width * CELL_SIZE, self.height), 2)
         
         # Titre du jeu
-        title = self.font.render("Jeu des Animaux", True, BLACK)
+        title = render_text(self.font, "Jeu des Animaux", BLACK)
         self.screen.blit(title, (self.terrain.width * CELL_SIZE + 10, 10))
         
         # Afficher les informations sur l'animal sélectionné
         if self.selected_animal:
             # Nom de l'animal
-            name_text = self.font.render(f"{self.selected_animal.name}", True, BLACK)
+            name_text = render_text(self.font, f"{self.selected_animal.name}", BLACK)
             self.screen.blit(name_text, (self.terrain.width * CELL_SIZE + 10, 50))
             
             # Ligne de séparation pour les statistiques
@@ -1445,7 +1542,7 @@ class GUI:
                             (self.terrain.width * CELL_SIZE + INFO_WIDTH - 5, 75), 1)
             
             # Titre des statistiques
-            stats_title = self.small_font.render("Statistiques:", True, BLACK)
+            stats_title = render_text(self.small_font, "Statistiques:", BLACK)
             self.screen.blit(stats_title, (self.terrain.width * CELL_SIZE + 10, 80))
             
             # Statistiques de base
@@ -1453,53 +1550,53 @@ class GUI:
             line_height = 20
             
             # Points de vie
-            hp_text = self.small_font.render(f"HP: {self.selected_animal.hp}/{self.selected_animal.max_hp}", True, RED)
+            hp_text = render_text(self.small_font, f"HP: {self.selected_animal.hp}/{self.selected_animal.max_hp}", RED)
             self.screen.blit(hp_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Stamina
-            stamina_text = self.small_font.render(f"Stamina: {self.selected_animal.stamina}/{self.selected_animal.max_stamina}", True, BLUE)
+            stamina_text = render_text(self.small_font, f"Stamina: {self.selected_animal.stamina}/{self.selected_animal.max_stamina}", BLUE)
             self.screen.blit(stamina_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Vitesse
-            speed_text = self.small_font.render(f"Vitesse: {self.selected_animal.speed}", True, GREEN)
+            speed_text = render_text(self.small_font, f"Vitesse: {self.selected_animal.speed}", GREEN)
             self.screen.blit(speed_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Points de vitesse
-            speed_points_text = self.small_font.render(f"Points de vitesse: {self.selected_animal.speed_points}", True, GREEN)
+            speed_points_text = render_text(self.small_font, f"Points de vitesse: {self.selected_animal.speed_points}", GREEN)
             self.screen.blit(speed_points_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Nouvelles caractéristiques
             # Dents
-            teeth_text = self.small_font.render(f"Dents: {self.selected_animal.teeth}", True, YELLOW)
+            teeth_text = render_text(self.small_font, f"Dents: {self.selected_animal.teeth}", YELLOW)
             self.screen.blit(teeth_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Griffes
-            claws_text = self.small_font.render(f"Griffes: {self.selected_animal.claws}", True, ORANGE)
+            claws_text = render_text(self.small_font, f"Griffes: {self.selected_animal.claws}", ORANGE)
             self.screen.blit(claws_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Peau
-            skin_text = self.small_font.render(f"Peau: {self.selected_animal.skin}", True, BROWN)
+            skin_text = render_text(self.small_font, f"Peau: {self.selected_animal.skin}", BROWN)
             self.screen.blit(skin_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Taille
-            height_text = self.small_font.render(f"Taille: {self.selected_animal.height}", True, PURPLE)
+            height_text = render_text(self.small_font, f"Taille: {self.selected_animal.height}", PURPLE)
             self.screen.blit(height_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Faim
-            hunger_text = self.small_font.render(f"Faim: {int(self.selected_animal.hunger)}/{self.selected_animal.max_hunger}", True, ORANGE)
+            hunger_text = render_text(self.small_font, f"Faim: {int(self.selected_animal.hunger)}/{self.selected_animal.max_hunger}", ORANGE)
             self.screen.blit(hunger_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
             # Soif
-            thirst_text = self.small_font.render(f"Soif: {int(self.selected_animal.thirst)}/{self.selected_animal.max_thirst}", True, LIGHT_BLUE)
+            thirst_text = render_text(self.small_font, f"Soif: {int(self.selected_animal.thirst)}/{self.selected_animal.max_thirst}", LIGHT_BLUE)
             self.screen.blit(thirst_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             y_offset += line_height
             
@@ -1511,7 +1608,7 @@ class GUI:
             
             # Indiquer si c'est le tour de cet animal
             if self.selected_animal == self.current_animal:
-                turn_text = self.small_font.render("C'est son tour de jouer!", True, GREEN)
+                turn_text = render_text(self.small_font, "C'est son tour de jouer!", GREEN)
                 self.screen.blit(turn_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height + 10
                 
@@ -1522,21 +1619,21 @@ class GUI:
                 y_offset += 10
                 
                 # Afficher les commandes
-                commands_title = self.small_font.render("Commandes:", True, BLACK)
+                commands_title = render_text(self.small_font, "Commandes:", BLACK)
                 self.screen.blit(commands_title, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height + 5
                 
                 # Déplacements
-                move_text = self.small_font.render("- Clic: Marcher", True, BLUE)
+                move_text = render_text(self.small_font, "- Clic: Marcher", BLUE)
                 self.screen.blit(move_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height
                 
-                run_text = self.small_font.render(f"- Shift+Clic: Courir (+{RUN_SPEED_GAIN} vitesse)", True, (50, 50, 200))
+                run_text = render_text(self.small_font, f"- Shift+Clic: Courir (+{RUN_SPEED_GAIN} vitesse)", (50, 50, 200))
                 self.screen.blit(run_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height + 5
                 
                 # Attaques
-                attack_title = self.small_font.render("Sur un ennemi:", True, BLACK)
+                attack_title = render_text(self.small_font, "Sur un ennemi:", BLACK)
                 self.screen.blit(attack_title, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height
                 
@@ -1544,32 +1641,35 @@ class GUI:
                 slap_damage = SLAP_DAMAGE + self.selected_animal.claws
                 bite_damage = BITE_DAMAGE + self.selected_animal.teeth
                 
-                slap_text = self.small_font.render(f"- Clic: Gifler ({slap_damage} dégâts, +{SLAP_SPEED_GAIN} vitesse)", True, RED)
+                slap_text = render_text(self.small_font, f"- Clic: Gifler ({slap_damage} dégâts, +{SLAP_SPEED_GAIN} vitesse)", RED)
                 self.screen.blit(slap_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
                 y_offset += line_height
                 
-                bite_text = self.small_font.render(f"- Shift+Clic: Mordre ({bite_damage} dégâts)", True, (200, 0, 0))
+                bite_text = render_text(self.small_font, f"- Shift+Clic: Mordre ({bite_damage} dégâts)", (200, 0, 0))
                 self.screen.blit(bite_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
             else:
-                turn_text = self.small_font.render("En attente de son tour...", True, RED)
+                turn_text = render_text(self.small_font, "En attente de son tour...", RED)
                 self.screen.blit(turn_text, (self.terrain.width * CELL_SIZE + 10, y_offset))
         
         # Afficher le message d'information
         if self.info_message and self.info_message_timer > 0:
-            info_text = self.small_font.render(self.info_message, True, BLACK)
+            info_text = render_text(self.small_font, self.info_message, BLACK)
             info_rect = info_text.get_rect(center=(self.terrain.width * CELL_SIZE + INFO_WIDTH // 2, self.height - 50))
             self.screen.blit(info_text, info_rect)
         
         # Afficher le statut du jeu
         if self.game.game_over:
-            game_over_text = self.font.render("Jeu terminé!", True, RED)
+            game_over_text = render_text(self.font, "Jeu terminé!", RED)
             game_over_rect = game_over_text.get_rect(center=(self.terrain.width * CELL_SIZE + INFO_WIDTH // 2, self.height - 100))
             self.screen.blit(game_over_text, game_over_rect)
             
             if self.game.winner:
-                winner_text = self.font.render(f"{self.game.winner.name} a gagné!", True, GREEN)
+                winner_text = render_text(self.font, f"{self.game.winner.name} a gagné!", GREEN)
                 winner_rect = winner_text.get_rect(center=(self.terrain.width * CELL_SIZE + INFO_WIDTH // 2, self.height - 70))
                 self.screen.blit(winner_text, winner_rect)
+        
+        self.screen.set_clip(None)
+        return [panel_rect]
 
     def handle_click(self, pos, shift_pressed=False):
         """Gère les clics sur le terrain
@@ -1591,7 +1691,7 @@ class GUI:
             position = self.terrain.coordinates_to_position(grid_x, grid_y)
             
             # Si un animal est sélectionné et que c'est son tour
-            if self.selected_animal and self.selected_animal == self.current_animal:
+            if self.is_human_turn():
                 # Récupérer les actions possibles
                 actions = self.game.get_animal_possible_actions(self.selected_animal)
                 
@@ -1723,6 +1823,87 @@ class GUI:
                     else:
                         self.show_info_message(f"Ce n'est pas le tour de {animal.name}")
 
+    def simulation_tick(self):
+        """Avance la simulation d'un tick
+        
+        Un tick fait progresser l'animation en cours, ou sinon le temps de jeu
+        (points de vitesse, cases, fruits) jusqu'à ce qu'un animal soit prêt.
+        Un animal joué par l'ordinateur joue aussitôt ; un animal joué par un
+        humain bloque la simulation jusqu'à son action.
+        
+        Returns:
+            bool: False si la simulation attend un joueur humain ou si la partie est finie
+        """
+        if self.animation_in_progress:
+            self.update_animation()
+            return True
+        if self.game.game_over:
+            return False
+        
+        previous_animal = self.current_animal
+        self.current_animal = self.game.get_next_animal_to_play()
+        
+        # Si un nouvel animal est prêt à jouer, le sélectionner automatiquement
+        if self.current_animal and self.current_animal != previous_animal:
+            self.selected_animal = self.current_animal
+            self.show_info_message(f"C'est au tour de {self.current_animal.name}")
+            self.update_highlights()
+        
+        if self.current_animal is None:
+            # Sans animal sur le terrain (partie en réseau pas encore commencée), rien n'évolue
+            return bool(self.game.animals) and not self.game.game_over
+        policy = self.policies.get(self.current_animal)
+        if policy is None:
+            return False
+        self.play_policy_turn(self.current_animal, policy)
+        return True
+
+    def play_policy_turn(self, animal, policy):
+        """Fait jouer un animal contrôlé par l'ordinateur
+        
+        Args:
+            animal: Animal dont c'est le tour
+            policy: Politique (game, animal, rng) -> (action, cible)
+        """
+        action, target = policy(self.game, animal, self.policy_rng)
+        old_position = animal.position
+        if target is None:
+            result = self.game.play_turn(animal, action)
+        else:
+            result = self.game.play_turn(animal, action, target)
+        
+        if result and action in ("walk", "run"):
+            self.start_animation(animal, old_position, target)
+        if action == "bite" or action == "slap":
+            self.show_info_message(f"{animal.name} attaque {target.name} ({action})")
+        
+        # Le prochain tick désignera le prochain animal
+        self.current_animal = None
+
+    def is_idle(self):
+        """Indique si l'écran peut rester figé jusqu'au prochain événement
+        
+        C'est le cas quand aucune animation ni aucun message temporaire n'est en
+        cours et que la simulation attend un joueur humain (ou que la partie est
+        finie) : seul un clic, une touche ou un message réseau peut alors changer
+        l'affichage.
+        
+        Returns:
+            bool: True si la boucle peut bloquer en attendant un événement
+        """
+        if self.animation_in_progress or not self.sim_clock.waiting:
+            return False
+        # Un message affiché sans limite de durée ne demande pas de redessiner
+        return self.info_message_timer <= 0 or self.info_message_timer == float('inf')
+
+    def is_human_turn(self):
+        """Indique si l'animal sélectionné est celui qui doit jouer et s'il est joué par un humain"""
+        return (
+            self.selected_animal is not None
+            and self.selected_animal == self.current_animal
+            and self.current_animal not in self.policies
+        )
+
     def start_animation(self, animal, start_pos, end_pos):
         self.animation_in_progress = True
         self.animation_current_frame = 0
@@ -1745,7 +1926,7 @@ class GUI:
         self.highlighted_cells = []
         self.highlighted_animals = []
         
-        if self.selected_animal and self.selected_animal == self.current_animal:
+        if self.is_human_turn():
             actions = self.game.get_animal_possible_actions(self.selected_animal)
             
             # Mettre en évidence les cellules pour les déplacements
@@ -1795,8 +1976,34 @@ class GUI:
             else:
                 self.show_info_message(f"{len(new_fruit_positions)} fruits sont apparus!")
 
+    def speed_bar_state(self):
+        """Relève le contenu de la barre de vitesse
+        
+        Returns:
+            tuple: Tout ce qu'affiche la barre, comparé d'une frame à l'autre
+        """
+        animals = tuple(
+            (animal.name, animal.speed_points, animal == self.current_animal)
+            for animal in self.game.animals if animal.is_alive
+        )
+        return self.width, self.terrain.height, self.sim_clock.speed, animals
+
     def draw_speed_bar(self):
-        """Dessine la barre de vitesse montrant la position des animaux en fonction de leurs points de vitesse"""
+        """Dessine la barre de vitesse montrant la position des animaux en fonction de leurs points de vitesse
+        
+        La barre n'est redessinée que si son contenu a changé depuis la frame précédente.
+        
+        Returns:
+            list: Rectangles de l'écran redessinés
+        """
+        state = self.speed_bar_state()
+        if state == self.drawn_speed_bar and not self.full_redraw:
+            return []
+        self.drawn_speed_bar = state
+        
+        section_rect = pygame.Rect(0, self.terrain.height * CELL_SIZE, self.width, 80)
+        self.screen.set_clip(section_rect)
+        
         # Dimensions et position de la barre
         bar_width = 600
         bar_height = 40
@@ -1807,10 +2014,15 @@ class GUI:
         pygame.draw.rect(self.screen, LIGHT_GRAY, (0, self.terrain.height * CELL_SIZE, self.width, 80))
         
         # Titre de la barre
-        title_text = self.font.render("Points de vitesse", True, BLACK)
+        title_text = render_text(self.font, "Points de vitesse", BLACK)
         title_rect = title_text.get_rect(center=(self.width // 2, bar_y - 10))
         self.screen.blit(title_text, title_rect)
         
+        # Vitesse de la simulation (touches 1, 2 et 3 : x1, x10, illimitée)
+        speed_label = f"x{self.sim_clock.speed}" if self.sim_clock.speed else "max"
+        speed_text = render_text(self.small_font, f"Vitesse: {speed_label}", BLACK)
+        self.screen.blit(speed_text, (10, bar_y + bar_height // 2 - speed_text.get_height() // 2))
+        
         # Dessiner le fond de la barre
         pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height))
         
@@ -1821,7 +2033,7 @@ class GUI:
             
             # Ajouter les valeurs numériques
             if i % 2 == 0:  # 0, 20, 40, 60, 80, 100
-                value_text = self.small_font.render(str(i * 10), True, BLACK)
+                value_text = render_text(self.small_font, str(i * 10), BLACK)
                 self.screen.blit(value_text, (pos_x - 10, bar_y + bar_height + 5))
         
         # Dessiner le contour de la barre
@@ -1846,7 +2058,7 @@ class GUI:
                     pygame.draw.circle(self.screen, BLACK, (position_x, bar_y + bar_height // 2), 12, 2)
                 
                 # Ajouter le nom de l'animal et ses points de vitesse
-                name_text = self.small_font.render(f"{animal.name}: {animal.speed_points}", True, BLACK)
+                name_text = render_text(self.small_font, f"{animal.name}: {animal.speed_points}", BLACK)
                 name_rect = name_text.get_rect(center=(position_x, bar_y + bar_height // 2))
                 # Dessiner un fond blanc pour le texte pour une meilleure lisibilité
                 text_bg_rect = name_rect.copy()
@@ -1855,4 +2067,7 @@ class GUI:
                 pygame.draw.rect(self.screen, WHITE, text_bg_rect)
                 pygame.draw.rect(self.screen, BLACK, text_bg_rect, 1)
                 name_rect.y -= 20
-                self.screen.blit(name_text, name_rect) 
\ No newline at end of file
+                self.screen.blit(name_text, name_rect) 
+        
+        self.screen.set_clip(None)
+        return [section_rect]
@@ -6,6 +6,8 @@ import time
 from game.config import (
     WHITE, BLACK, GRAY, BLUE, RED, GREEN, LIGHT_GRAY
 )
+from ui.events import NETWORK_EVENT, post_network_event, wait_for_events
+from ui.text_cache import get_font, render_text
 
 class Lobby:
     """Classe pour l'écran de lobby multijoueur"""
@@ -39,11 +41,11 @@ class Lobby:
             })
         
         # Polices
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.subtitle_font = pygame.font.SysFont(None, 48)
-        self.info_font = pygame.font.SysFont(None, 36)
-        self.player_font = pygame.font.SysFont(None, 30)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.title_font = get_font(72)
+        self.subtitle_font = get_font(48)
+        self.info_font = get_font(36)
+        self.player_font = get_font(30)
+        self.small_font = get_font(24)
         
         # Boutons
         button_width = 300
@@ -103,6 +105,11 @@ class Lobby:
         else:
             self.info_message = "En attente que l'hôte démarre la partie..."
         
+        # Chaque message du serveur réveille la boucle du lobby
+        if self.client:
+            self.client.register_callback("message", post_network_event)
+            self.client.register_callback("disconnect", post_network_event)
+        
     def run(self):
         """Exécute la boucle principale du lobby
         
@@ -114,10 +121,20 @@ class Lobby:
         
         print(f"Démarrage du lobby (hôte: {self.is_host})")
         
+        drawn_state = None  # Contenu affiché à la dernière frame
+        
         while self.running:
+            # Attendre un événement (clic, message du serveur) ou la prochaine mise à jour des joueurs
+            next_update = self.last_update + self.update_interval - time.time()
+            events = wait_for_events(idle=drawn_state is not None, timeout=next_update * 1000)
+            
             # Gérer les événements
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in events:
+                if event.type == NETWORK_EVENT:
+                    # Nouvel état reçu : l'appliquer sans attendre la mise à jour périodique
+                    self.apply_game_state()
+                
+                elif event.type == pygame.QUIT:
                     print("Événement QUIT détecté")
                     self.running = False
                     result = {"action": "quit"}
@@ -203,11 +220,17 @@ class Lobby:
                 result = {"action": "start_game"}
                 break
             
+            # Ne redessiner que si le joueur a agi ou si le contenu a changé
+            state = self.display_state()
+            if not events and state == drawn_state:
+                continue
+            drawn_state = state
+            
             # Mettre à jour l'affichage
             self.screen.fill(WHITE)
             
             # Dessiner le titre
-            title = self.title_font.render("Lobby Multijoueur", True, BLACK)
+            title = render_text(self.title_font, "Lobby Multijoueur", BLACK)
             title_rect = title.get_rect(center=(self.screen_width // 2, 60))
             self.screen.blit(title, title_rect)
             
@@ -216,7 +239,7 @@ class Lobby:
             pygame.draw.rect(self.screen, BLUE, self.ip_highlight_rect, 2)
             
             # Dessiner l'adresse IP en gros et en gras
-            ip_text = self.subtitle_font.render(f"Adresse IP: {self.host_ip}", True, BLUE)
+            ip_text = render_text(self.subtitle_font, f"Adresse IP: {self.host_ip}", BLUE)
             ip_rect = ip_text.get_rect(center=self.ip_highlight_rect.center)
             self.screen.blit(ip_text, ip_rect)
             
@@ -225,30 +248,30 @@ class Lobby:
                 info_y = self.ip_highlight_rect.bottom + 10
                 
                 # Titre des informations de connexion
-                info_text = self.small_font.render(self.connection_info, True, BLACK)
+                info_text = render_text(self.small_font, self.connection_info, BLACK)
                 info_rect = info_text.get_rect(center=(self.screen_width // 2, info_y))
                 self.screen.blit(info_text, info_rect)
                 
                 # Informations sur le réseau local
                 info_y += 25
-                local_text = self.small_font.render(self.connection_info_local, True, BLACK)
+                local_text = render_text(self.small_font, self.connection_info_local, BLACK)
                 local_rect = local_text.get_rect(center=(self.screen_width // 2, info_y))
                 self.screen.blit(local_text, local_rect)
                 
                 # Informations sur le réseau externe
                 info_y += 25
-                external_text = self.small_font.render(self.connection_info_external, True, BLACK)
+                external_text = render_text(self.small_font, self.connection_info_external, BLACK)
                 external_rect = external_text.get_rect(center=(self.screen_width // 2, info_y))
                 self.screen.blit(external_text, external_rect)
                 
                 # Informations sur le port
                 info_y += 25
-                port_text = self.small_font.render(self.connection_info_port, True, BLACK)
+                port_text = render_text(self.small_font, self.connection_info_port, BLACK)
                 port_rect = port_text.get_rect(center=(self.screen_width // 2, info_y))
                 self.screen.blit(port_text, port_rect)
             
             # Dessiner le sous-titre pour la liste des joueurs
-            subtitle = self.subtitle_font.render("Joueurs connectés:", True, BLACK)
+            subtitle = render_text(self.subtitle_font, "Joueurs connectés:", BLACK)
             subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, 220))
             self.screen.blit(subtitle, subtitle_rect)
             
@@ -267,14 +290,13 @@ class Lobby:
                 
                 # Dessiner le nom du joueur
                 player_name = f"Joueur {player['id']}: {player['name']}"
-                player_text = self.player_font.render(player_name, True, BLACK)
+                player_text = render_text(self.player_font, player_name, BLACK)
                 player_text_rect = player_text.get_rect(midleft=(player_rect.left + 20, player_rect.centery))
                 self.screen.blit(player_text, player_text_rect)
                 
                 # Dessiner le statut du joueur
-                status_text = self.player_font.render(
+                status_text = render_text(self.player_font,
                     "Prêt" if player.get("ready", False) else "En attente",
-                    True,
                     GREEN if player.get("ready", False) else RED
                 )
                 status_rect = status_text.get_rect(midright=(player_rect.right - 20, player_rect.centery))
@@ -283,7 +305,7 @@ class Lobby:
                 player_y += 50
             
             # Dessiner le message d'information
-            info_text = self.info_font.render(self.info_message, True, BLACK)
+            info_text = render_text(self.info_font, self.info_message, BLACK)
             info_rect = info_text.get_rect(center=(self.screen_width // 2, self.screen_height - 200))
             self.screen.blit(info_text, info_rect)
             
@@ -297,7 +319,7 @@ class Lobby:
                 pygame.draw.rect(self.screen, start_color, self.start_button["rect"])
                 pygame.draw.rect(self.screen, BLACK, self.start_button["rect"], 2)
                 
-                start_text = self.info_font.render(self.start_button["text"], True, WHITE)
+                start_text = render_text(self.info_font, self.start_button["text"], WHITE)
                 start_text_rect = start_text.get_rect(center=self.start_button["rect"].center)
                 self.screen.blit(start_text, start_text_rect)
             
@@ -307,7 +329,7 @@ class Lobby:
                 pygame.draw.rect(self.screen, ready_color, self.ready_button["rect"])
                 pygame.draw.rect(self.screen, BLACK, self.ready_button["rect"], 2)
                 
-                ready_text = self.info_font.render(self.ready_button["text"], True, WHITE)
+                ready_text = render_text(self.info_font, self.ready_button["text"], WHITE)
                 ready_text_rect = ready_text.get_rect(center=self.ready_button["rect"].center)
                 self.screen.blit(ready_text, ready_text_rect)
             
@@ -316,7 +338,7 @@ class Lobby:
             pygame.draw.rect(self.screen, back_color, self.back_button["rect"])
             pygame.draw.rect(self.screen, BLACK, self.back_button["rect"], 2)
             
-            back_text = self.info_font.render(self.back_button["text"], True, WHITE)
+            back_text = render_text(self.info_font, self.back_button["text"], WHITE)
             back_text_rect = back_text.get_rect(center=self.back_button["rect"].center)
             self.screen.blit(back_text, back_text_rect)
             
@@ -324,9 +346,26 @@ class Lobby:
             pygame.display.flip()
             clock.tick(60)
         
+        if self.client:
+            self.client.unregister_callback("message", post_network_event)
+            self.client.unregister_callback("disconnect", post_network_event)
+        
         print(f"Sortie du lobby avec résultat: {result}")
         return result
     
+    def display_state(self):
+        """Retourne le contenu affiché par le lobby, pour ne redessiner que ce qui a changé
+        
+        Returns:
+            tuple: Message, joueurs et état des boutons
+        """
+        return (
+            self.info_message,
+            repr(self.players),
+            self.start_button["active"],
+            self.ready_button["text"]
+        )
+    
     def update_players(self):
         """Met à jour la liste des joueurs connectés"""
         # Si nous avons un client, demander la liste des joueurs au serveur
@@ -338,29 +377,7 @@ class Lobby:
                     return
                 print("Reconnexion réussie, mise à jour des joueurs...")
             
-            # Vérifier si nous avons reçu des mises à jour de l'état du jeu
-            game_state = self.client.game_state
-            if game_state:
-                # Vérifier si la partie a commencé
-                if "game_started" in game_state and game_state["game_started"]:
-                    self.game_started = True
-                    if not self.is_host:
-                        self.info_message = "L'hôte a démarré la partie. Préparation en cours..."
-                
-                # Mettre à jour la liste des joueurs
-                if "players" in game_state:
-                    self.players = game_state["players"]
-                    
-                    # Mettre à jour le message d'information
-                    if self.is_host:
-                        # Vérifier si tous les joueurs sont prêts
-                        all_ready = all(player.get("ready", False) for player in self.players if player["id"] != 1)
-                        if len(self.players) > 1 and all_ready:
-                            self.info_message = "Tous les joueurs sont prêts. Vous pouvez démarrer la partie."
-                            self.start_button["active"] = True
-                        else:
-                            self.info_message = "En attente que tous les joueurs soient prêts..."
-                            self.start_button["active"] = len(self.players) > 1
+            self.apply_game_state()
             
             # Envoyer notre statut au serveur
             if not self.is_host and self.client.connected:
@@ -370,4 +387,30 @@ class Lobby:
         elif self.is_host:
             # Mettre à jour le message d'information
             self.info_message = "En attente de joueurs..."
-            self.start_button["active"] = False 
\ No newline at end of file
+            self.start_button["active"] = False
+    
+    def apply_game_state(self):
+        """Met à jour le lobby à partir du dernier état reçu par le client (sans rien envoyer)"""
+        # Vérifier si nous avons reçu des mises à jour de l'état du jeu
+        game_state = self.client.game_state if self.client else None
+        if game_state:
+            # Vérifier si la partie a commencé
+            if "game_started" in game_state and game_state["game_started"]:
+                self.game_started = True
+                if not self.is_host:
+                    self.info_message = "L'hôte a démarré la partie. Préparation en cours..."
+            
+            # Mettre à jour la liste des joueurs
+            if "players" in game_state:
+                self.players = game_state["players"]
+                
+                # Mettre à jour le message d'information
+                if self.is_host:
+                    # Vérifier si tous les joueurs sont prêts
+                    all_ready = all(player.get("ready", False) for player in self.players if player["id"] != 1)
+                    if len(self.players) > 1 and all_ready:
+                        self.info_message = "Tous les joueurs sont prêts. Vous pouvez démarrer la partie."
+                        self.start_button["active"] = True
+                    else:
+                        self.info_message = "En attente que tous les joueurs soient prêts..."
+                        self.start_button["active"] = len(self.players) > 1
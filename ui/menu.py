@@ -8,6 +8,8 @@ from game.config import (
     WHITE, BLACK, GRAY, BLUE, RED, GREEN,
     LIGHT_GRAY
 )
+from ui.events import wait_for_events
+from ui.text_cache import get_font, render_text
 
 class MainMenu:
     """Classe pour l'écran de menu principal"""
@@ -25,10 +27,10 @@ class MainMenu:
         pygame.display.set_caption("Jeu des Animaux - Menu Principal")
         
         # Polices
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.button_font = pygame.font.SysFont(None, 48)
-        self.info_font = pygame.font.SysFont(None, 24)
-        self.ip_font = pygame.font.SysFont(None, 36)  # Police plus grande pour l'IP
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
+        self.info_font = get_font(24)
+        self.ip_font = get_font(36)  # Police plus grande pour l'IP
         
         # Boutons
         button_width = 300
@@ -153,10 +155,14 @@ class MainMenu:
             dict: Informations sur l'action choisie par l'utilisateur
         """
         clock = pygame.time.Clock()
+        needs_redraw = True  # Dessiner la première frame sans attendre
         
         while self.running:
+            # Le menu ne change qu'en réponse au joueur : attendre le prochain événement
+            events = wait_for_events(idle=not needs_redraw)
+            
             # Gérer les événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                     return {"action": "quit"}
@@ -243,6 +249,11 @@ class MainMenu:
                             if button["rect"].collidepoint(event.pos):
                                 self.selected_button = button
             
+            # Rien n'a changé depuis la dernière frame (délai d'attente expiré)
+            if not events and not needs_redraw:
+                continue
+            needs_redraw = False
+            
             # Dessiner l'écran
             self.draw()
             
@@ -260,7 +271,7 @@ class MainMenu:
         self.screen.fill(WHITE)
         
         # Dessiner le titre
-        title_text = self.title_font.render("Jeu des Animaux", True, BLACK)
+        title_text = render_text(self.title_font, "Jeu des Animaux", BLACK)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 100))
         self.screen.blit(title_text, title_rect)
         
@@ -284,14 +295,14 @@ class MainMenu:
             pygame.draw.rect(self.screen, BLACK, button["rect"], 2)
             
             # Dessiner le texte du bouton
-            text = self.button_font.render(button["text"], True, WHITE)
+            text = render_text(self.button_font, button["text"], WHITE)
             text_rect = text.get_rect(center=button["rect"].center)
             self.screen.blit(text, text_rect)
     
     def draw_multiplayer_screen(self):
         """Dessine l'écran multijoueur"""
         # Dessiner le titre
-        title = self.title_font.render("Mode Multijoueur", True, BLACK)
+        title = render_text(self.title_font, "Mode Multijoueur", BLACK)
         title_rect = title.get_rect(center=(self.screen_width // 2, 80))
         self.screen.blit(title, title_rect)
         
@@ -306,15 +317,15 @@ class MainMenu:
         pygame.draw.rect(self.screen, BLUE, ip_highlight_rect, 2)
         
         # Dessiner l'adresse IP en gros et en gras
-        ip_font = pygame.font.SysFont(None, 36)
-        ip_text = ip_font.render(f"Votre IP: {self.local_ip}", True, BLUE)
+        ip_font = get_font(36)
+        ip_text = render_text(ip_font, f"Votre IP: {self.local_ip}", BLUE)
         ip_rect = ip_text.get_rect(center=ip_highlight_rect.center)
         self.screen.blit(ip_text, ip_rect)
         
         # Dessiner les informations
         y_offset = 180
         for line in self.multiplayer_info:
-            text = self.info_font.render(line, True, BLACK)
+            text = render_text(self.info_font, line, BLACK)
             text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 30
@@ -322,7 +333,7 @@ class MainMenu:
         # Dessiner le champ de saisie avec un texte explicatif au-dessus
         if self.ip_input["active"] or any(button["action"] == "confirm_join" for button in self.multiplayer_buttons):
             # Dessiner le texte "Entrez l'adresse IP:" au-dessus du champ
-            ip_label = self.info_font.render("Entrez l'adresse IP du serveur:", True, BLUE)
+            ip_label = render_text(self.info_font, "Entrez l'adresse IP du serveur:", BLUE)
             ip_label_rect = ip_label.get_rect(center=(self.screen_width // 2, self.ip_input["rect"].top - 20))
             self.screen.blit(ip_label, ip_label_rect)
         
@@ -332,9 +343,9 @@ class MainMenu:
         
         # Dessiner le texte du champ de saisie ou le placeholder
         if self.ip_input["text"]:
-            text = self.info_font.render(self.ip_input["text"], True, BLACK)
+            text = render_text(self.info_font, self.ip_input["text"], BLACK)
         else:
-            text = self.info_font.render(self.ip_input["placeholder"], True, LIGHT_GRAY)
+            text = render_text(self.info_font, self.ip_input["placeholder"], LIGHT_GRAY)
         
         text_rect = text.get_rect(center=self.ip_input["rect"].center)
         self.screen.blit(text, text_rect)
@@ -349,14 +360,14 @@ class MainMenu:
             pygame.draw.rect(self.screen, BLACK, button["rect"], 2)
             
             # Dessiner le texte du bouton
-            text = self.button_font.render(button["text"], True, WHITE)
+            text = render_text(self.button_font, button["text"], WHITE)
             text_rect = text.get_rect(center=button["rect"].center)
             self.screen.blit(text, text_rect)
     
     def draw_options_screen(self):
         """Dessine l'écran d'options"""
         # Pour l'instant, juste afficher un message
-        text = self.info_font.render("Options (à venir)", True, BLACK)
+        text = render_text(self.info_font, "Options (à venir)", BLACK)
         text_rect = text.get_rect(center=(self.screen_width // 2, 250))
         self.screen.blit(text, text_rect)
         
@@ -376,7 +387,7 @@ class MainMenu:
         pygame.draw.rect(self.screen, BLACK, back_button["rect"], 2)
         
         # Dessiner le texte du bouton
-        text = self.button_font.render(back_button["text"], True, WHITE)
+        text = render_text(self.button_font, back_button["text"], WHITE)
         text_rect = text.get_rect(center=back_button["rect"].center)
         self.screen.blit(text, text_rect)
     
@@ -15,6 +15,7 @@ from game.config import (
     LION_START_POSITION, TIGER_START_POSITION
 )
 from ui.gui import SetupScreen, Button
+from ui.events import wait_for_events
 from game.game import Game
 from game.animal import Animal
 from game.resources import Fruit, GreenFruit, RedFruit
@@ -111,9 +112,13 @@ class FixedSetupScreen(SetupScreen):
         self.start_button = Button(button_x, button_y, button_width, button_height, "Démarrer", GREEN, (150, 255, 150))
         
         running = True
+        needs_redraw = True  # Dessiner la première frame sans attendre
         while running:
+            # L'écran ne change qu'en réponse au joueur : attendre le prochain événement
+            events = wait_for_events(idle=not needs_redraw)
+            
             # Gérer les événements
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return None
                 
@@ -135,6 +140,11 @@ class FixedSetupScreen(SetupScreen):
                         if button["rect"].collidepoint(event.pos):
                             self.handle_stat_change(button["stat"], button["change"])
             
+            # Rien n'a changé depuis la dernière frame (délai d'attente expiré)
+            if not events and not needs_redraw:
+                continue
+            needs_redraw = False
+            
             # Mettre à jour les sliders
             mouse_pos = pygame.mouse.get_pos()
             for slider in self.sliders:
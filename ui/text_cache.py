@@ -0,0 +1,125 @@
+"""
+Module des polices partagées et du cache des textes rendus.
+
+pygame.font.SysFont recherche et charge la police à chaque appel, et
+font.render rasterise le texte à chaque fois. Les écrans du jeu redessinent
+pourtant sans cesse les mêmes libellés (statistiques, commandes, compteurs) :
+les polices sont donc créées une seule fois, et les surfaces de texte sont
+gardées dans un cache LRU indexé par (police, texte, couleur).
+
+Les surfaces retournées sont partagées : il faut les blitter, jamais les modifier.
+"""
+import collections
+
+import pygame
+
+# Nombre de surfaces de texte gardées en cache
+TEXT_CACHE_SIZE = 512
+
+
+class TextCache:
+    """Cache LRU des surfaces de texte rendues"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """Initialise un cache vide
+
+        Args:
+            max_size: Nombre maximal de surfaces gardées en cache
+        """
+        self.max_size = max_size
+        self.surfaces = collections.OrderedDict()  # {(police, texte, couleur, ...): Surface}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True, background=None):
+        """Retourne la surface d'un texte, rendue au premier appel puis gardée en cache
+
+        Args:
+            font: Police (pygame.font.Font)
+            text: Texte à afficher
+            color: Couleur du texte
+            antialias: Si True, lisse le texte
+            background: Couleur de fond, None pour un fond transparent
+
+        Returns:
+            pygame.Surface: Surface du texte (partagée, à ne pas modifier)
+        """
+        key = (font, text, tuple(color), antialias, tuple(background) if background is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vide le cache"""
+        self.surfaces.clear()
+
+
+# Polices partagées, indexées par (nom, taille, gras, italique)
+_fonts = {}
+
+# Cache partagé par tous les écrans
+text_cache = TextCache()
+
+# True si clear() est inscrite auprès de pygame.quit() (pygame oublie les inscriptions à chaque arrêt)
+_quit_registered = False
+
+
+def get_font(size, name=None, bold=False, italic=False):
+    """Retourne la police système demandée, créée au premier appel
+
+    Args:
+        size: Taille de la police
+        name: Nom de la police système (None pour la police par défaut)
+        bold: Si True, police grasse
+        italic: Si True, police italique
+
+    Returns:
+        pygame.font.Font: Police partagée
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        register_quit()
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size, bold, italic)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color, antialias=True, background=None):
+    """Rend un texte en passant par le cache partagé (voir TextCache.render)"""
+    register_quit()
+    return text_cache.render(font, text, color, antialias, background)
+
+
+def register_quit():
+    """Inscrit clear() auprès de pygame.quit(), une seule fois par démarrage de pygame"""
+    global _quit_registered
+    if not _quit_registered:
+        pygame.register_quit(clear)
+        _quit_registered = True
+
+
+def clear():
+    """Oublie les polices et les textes rendus
+
+    Appelée automatiquement par pygame.quit() : les polices ne sont plus
+    utilisables une fois pygame arrêté.
+    """
+    global _quit_registered
+    _quit_registered = False
+    _fonts.clear()
+    text_cache.clear()